@@ -1,28 +1,52 @@
-import re
+import sys
+
+from devtools.balance import check_file as check_balance
+from devtools.cache import Cache
+from devtools.scanner import CONFLICT_PATTERNS, scan_tree
 
-def check_file(path):
-    print(f"Analyzing {path}...")
-    with open(path, 'r') as f:
-        content = f.read()
 
-    if '<<<<<<<' in content:
+def report(path, hits, diag=None):
+    print(f"Analyzing {path}...")
+    conflicts = [h for h in hits if h.pattern in CONFLICT_PATTERNS]
+    if conflicts:
         print(f"  FOUND CONFLICT MARKERS!")
-        lines = content.split('\n')
-        for i, line in enumerate(lines):
-            if '<<<<<<<' in line:
-                print(f"  Line {i+1}: {line}")
+        for hit in conflicts:
+            print(f"  Line {hit.line}: {hit.text}")
     else:
         print("  No conflict markers found.")
 
-    # Check for unclosed React.memo
-    if 'React.memo' in content:
-        print("  Contains React.memo")
-        # Simple heuristic: Count ( and ) after React.memo
-        # This is hard to do robustly with regex, but let's just check the end of the file
-        last_lines = content.strip().split('\n')[-5:]
-        print(f"  Last lines: {last_lines}")
-
-check_file('components/Hero.tsx')
-check_file('components/Footer2026.tsx')
-check_file('components/InteractiveGallery.tsx')
-check_file('components/CardStack.tsx')
+    memo = [h for h in hits if h.pattern == 'react-memo']
+    if memo:
+        print(f"  Contains React.memo (line {', '.join(str(h.line) for h in memo)})")
+
+    if diag:
+        print(f"  UNBALANCED: {diag.format(path)}")
+
+
+def check_file(path, cache=None):
+    for path, hits, error in scan_tree(paths=[path], cache=cache):
+        if error:
+            print(f"Analyzing {path}...\n  {error}")
+        else:
+            report(path, hits, check_balance(path, cache))
+
+
+if __name__ == '__main__':
+    # With explicit paths, report on each; otherwise scan the whole tree and
+    # only report files that contain conflict markers or unbalanced brackets.
+    with Cache() as cache:
+        if sys.argv[1:]:
+            for p in sys.argv[1:]:
+                check_file(p, cache)
+        else:
+            found = 0
+            for path, hits, error in scan_tree(cache=cache):
+                diag = None if error else check_balance(path, cache)
+                if error or diag or any(h.pattern in CONFLICT_PATTERNS for h in hits):
+                    found += 1
+                    if error:
+                        print(f"{path}: {error}")
+                    else:
+                        report(path, hits, diag)
+            if not found:
+                print("No conflict markers or unbalanced brackets found.")
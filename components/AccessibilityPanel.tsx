@@ -6,7 +6,7 @@ import { useAccessibility } from './AccessibilityProvider';
  * AccessibilityPanel - Component for managing accessibility features
  * Complies with WCAG 2.1 AA standards
  */
-export const AccessibilityPanel: React.FC = () => {
+export const AccessibilityPanel: React.FC = React.memo(() => {
   const { t, lang } = useI18n();
   const {
     fontSize,
@@ -190,7 +190,7 @@ export const AccessibilityPanel: React.FC = () => {
       </button>
     </>
   );
-};
+});
 
 AccessibilityPanel.displayName = 'AccessibilityPanel';
 
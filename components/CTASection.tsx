@@ -3,6 +3,16 @@ import { motion, useMotionValue, useSpring, useTransform } from 'framer-motion';
 import { ArrowRight, Sparkles, Award, Code2, Users, Clock } from 'lucide-react';
 import { useI18n } from '../i18n';
 
+const TROPHY_3D_PERSPECTIVE_STYLE = { perspective: '1000px' } as const;
+const TROPHY_3D_TROPHY_BASE_STYLE = { transform: 'translateX(-50%) translateZ(20px)' } as const;
+const TROPHY_3D_TROPHY_STEM_STYLE = {
+  transform: 'translateX(-50%) translateZ(20px)',
+  clipPath: 'polygon(20% 0%, 80% 0%, 100% 100%, 0% 100%)',
+} as const;
+const TROPHY_3D_TROPHY_CUP_FRONT_STYLE = { transform: 'translateX(-50%) translateZ(40px)' } as const;
+const TROPHY_3D_HANDLES_STYLE = { transform: 'translateZ(10px)' } as const;
+const TROPHY_3D_GLOW_EFFECT_STYLE = { transform: 'translateX(-50%) translateZ(-20px)' } as const;
+
 // 3D Trophy Component
 const Trophy3D: React.FC = () => {
   const containerRef = useRef<HTMLDivElement>(null);
@@ -35,7 +45,7 @@ const Trophy3D: React.FC = () => {
     <div 
       ref={containerRef}
       className="relative w-64 h-80 mx-auto perspective-1000"
-      style={{ perspective: '1000px' }}
+      style={TROPHY_3D_PERSPECTIVE_STYLE}
     >
       <motion.div
         className="relative w-full h-full"
@@ -48,7 +58,7 @@ const Trophy3D: React.FC = () => {
         {/* Trophy Base */}
         <div 
           className="absolute bottom-0 left-1/2 -translate-x-1/2 w-32 h-8 bg-gradient-to-b from-amber-600 to-amber-800 rounded-lg"
-          style={{ transform: 'translateX(-50%) translateZ(20px)' }}
+          style={TROPHY_3D_TROPHY_BASE_STYLE}
         >
           <div className="absolute inset-0 bg-gradient-to-r from-transparent via-white/20 to-transparent rounded-lg" />
         </div>
@@ -56,16 +66,13 @@ const Trophy3D: React.FC = () => {
         {/* Trophy Stem */}
         <div 
           className="absolute bottom-8 left-1/2 -translate-x-1/2 w-8 h-24 bg-gradient-to-b from-amber-500 to-amber-700"
-          style={{ 
-            transform: 'translateX(-50%) translateZ(20px)',
-            clipPath: 'polygon(20% 0%, 80% 0%, 100% 100%, 0% 100%)'
-          }}
+          style={TROPHY_3D_TROPHY_STEM_STYLE}
         />
         
         {/* Trophy Cup - Front */}
         <div 
           className="absolute top-8 left-1/2 -translate-x-1/2 w-40 h-32"
-          style={{ transform: 'translateX(-50%) translateZ(40px)' }}
+          style={TROPHY_3D_TROPHY_CUP_FRONT_STYLE}
         >
           <div className="absolute inset-0 bg-gradient-to-b from-amber-400 via-amber-500 to-amber-600 rounded-t-full rounded-b-3xl shadow-2xl">
             <div className="absolute inset-0 bg-gradient-to-r from-transparent via-white/30 to-transparent rounded-t-full rounded-b-3xl" />
@@ -76,11 +83,11 @@ const Trophy3D: React.FC = () => {
           {/* Handles */}
           <div 
             className="absolute top-4 -left-6 w-8 h-16 border-4 border-amber-500 rounded-full"
-            style={{ transform: 'translateZ(10px)' }}
+            style={TROPHY_3D_HANDLES_STYLE}
           />
           <div 
             className="absolute top-4 -right-6 w-8 h-16 border-4 border-amber-500 rounded-full"
-            style={{ transform: 'translateZ(10px)' }}
+            style={TROPHY_3D_HANDLES_STYLE}
           />
         </div>
 
@@ -110,7 +117,7 @@ const Trophy3D: React.FC = () => {
         {/* Glow Effect */}
         <div 
           className="absolute top-8 left-1/2 -translate-x-1/2 w-48 h-48 bg-amber-500/20 rounded-full blur-3xl"
-          style={{ transform: 'translateX(-50%) translateZ(-20px)' }}
+          style={TROPHY_3D_GLOW_EFFECT_STYLE}
         />
       </motion.div>
 
@@ -120,6 +127,11 @@ const Trophy3D: React.FC = () => {
   );
 };
 
+const STAT_CARD_BACKGROUND_PATTERN_STYLE = {
+  backgroundImage: `radial-gradient(circle at 2px 2px, white 1px, transparent 0)`,
+  backgroundSize: '16px 16px',
+} as const;
+
 // Stat Card Component
 const StatCard: React.FC<{
   icon: React.ReactNode;
@@ -138,10 +150,7 @@ const StatCard: React.FC<{
   >
     {/* Background Pattern */}
     <div className="absolute inset-0 opacity-[0.03]"
-      style={{
-        backgroundImage: `radial-gradient(circle at 2px 2px, white 1px, transparent 0)`,
-        backgroundSize: '16px 16px'
-      }}
+      style={STAT_CARD_BACKGROUND_PATTERN_STYLE}
     />
     
     {/* Glow on hover */}
@@ -171,6 +180,12 @@ const StatCard: React.FC<{
   </motion.div>
 );
 
+const CTA_SECTION_GRID_PATTERN_STYLE = {
+  backgroundImage: `linear-gradient(rgba(255,255,255,0.1) 1px, transparent 1px),
+                           linear-gradient(90deg, rgba(255,255,255,0.1) 1px, transparent 1px)`,
+  backgroundSize: '60px 60px',
+} as const;
+
 export const CTASection: React.FC = React.memo(() => {
   const { t } = useI18n();
 
@@ -236,11 +251,7 @@ export const CTASection: React.FC = React.memo(() => {
       {/* Grid Pattern */}
       <div 
         className="absolute inset-0 opacity-[0.02]"
-        style={{
-          backgroundImage: `linear-gradient(rgba(255,255,255,0.1) 1px, transparent 1px),
-                           linear-gradient(90deg, rgba(255,255,255,0.1) 1px, transparent 1px)`,
-          backgroundSize: '60px 60px'
-        }}
+        style={CTA_SECTION_GRID_PATTERN_STYLE}
         aria-hidden="true"
       />
 
@@ -10,6 +10,14 @@ interface CardStackItem {
   gradient: string;
 }
 
+const CARD_STACK_EMERALD_CONIC_GRADIENT_STYLE = {
+  width: '600px',
+  height: '600px',
+  background: 'conic-gradient(from 0deg, #10B981, #06B6D4, #F59E0B)',
+  top: '20%',
+  left: '10%',
+} as const;
+
 export const CardStack: React.FC = React.memo(() => {
   const stackItems = useMemo<CardStackItem[]>(() => [
     {
@@ -63,13 +71,7 @@ export const CardStack: React.FC = React.memo(() => {
       {/* Background */}
       <div className="absolute inset-0">
         <div className="absolute inset-0 bg-gradient-to-br from-emerald-900/10 via-transparent to-orange-900/10" />
-        <div className="blob-bg" style={{
-          width: '600px',
-          height: '600px',
-          background: 'conic-gradient(from 0deg, #10B981, #06B6D4, #F59E0B)',
-          top: '20%',
-          left: '10%',
-        }} />
+        <div className="blob-bg" style={CARD_STACK_EMERALD_CONIC_GRADIENT_STYLE} />
       </div>
 
       <div className="container-wrapper relative z-10">
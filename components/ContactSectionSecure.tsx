@@ -18,6 +18,8 @@ interface ContactSectionSecureProps {
   id?: string;
 }
 
+const CONTACT_SECTION_SECURE_INNER_DECORATIVE_BORDERS_STYLE = { boxShadow: 'inset 0 0 30px rgba(16, 185, 129, 0.1), inset 0 0 60px rgba(6, 182, 212, 0.05)' } as const;
+
 const ContactSectionSecure: React.FC<ContactSectionSecureProps> = ({ id = 'contact' }) => {
   const { t } = useI18n();
   const lastSubmitRef = useRef<number>(0);
@@ -183,9 +185,7 @@ const ContactSectionSecure: React.FC<ContactSectionSecureProps> = ({ id = 'conta
           </p>
           {/* Inner decorative borders */}
           <div className="absolute inset-0 border border-emerald-500/20 rounded-3xl pointer-events-none" 
-               style={{
-                 boxShadow: 'inset 0 0 30px rgba(16, 185, 129, 0.1), inset 0 0 60px rgba(6, 182, 212, 0.05)'
-               }} />
+               style={CONTACT_SECTION_SECURE_INNER_DECORATIVE_BORDERS_STYLE} />
           
           <input 
             type="text" 
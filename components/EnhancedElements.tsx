@@ -352,6 +352,12 @@ interface HolographicCardProps {
   className?: string;
 }
 
+const HOLOGRAPHIC_CARD_PERSPECTIVE_STYLE = { perspective: 1000, transformStyle: 'preserve-3d' } as const;
+const HOLOGRAPHIC_CARD_RAINBOW_SHIMMER_STYLE = {
+  background: 'linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.3), transparent)',
+  transform: 'skewX(-20deg)',
+} as const;
+
 export const HolographicCard: React.FC<HolographicCardProps> = React.memo(({
   children,
   className = '',
@@ -386,10 +392,7 @@ export const HolographicCard: React.FC<HolographicCardProps> = React.memo(({
     <motion.div
       ref={cardRef}
       className={`relative rounded-2xl overflow-hidden ${className}`}
-      style={{
-        perspective: 1000,
-        transformStyle: 'preserve-3d',
-      }}
+      style={HOLOGRAPHIC_CARD_PERSPECTIVE_STYLE}
       onMouseMove={handleMouseMove}
       onMouseLeave={handleMouseLeave}
     >
@@ -422,10 +425,7 @@ export const HolographicCard: React.FC<HolographicCardProps> = React.memo(({
         {/* Rainbow shimmer */}
         <motion.div
           className="absolute inset-0 rounded-2xl pointer-events-none opacity-30"
-          style={{
-            background: 'linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.3), transparent)',
-            transform: 'skewX(-20deg)',
-          }}
+          style={HOLOGRAPHIC_CARD_RAINBOW_SHIMMER_STYLE}
           animate={{
             x: ['-100%', '200%'],
           }}
@@ -650,6 +650,11 @@ interface OrbitingRingsProps {
   size?: number;
 }
 
+const ORBITING_RINGS_CENTER_GLOW_STYLE = {
+  background: 'linear-gradient(135deg, #6366f1, #a855f7)',
+  boxShadow: '0 0 20px rgba(99, 102, 241, 0.6)',
+} as const;
+
 export const OrbitingRings: React.FC<OrbitingRingsProps> = React.memo(({
   className = '',
   size = 200,
@@ -686,10 +691,7 @@ export const OrbitingRings: React.FC<OrbitingRingsProps> = React.memo(({
       {/* Center glow */}
       <motion.div
         className="absolute top-1/2 left-1/2 w-4 h-4 -translate-x-1/2 -translate-y-1/2 rounded-full"
-        style={{
-          background: 'linear-gradient(135deg, #6366f1, #a855f7)',
-          boxShadow: '0 0 20px rgba(99, 102, 241, 0.6)',
-        }}
+        style={ORBITING_RINGS_CENTER_GLOW_STYLE}
         animate={{
           scale: [1, 1.3, 1],
           opacity: [0.8, 1, 0.8],
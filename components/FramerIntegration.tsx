@@ -4,7 +4,7 @@ interface FramerIntegrationProps {
   className?: string;
 }
 
-const FramerIntegration: React.FC<FramerIntegrationProps> = ({ className = '' }) => {
+const FramerIntegration: React.FC<FramerIntegrationProps> = React.memo(({ className = '' }) => {
 
   return (
     <section className={`relative min-h-screen py-20 px-6 overflow-hidden ${className}`}>
@@ -190,6 +190,8 @@ const FramerIntegration: React.FC<FramerIntegrationProps> = ({ className = '' })
       <div className="absolute inset-0 interactive-grid opacity-20" />
     </section>
   );
-};
+});
+
+FramerIntegration.displayName = 'FramerIntegration';
 
 export default FramerIntegration;
\ No newline at end of file
@@ -52,6 +52,8 @@ const FloatingOrb: React.FC<{
   );
 });
 
+const ANIMATED_LETTER_PRESERVE_3D_STYLE = { transformStyle: 'preserve-3d' } as const;
+
 /**
  * Individual letter animation component for the hero name
  * Applies staggered entrance animation and hover effects
@@ -79,9 +81,7 @@ const AnimatedLetter: React.FC<{
         textShadow: '0 0 40px rgba(139, 92, 246, 0.8)',
         transition: { duration: 0.2 },
       }}
-      style={{
-        transformStyle: 'preserve-3d',
-      }}
+      style={ANIMATED_LETTER_PRESERVE_3D_STYLE}
     >
       {letter}
       {/* Dot decoration for specific letters */}
@@ -150,6 +150,36 @@ const CustomCursor: React.FC<{ mouseX: number; mouseY: number }> = React.memo(({
   );
 });
 
+const HERO_PURPLE_RADIAL_GRADIENT_STYLE = {
+  background: 'radial-gradient(circle at 30% 20%, rgba(168, 85, 247, 0.15) 0%, transparent 50%), radial-gradient(circle at 70% 80%, rgba(236, 72, 153, 0.1) 0%, transparent 50%)',
+} as const;
+const HERO_DECORATIVE_PURPLE_STAR_STYLE = {
+  width: '1275px',
+  height: '1275px',
+  aspectRatio: '1 / 1',
+  backgroundImage: 'url(/purple-star1.svg)',
+  backgroundSize: 'cover',
+  backgroundRepeat: 'no-repeat',
+  backgroundPosition: 'center',
+  top: '-400px',
+  right: '-400px',
+} as const;
+const HERO_BLOB_BACKGROUND_ELEMENTS_STYLE = {
+  width: '400px',
+  height: '400px',
+  background: 'linear-gradient(45deg, #0EA5E9, #10B981)',
+  top: '10%',
+  left: '5%',
+} as const;
+const HERO_AMBER_GRADIENT_STYLE = {
+  width: '300px',
+  height: '300px',
+  background: 'linear-gradient(45deg, #F59E0B, #8B5CF6)',
+  bottom: '15%',
+  right: '8%',
+} as const;
+const HERO_H1_STYLE = { fontSize: 'clamp(2rem, 10vw, 6.5rem)' } as const;
+
 /**
  * Hero section component with interactive animations and 3D effects
  * Features:
@@ -294,9 +324,7 @@ const Hero: React.FC = React.memo(() => {
       {/* Animated gradient mesh background */}
       <motion.div
         className="absolute inset-0 pointer-events-none"
-        style={{
-          background: 'radial-gradient(circle at 30% 20%, rgba(168, 85, 247, 0.15) 0%, transparent 50%), radial-gradient(circle at 70% 80%, rgba(236, 72, 153, 0.1) 0%, transparent 50%)',
-        }}
+        style={HERO_PURPLE_RADIAL_GRADIENT_STYLE}
         animate={{
           background: [
             'radial-gradient(circle at 30% 20%, rgba(168, 85, 247, 0.15) 0%, transparent 50%), radial-gradient(circle at 70% 80%, rgba(236, 72, 153, 0.1) 0%, transparent 50%)',
@@ -310,17 +338,7 @@ const Hero: React.FC = React.memo(() => {
       {/* Decorative Purple Star */}
       <motion.div 
         className="absolute pointer-events-none"
-        style={{
-          width: '1275px',
-          height: '1275px',
-          aspectRatio: '1 / 1',
-          backgroundImage: 'url(/purple-star1.svg)',
-          backgroundSize: 'cover',
-          backgroundRepeat: 'no-repeat',
-          backgroundPosition: 'center',
-          top: '-400px',
-          right: '-400px',
-        }}
+        style={HERO_DECORATIVE_PURPLE_STAR_STYLE}
         initial={{ opacity: 0, rotate: 0, scale: 0.8 }}
         animate={{ 
           opacity: 0.4, 
@@ -406,13 +424,7 @@ const Hero: React.FC = React.memo(() => {
         {/* Blob Background Elements */}
         <motion.div
           className="blob-bg"
-          style={{
-            width: '400px',
-            height: '400px',
-            background: 'linear-gradient(45deg, #0EA5E9, #10B981)',
-            top: '10%',
-            left: '5%',
-          }}
+          style={HERO_BLOB_BACKGROUND_ELEMENTS_STYLE}
           animate={{
             x: [0, 50, 0],
             y: [0, -30, 0],
@@ -428,13 +440,7 @@ const Hero: React.FC = React.memo(() => {
         
         <motion.div
           className="blob-bg"
-          style={{
-            width: '300px',
-            height: '300px',
-            background: 'linear-gradient(45deg, #F59E0B, #8B5CF6)',
-            bottom: '15%',
-            right: '8%',
-          }}
+          style={HERO_AMBER_GRADIENT_STYLE}
           animate={{
             x: [0, -40, 0],
             y: [0, 20, 0],
@@ -494,7 +500,7 @@ const Hero: React.FC = React.memo(() => {
               initial={{ opacity: 0, y: 50 }}
               animate={{ opacity: 1, y: 0 }}
               transition={{ delay: 0.6 }}
-              style={{ fontSize: 'clamp(2rem, 10vw, 6.5rem)' }}
+              style={HERO_H1_STYLE}
             >
               {(t('hero.title.line1') + ' ' + t('hero.title.line2')).split('').map((letter, index) => (
                 <AnimatedLetter key={index} letter={letter} index={index} />
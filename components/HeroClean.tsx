@@ -27,9 +27,23 @@ const STATS_DATA = [
   { value: '∞', label: 'Coffee Cups', icon: Zap, color: 'text-violet-400', delay: 0.4 },
 ];
 
+const HERO_BLOB_BACKGROUND_ELEMENTS_STYLE = {
+  width: '400px',
+  height: '400px',
+  background: 'linear-gradient(45deg, #0EA5E9, #10B981)',
+  top: '10%',
+  left: '5%',
+} as const;
+const HERO_AMBER_GRADIENT_STYLE = {
+  width: '300px',
+  height: '300px',
+  background: 'linear-gradient(45deg, #F59E0B, #8B5CF6)',
+  bottom: '15%',
+  right: '8%',
+} as const;
+
 export const Hero: React.FC = React.memo(() => {
   const { t } = useI18n();
-  const [mousePosition, setMousePosition] = useState({ x: 0, y: 0 });
   const [isHovering, setIsHovering] = useState(false);
   const [scrollY, setScrollY] = useState(0);
 
@@ -40,14 +54,6 @@ export const Hero: React.FC = React.memo(() => {
     return () => window.removeEventListener('scroll', handleScroll);
   }, []);
 
-  const handleMouseMove = useCallback((e: React.MouseEvent) => {
-    const rect = e.currentTarget.getBoundingClientRect();
-    setMousePosition({
-      x: e.clientX - rect.left - rect.width / 2,
-      y: e.clientY - rect.top - rect.height / 2,
-    });
-  }, []);
-
   const scrollToWorks = useCallback(() => {
     document.getElementById('works')?.scrollIntoView({ behavior: 'smooth' });
   }, []);
@@ -97,7 +103,6 @@ export const Hero: React.FC = React.memo(() => {
     <section 
       id="home"
       className={SECTION_CLASSES}
-      onMouseMove={handleMouseMove}
       onMouseEnter={() => setIsHovering(true)}
       onMouseLeave={() => setIsHovering(false)}
       aria-label="Hero section"
@@ -122,13 +127,7 @@ export const Hero: React.FC = React.memo(() => {
         {/* Blob Background Elements */}
         <motion.div
           className="blob-bg"
-          style={{
-            width: '400px',
-            height: '400px',
-            background: 'linear-gradient(45deg, #0EA5E9, #10B981)',
-            top: '10%',
-            left: '5%',
-          }}
+          style={HERO_BLOB_BACKGROUND_ELEMENTS_STYLE}
           animate={{
             x: [0, 50, 0],
             y: [0, -30, 0],
@@ -142,13 +141,7 @@ export const Hero: React.FC = React.memo(() => {
         
         <motion.div
           className="blob-bg"
-          style={{
-            width: '300px',
-            height: '300px',
-            background: 'linear-gradient(45deg, #F59E0B, #8B5CF6)',
-            bottom: '15%',
-            right: '8%',
-          }}
+          style={HERO_AMBER_GRADIENT_STYLE}
           animate={{
             x: [0, -40, 0],
             y: [0, 20, 0],
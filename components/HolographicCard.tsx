@@ -1,5 +1,5 @@
 import React, { useState, useRef, useEffect } from 'react';
-import { motion } from 'framer-motion';
+import { motion, useMotionTemplate, useMotionValue } from 'framer-motion';
 
 interface HolographicCardProps {
   title: string;
@@ -10,6 +10,11 @@ interface HolographicCardProps {
   hoverIntensity?: number;
 }
 
+const HOLOGRAPHIC_CARD_WHITE_GRADIENT_STYLE = {
+  background: `linear-gradient(120deg, transparent 30%, rgba(255,255,255,0.1) 50%, transparent 70%)`,
+  backgroundSize: '200% 100%',
+} as const;
+
 /**
  * HolographicCard - A futuristic card with holographic effects and interactive lighting
  * Features:
@@ -27,7 +32,9 @@ export const HolographicCard: React.FC<HolographicCardProps> = React.memo(({
   hoverIntensity = 1.1
 }) => {
   const [isHovered, setIsHovered] = useState(false);
-  const [mousePosition, setMousePosition] = useState({ x: 0, y: 0 });
+  const mousePositionX = useMotionValue(0);
+  const mousePositionY = useMotionValue(0);
+  const mousePositionBackground = useMotionTemplate`radial-gradient(600px circle at ${mousePositionX}px ${mousePositionY}px, rgba(99, 102, 241, 0.4), transparent 80%)`;
   const cardRef = useRef<HTMLDivElement>(null);
 
   const handleMouseMove = (e: React.MouseEvent<HTMLDivElement>) => {
@@ -35,7 +42,8 @@ export const HolographicCard: React.FC<HolographicCardProps> = React.memo(({
       const rect = cardRef.current.getBoundingClientRect();
       const x = e.clientX - rect.left;
       const y = e.clientY - rect.top;
-      setMousePosition({ x, y });
+      mousePositionX.set(x);
+      mousePositionY.set(y);
     }
   };
 
@@ -52,10 +60,10 @@ export const HolographicCard: React.FC<HolographicCardProps> = React.memo(({
       transition={{ duration: 0.5, ease: 'easeOut' }}
     >
       {/* Dynamic light spot based on mouse position */}
-      <div 
+      <motion.div 
         className="absolute inset-0 opacity-30 pointer-events-none"
         style={{
-          background: `radial-gradient(600px circle at ${mousePosition.x}px ${mousePosition.y}px, rgba(99, 102, 241, 0.4), transparent 80%)`
+          background: mousePositionBackground
         }}
       />
 
@@ -66,10 +74,7 @@ export const HolographicCard: React.FC<HolographicCardProps> = React.memo(({
       <div className="absolute inset-0 overflow-hidden pointer-events-none">
         <motion.div
           className="absolute top-0 left-0 w-full h-full"
-          style={{
-            background: `linear-gradient(120deg, transparent 30%, rgba(255,255,255,0.1) 50%, transparent 70%)`,
-            backgroundSize: '200% 100%',
-          }}
+          style={HOLOGRAPHIC_CARD_WHITE_GRADIENT_STYLE}
           animate={{
             backgroundPosition: isHovered ? ['0% 0%', '200% 0%'] : '0% 0%',
           }}
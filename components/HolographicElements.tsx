@@ -7,6 +7,21 @@ interface HolographicCardProps {
   intensity?: number;
 }
 
+const HOLOGRAPHIC_CARD_PRISMATIC_REFLECTION_STYLE = {
+  background: `
+            linear-gradient(
+              135deg,
+              rgba(16, 185, 129, 0.1) 0%,
+              rgba(6, 182, 212, 0.1) 25%,
+              rgba(245, 158, 11, 0.1) 50%,
+              rgba(16, 185, 129, 0.1) 75%,
+              rgba(6, 182, 212, 0.1) 100%
+            )
+          `,
+  mixBlendMode: 'overlay',
+  opacity: 0.3,
+} as const;
+
 export const HolographicCard: React.FC<HolographicCardProps> = ({
   children,
   className = "",
@@ -30,20 +45,7 @@ export const HolographicCard: React.FC<HolographicCardProps> = ({
       {/* Prismatic reflection */}
       <motion.div
         className="absolute inset-0 rounded-2xl pointer-events-none"
-        style={{
-          background: `
-            linear-gradient(
-              135deg,
-              rgba(16, 185, 129, 0.1) 0%,
-              rgba(6, 182, 212, 0.1) 25%,
-              rgba(245, 158, 11, 0.1) 50%,
-              rgba(16, 185, 129, 0.1) 75%,
-              rgba(6, 182, 212, 0.1) 100%
-            )
-          `,
-          mixBlendMode: 'overlay',
-          opacity: 0.3
-        }}
+        style={HOLOGRAPHIC_CARD_PRISMATIC_REFLECTION_STYLE}
         animate={{
           backgroundPosition: ['0% 0%', '100% 100%'],
         }}
@@ -113,16 +115,8 @@ interface GradientWaveProps {
   height?: string;
 }
 
-export const GradientWave: React.FC<GradientWaveProps> = ({
-  className = "",
-  height = "h-32"
-}) => {
-  return (
-    <div className={`relative overflow-hidden ${height} ${className}`}>
-      <motion.div
-        className="absolute inset-0"
-        style={{
-          background: `
+const GRADIENT_WAVE_EMERALD_GRADIENT_STYLE = {
+  background: `
             linear-gradient(
               90deg,
               transparent 0%,
@@ -132,7 +126,28 @@ export const GradientWave: React.FC<GradientWaveProps> = ({
               transparent 100%
             )
           `,
-        }}
+} as const;
+const GRADIENT_WAVE_AMBER_GRADIENT_STYLE = {
+  background: `
+            linear-gradient(
+              90deg,
+              transparent 0%,
+              rgba(245, 158, 11, 0.2) 30%,
+              rgba(16, 185, 129, 0.2) 70%,
+              transparent 100%
+            )
+          `,
+} as const;
+
+export const GradientWave: React.FC<GradientWaveProps> = ({
+  className = "",
+  height = "h-32"
+}) => {
+  return (
+    <div className={`relative overflow-hidden ${height} ${className}`}>
+      <motion.div
+        className="absolute inset-0"
+        style={GRADIENT_WAVE_EMERALD_GRADIENT_STYLE}
         animate={{
           x: ['-100%', '100%'],
         }}
@@ -145,17 +160,7 @@ export const GradientWave: React.FC<GradientWaveProps> = ({
       
       <motion.div
         className="absolute inset-0"
-        style={{
-          background: `
-            linear-gradient(
-              90deg,
-              transparent 0%,
-              rgba(245, 158, 11, 0.2) 30%,
-              rgba(16, 185, 129, 0.2) 70%,
-              transparent 100%
-            )
-          `,
-        }}
+        style={GRADIENT_WAVE_AMBER_GRADIENT_STYLE}
         animate={{
           x: ['-150%', '150%'],
         }}
@@ -175,6 +180,20 @@ interface MorphingShapeProps {
   size?: number;
 }
 
+const MORPHING_SHAPE_EMERALD_GRADIENT_STYLE = {
+  background: `
+            linear-gradient(45deg, 
+              #10B981 0%, 
+              #06B6D4 25%, 
+              #F59E0B 50%, 
+              #10B981 75%, 
+              #06B6D4 100%
+            )
+          `,
+  filter: 'blur(20px)',
+  opacity: 0.4,
+} as const;
+
 export const MorphingShape: React.FC<MorphingShapeProps> = ({
   className = "",
   size = 200
@@ -203,19 +222,7 @@ export const MorphingShape: React.FC<MorphingShapeProps> = ({
     >
       <div 
         className="w-full h-full"
-        style={{
-          background: `
-            linear-gradient(45deg, 
-              #10B981 0%, 
-              #06B6D4 25%, 
-              #F59E0B 50%, 
-              #10B981 75%, 
-              #06B6D4 100%
-            )
-          `,
-          filter: 'blur(20px)',
-          opacity: 0.4
-        }}
+        style={MORPHING_SHAPE_EMERALD_GRADIENT_STYLE}
       />
     </motion.div>
   );
@@ -7,7 +7,7 @@ interface LazyGradientShaderCardProps {
   fallback?: React.ReactNode;
 }
 
-const LazyGradientShaderCard: React.FC<LazyGradientShaderCardProps> = ({ 
+const LazyGradientShaderCard: React.FC<LazyGradientShaderCardProps> = React.memo(({ 
   fallback = (
     <div className="w-full h-[360px] lg:h-[440px] rounded-[2.7rem] overflow-hidden relative bg-[#0f172a] flex items-center justify-center">
       <motion.div
@@ -23,6 +23,8 @@ const LazyGradientShaderCard: React.FC<LazyGradientShaderCardProps> = ({
       <GradientShaderCard />
     </Suspense>
   );
-};
+});
+
+LazyGradientShaderCard.displayName = 'LazyGradientShaderCard';
 
 export default LazyGradientShaderCard;
\ No newline at end of file
@@ -81,7 +81,7 @@ const MobileMenuItemComponent: React.FC<{
   );
 };
 
-export const MobileMenu: React.FC = () => {
+export const MobileMenu: React.FC = React.memo(() => {
   const [isOpen, setIsOpen] = useState(false);
   const { t } = useI18n();
 
@@ -185,4 +185,6 @@ export const MobileMenu: React.FC = () => {
       </AnimatePresence>
     </>
   );
-};
+});
+
+MobileMenu.displayName = 'MobileMenu';
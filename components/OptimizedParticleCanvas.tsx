@@ -3,7 +3,7 @@ import { Canvas } from '@react-three/fiber';
 import ParticleField from './home/ParticleField';
 
 // Memoized canvas wrapper to prevent unnecessary re-renders
-const OptimizedParticleCanvas: React.FC = () => {
+const OptimizedParticleCanvas: React.FC = React.memo(() => {
   // Memoize canvas props to prevent re-creation
   const canvasProps = useMemo(() => ({
     camera: { position: [0, 0, 3] as [number, number, number] },
@@ -19,6 +19,8 @@ const OptimizedParticleCanvas: React.FC = () => {
       <ParticleField />
     </Canvas>
   );
-};
+});
+
+OptimizedParticleCanvas.displayName = 'OptimizedParticleCanvas';
 
 export default OptimizedParticleCanvas;
\ No newline at end of file
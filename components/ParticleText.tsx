@@ -5,7 +5,7 @@ interface ParticleTextProps {
   text: string;
 }
 
-export const ParticleText: React.FC<ParticleTextProps> = ({ text }) => {
+export const ParticleText: React.FC<ParticleTextProps> = React.memo(({ text }) => {
   return (
     <div className="relative w-full overflow-hidden">
       <div className="absolute top-0 left-0 w-full h-full">
@@ -41,6 +41,8 @@ export const ParticleText: React.FC<ParticleTextProps> = ({ text }) => {
       </motion.h2>
     </div>
   );
-};
+});
+
+ParticleText.displayName = 'ParticleText';
 
 export default ParticleText;
\ No newline at end of file
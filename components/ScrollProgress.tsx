@@ -4,6 +4,12 @@ import { useReducedMotion } from '../lib/hooks';
 
 interface ScrollProgressProps {}
 
+const SCROLL_PROGRESS_GLOW_EFFECT_STYLE = { background: 'inherit', opacity: 0.8 } as const;
+const SCROLL_PROGRESS_SHINE_EFFECT_STYLE = {
+  background: 'linear-gradient(90deg, transparent, rgba(255,255,255,0.6), transparent)',
+  backgroundSize: '50% 100%',
+} as const;
+
 const ScrollProgress: React.FC<ScrollProgressProps> = () => {
   const prefersReducedMotion = useReducedMotion();
   const { scrollYProgress } = useScroll();
@@ -29,19 +35,13 @@ const ScrollProgress: React.FC<ScrollProgressProps> = () => {
       {/* Glow effect */}
       <div 
         className="absolute inset-0 blur-md"
-        style={{
-          background: 'inherit',
-          opacity: 0.8,
-        }}
+        style={SCROLL_PROGRESS_GLOW_EFFECT_STYLE}
       />
       
       {/* Shine effect */}
       <motion.div
         className="absolute inset-0"
-        style={{
-          background: 'linear-gradient(90deg, transparent, rgba(255,255,255,0.6), transparent)',
-          backgroundSize: '50% 100%',
-        }}
+        style={SCROLL_PROGRESS_SHINE_EFFECT_STYLE}
         animate={{
           backgroundPosition: ['0% 0%', '200% 0%'],
         }}
@@ -13,8 +13,10 @@ interface SectionDividerProps {
 // Memoized style objects for performance
 const CENTER_ELEMENT_STYLE = { transform: 'rotate(45deg)' } as const;
 const CENTER_DOT_STYLE = { boxShadow: '0 0 15px rgba(99, 102, 241, 0.6)' } as const;
+const SECTION_DIVIDER_CENTER_DIAMOND_STYLE = { transform: 'rotate(45deg)', boxShadow: '0 0 20px rgba(99, 102, 241, 0.5)' } as const;
+const SECTION_DIVIDER_PINK_GLOW_STYLE = { boxShadow: '0 0 10px rgba(236, 72, 153, 0.6)' } as const;
 
-export const SectionDivider: React.FC<SectionDividerProps> = ({ 
+export const SectionDivider: React.FC<SectionDividerProps> = React.memo(({ 
   variant = 'gradient',
   className = ''
 }) => {
@@ -195,10 +197,7 @@ export const SectionDivider: React.FC<SectionDividerProps> = ({
           {/* Center diamond */}
           <motion.div
             className="w-6 h-6 bg-gradient-to-br from-indigo-500 to-purple-500 shadow-lg"
-            style={{ 
-              transform: 'rotate(45deg)',
-              boxShadow: '0 0 20px rgba(99, 102, 241, 0.5)',
-            }}
+            style={SECTION_DIVIDER_CENTER_DIAMOND_STYLE}
             animate={{
               rotate: [45, 135, 225, 315, 405],
               scale: [1, 1.1, 1],
@@ -211,9 +210,7 @@ export const SectionDivider: React.FC<SectionDividerProps> = ({
             <motion.div
               key={i}
               className="absolute w-2 h-2 rounded-full bg-gradient-to-r from-pink-500 to-purple-500"
-              style={{
-                boxShadow: '0 0 10px rgba(236, 72, 153, 0.6)',
-              }}
+              style={SECTION_DIVIDER_PINK_GLOW_STYLE}
               animate={{
                 rotate: 360,
               }}
@@ -301,6 +298,6 @@ export const SectionDivider: React.FC<SectionDividerProps> = ({
       />
     </div>
   );
-};
+});
 
 SectionDivider.displayName = 'SectionDivider';
@@ -7,6 +7,8 @@ interface Service {
   icon: React.ReactNode;
 }
 
+const SERVICES_GRID_PRESERVE_3D_STYLE = { transformStyle: 'preserve-3d', willChange: 'transform' } as const;
+
 export const ServicesGrid: React.FC = React.memo(() => {
   const { t } = useI18n();
 
@@ -65,10 +67,7 @@ export const ServicesGrid: React.FC = React.memo(() => {
           <div
             key={idx}
             className="group relative p-8 rounded-2xl bg-[#050505] border border-white/5 hover:border-supporting-500/30 ease-smooth hover:-translate-y-1 overflow-hidden visual-depth-2 interactive-element"
-            style={{ 
-              transformStyle: 'preserve-3d',
-              willChange: 'transform'
-            }}
+            style={SERVICES_GRID_PRESERVE_3D_STYLE}
           >
             {/* Gradient background highlight on hover */}
             <div className="absolute inset-0 bg-gradient-to-br from-supporting-500/5 to-primary-500/5 opacity-0 group-hover:opacity-100 ease-smooth" />
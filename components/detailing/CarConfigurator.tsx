@@ -22,7 +22,7 @@ function Model() {
   );
 }
 
-const CarConfigurator: React.FC = () => {
+const CarConfigurator: React.FC = React.memo(() => {
   return (
     <div className="w-full h-full relative">
       <Canvas 
@@ -60,6 +60,8 @@ const CarConfigurator: React.FC = () => {
       </div>
     </div>
   );
-};
+});
+
+CarConfigurator.displayName = 'CarConfigurator';
 
 export default CarConfigurator;
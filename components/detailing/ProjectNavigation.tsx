@@ -2,7 +2,7 @@ import React from 'react';
 import { Link } from 'react-router-dom';
 import { useI18n } from '../../i18n';
 
-const ProjectNavigation: React.FC = () => {
+const ProjectNavigation: React.FC = React.memo(() => {
   const { t } = useI18n();
 
   return (
@@ -28,6 +28,8 @@ const ProjectNavigation: React.FC = () => {
       </div>
     </header>
   );
-};
+});
+
+ProjectNavigation.displayName = 'ProjectNavigation';
 
 export default ProjectNavigation;
@@ -6,7 +6,7 @@ import { Link } from 'react-router-dom';
 import OptimizedImage from '../OptimizedImage';
 import LazyGradientShaderCard from '../LazyGradientShaderCard';
 
-const BentoGrid: React.FC = () => {
+const BentoGrid: React.FC = React.memo(() => {
   const { t } = useI18n();
   const mainProject = PROJECTS[0]; // Detailing Hub
   const secondaryProject = PROJECTS[2]; // Barbershop
@@ -172,6 +172,8 @@ const BentoGrid: React.FC = () => {
       </div>
     </section>
   );
-};
+});
+
+BentoGrid.displayName = 'BentoGrid';
 
 export default BentoGrid;
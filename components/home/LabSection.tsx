@@ -5,7 +5,12 @@ import { Orbit, Brain, ArrowUpRight } from 'lucide-react';
 
 const GradientShaderCard = React.lazy(() => import('../GradientShaderCard'));
 
-const LabSection: React.FC = () => {
+const LAB_SECTION_BACKGROUND_PATTERN_STYLE = {
+  backgroundImage: `radial-gradient(circle at 2px 2px, rgba(255,255,255,0.8) 1px, transparent 0)`,
+  backgroundSize: '20px 20px',
+} as const;
+
+const LabSection: React.FC = React.memo(() => {
   const { t } = useI18n();
 
   const cards = [
@@ -104,10 +109,7 @@ const LabSection: React.FC = () => {
                 <div className={`relative h-full p-6 rounded-2xl bg-gradient-to-br ${card.gradient} ${card.hoverGradient} border ${card.borderColor} ${card.hoverBorderColor} transition-all duration-500 overflow-hidden`}>
                   {/* Background Pattern */}
                   <div className="absolute inset-0 opacity-[0.03]"
-                    style={{
-                      backgroundImage: `radial-gradient(circle at 2px 2px, rgba(255,255,255,0.8) 1px, transparent 0)`,
-                      backgroundSize: '20px 20px'
-                    }}
+                    style={LAB_SECTION_BACKGROUND_PATTERN_STYLE}
                   />
                   
                   {/* Content */}
@@ -147,6 +149,8 @@ const LabSection: React.FC = () => {
       </div>
     </section>
   );
-};
+});
+
+LabSection.displayName = 'LabSection';
 
 export default LabSection;
@@ -0,0 +1,6 @@
+"""Python tooling for repairing and analysing the portfolio source tree.
+
+The one-off ``fix_*.py`` scripts at the repo root grew their own copies of
+``read_file``/``write_file`` and fixed path lists. Everything here is shared
+infrastructure those scripts now sit on top of.
+"""
@@ -0,0 +1,188 @@
+"""One entry point for the tooling: ``python -m devtools <command> [args]``.
+
+Each command names the module that implements it. Only that module is
+imported, so ``scan`` does not pay for the tokenizer, the rule modules or
+multiprocessing. Arguments after the command go to the module's own
+``main``. ``fix`` runs the codemod engine over the rule modules named after
+it (``devtools.rules.load``). It has no default: most modules are one-off
+repairs of a particular file, and re-running them is not safe.
+
+Two selectors restrict commands that work per file (scan, fix, tests):
+
+- ``--paths FILE...`` lists the files explicitly.
+- ``--changed-since REF`` takes the files ``git diff REF`` reports, plus
+  untracked files.
+
+Either list is filtered by the command's own globs (or by the rules' globs
+for ``fix``), and an empty selection exits 0 at once. That makes a
+pre-commit hook cheap:
+
+    python -m devtools scan --changed-since HEAD
+    python -m devtools fix errors codebase --dry-run
+    python -m devtools fix hot_state --changed-since origin/main
+    python -m devtools tests --paths tests/PerformanceOptimizations.test.tsx
+    python -m devtools graph --check
+    python -m devtools undo last
+"""
+from __future__ import annotations
+
+import os
+import sys
+from typing import NamedTuple, Optional, Sequence
+
+
+class Command(NamedTuple):
+    module: str
+    summary: str
+    globs: Optional[str] = None   # module attribute the selectors filter by; None: takes no file selection
+    argv: tuple[str, ...] = ()    # arguments put in front of the user's
+
+
+COMMANDS = {
+    'scan': Command('devtools.scanner', 'conflict markers and code smells', 'DEFAULT_GLOBS'),
+    'fix': Command('devtools.engine', 'run the named codemod rule modules: fix MODULE...', ''),
+    'tests': Command('devtools.testsuite', 'describe/it structure of tests/, --fix to repair', 'GLOBS'),
+    'i18n': Command('devtools.i18n', 'missing, extra and duplicate translation keys'),
+    'i18n-usage': Command('devtools.i18n_usage', 't() keys used in code vs the dictionary'),
+    'i18n-chunks': Command('devtools.i18n_chunks', 'write the per-language dictionary modules'),
+    'graph': Command('devtools.graph', 'heavy packages on the eager import path'),
+    'bench': Command('devtools.bench', 'benchmark the tooling on synthetic trees'),
+    'balance': Command('devtools.balance', 'first bracket or JSX imbalance per file'),
+    'tsc': Command('devtools.tsc', 'fixes driven by tsc output'),
+    'hot-state': Command('devtools.hot_state', 'per-event state updates'),
+    'style-hoist': Command('devtools.style_hoist', 'constant inline styles'),
+    'memo': Command('devtools.memoize', 'React.memo candidates'),
+    'similar': Command('devtools.similar', 'near-duplicate files and functions'),
+    'screenshots': Command('devtools.screenshots', 'perceptual-hash index of e2e screenshots'),
+    'precache': Command('devtools.precache', 'service worker precache manifest'),
+    'watch': Command('devtools.watch', 're-check files as they change'),
+    'journal': Command('devtools.journal', 'list, show and garbage-collect recorded codemod runs'),
+    'undo': Command('devtools.journal', 'restore the files a codemod run overwrote: undo RUN-ID', argv=('undo',)),
+}
+
+
+class SelectionError(Exception):
+    """A selector was given to a command that takes none, or git failed."""
+
+
+def changed_files(root: str, ref: str) -> list[str]:
+    """Files changed since ``ref`` (committed, staged or not) and untracked files, relative to ``root``."""
+    import subprocess
+
+    def git(*args: str) -> list[str]:
+        try:
+            out = subprocess.run(['git', '-C', root, *args], capture_output=True, text=True, check=True).stdout
+        except (OSError, subprocess.CalledProcessError) as e:
+            raise SelectionError(f'git {" ".join(args)}: {getattr(e, "stderr", "") or e}'.strip()) from None
+        return [line for line in out.splitlines() if line]
+
+    changed = git('diff', '--name-only', '--relative', '--diff-filter=d', ref, '--')
+    return sorted(set(changed) | set(git('ls-files', '--others', '--exclude-standard')))
+
+
+def split_selectors(argv: Sequence[str]) -> tuple[list[str], Optional[list[str]], Optional[str], str]:
+    """Take ``--paths``, ``--changed-since`` and ``--root`` out of ``argv``.
+
+    Returns ``(remaining args, paths or None, ref or None, root)``. ``--root``
+    stays in the remaining args too, since every command accepts it.
+    """
+    rest: list[str] = []
+    paths: Optional[list[str]] = None
+    ref = None
+    root = '.'
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == '--paths':
+            paths = paths or []
+            i += 1
+            while i < len(argv) and not argv[i].startswith('-'):
+                paths.append(argv[i])
+                i += 1
+            continue
+        if arg.startswith('--changed-since'):
+            if '=' in arg:
+                ref = arg.split('=', 1)[1]
+            elif i + 1 < len(argv):
+                ref = argv[i + 1]
+                i += 1
+            else:
+                raise SelectionError('--changed-since needs a git ref')
+            i += 1
+            continue
+        if arg == '--root' and i + 1 < len(argv):
+            root = argv[i + 1]
+        elif arg.startswith('--root='):
+            root = arg.split('=', 1)[1]
+        rest.append(arg)
+        i += 1
+    return rest, paths, ref, root
+
+
+def _usage() -> str:
+    width = max(map(len, COMMANDS))
+    lines = ['usage: python -m devtools COMMAND [--paths FILE... | --changed-since REF] [ARGS...]', '', 'commands:']
+    lines += [f'  {name:<{width}}  {cmd.summary}' for name, cmd in COMMANDS.items()]
+    lines += ['', "Run 'python -m devtools COMMAND --help' for a command's own options."]
+    return '\n'.join(lines)
+
+
+def _fix(argv: list[str], selected: Optional[list[str]]) -> int:
+    from .engine import main as run_rules
+    from .rules import MODULES, load
+    names = []
+    while argv and argv[0] in MODULES:
+        names.append(argv.pop(0))
+    if not names:
+        print(f'usage: python -m devtools fix MODULE... [ARGS...]\nmodules: {", ".join(MODULES)}', file=sys.stderr)
+        return 2
+    rules = load(*names)
+    if selected is not None:
+        selected = [rel for rel in selected if any(r.matches(rel) for r in rules)]
+        if not selected:
+            return 0
+        argv = argv + selected
+    return run_rules(rules, argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or argv[0] in ('-h', '--help'):
+        print(_usage())
+        return 0
+    name, args = argv[0], argv[1:]
+    command = COMMANDS.get(name)
+    if command is None:
+        print(f'unknown command {name!r}\n\n{_usage()}', file=sys.stderr)
+        return 2
+    try:
+        args, paths, ref, root = split_selectors(args)
+        if (paths is not None or ref is not None) and command.globs is None:
+            raise SelectionError(f'{name} does not take --paths or --changed-since')
+        selected = None
+        if paths is not None or ref is not None:
+            selected = list(paths or [])
+            if ref is not None:
+                selected += changed_files(root, ref)
+            selected = [os.path.normpath(p).replace(os.sep, '/') for p in selected]
+    except SelectionError as e:
+        print(f'devtools {name}: {e}', file=sys.stderr)
+        return 2
+
+    if selected == []:
+        return 0
+    if name == 'fix':
+        return _fix(args, selected)
+    module = __import__(command.module, fromlist=['main'])
+    if selected is not None:
+        from .engine import filter_paths
+        selected = [rel for rel in filter_paths(selected, getattr(module, command.globs))
+                    if os.path.isfile(os.path.join(root, rel))]
+        if not selected:
+            return 0
+        args = args + selected
+    return module.main([*command.argv, *args])
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,179 @@
+"""Declarative anchor patches: find every anchor in one scan, splice once.
+
+fix_codebase.py and fix_errors_2.py repaired blocks with chains of
+``find`` / ``rfind`` calls, and every lookup rescanned the file. An
+``AnchorPatch`` says the same thing as data instead:
+
+- ``start``: a chain of anchors. Each one is searched after the previous
+  one, and the last one marks where the replaced span begins.
+- ``end``: a chain searched after the start; its last anchor marks where
+  the span ends.
+- ``keep_start`` / ``keep_end``: whether the anchor text itself is kept
+  (the span begins after the start anchor, or ends before the end anchor).
+- ``replacement``: the new text for the span.
+
+Each ``Anchor`` has an ``occurrence``: 0 is the first match after the
+previous anchor, -1 the last, and so on. ``None`` (the default) requires
+exactly one match and reports ambiguity otherwise.
+
+``PatchSet.apply`` collects the literal text of every anchor of every
+patch into one alternation and finds all of their positions in a single
+pass. Each patch is then resolved with bisection, and the result is built
+with one join. A patch that cannot be resolved is reported in
+``problems`` and not applied. So is one that overlaps an earlier patch in
+the set.
+
+    HERO = PatchSet([AnchorPatch(
+        'hero-orbs-repair',
+        start=(Anchor('{/* Floating Orbs */}', 0), Anchor('))}', 0)),
+        end=(Anchor('{/* Animated Background Elements */}', -1),),
+        replacement=MIDDLE, keep_start=True)])
+"""
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional, Sequence, Union
+
+
+class Anchor(NamedTuple):
+    text: str
+    occurrence: Optional[int] = None   # None: must be unique; 0 first, -1 last, ...
+
+
+AnchorLike = Union[Anchor, str]
+
+
+class PatchError(Exception):
+    """An anchor is missing or ambiguous."""
+
+
+@dataclass(frozen=True)
+class AnchorPatch:
+    name: str
+    start: Union[AnchorLike, Sequence[AnchorLike]]
+    end: Union[AnchorLike, Sequence[AnchorLike]]
+    replacement: str
+    keep_start: bool = False
+    keep_end: bool = True
+
+
+class Splice(NamedTuple):
+    patch: str
+    start: int
+    end: int
+    replacement: str
+
+
+@dataclass
+class PatchResult:
+    text: str
+    splices: list[Splice] = field(default_factory=list)
+    problems: list[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.splices)
+
+
+def _anchors(chain: Union[AnchorLike, Sequence[AnchorLike]]) -> list[Anchor]:
+    if isinstance(chain, (str, Anchor)):   # a single anchor is a chain of one
+        chain = (chain,)
+    return [a if isinstance(a, Anchor) else Anchor(a) for a in chain]
+
+
+class PatchSet:
+    def __init__(self, patches: Sequence[AnchorPatch]):
+        if len({p.name for p in patches}) != len(patches):
+            raise ValueError('patch names must be unique within a PatchSet')
+        self.patches = list(patches)
+        for p in self.patches:
+            if not p.start or not p.end:
+                raise ValueError(f'patch {p.name!r}: start and end need at least one anchor')
+        literals = sorted({a.text for p in self.patches for a in _anchors(p.start) + _anchors(p.end)},
+                          key=len, reverse=True)
+        if not all(literals):
+            raise ValueError('anchors must not be empty')
+        self.literals = literals
+        # Zero-width lookahead, so anchors that overlap each other are all found.
+        self._scan = re.compile('(?=' + '|'.join(map(re.escape, literals)) + ')')
+
+    def positions(self, text: str) -> dict[str, list[int]]:
+        """Every offset of every anchor, from one pass over ``text``."""
+        found: dict[str, list[int]] = {lit: [] for lit in self.literals}
+        for m in self._scan.finditer(text):
+            pos = m.start()
+            # The alternation reports one literal per offset; others may start there too.
+            for lit in self.literals:
+                if text.startswith(lit, pos):
+                    found[lit].append(pos)
+        return found
+
+    @staticmethod
+    def _locate(chain: list[Anchor], positions: dict[str, list[int]], after: int) -> tuple[int, int]:
+        """``(start, end)`` of the last anchor of ``chain``, each searched after the one before."""
+        start = end = after
+        for a in chain:
+            offsets = positions[a.text]
+            candidates = offsets[bisect_left(offsets, end):]
+            where = f' after offset {end}' if end else ''
+            if not candidates:
+                raise PatchError(f'anchor {a.text!r} not found{where}')
+            if a.occurrence is None:
+                if len(candidates) > 1:
+                    raise PatchError(f'anchor {a.text!r} is ambiguous: {len(candidates)} matches{where}')
+                start = candidates[0]
+            else:
+                try:
+                    start = candidates[a.occurrence]
+                except IndexError:
+                    raise PatchError(f'anchor {a.text!r}: occurrence {a.occurrence} requested, '
+                                     f'{len(candidates)} found{where}') from None
+            end = start + len(a.text)
+        return start, end
+
+    def resolve(self, patch: AnchorPatch, positions: dict[str, list[int]]) -> Splice:
+        s_start, s_end = self._locate(_anchors(patch.start), positions, 0)
+        lo = s_end if patch.keep_start else s_start
+        e_start, e_end = self._locate(_anchors(patch.end), positions, s_end)
+        hi = e_start if patch.keep_end else e_end
+        return Splice(patch.name, lo, hi, patch.replacement)
+
+    def apply(self, text: str) -> PatchResult:
+        result = PatchResult(text)
+        positions = self.positions(text)
+        taken: list[Splice] = []
+        for patch in self.patches:
+            try:
+                splice = self.resolve(patch, positions)
+            except PatchError as e:
+                result.problems.append(f'{patch.name}: {e}')
+                continue
+            other = next((t for t in taken if splice.start < t.end and t.start < splice.end), None)
+            if other is not None:
+                result.problems.append(f'{patch.name}: overlaps {other.patch} '
+                                       f'({splice.start}-{splice.end} vs {other.start}-{other.end}); skipped')
+                continue
+            taken.append(splice)
+        pieces = []
+        last = 0
+        for s in sorted(taken, key=lambda s: s.start):
+            if text[s.start:s.end] == s.replacement:
+                continue
+            pieces.append(text[last:s.start])
+            pieces.append(s.replacement)
+            last = s.end
+            result.splices.append(s)
+        if result.splices:
+            pieces.append(text[last:])
+            result.text = ''.join(pieces)
+        return result
+
+    def apply_ctx(self, ctx) -> str:
+        """Engine adapter: patch ``ctx.text``, report the splice count and log problems."""
+        result = self.apply(ctx.text)
+        ctx.count(len(result.splices))
+        for problem in result.problems:
+            ctx.log(problem)
+        return result.text
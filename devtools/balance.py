@@ -0,0 +1,143 @@
+"""Bracket and JSX balance checker on top of the tokenizer.
+
+Reports the first unmatched ``(``, ``[``, ``{``, ``${`` or JSX tag with its
+exact position, using the same codes and wording as tsc (TS1005, TS1128,
+TS17002, TS17008) so the output reads like ``typecheck_output_final.txt``
+without running tsc. Only the first problem is reported: after an
+imbalance any further "errors" are guesses about the author's intent.
+
+    python -m devtools.balance components/CardStack.tsx
+    components/CardStack.tsx(239,2): error TS1005: ')' expected.
+      components/CardStack.tsx(169,54): The opening bracket is here.
+
+The output parses as tsc diagnostics, so it can be piped into the tsc-driven
+fixers: ``python -m devtools.balance ... | python -m devtools.tsc - --fix``.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import NamedTuple, Optional, Sequence
+
+from .cache import Cache, fingerprint, module_version
+from .tokenizer import (ERROR, IDENT, JSX_CLOSE, JSX_OPEN, JSX_SELF_CLOSE, PUNCT,
+                        is_jsx_path, tokenize)
+
+_CLOSER = {'(': ')', '[': ']', '{': '}', '${': '}'}
+_OPENERS = frozenset(_CLOSER)
+_CLOSERS = frozenset(_CLOSER.values())
+
+
+class Diagnostic(NamedTuple):
+    code: str
+    message: str
+    offset: int
+    line: int
+    col: int
+    # (line, col) of the bracket or tag the message refers to, if elsewhere.
+    related: Optional[tuple[int, int]] = None
+
+    def format(self, path: str) -> str:
+        """tsc's plain output: the related location goes on an indented line,
+        which ``devtools.tsc.parse`` keeps apart from the message."""
+        out = f'{path}({self.line},{self.col}): error {self.code}: {self.message}'
+        if self.related:
+            out += f'\n  {path}({self.related[0]},{self.related[1]}): The opening bracket is here.'
+        return out
+
+
+def line_col(text: str, offset: int) -> tuple[int, int]:
+    line = text.count('\n', 0, offset) + 1
+    return line, offset - text.rfind('\n', 0, offset)
+
+
+def _diag(text: str, code: str, message: str, offset: int, related: Optional[int] = None) -> Diagnostic:
+    line, col = line_col(text, offset)
+    return Diagnostic(code, message, offset, line, col, line_col(text, related) if related is not None else None)
+
+
+def _unclosed(text: str, entry: tuple) -> Diagnostic:
+    kind, value, offset, _ = entry
+    if kind == 'jsx':
+        return _diag(text, 'TS17008', f"JSX element '{value}' has no corresponding closing tag.", offset)
+    return _diag(text, 'TS1005', f"'{_CLOSER[kind]}' expected.", len(text), offset)
+
+
+def check(text: str, jsx: bool = True) -> Optional[Diagnostic]:
+    """First bracket/JSX imbalance in ``text``, or ``None`` if it is balanced."""
+    # Entries are (kind, tag name, offset, opened by `for`).
+    stack: list[tuple[str, str, int, bool]] = []
+    prev = None
+    for tok in tokenize(text, jsx=jsx):
+        kind, value, start = tok.kind, tok.value, tok.start
+        if kind == PUNCT:
+            if value in _OPENERS:
+                stack.append((value, '', start, value == '(' and prev is not None
+                              and prev.kind == IDENT and prev.value == 'for'))
+            elif value in _CLOSERS:
+                if not stack:
+                    return _diag(text, 'TS1128', 'Declaration or statement expected.', start)
+                top = stack[-1]
+                if top[0] == 'jsx':
+                    return _unclosed(text, top)
+                if _CLOSER[top[0]] != value:
+                    return _diag(text, 'TS1005', f"'{_CLOSER[top[0]]}' expected.", start, top[2])
+                stack.pop()
+            elif value == ';' and stack and stack[-1][0] in ('(', '[') and not stack[-1][3]:
+                # `};` where `});` was meant: a statement can't end inside ( or [.
+                return _diag(text, 'TS1005', f"'{_CLOSER[stack[-1][0]]}' expected.", start, stack[-1][2])
+        elif kind == JSX_OPEN:
+            stack.append(('jsx', value, start, False))
+        elif kind == JSX_SELF_CLOSE:
+            if not stack or stack[-1][0] != 'jsx':
+                return _unclosed(text, stack[-1]) if stack else _diag(text, 'TS1128', 'Declaration or statement expected.', start)
+            stack.pop()
+        elif kind == JSX_CLOSE:
+            if not stack:
+                return _diag(text, 'TS1128', 'Declaration or statement expected.', start)
+            top = stack[-1]
+            if top[0] != 'jsx':
+                return _unclosed(text, top)
+            if top[1] != value:
+                if any(e[0] == 'jsx' and e[1] == value for e in stack):
+                    return _unclosed(text, top)
+                return _diag(text, 'TS17002', f"Expected corresponding JSX closing tag for '{top[1]}'.", start, top[2])
+            stack.pop()
+        elif kind == ERROR:
+            code, _, message = value.partition(': ')
+            return _diag(text, code, message, start)
+        prev = tok
+    if stack:
+        return _unclosed(text, stack[-1])
+    return None
+
+
+def check_file(path: str, cache: Optional[Cache] = None) -> Optional[Diagnostic]:
+    """``check`` on a file; with a cache, unchanged files are not re-tokenized."""
+    jsx = is_jsx_path(path)
+    if cache is None:
+        with open(path, 'r', encoding='utf-8') as f:
+            return check(f.read(), jsx=jsx)
+    version = fingerprint(module_version(__name__), module_version(tokenize.__module__))
+    value = cache.memoize('scan:balance', version, path, lambda text: list(check(text, jsx=jsx) or ()))
+    if not value:
+        return None
+    related = value[5]
+    return Diagnostic(*value[:5], tuple(related) if related else None)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Report the first bracket/JSX imbalance in each file.')
+    parser.add_argument('paths', nargs='+')
+    args = parser.parse_args(argv)
+    failed = 0
+    for path in args.paths:
+        diag = check_file(path)
+        if diag:
+            failed += 1
+            print(diag.format(path))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
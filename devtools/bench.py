@@ -0,0 +1,359 @@
+"""Benchmarks for the Python tooling on synthetic TSX trees.
+
+``generate`` writes a deterministic tree of N components. Most files are
+ordinary components; a seeded fraction carry what the fix scripts exist
+for:
+
+- duplicated inline style props (fix_errors_2)
+- ``React.memo`` wrappers missing their ``)`` (fix_codebase)
+- a merge-duplicated Hero block (fix_codebase's anchor patching)
+- conflict markers (analyze_syntax)
+- a few large trilingual ``translations`` blobs (the i18n checks)
+
+Each workload runs in a fresh child process, so peak RSS (the process's
+own plus its pool workers') belongs to that workload alone:
+
+- ``scan``: marker scan plus bracket balance of every file, uncached (analyze_syntax)
+- ``scan-warm``: the same against a populated cache
+- ``rewrite``: the fix_errors_2 rewriter rules over every component
+- ``anchor``: fix_codebase's anchor and balance-driven rules over every component
+- ``i18n``: parse and cross-check every translations blob
+
+Results are compared with ``benchmarks/devtools_baseline.json`` and can
+be written as JSON:
+
+    python -m devtools.bench --sizes 1000 10000 --json bench.json
+    python -m devtools.bench --save-baseline
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Optional, Sequence
+
+DEFAULT_SIZES = (1000, 10000, 50000)
+WORKLOADS = ('scan', 'scan-warm', 'rewrite', 'anchor', 'i18n')
+BASELINE = 'benchmarks/devtools_baseline.json'
+FILES_PER_DIR = 500
+COMPONENT_GLOB = 'components/**/*.tsx'
+
+_WORDS = ('motion', 'card', 'grid', 'hero', 'panel', 'stack', 'glow', 'orb', 'menu', 'link', 'title', 'label')
+_RU = ('Услуги', 'Работы', 'Контакт', 'Главная', 'Лаборатория', 'Связаться', 'Проекты', 'О нас')
+_CS = ('Služby', 'Práce', 'Kontakt', 'Domů', 'Laboratoř', 'Spustit', 'Projekty', 'O nás')
+
+COMPONENT = """import React, {{ useState }} from 'react';
+import {{ useI18n }} from '../../i18n';
+
+interface {name}Props {{
+  title?: string;
+  items?: string[];
+}}
+
+const WAVE_SVG_STYLE = {{ height: '50%' }};
+
+export const {name}: React.FC<{name}Props> = ({{ title, items = [] }}) => {{
+  const {{ t }} = useI18n();
+  const [open, setOpen] = useState(false);
+
+  return (
+    <section className="relative py-24 px-6" aria-label={{t('{key}.label')}}>
+      <h2 className="text-4xl font-bold">{{title ?? t('{key}.title')}}</h2>
+      <svg {style}>
+        <path d="M0 0 L100 100" />
+      </svg>
+      <ul>
+        {{items.map((item, i) => (
+          <li key={{i}} onClick={{() => setOpen(!open)}}>{{item}}</li>
+        ))}}
+      </ul>
+    </section>
+  );
+}};
+"""
+MEMO = """
+export const {name}Memo = React.memo(() => {{
+  return <div className="memo">{{'{key}'}}</div>;
+}};
+"""
+HERO = """
+export const {name}Hero = () => (
+  <div>
+    {{/* Floating Orbs */}}
+    {{orbs.map((o) => (
+      <span key={{o}} />
+    ))}}
+    <div className="duplicated">stale merge leftovers</div>
+    {{/* Animated Background Elements */}}
+    <div className="bg" />
+  </div>
+);
+"""
+CONFLICT = """
+<<<<<<< HEAD
+const variant = 'a';
+=======
+const variant = 'b';
+>>>>>>> feature
+"""
+
+
+# --------------------------------------------------------------------------
+# Tree generation
+# --------------------------------------------------------------------------
+
+def generate(root: str, files: int, seed: int = 0) -> dict:
+    """Write ``files`` components under ``root``; returns counts per feature."""
+    rng = random.Random(seed)
+    counts = {'files': 0, 'bytes': 0, 'style': 0, 'memo': 0, 'hero': 0, 'conflict': 0, 'i18n': 0}
+    blobs = max(1, files // 1000)
+    blob_at = set(rng.sample(range(files), blobs))
+    for i in range(files):
+        directory = os.path.join(root, 'components', f'group{i // FILES_PER_DIR:03d}')
+        if i % FILES_PER_DIR == 0:
+            os.makedirs(directory, exist_ok=True)
+        name = f'{rng.choice(_WORDS).title()}{rng.choice(_WORDS).title()}{i}'
+        if i in blob_at:
+            text = _i18n_blob(rng, 600)
+            counts['i18n'] += 1
+        else:
+            text = _component(rng, name, counts)
+        data = text.encode('utf-8')
+        with open(os.path.join(directory, f'{name}.tsx'), 'wb') as f:
+            f.write(data)
+        counts['files'] += 1
+        counts['bytes'] += len(data)
+    return counts
+
+
+def _component(rng: random.Random, name: str, counts: dict) -> str:
+    key = f'{rng.choice(_WORDS)}.{rng.choice(_WORDS)}'
+    style = 'style={WAVE_SVG_STYLE}'
+    roll = rng.random()
+    if roll < 0.02:
+        style = "style={{ height: '50%' }} style={WAVE_SVG_STYLE}"
+        counts['style'] += 1
+    text = COMPONENT.format(name=name, key=key, style=style)
+    if 0.02 <= roll < 0.03:
+        text += MEMO.format(name=name, key=key)
+        counts['memo'] += 1
+    elif 0.03 <= roll < 0.035:
+        text += HERO.format(name=name)
+        counts['hero'] += 1
+    elif 0.035 <= roll < 0.04:
+        text += CONFLICT
+        counts['conflict'] += 1
+    return text
+
+
+def _i18n_blob(rng: random.Random, keys: int) -> str:
+    names = [f'{rng.choice(_WORDS)}.{rng.choice(_WORDS)}.{i}' for i in range(keys)]
+    out = ["import React from 'react';\n\nexport type Lang = 'en' | 'ru' | 'cs';\n\n"
+           'const translations: Record<Lang, Record<string, string>> = {\n']
+    for lang, vocab in (('en', _WORDS), ('ru', _RU), ('cs', _CS)):
+        out.append(f'  {lang}: {{\n')
+        for k in names:
+            value = ' '.join(rng.choice(vocab) for _ in range(rng.randint(2, 8))).replace("'", "\\'")
+            out.append(f"    '{k}': '{value}',\n")
+        out.append('  },\n')
+    out.append('};\n\nexport default translations;\n')
+    return ''.join(out)
+
+
+# --------------------------------------------------------------------------
+# Workloads (run in a child process)
+# --------------------------------------------------------------------------
+
+def _component_rules(*names: str):
+    """Registered rules ``names`` retargeted at every generated component."""
+    from .engine import REGISTRY
+    from .rules import load
+    load()
+    return [dataclasses.replace(REGISTRY[n], name=f'bench-{n}', patterns=(COMPONENT_GLOB,)) for n in names]
+
+
+def _run_rules(root: str, rules, jobs: Optional[int]) -> int:
+    from .engine import run
+    errors = 0
+    for res in run(rules, root, jobs=jobs):
+        errors += res.error is not None
+    return errors
+
+
+def _scan(root: str, jobs: Optional[int], cache=None) -> int:
+    from .balance import check_file
+    from .scanner import scan_tree
+    errors = 0
+    for path, hits, error in scan_tree(root, globs=(COMPONENT_GLOB,), cache=cache, jobs=jobs):
+        errors += error is not None
+        check_file(path if cache is not None else os.path.join(root, path), cache)
+    return errors
+
+
+def prepare(name: str, root: str, jobs: Optional[int]) -> None:
+    """Untimed setup: ``scan-warm`` measures a second pass over a filled cache."""
+    if name == 'scan-warm':
+        from .cache import Cache
+        with Cache(root) as cache:
+            _scan(root, jobs, cache)
+
+
+def workload(name: str, root: str, jobs: Optional[int]) -> int:
+    """Run one workload over the tree at ``root``; returns the error count."""
+    if name == 'scan':
+        return _scan(root, jobs)
+    if name == 'scan-warm':
+        from .cache import Cache
+        with Cache(root) as cache:
+            return _scan(root, jobs, cache)
+    if name == 'rewrite':
+        return _run_rules(root, _component_rules('duplicate-style-props', 'batched-update-any'), jobs)
+    if name == 'anchor':
+        return _run_rules(root, _component_rules('hero-orbs-repair', 'memo-trailing-close'), jobs)
+    if name == 'i18n':
+        from .engine import iter_files
+        from .i18n import analyze, load_table
+        for rel in iter_files(root, (COMPONENT_GLOB,)):
+            with open(os.path.join(root, rel), 'r', encoding='utf-8') as f:
+                head = f.read(4096)
+            if 'const translations' in head:
+                analyze(load_table(os.path.join(root, rel)))
+        return 0
+    raise ValueError(f'unknown workload {name!r}')
+
+
+def _child(name: str, root: str, jobs: Optional[int]) -> int:
+    prepare(name, root, jobs)
+    start = time.perf_counter()
+    errors = workload(name, root, jobs)
+    seconds = time.perf_counter() - start
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    if sys.platform == 'darwin':   # bytes there, KiB on Linux
+        peak //= 1024
+    print(json.dumps({'seconds': seconds, 'peak_rss_kb': peak, 'errors': errors}))
+    return 0
+
+
+def measure(name: str, root: str, jobs: Optional[int]) -> dict:
+    """Run one workload in a fresh interpreter and return its measurements."""
+    cmd = [sys.executable, '-m', 'devtools.bench', '--child', name, '--tree', root]
+    if jobs:
+        cmd += ['--jobs', str(jobs)]
+    proc = subprocess.run(cmd, capture_output=True, text=True, cwd=_package_root())
+    if proc.returncode != 0:
+        raise RuntimeError(f'workload {name} failed:\n{proc.stderr}')
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _package_root() -> str:
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# --------------------------------------------------------------------------
+# Harness
+# --------------------------------------------------------------------------
+
+def load_baseline(path: str) -> dict:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('results', {})
+    except FileNotFoundError:
+        return {}
+
+
+def bench(sizes: Sequence[int], workloads: Sequence[str] = WORKLOADS, jobs: Optional[int] = None,
+          baseline: Optional[dict] = None, tree_dir: Optional[str] = None, seed: int = 0,
+          log=sys.stderr) -> list[dict]:
+    baseline = baseline or {}
+    results = []
+    for size in sizes:
+        root = tempfile.mkdtemp(prefix=f'devtools-bench-{size}-', dir=tree_dir)
+        try:
+            start = time.perf_counter()
+            counts = generate(root, size, seed)
+            print(f'generated {size} files ({counts["bytes"] / 1e6:.1f} MB) in '
+                  f'{time.perf_counter() - start:.1f}s', file=log)
+            for name in workloads:
+                m = measure(name, root, jobs)
+                seconds = m['seconds']
+                key = f'{name}@{size}'
+                base = baseline.get(key, {}).get('seconds')
+                row = {
+                    'key': key, 'workload': name, 'files': counts['files'], 'bytes': counts['bytes'],
+                    'seconds': round(seconds, 4),
+                    'files_per_s': round(counts['files'] / seconds, 1) if seconds else None,
+                    'mb_per_s': round(counts['bytes'] / 1e6 / seconds, 2) if seconds else None,
+                    'peak_rss_kb': m['peak_rss_kb'], 'errors': m['errors'],
+                    'baseline_seconds': base,
+                    'delta_pct': round((seconds - base) / base * 100, 1) if base else None,
+                }
+                results.append(row)
+                print(_format_row(row), file=log)
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+    return results
+
+
+def _format_row(row: dict) -> str:
+    delta = f'{row["delta_pct"]:+.1f}%' if row['delta_pct'] is not None else 'n/a'
+    return (f'{row["key"]:<18} {row["seconds"]:>9.3f}s {row["files_per_s"] or 0:>10.0f} files/s '
+            f'{row["mb_per_s"] or 0:>8.2f} MB/s {row["peak_rss_kb"] / 1024:>8.1f} MB peak  {delta}')
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the Python tooling on synthetic trees.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--workloads', nargs='+', choices=WORKLOADS, default=list(WORKLOADS))
+    parser.add_argument('-j', '--jobs', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--tree-dir', default=None, help='where to generate trees (default: system temp)')
+    parser.add_argument('--baseline', default=BASELINE, help='baseline file (default: %(default)s)')
+    parser.add_argument('--save-baseline', action='store_true', help='write these results as the new baseline')
+    parser.add_argument('--json', default=None, help="write results as JSON to this file ('-' for stdout)")
+    parser.add_argument('--fail-over', type=float, default=None, metavar='PCT',
+                        help='exit 1 if any workload is more than PCT percent slower than baseline')
+    parser.add_argument('--child', default=None, help=argparse.SUPPRESS)
+    parser.add_argument('--tree', default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        return _child(args.child, args.tree, args.jobs)
+
+    results = bench(args.sizes, args.workloads, args.jobs, load_baseline(args.baseline),
+                    args.tree_dir, args.seed)
+    doc = {
+        'python': platform.python_version(), 'platform': platform.platform(),
+        'cpus': os.cpu_count(), 'jobs': args.jobs, 'seed': args.seed,
+        'results': {row['key']: row for row in results},
+    }
+    if args.json == '-':
+        json.dump(doc, sys.stdout, indent=2)
+        print()
+    elif args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(doc, f, indent=2)
+    if args.save_baseline:
+        merged = {'results': {**load_baseline(args.baseline), **doc['results']}}
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({**doc, **merged}, f, indent=2)
+            f.write('\n')
+    if args.fail_over is not None:
+        slow = [r for r in results if r['delta_pct'] is not None and r['delta_pct'] > args.fail_over]
+        for r in slow:
+            print(f'regression: {r["key"]} {r["delta_pct"]:+.1f}% vs baseline', file=sys.stderr)
+        return 1 if slow else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""Persistent content-hash cache for scans and codemod verdicts.
+
+Entries are keyed by ``(namespace, content hash, version)``. The namespace
+says what was computed (``scan:conflicts``, ``noop``), the version says with
+what code (a rule-set fingerprint, or a constant bumped by hand). A file's
+content hash is itself memoised against its ``(size, mtime_ns)`` so that a
+re-run over an unchanged tree costs one ``stat`` per file.
+
+Storage is a single SQLite file under ``.devtools-cache/``; nothing here is
+shared with worker processes, the engine consults the cache in the parent.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from typing import Any, Callable, Optional
+
+DEFAULT_DIR = '.devtools-cache'
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_AGE = 30 * 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    version TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL,
+    PRIMARY KEY (namespace, hash, version)
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+"""
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def fingerprint(*parts: Any) -> str:
+    """Stable short hash of arbitrary JSON-able parts, for use as a version."""
+    return content_hash(json.dumps(parts, sort_keys=True, default=str).encode())
+
+
+_MODULE_VERSIONS: dict[str, str] = {}
+
+
+def module_version(module_name: str) -> str:
+    """Hash of a module's source file, so editing a rule module invalidates its verdicts."""
+    version = _MODULE_VERSIONS.get(module_name)
+    if version is None:
+        module = sys.modules.get(module_name)
+        path = getattr(module, '__file__', None)
+        try:
+            with open(path, 'rb') as f:
+                version = content_hash(f.read())
+        except (OSError, TypeError):
+            version = module_name
+        _MODULE_VERSIONS[module_name] = version
+    return version
+
+
+class Cache:
+    def __init__(self, root: str = '.', directory: Optional[str] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES, max_age: float = DEFAULT_MAX_AGE):
+        self.root = root
+        self.directory = directory or os.path.join(root, DEFAULT_DIR)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        os.makedirs(self.directory, exist_ok=True)
+        self.db = sqlite3.connect(os.path.join(self.directory, 'cache.sqlite'))
+        self.db.executescript(_SCHEMA)
+        self._now = time.time()
+
+    # -- context manager ---------------------------------------------------
+
+    def __enter__(self) -> 'Cache':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def commit(self) -> None:
+        """Make writes so far visible to other processes (long-lived users)."""
+        if self.db is not None:
+            self.db.commit()
+
+    def close(self) -> None:
+        if self.db is None:
+            return
+        self.evict()
+        self.db.commit()
+        self.db.close()
+        self.db = None
+
+    # -- file hashes -------------------------------------------------------
+
+    def file_hash(self, relpath: str) -> Optional[str]:
+        """Content hash of ``relpath``; re-read only if its stat changed.
+
+        Returns ``None`` if the file does not exist.
+        """
+        path = os.path.join(self.root, relpath)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        row = self.db.execute('SELECT size, mtime_ns, hash FROM files WHERE path = ?', (relpath,)).fetchone()
+        if row is not None and row[0] == st.st_size and row[1] == st.st_mtime_ns:
+            return row[2]
+        with open(path, 'rb') as f:
+            digest = content_hash(f.read())
+        self.record_file(relpath, st.st_size, st.st_mtime_ns, digest)
+        return digest
+
+    def record_file(self, relpath: str, size: int, mtime_ns: int, digest: str) -> None:
+        self.db.execute('INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)',
+                        (relpath, size, mtime_ns, digest, self._now))
+
+    # -- entries -----------------------------------------------------------
+
+    def get(self, namespace: str, digest: str, version: str) -> Any:
+        row = self.db.execute('SELECT value FROM entries WHERE namespace = ? AND hash = ? AND version = ?',
+                              (namespace, digest, version)).fetchone()
+        if row is None:
+            return None
+        self.db.execute('UPDATE entries SET accessed = ? WHERE namespace = ? AND hash = ? AND version = ?',
+                        (self._now, namespace, digest, version))
+        return json.loads(row[0])
+
+    def put(self, namespace: str, digest: str, version: str, value: Any) -> None:
+        blob = json.dumps(value, separators=(',', ':'))
+        self.db.execute('INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)',
+                        (namespace, digest, version, blob, len(blob), self._now))
+
+    def memoize(self, namespace: str, version: str, relpath: str, compute: Callable[[str], Any]) -> Any:
+        """Return ``compute(text)`` for ``relpath``, from cache when its content is unchanged."""
+        digest = self.file_hash(relpath)
+        if digest is None:
+            raise FileNotFoundError(relpath)
+        value = self.get(namespace, digest, version)
+        if value is None:
+            with open(os.path.join(self.root, relpath), 'r', encoding='utf-8') as f:
+                value = compute(f.read())
+            self.put(namespace, digest, version, value)
+        return value
+
+    # -- maintenance -------------------------------------------------------
+
+    def invalidate(self, namespace: Optional[str] = None, prefix: bool = False) -> int:
+        """Drop entries for ``namespace`` (or everything). Returns rows removed."""
+        if namespace is None:
+            cur = self.db.execute('DELETE FROM entries')
+            self.db.execute('DELETE FROM files')
+        elif prefix:
+            cur = self.db.execute("DELETE FROM entries WHERE namespace LIKE ? ESCAPE '\\'",
+                                  (namespace.replace('%', r'\%').replace('_', r'\_') + '%',))
+        else:
+            cur = self.db.execute('DELETE FROM entries WHERE namespace = ?', (namespace,))
+        self.db.commit()
+        return cur.rowcount
+
+    def evict(self, max_bytes: Optional[int] = None, max_age: Optional[float] = None) -> int:
+        """Drop entries older than ``max_age`` seconds, then the least recently
+        used ones until the total stays under ``max_bytes``."""
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        max_age = self.max_age if max_age is None else max_age
+        cutoff = self._now - max_age
+        removed = self.db.execute('DELETE FROM entries WHERE accessed < ?', (cutoff,)).rowcount
+        self.db.execute('DELETE FROM files WHERE accessed < ?', (cutoff,))
+        total = self.db.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+        if total > max_bytes:
+            doomed = []
+            for namespace, digest, version, size in self.db.execute(
+                    'SELECT namespace, hash, version, size FROM entries ORDER BY accessed'):
+                if total <= max_bytes:
+                    break
+                doomed.append((namespace, digest, version))
+                total -= size
+            self.db.executemany('DELETE FROM entries WHERE namespace = ? AND hash = ? AND version = ?', doomed)
+            removed += len(doomed)
+        return removed
+
+    def stats(self) -> dict:
+        entries, size = self.db.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries').fetchone()
+        files = self.db.execute('SELECT COUNT(*) FROM files').fetchone()[0]
+        return {'entries': entries, 'bytes': size, 'files': files}
+
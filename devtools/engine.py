@@ -0,0 +1,485 @@
+"""Codemod engine: rules register once, files are found by glob, and the
+work is spread over a process pool.
+
+A rule is a plain module-level function that takes a ``FileContext`` and
+returns the new text (or ``None`` for "no change"). Rules are registered
+with the ``rule`` decorator and grouped by the module that defines them, so
+a fix script is just a module of rules plus a call to ``main``.
+
+    from devtools.engine import rule
+
+    @rule('mobile-menu-aria', 'components/MobileMenu.tsx')
+    def mobile_menu_aria(ctx):
+        return ctx.text.replace('aria-label="Open navigation menu"', ...)
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional, Sequence
+
+from .cache import Cache, content_hash, fingerprint, module_version
+from .lineindex import LineIndex
+from .output import Batch, stage, unified_diff
+
+# Directories never worth walking into when resolving globs.
+EXCLUDED_DIRS = frozenset({
+    '.git', 'node_modules', 'dist', 'build', 'coverage', 'playwright-report',
+    '__pycache__', '.venv', 'venv', '.vite',
+})
+
+
+class RuleError(Exception):
+    """Raised for registration mistakes such as duplicate rule names."""
+
+
+@dataclass
+class Rule:
+    name: str
+    patterns: tuple[str, ...]
+    func: Callable[['FileContext'], Optional[str]]
+    module: str
+    codes: frozenset[str] = frozenset()   # tsc codes this rule fixes, if any
+
+    def matches(self, relpath: str) -> bool:
+        return any(rx.match(relpath) for rx in _compiled_patterns(self.patterns))
+
+
+@dataclass
+class FileContext:
+    """What a rule sees for one file. ``text`` reflects earlier rules' edits."""
+    path: str
+    text: str
+    messages: list[str] = field(default_factory=list)
+    # tsc diagnostics for this file, in targeted runs (see devtools.tsc).
+    diagnostics: list = field(default_factory=list)
+    # Matches reported by the running rule via ``count``; None if it doesn't say.
+    matches: Optional[int] = None
+    _lines: Optional[LineIndex] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def lines(self) -> LineIndex:
+        """Line index of the current ``text``, shared by every rule until the
+        text changes. Rules that splice via ``lines.apply_edits`` and return
+        ``lines.text`` keep it valid without a rebuild."""
+        if self._lines is None or self._lines.text is not self.text:
+            self._lines = LineIndex(self.text)
+        return self._lines
+
+    def log(self, message: str) -> None:
+        self.messages.append(message)
+
+    def count(self, n: int = 1) -> None:
+        """Report ``n`` pattern matches for the profiler (see devtools.profiling)."""
+        self.matches = (self.matches or 0) + n
+
+
+@dataclass
+class FileResult:
+    path: str
+    changed: bool = False
+    applied: list[str] = field(default_factory=list)
+    messages: list[str] = field(default_factory=list)
+    error: Optional[str] = None
+    # Hash and (size, mtime_ns) of the content the rules ran on, for the cache.
+    content_hash: Optional[str] = None
+    stat: Optional[tuple[int, int]] = None
+    staged: Optional[str] = None   # temp file awaiting commit
+    diff: Optional[str] = None     # dry runs only
+    # With profiling on: the file span and one RuleTiming per rule run.
+    span: Optional[tuple[int, int, int]] = None   # (pid, start_ns, duration_ns)
+    timings: list['RuleTiming'] = field(default_factory=list)
+
+
+class RuleTiming(NamedTuple):
+    rule: str
+    start_ns: int       # time.monotonic_ns(), comparable across worker processes
+    duration_ns: int
+    matches: Optional[int]
+    bytes: int          # size of the text the rule scanned
+    changed: bool
+
+
+REGISTRY: dict[str, Rule] = {}
+
+
+def rule(name: str, *patterns: str, codes: Iterable[str] = ()):
+    """Register the decorated function as a rule over the given globs.
+
+    ``codes`` lists the tsc error codes the rule knows how to fix; such rules
+    can be dispatched from tsc output to just the flagged files.
+
+    The function itself is returned unchanged so it stays picklable by
+    reference for the worker processes.
+    """
+    if not patterns:
+        raise RuleError(f'rule {name!r} needs at least one path pattern')
+
+    def decorator(func):
+        existing = REGISTRY.get(name)
+        if existing is not None and (existing.module, existing.func.__qualname__) != (func.__module__, func.__qualname__):
+            raise RuleError(f'rule {name!r} already registered by {existing.module}')
+        REGISTRY[name] = Rule(name, tuple(patterns), func, func.__module__, frozenset(codes))
+        return func
+
+    return decorator
+
+
+def ruleset_version(rules: Iterable[Rule]) -> str:
+    """Fingerprint of a rule set; changes whenever a rule's module source does."""
+    return fingerprint(sorted((r.name, module_version(r.module)) for r in rules))
+
+
+def rules_from(*modules) -> list[Rule]:
+    """Rules defined by the given modules, in registration order."""
+    names = {m if isinstance(m, str) else m.__name__ for m in modules}
+    return [r for r in REGISTRY.values() if r.module in names]
+
+
+# --------------------------------------------------------------------------
+# File discovery
+# --------------------------------------------------------------------------
+
+_PATTERN_CACHE: dict[tuple[str, ...], list[re.Pattern]] = {}
+
+
+def glob_to_regex(pattern: str) -> re.Pattern:
+    """Translate a posix glob (with ``**``) into an anchored regex."""
+    out = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if pattern.startswith('**/', i):
+            out.append('(?:.*/)?')
+            i += 3
+            continue
+        if pattern.startswith('**', i):
+            out.append('.*')
+            i += 2
+            continue
+        if c == '*':
+            out.append('[^/]*')
+        elif c == '?':
+            out.append('[^/]')
+        elif c == '{':
+            end = pattern.find('}', i)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                alts = pattern[i + 1:end].split(',')
+                out.append('(?:' + '|'.join(re.escape(a) for a in alts) + ')')
+                i = end
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return re.compile(''.join(out) + r'\Z')
+
+
+def _compiled_patterns(patterns: tuple[str, ...]) -> list[re.Pattern]:
+    compiled = _PATTERN_CACHE.get(patterns)
+    if compiled is None:
+        compiled = _PATTERN_CACHE[patterns] = [glob_to_regex(p) for p in patterns]
+    return compiled
+
+
+def filter_paths(paths: Iterable[str], patterns: Iterable[str]) -> list[str]:
+    """The repo-relative ``paths`` matching any glob, in order, without walking the tree."""
+    compiled = _compiled_patterns(tuple(patterns))
+    return [p for p in dict.fromkeys(paths) if any(rx.match(p) for rx in compiled)]
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Directory part of a glob before its first wildcard, e.g. ``components``."""
+    head = re.split(r'[*?{\[]', pattern, maxsplit=1)[0]
+    return head.rpartition('/')[0]
+
+
+def iter_files(root: str, patterns: Iterable[str]) -> Iterator[str]:
+    """Yield repo-relative posix paths under ``root`` matching any pattern.
+
+    Walks only the literal directory prefixes of the patterns, so
+    ``components/**/*.tsx`` never descends into ``node_modules``.
+    """
+    patterns = tuple(patterns)
+    compiled = _compiled_patterns(patterns)
+    prefixes = sorted({_literal_prefix(p) for p in patterns})
+    # Drop prefixes nested under another prefix; the outer walk covers them.
+    bases = [p for p in prefixes if not any(q != p and (q == '' or p.startswith(q + '/')) for q in prefixes)]
+    seen = set()
+    for base in bases:
+        top = os.path.join(root, base) if base else root
+        if os.path.isfile(top):
+            if base not in seen and any(rx.match(base) for rx in compiled):
+                seen.add(base)
+                yield base
+            continue
+        for dirpath, dirnames, filenames in os.walk(top):
+            dirnames[:] = sorted(d for d in dirnames if d not in EXCLUDED_DIRS)
+            rel_dir = os.path.relpath(dirpath, root).replace(os.sep, '/')
+            rel_dir = '' if rel_dir == '.' else rel_dir + '/'
+            for name in sorted(filenames):
+                rel = rel_dir + name
+                if rel not in seen and any(rx.match(rel) for rx in compiled):
+                    seen.add(rel)
+                    yield rel
+
+
+def plan_diagnostics(rules: Sequence[Rule], diagnostics) -> list[tuple[str, tuple[str, ...]]]:
+    """Like ``plan``, but only for files tsc flagged with a code some rule handles.
+
+    No directory walk happens: the file list comes from the diagnostics.
+    """
+    work = []
+    for rel in diagnostics.files(set().union(*(r.codes for r in rules))):
+        present = {d.code for d in diagnostics.for_file(rel)}
+        names = tuple(r.name for r in rules if r.codes & present and r.matches(rel))
+        if names:
+            work.append((rel, names))
+    return work
+
+
+def plan(rules: Sequence[Rule], root: str = '.',
+         paths: Optional[Sequence[str]] = None) -> list[tuple[str, tuple[str, ...]]]:
+    """Map every matched file to the names of the rules that apply to it.
+
+    With ``paths`` only those files are considered and no directory is walked.
+    """
+    if paths is not None:
+        files = sorted({p.replace(os.sep, '/') for p in paths if os.path.isfile(os.path.join(root, p))})
+    else:
+        files = iter_files(root, [p for r in rules for p in r.patterns])
+    work = []
+    for rel in files:
+        names = tuple(r.name for r in rules if r.matches(rel))
+        if names:
+            work.append((rel, names))
+    return work
+
+
+# --------------------------------------------------------------------------
+# Execution
+# --------------------------------------------------------------------------
+
+def apply_rules(root: str, relpath: str, rules: Sequence[Rule], dry_run: bool = False,
+                diagnostics: Sequence = (), profile: bool = False) -> FileResult:
+    """Run ``rules`` over one file. Never raises: errors land on the result.
+
+    Changed output is staged to a temp file (``result.staged``) for the
+    parent to commit, or rendered as a diff (``result.diff``) in a dry run.
+    With ``profile``, each rule is timed into ``result.timings``.
+    """
+    result = FileResult(relpath)
+    file_start = time.monotonic_ns() if profile else 0
+    path = os.path.join(root, relpath)
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+            st = os.fstat(f.fileno())
+        result.content_hash = content_hash(raw)
+        result.stat = (st.st_size, st.st_mtime_ns)
+        original = raw.decode('utf-8')
+        ctx = FileContext(relpath, original, diagnostics=list(diagnostics))
+        for r in rules:
+            if profile:
+                ctx.matches = None
+                size = len(ctx.text)
+                start = time.monotonic_ns()
+            new_text = r.func(ctx)
+            changed = new_text is not None and new_text != ctx.text
+            if profile:
+                result.timings.append(RuleTiming(r.name, start, time.monotonic_ns() - start,
+                                                 ctx.matches, size, changed))
+            if changed:
+                ctx.text = new_text
+                result.applied.append(r.name)
+        result.messages = ctx.messages
+        if ctx.text != original:
+            result.changed = True
+            if dry_run:
+                result.diff = unified_diff(relpath, original, ctx.text)
+            else:
+                result.staged = stage(path, ctx.text, original)
+    except Exception as exc:  # per-file error boundary
+        result.error = f'{type(exc).__name__}: {exc}'
+    if profile:
+        result.span = (os.getpid(), file_start, time.monotonic_ns() - file_start)
+    return result
+
+
+def _run_batch(root: str, batch: list[tuple[str, tuple[str, ...]]], rules: dict[str, Rule],
+               dry_run: bool, diagnostics: Optional[dict] = None, profile: bool = False) -> list[FileResult]:
+    diagnostics = diagnostics or {}
+    return [apply_rules(root, rel, [rules[n] for n in names], dry_run, diagnostics.get(rel, ()), profile)
+            for rel, names in batch]
+
+
+def _batches(work: list, size: int) -> Iterator[list]:
+    for i in range(0, len(work), size):
+        yield work[i:i + size]
+
+
+def run(rules: Sequence[Rule], root: str = '.', jobs: Optional[int] = None,
+        batch_size: int = 32, cache: Optional[Cache] = None, dry_run: bool = False,
+        fsync: bool = False, diagnostics=None, profile: bool = False,
+        paths: Optional[Sequence[str]] = None, journal=None) -> Iterator[FileResult]:
+    """Apply ``rules`` across the tree, yielding results in path order.
+
+    At most ``jobs * 2`` batches are in flight at once, so memory stays
+    bounded by the batch size rather than the tree size. Workers read and
+    write files themselves; only paths and small results cross the pool.
+
+    With a ``cache``, files whose current content already came out of this
+    exact rule set unchanged are skipped without being dispatched.
+
+    Nothing is written until every file has been processed: staged outputs
+    are then committed as one batch (see ``devtools.output``). If the run is
+    abandoned or fails, staged files are discarded and the tree is untouched.
+    With ``dry_run`` nothing is staged and results carry a unified diff.
+
+    Given a ``devtools.tsc.DiagnosticIndex``, only rules that declare tsc
+    codes run, only on the files flagged with those codes, and the cache is
+    not consulted (the diagnostics, not the content, decide what to do).
+
+    ``profile`` times every rule on every file (``FileResult.timings``);
+    feed the results to ``devtools.profiling.Profile``.
+
+    ``paths`` limits the run to those files (see ``plan``). A
+    ``devtools.journal.Journal`` records the commit so it can be undone.
+    """
+    by_name = {r.name: r for r in rules}
+    if diagnostics is not None:
+        work = plan_diagnostics([r for r in rules if r.codes], diagnostics)
+        results = _run_work(work, by_name, root, jobs, batch_size, dry_run, diagnostics, profile)
+    elif cache is not None:
+        results = _run_cached(plan(rules, root, paths), by_name, root, jobs, batch_size, cache, dry_run, profile)
+    else:
+        results = _run_work(plan(rules, root, paths), by_name, root, jobs, batch_size, dry_run, profile=profile)
+    batch = Batch(fsync=fsync, journal=journal)
+    try:
+        for res in results:
+            if res.staged:
+                batch.add(os.path.join(root, res.path), res.staged)
+            yield res
+        batch.commit()
+    finally:
+        batch.discard()
+
+
+def _run_cached(work, by_name, root, jobs, batch_size, cache: Cache, dry_run,
+                profile=False) -> Iterator[FileResult]:
+    versions: dict[tuple[str, ...], str] = {}
+    todo = []
+    for rel, names in work:
+        version = versions.get(names)
+        if version is None:
+            version = versions[names] = ruleset_version(by_name[n] for n in names)
+        digest = cache.file_hash(rel)
+        if digest is None or cache.get('noop', digest, version) is None:
+            todo.append((rel, names))
+    names_for = dict(todo)
+    for res in _run_work(todo, by_name, root, jobs, batch_size, dry_run, profile=profile):
+        if not res.changed and res.error is None and res.content_hash is not None:
+            cache.record_file(res.path, *res.stat, res.content_hash)
+            cache.put('noop', res.content_hash, versions[names_for[res.path]], True)
+        yield res
+
+
+def _run_work(work, by_name, root, jobs, batch_size, dry_run, diagnostics=None,
+              profile=False) -> Iterator[FileResult]:
+    def task(batch):
+        # Only ship the rules (and diagnostics) this batch needs.
+        needed = {n: by_name[n] for _, names in batch for n in names}
+        diags = {rel: diagnostics.for_file(rel) for rel, _ in batch} if diagnostics is not None else None
+        return _run_batch, (root, batch, needed, dry_run, diags, profile)
+
+    yield from parallel_map(task, work, jobs, batch_size)
+
+
+def parallel_map(task: Callable[[list], tuple], items: Sequence, jobs: Optional[int] = None,
+                 batch_size: int = 32) -> Iterator:
+    """Run batches of ``items`` on a process pool and yield results in order.
+
+    ``task(batch)`` returns ``(func, args)``; ``func(*args)`` runs in a worker
+    and must return a list, which is flattened into the output. At most
+    ``jobs * 2`` batches are in flight, and small inputs run inline.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(items) <= batch_size:
+        for batch in _batches(items, batch_size):
+            func, args = task(batch)
+            yield from func(*args)
+        return
+
+    # Imported here: multiprocessing costs ~30 ms, and small runs never need it.
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = deque()
+        for batch in _batches(items, batch_size):
+            if len(pending) >= jobs * 2:
+                yield from pending.popleft().result()
+            func, args = task(batch)
+            pending.append(pool.submit(func, *args))
+        while pending:
+            yield from pending.popleft().result()
+
+
+def report(results: Iterable[FileResult], out=sys.stdout) -> int:
+    """Print results in the old scripts' "Updated <path>" style; return error count."""
+    errors = 0
+    for res in results:
+        for msg in res.messages:
+            print(f'{res.path}: {msg}', file=out)
+        if res.error:
+            errors += 1
+            print(f'Failed {res.path}: {res.error}', file=out)
+        elif res.diff is not None:
+            out.write(res.diff)
+        elif res.changed:
+            print(f'Updated {res.path} ({", ".join(res.applied)})', file=out)
+    return errors
+
+
+def main(rules: Sequence[Rule], argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Apply codemod rules to the tree.')
+    parser.add_argument('paths', nargs='*', help='only these files (default: every file a rule matches)')
+    parser.add_argument('--root', default='.', help='repository root (default: cwd)')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--no-cache', action='store_true', help='re-run rules even on files known to be no-ops')
+    parser.add_argument('--clear-cache', action='store_true', help='drop cached no-op verdicts before running')
+    parser.add_argument('--dry-run', action='store_true', help='print a unified diff instead of writing')
+    parser.add_argument('--fsync', action='store_true', help='flush staged files to disk before committing')
+    parser.add_argument('--no-journal', action='store_true', help='do not record the run for undo')
+    parser.add_argument('--profile', action='store_true', help='print per-rule timings to stderr')
+    parser.add_argument('--trace', metavar='FILE', help='write a Chrome trace of per-rule timings (implies --profile)')
+    args = parser.parse_args(argv)
+    profiler = None
+    if args.profile or args.trace:
+        from .profiling import Profile
+        profiler = Profile()
+    journal = None
+    if not (args.dry_run or args.no_journal):
+        from .journal import Journal
+        journal = Journal(args.root)
+    options = dict(jobs=args.jobs, dry_run=args.dry_run, fsync=args.fsync, profile=profiler is not None,
+                   paths=args.paths or None, journal=journal)
+
+    def execute(cache=None) -> int:
+        results = run(rules, args.root, cache=cache, **options)
+        errors = report(profiler.collect(results) if profiler else results)
+        if profiler:
+            profiler.finish(args.trace)
+        if journal is not None and journal.run_id:
+            print(f'Journaled as run {journal.run_id} (python -m devtools undo {journal.run_id})')
+        return 1 if errors else 0
+
+    if args.no_cache:
+        return execute()
+    with Cache(args.root) as cache:
+        if args.clear_cache:
+            cache.invalidate('noop')
+        return execute(cache)
@@ -0,0 +1,249 @@
+"""Import graph: which heavy packages load before the first paint.
+
+Starting from the entry (index.tsx), every file reached through static
+``import`` / ``export ... from`` is in the eager bundle. ``import()`` edges,
+including ``React.lazy(() => import(...))`` boundaries such as
+LazyGradientShaderCard, start a separate chunk. The graph is built by
+following imports from the entry. Relative and ``@/`` specifiers resolve to
+files. Bare specifiers become package nodes (``three/examples/...`` counts
+as ``three``). ``import type`` is ignored because it is erased.
+
+For every heavy package reachable eagerly the report gives the shortest
+eager path and a split point. The split point is the deepest file on that
+path whose lazy loading takes the package out of the eager set, together
+with any other heavy packages that would go with it.
+
+Each file's edges are cached by content hash in the devtools cache, so a
+rerun only re-tokenizes the files that changed.
+
+    python -m devtools.graph
+    python -m devtools.graph --check --allow framer-motion   # CI: exit 1 on new eager heavy deps
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from collections import deque
+from typing import NamedTuple, Optional, Sequence
+
+from . import tokenizer
+from .cache import Cache, fingerprint, module_version
+from .jsmodule import ALIASES, import_statements, resolve
+from .tokenizer import IDENT, PUNCT, STRING, TokenStream, is_jsx_path, is_token
+
+ENTRY = 'index.tsx'
+HEAVY = ('three', '@react-three/fiber', '@react-three/drei', 'gsap', 'framer-motion')
+STATIC = 'static'
+LAZY = 'lazy'
+
+
+class Edge(NamedTuple):
+    spec: str
+    kind: str   # STATIC | LAZY
+    line: int
+
+
+class Link(NamedTuple):
+    target: str     # file relpath, or package name when ``package``
+    kind: str
+    line: int
+    package: bool
+
+
+def edges(text: str, jsx: bool = True) -> list[Edge]:
+    """Imports, re-exports and ``import()`` calls of one file."""
+    ts = TokenStream(text, jsx=jsx)
+    toks = ts.toks
+    found = []
+    for i, j, _ in import_statements(ts):
+        if is_token(toks[i + 1], IDENT, 'type') and not is_token(toks[i + 2], IDENT, 'from'):
+            continue
+        brace = next((k for k in range(i, j) if is_token(toks[k], PUNCT, '{')), None)
+        if brace is not None and brace == i + 1 and is_token(ts.tok(ts.close.get(brace, 0) + 1), IDENT, 'from'):
+            names = [k for k in range(brace + 1, ts.close[brace]) if is_token(toks[k], IDENT)]
+            if names and all(is_token(toks[k], IDENT, 'type') or is_token(toks[k - 1], IDENT, 'type', 'as')
+                             or is_token(ts.tok(k + 1), IDENT, 'as') for k in names):
+                continue   # import { type A, type B } from ...
+        found.append(Edge(toks[j].value[1:-1], STATIC, ts.line(i)))
+    for i, tok in enumerate(toks):
+        if is_token(tok, IDENT, 'export') and ts.parent[i] == -1:
+            if is_token(ts.tok(i + 1), IDENT, 'type'):
+                continue
+            k = i + 1
+            if is_token(ts.tok(k), PUNCT, '{'):
+                k = ts.close.get(k, k) + 1
+            elif is_token(ts.tok(k), PUNCT, '*'):
+                k += 3 if is_token(ts.tok(k + 1), IDENT, 'as') else 1
+            else:
+                continue
+            if is_token(ts.tok(k), IDENT, 'from') and ts.tok(k + 1).kind == STRING:
+                found.append(Edge(toks[k + 1].value[1:-1], STATIC, ts.line(i)))
+        elif is_token(tok, IDENT, 'import') and is_token(ts.tok(i + 1), PUNCT, '(') \
+                and ts.tok(i + 2).kind == STRING and not is_token(ts.tok(i - 1), PUNCT, '.'):
+            found.append(Edge(toks[i + 2].value[1:-1], LAZY, ts.line(i)))
+    found.sort(key=lambda e: e.line)
+    return found
+
+
+def package_name(spec: str) -> Optional[str]:
+    """``three/examples/x`` -> ``three``, ``@a/b/c`` -> ``@a/b``; ``None`` for local paths."""
+    if spec.startswith('.') or any(spec.startswith(p) for p in ALIASES) or spec.startswith('/'):
+        return None
+    parts = spec.split('/')
+    return '/'.join(parts[:2]) if spec.startswith('@') else parts[0]
+
+
+class Graph:
+    """Files reachable from ``entry`` and the links between them."""
+
+    def __init__(self, root: str = '.', entry: str = ENTRY, cache: Optional[Cache] = None):
+        self.root = root
+        self.entry = entry
+        self.links: dict[str, list[Link]] = {}
+        self.unresolved: list[tuple[str, Edge]] = []
+        version = fingerprint(module_version(__name__), module_version(tokenizer.__name__),
+                              module_version('devtools.jsmodule'))
+        todo = deque([entry])
+        while todo:
+            rel = todo.popleft()
+            if rel in self.links:
+                continue
+            jsx = is_jsx_path(rel)
+            if cache is None:
+                with open(os.path.join(root, rel), 'r', encoding='utf-8') as fh:
+                    found = edges(fh.read(), jsx)
+            else:
+                namespace = 'import-graph-jsx' if jsx else 'import-graph'
+                found = [Edge(*e) for e in cache.memoize(namespace, version, rel, lambda t: edges(t, jsx))]
+            out = self.links[rel] = []
+            for e in found:
+                pkg = package_name(e.spec)
+                if pkg is not None:
+                    out.append(Link(pkg, e.kind, e.line, True))
+                    continue
+                target = resolve(root, rel, e.spec)
+                if target is None:
+                    if os.path.splitext(e.spec)[1] in ('', '.ts', '.tsx', '.js', '.jsx'):
+                        self.unresolved.append((rel, e))
+                    continue   # stylesheets, images and other assets
+                out.append(Link(target, e.kind, e.line, False))
+                todo.append(target)
+
+    def reach(self, kinds: Sequence[str] = (STATIC,), blocked: frozenset = frozenset()
+              ) -> tuple[dict[str, Optional[tuple[str, int]]], dict[str, tuple[str, int]]]:
+        """BFS over ``kinds`` edges avoiding ``blocked`` files.
+
+        Returns ``(file -> (importer, line))`` for the files reached and
+        ``(package -> (importer, line))`` for the first importer of each
+        package, both along shortest paths.
+        """
+        files: dict[str, Optional[tuple[str, int]]] = {self.entry: None}
+        packages: dict[str, tuple[str, int]] = {}
+        todo = deque([self.entry])
+        while todo:
+            rel = todo.popleft()
+            for link in self.links.get(rel, ()):
+                if link.kind not in kinds:
+                    continue
+                if link.package:
+                    packages.setdefault(link.target, (rel, link.line))
+                elif link.target not in files and link.target not in blocked:
+                    files[link.target] = (rel, link.line)
+                    todo.append(link.target)
+        return files, packages
+
+    def path(self, files: dict, packages: dict, package: str) -> list[tuple[str, int]]:
+        """``[(file, line it imports the next hop)]`` from the entry to ``package``."""
+        rel, line = packages[package]
+        hops = [(rel, line)]
+        while files[rel] is not None:
+            rel, line = files[rel]
+            hops.append((rel, line))
+        return hops[::-1]
+
+
+class Report(NamedTuple):
+    package: str
+    path: list[tuple[str, int]]
+    importers: list[str]                  # eager files importing the package directly
+    split: Optional[tuple[str, str, int]]  # (file to lazy-load, importer, line)
+    also: list[str]                       # other heavy packages the split defers
+
+
+def analyze(graph: Graph, heavy: Sequence[str] = HEAVY) -> tuple[list[Report], dict[str, list[tuple[str, int]]]]:
+    """Eager heavy packages, and the lazy-only ones with the path to their chunk."""
+    files, packages = graph.reach()
+    eager = [p for p in heavy if p in packages]
+    reports = []
+    for pkg in eager:
+        hops = graph.path(files, packages, pkg)
+        importers = sorted(rel for rel in files for link in graph.links.get(rel, ())
+                           if link.package and link.target == pkg and link.kind == STATIC)
+        split = None
+        also: list[str] = []
+        # Deepest file first: lazy-loading it defers the least code. The
+        # entry's own imports are the app shell, so they are not offered.
+        for k in range(len(hops) - 1, 1, -1):
+            _, cut_packages = graph.reach(blocked=frozenset({hops[k][0]}))
+            if pkg not in cut_packages:
+                split = (hops[k][0], hops[k - 1][0], hops[k - 1][1])
+                also = [p for p in eager if p != pkg and p not in cut_packages]
+                break
+        reports.append(Report(pkg, hops, sorted(set(importers)), split, also))
+    all_files, all_packages = graph.reach((STATIC, LAZY))
+    lazy_only = {p: graph.path(all_files, all_packages, p) for p in heavy if p in all_packages and p not in packages}
+    return reports, lazy_only
+
+
+def _hops(hops: list[tuple[str, int]], package: str) -> str:
+    return ' -> '.join(f'{rel}:{line}' for rel, line in hops) + f' -> {package}'
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Find heavy packages on the eager import path.')
+    parser.add_argument('--root', default='.')
+    parser.add_argument('--entry', default=ENTRY)
+    parser.add_argument('--heavy', action='append', default=[], metavar='PKG',
+                        help=f'extra package to treat as heavy (default: {", ".join(HEAVY)})')
+    parser.add_argument('--allow', action='append', default=[], metavar='PKG',
+                        help='heavy package that may stay eager (still reported)')
+    parser.add_argument('--check', action='store_true', help='exit 1 if a heavy package not --allow-ed is eager')
+    parser.add_argument('--no-cache', action='store_true')
+    args = parser.parse_args(argv)
+
+    cache = None if args.no_cache else Cache(args.root)
+    try:
+        graph = Graph(args.root, args.entry, cache)
+    except OSError as e:
+        print(f'{args.entry}: {e}', file=sys.stderr)
+        return 2
+    finally:
+        if cache is not None:
+            cache.close()
+    reports, lazy_only = analyze(graph, HEAVY + tuple(args.heavy))
+
+    eager_files = len(graph.reach()[0])
+    print(f'{len(graph.links)} files reachable from {args.entry}, {eager_files} of them eager')
+    for r in reports:
+        tag = ' (allowed)' if r.package in args.allow else ''
+        print(f'\n{r.package}: eager{tag}, imported by {len(r.importers)} eager file'
+              + 's' * (len(r.importers) != 1))
+        print(f'  path: {_hops(r.path, r.package)}')
+        if r.split is not None:
+            target, importer, line = r.split
+            also = f'; also defers {", ".join(r.also)}' if r.also else ''
+            print(f'  split: lazy-load {target} (imported at {importer}:{line}){also}')
+        else:
+            shown = ', '.join(r.importers[:5]) + (f' and {len(r.importers) - 5} more' if len(r.importers) > 5 else '')
+            print(f'  split: no single file; import it lazily in {shown}')
+    for pkg, hops in lazy_only.items():
+        print(f'\n{pkg}: lazy only, first chunk via {_hops(hops, pkg)}')
+    for rel, e in graph.unresolved:
+        print(f'{rel}:{e.line}: cannot resolve {e.spec!r}', file=sys.stderr)
+    blocking = [r.package for r in reports if r.package not in args.allow]
+    return 1 if args.check and blocking else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,702 @@
+"""Find React state that is set from high-frequency event handlers.
+
+A ``setState`` in a mousemove, pointermove, scroll or resize handler
+re-renders the component on every event. That can be a few hundred times
+a second. ``analyze`` tokenizes a file once and pairs up three things:
+
+- state declared with ``useState`` or ``React.useState``
+- handlers registered with ``addEventListener('mousemove', ...)`` or with
+  JSX ``onMouseMove`` / ``onPointerMove`` / ``onScroll``, together with the
+  local functions they call or hand to ``requestAnimationFrame``
+- calls to the state's setter inside those handlers. A call that runs
+  inside ``requestAnimationFrame`` counts as throttled.
+
+Two cases can be rewritten without changing what is rendered. The
+``hot-state`` rule (``devtools/rules/hot_state.py``) rewrites them:
+
+- The state is written but never read. It is dead: the ``useState`` and
+  every ``setX(v)`` statement are deleted, provided no argument has side
+  effects. The handler that wrote it is left for review, since it may now
+  do nothing.
+- The state is a number, or an object of numbers, and is only read as a
+  ``style`` value, either directly or inside a template literal. Each
+  field becomes a ``useMotionValue``, and each template becomes a
+  ``useMotionTemplate``. A plain ``<div>`` carrying the style becomes
+  ``<motion.div>``. Framer Motion then writes the style without a render.
+
+Everything else is reported. The list is ranked by event rate times the
+number of places that re-render:
+
+    python -m devtools.hot_state                  # ranked report
+    python -m devtools.hot_state --fix --dry-run  # diff of the safe rewrites
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional, Sequence
+
+from .cache import Cache, fingerprint, module_version
+from .engine import iter_files
+from .jsmodule import import_edits, import_statements
+from .tokenizer import (IDENT, JSX_ATTR, JSX_CLOSE, JSX_OPEN, JSX_SELF_CLOSE, NUMBER, PUNCT, STRING,
+                        TEMPLATE, TokenStream, is_token, tokenize)
+
+EVENT_WEIGHTS = {'mousemove': 3, 'pointermove': 3, 'scroll': 2, 'resize': 1}
+JSX_EVENTS = {'onMouseMove': 'mousemove', 'onPointerMove': 'pointermove', 'onScroll': 'scroll'}
+THROTTLED = 0.25   # weight of a setter that already runs once per frame
+DEFAULT_GLOBS = ('components/**/*.tsx', 'pages/**/*.tsx', '*.tsx')
+
+
+class Finding(NamedTuple):
+    line: int            # of the setter call
+    event: str
+    handler: str         # function name, or 'inline'
+    setter: str
+    state: str
+    throttled: bool      # inside requestAnimationFrame
+    reads: int           # places that read the state
+    fix: Optional[str]   # 'remove' or 'motion' when it can be rewritten
+    reason: str          # why not, otherwise ''
+
+    @property
+    def score(self) -> float:
+        return EVENT_WEIGHTS[self.event] * (THROTTLED if self.throttled else 1) * (1 + self.reads)
+
+
+@dataclass
+class _State:
+    name: str
+    setter: str
+    first: int           # token index of const/let
+    last: int            # token index of the closing ')' or ';'
+    react: bool          # React.useState
+    generic: str
+    init: tuple[int, int]   # token range of the initial value
+    scope: int           # end of the enclosing block
+    reads: list[int] = field(default_factory=list)
+    calls: list[int] = field(default_factory=list)   # setter tokens
+    reason: str = ''
+
+
+@dataclass
+class Analysis:
+    findings: list[Finding]
+    edits: list[tuple[int, int, str]]   # for LineIndex.apply_edits
+    rewritten: list[str]                # '<state> -> useMotionValue' etc.
+
+
+def _states(f: TokenStream) -> list[_State]:
+    toks = f.toks
+    found = []
+    for i, tok in enumerate(toks):
+        if not (is_token(tok, IDENT, 'const', 'let') and is_token(f.tok(i + 1), PUNCT, '[')
+                and is_token(f.tok(i + 2), IDENT) and is_token(f.tok(i + 3), PUNCT, ',') and is_token(f.tok(i + 4), IDENT)
+                and is_token(f.tok(i + 5), PUNCT, ']') and is_token(f.tok(i + 6), PUNCT, '=')):
+            continue
+        j = i + 7
+        react = is_token(f.tok(j), IDENT, 'React') and is_token(f.tok(j + 1), PUNCT, '.')
+        if react:
+            j += 2
+        if not is_token(f.tok(j), IDENT, 'useState'):
+            continue
+        j += 1
+        generic = ''
+        if is_token(f.tok(j), PUNCT, '<'):
+            depth, k = 0, j
+            while k < len(toks):
+                v = toks[k].value if toks[k].kind == PUNCT else ''
+                if v == '<':
+                    depth += 1
+                elif v and set(v) == {'>'}:
+                    depth -= len(v)
+                if depth <= 0:
+                    break
+                k += 1
+            generic = f.src(j, k)
+            j = k + 1
+        if not is_token(f.tok(j), PUNCT, '(') or j not in f.close:
+            continue
+        close = f.close[j]
+        last = close + 1 if is_token(f.tok(close + 1), PUNCT, ';') else close
+        found.append(_State(toks[i + 2].value, toks[i + 4].value, i, last, react, generic,
+                            (j + 1, close - 1), f.block_end(i)))
+    return found
+
+
+def _resolve(decls: Sequence, i: int):
+    """The declaration in scope at token ``i``: the nearest one before it
+    whose enclosing block contains it."""
+    best = None
+    for d in decls:
+        if d.first <= i < d.scope and (best is None or d.first > best.first):
+            best = d
+    return best
+
+
+class _Def(NamedTuple):
+    first: int
+    scope: int
+    body: tuple[int, int]
+
+
+def _definitions(f: TokenStream) -> dict[str, list[_Def]]:
+    """Local ``const name = ...`` and ``function name() {...}`` bodies."""
+    defs: dict[str, list[_Def]] = {}
+    toks = f.toks
+    for i, tok in enumerate(toks):
+        if tok.kind != IDENT or not is_token(f.tok(i + 1), IDENT):
+            continue
+        if tok.value in ('const', 'let', 'var') and is_token(f.tok(i + 2), PUNCT, '='):
+            end = i + 3
+            while end < len(toks) and not (f.parent[end] == f.parent[i] and (
+                    is_token(toks[end], PUNCT, ';', '}') or is_token(toks[end], IDENT, 'const', 'let', 'var', 'return'))):
+                end += 1
+            body = (i + 3, end - 1)
+        elif tok.value == 'function' and is_token(f.tok(i + 2), PUNCT, '(') and i + 2 in f.close:
+            j = f.close[i + 2] + 1
+            while j < len(toks) and not is_token(toks[j], PUNCT, '{'):
+                j += 1
+            if j not in f.close:
+                continue
+            body = (j, f.close[j])
+        else:
+            continue
+        # Function declarations are hoisted to the start of their block.
+        first = i if tok.value != 'function' else max(f.parent[i], 0)
+        defs.setdefault(toks[i + 1].value, []).append(_Def(first, f.block_end(i), body))
+    return defs
+
+
+def _handlers(f: TokenStream, defs: dict[str, list[_Def]]) -> list[tuple[str, str, tuple[int, int]]]:
+    """``(event, handler name, body token range)`` for every hot handler."""
+    toks = f.toks
+    found = []
+    for i, tok in enumerate(toks):
+        if is_token(tok, IDENT, 'addEventListener') and is_token(f.tok(i + 1), PUNCT, '(') and i + 1 in f.close:
+            event = f.tok(i + 2).value[1:-1] if is_token(f.tok(i + 2), STRING) else ''
+            if event not in EVENT_WEIGHTS or not is_token(f.tok(i + 3), PUNCT, ','):
+                continue
+            commas = f.top_commas(i + 1, f.close[i + 1])
+            lo, hi = i + 4, (commas[1] if len(commas) > 1 else f.close[i + 1]) - 1
+        elif is_token(tok, JSX_ATTR) and tok.value in JSX_EVENTS and is_token(f.tok(i + 1), PUNCT, '=') \
+                and is_token(f.tok(i + 2), PUNCT, '{') and i + 2 in f.close:
+            event = JSX_EVENTS[tok.value]
+            lo, hi = i + 3, f.close[i + 2] - 1
+        else:
+            continue
+        if lo == hi and toks[lo].kind == IDENT:
+            d = _resolve(defs.get(toks[lo].value, ()), lo)
+            if d is not None:
+                found.append((event, toks[lo].value, d.body))
+        elif lo <= hi:
+            found.append((event, 'inline', (lo, hi)))
+    return found
+
+
+def _setter_calls(f: TokenStream, lo: int, hi: int, setters: dict[str, list[_State]],
+                  defs: dict[str, list[_Def]], throttled: bool, seen: set) -> list[tuple[int, _State, bool]]:
+    """Setter calls reachable from the code in ``lo..hi``."""
+    toks = f.toks
+    raf = [(j + 1, f.close[j + 1]) for j in range(lo, hi + 1)   # (paren, close)
+           if is_token(toks[j], IDENT, 'requestAnimationFrame') and j + 1 in f.close]
+    calls = []
+    for j in range(lo, hi + 1):
+        tok = toks[j]
+        if tok.kind != IDENT or not f.is_ref(j):
+            continue
+        in_raf = throttled or any(a < j < b for a, b in raf)
+        called = is_token(f.tok(j + 1), PUNCT, '(')
+        state = _resolve(setters.get(tok.value, ()), j) if called else None
+        if state is not None:
+            calls.append((j, state, in_raf))
+            continue
+        passed_to_raf = any(a < j < b and f.parent[j] == a for a, b in raf)
+        if called or passed_to_raf:
+            d = _resolve(defs.get(tok.value, ()), j)
+            if d is not None and d not in seen:
+                seen.add(d)
+                calls.extend(_setter_calls(f, d.body[0], d.body[1], setters, defs, in_raf, seen))
+    return calls
+
+
+# --------------------------------------------------------------------------
+# Which states can be rewritten
+# --------------------------------------------------------------------------
+
+class _Style(NamedTuple):
+    owner: int                   # JSX_OPEN token of the element
+    value: tuple[int, int]       # token range of the property value
+    prop: str
+
+
+def _numeric_init(f: TokenStream, s: _State) -> Optional[list[str]]:
+    """``[]`` for a number, the keys for ``{ x: 0, y: 0 }``, else None."""
+    lo, hi = s.init
+    toks = f.toks
+    if (lo == hi and toks[lo].kind == NUMBER) or (
+            hi == lo + 1 and is_token(toks[lo], PUNCT, '-') and toks[hi].kind == NUMBER):
+        return []
+    if not (is_token(toks[lo], PUNCT, '{') and f.close.get(lo) == hi):
+        return None
+    keys = []
+    j = lo + 1
+    while j < hi:
+        if not (is_token(toks[j], IDENT) and is_token(toks[j + 1], PUNCT, ':')):
+            return None
+        k = j + 2
+        if is_token(toks[k], PUNCT, '-'):
+            k += 1
+        if toks[k].kind != NUMBER:
+            return None
+        keys.append(toks[j].value)
+        j = k + 1
+        if is_token(toks[j], PUNCT, ','):
+            j += 1
+    return keys or None
+
+
+def _style_of(f: TokenStream, lo: int, hi: int) -> Optional[_Style]:
+    """The ``style={{ prop: ... }}`` property whose value contains ``lo..hi``."""
+    toks = f.toks
+    p = f.parent[lo]
+    if p < 0:
+        return None
+    if toks[p].value == '${':
+        if f.close.get(p) != hi + 1:
+            return None
+        p = f.parent[p]
+    if p < 0 or toks[p].value != '{' or not (is_token(f.tok(p - 1), PUNCT, '{') and is_token(f.tok(p - 2), PUNCT, '=')
+                                             and is_token(f.tok(p - 3), JSX_ATTR, 'style')):
+        return None
+    # The value runs from the ':' to the next ',' or '}' of the style object.
+    colon = max((j for j in range(p + 1, lo) if f.parent[j] == p and is_token(toks[j], PUNCT, ':')), default=None)
+    if colon is None:
+        return None
+    end = colon + 1
+    while end < len(toks) and not (f.parent[end] == p and is_token(toks[end], PUNCT, ',')) and end != f.close[p]:
+        end += 1
+    key = toks[colon - 1]
+    if key.kind not in (IDENT, STRING):
+        return None
+    owner = p - 3
+    while owner >= 0 and not (toks[owner].kind == JSX_OPEN and f.parent[owner] == f.parent[p - 3]):
+        owner -= 1
+    if owner < 0:
+        return None
+    prop = key.value.strip('\'"')
+    return _Style(owner, (colon + 1, end - 1), prop)
+
+
+def _inside_style(f: TokenStream, i: int) -> bool:
+    p = f.parent[i]
+    while p >= 0:
+        if is_token(f.tok(p - 2), JSX_ATTR, 'style'):
+            return True
+        p = f.parent[p]
+    return False
+
+
+def _classify(f: TokenStream, s: _State) -> tuple[Optional[str], dict]:
+    """``('remove' | 'motion' | None, plan)``; sets ``s.reason`` when None."""
+    toks = f.toks
+    for j in s.calls:
+        if not is_token(f.tok(j + 1), PUNCT, '(') or j + 1 not in f.close:
+            s.reason = f'setter passed around at line {f.line(j)}'
+            return None, {}
+        if len(f.top_commas(j + 1, f.close[j + 1])) or f.close[j + 1] == j + 2:
+            s.reason = f'setter called without exactly one argument at line {f.line(j)}'
+            return None, {}
+        if any(is_token(toks[k], PUNCT, '=>') and f.parent[k] == j + 1 for k in range(j + 2, f.close[j + 1])) \
+                or is_token(toks[j + 2], IDENT, 'function'):
+            s.reason = f'updater function at line {f.line(j)}'
+            return None, {}
+    for k in range(s.first + 6, s.scope):
+        if toks[k].kind == IDENT and toks[k].value in (s.name, s.setter) and (
+                is_token(f.tok(k - 1), IDENT, 'const', 'let', 'var', 'function') or is_token(f.tok(k + 1), PUNCT, '=>')):
+            s.reason = f'{toks[k].value} is redeclared at line {f.line(k)}'
+            return None, {}
+    if not s.reads:
+        for j in s.calls:
+            if not _statement(f, j):
+                s.reason = f'written, never read; setter used inside an expression at line {f.line(j)}'
+                return None, {}
+            if not _pure(f, j + 2, f.close[j + 1] - 1):
+                s.reason = f'written, never read; setter argument has side effects at line {f.line(j)}'
+                return None, {}
+        return 'remove', {}
+
+    keys = _numeric_init(f, s)
+    if keys is None:
+        s.reason = f'not a number or object of numbers, read at line {f.line(s.reads[0])}'
+        return None, {}
+    reads = {}
+    for j in s.reads:
+        if keys:
+            if not (is_token(f.tok(j + 1), PUNCT, '.') and is_token(f.tok(j + 2), IDENT) and toks[j + 2].value in keys):
+                s.reason = f'read as a whole at line {f.line(j)}'
+                return None, {}
+            hi = j + 2
+        else:
+            hi = j
+        style = _style_of(f, j, hi)
+        if style is None:
+            where = 'computed into a style value' if _inside_style(f, j) else 'read outside a style prop'
+            s.reason = f'{where} at line {f.line(j)}'
+            return None, {}
+        tag = toks[style.owner].value
+        if not (tag.startswith('motion.') or (tag[:1].islower() and '.' not in tag)):
+            s.reason = f'style passed to <{tag}>'
+            return None, {}
+        reads[j] = (hi, style)
+    # A template value may only interpolate this state.
+    for j, (hi, style) in reads.items():
+        lo_v, hi_v = style.value
+        if lo_v == j and hi_v == hi:
+            continue
+        if not (toks[lo_v].kind == TEMPLATE and toks[lo_v].value.startswith('`')
+                and toks[hi_v].kind == TEMPLATE and toks[hi_v].value.endswith('`')):
+            s.reason = f'computed into a style value at line {f.line(j)}'
+            return None, {}
+        for k in range(lo_v, hi_v + 1):
+            if f.parent[k] == f.parent[lo_v] and is_token(toks[k], PUNCT, '${') and k + 1 not in reads:
+                s.reason = f'computed into a style value at line {f.line(j)}'
+                return None, {}
+    for j in s.calls:
+        arg = (j + 2, f.close[j + 1] - 1)
+        if not keys:
+            continue
+        fields = _object_fields(f, arg)
+        if fields is None or sorted(fields) != sorted(keys):
+            s.reason = f'partial or computed update at line {f.line(j)}'
+            return None, {}
+        if not _statement(f, j):
+            s.reason = f'setter used inside an expression at line {f.line(j)}'
+            return None, {}
+    return 'motion', {'keys': keys, 'reads': reads}
+
+
+def _object_fields(f: TokenStream, arg: tuple[int, int]) -> Optional[dict[str, str]]:
+    """``{ x, y: expr }`` as ``{'x': 'x', 'y': 'expr'}``; None otherwise."""
+    lo, hi = arg
+    toks = f.toks
+    if not (is_token(toks[lo], PUNCT, '{') and f.close.get(lo) == hi):
+        return None
+    fields = {}
+    start = lo + 1
+    for end in f.top_commas(lo, hi) + [hi]:
+        if start == end:   # trailing comma
+            continue
+        if not is_token(toks[start], IDENT):
+            return None
+        if end == start + 1:
+            fields[toks[start].value] = toks[start].value
+        elif is_token(toks[start + 1], PUNCT, ':') and end > start + 2:
+            fields[toks[start].value] = f.src(start + 2, end - 1)
+        else:
+            return None
+        start = end + 1
+    return fields
+
+
+def _pure(f: TokenStream, lo: int, hi: int) -> bool:
+    """No calls, assignments or updates in ``lo..hi``: dropping it loses nothing."""
+    for k in range(lo, hi + 1):
+        tok = f.toks[k]
+        if is_token(tok, IDENT, 'new', 'await', 'delete', 'yield') or is_token(tok, PUNCT, '++', '--') \
+                or (tok.kind == PUNCT and tok.value.endswith('=') and tok.value not in ('==', '===', '!=', '!==',
+                                                                                        '<=', '>=')) \
+                or (is_token(tok, PUNCT, '(') and k > lo and (f.toks[k - 1].kind == IDENT
+                                                              or is_token(f.toks[k - 1], PUNCT, ')', ']'))):
+            return False
+    return True
+
+
+def _statement(f: TokenStream, j: int) -> bool:
+    """Is the call starting at token ``j`` a whole statement (or arrow body)?"""
+    prev = f.tok(j - 1)
+    after = f.tok(f.close[j + 1] + 1)
+    if is_token(prev, PUNCT, '=>'):
+        return True
+    return (is_token(prev, PUNCT, ';', '{', '}', ')') or is_token(prev, IDENT, 'else')) \
+        and (after.kind == '' or is_token(after, PUNCT, ';', '}'))
+
+
+# --------------------------------------------------------------------------
+# Edits
+# --------------------------------------------------------------------------
+
+def _camel(name: str) -> str:
+    parts = name.replace('-', ' ').split()
+    return ''.join(p[:1].upper() + p[1:] for p in parts)
+
+
+class _Names:
+    def __init__(self, taken: set[str]):
+        self.taken = set(taken)
+
+    def new(self, base: str) -> str:
+        name, n = base, 2
+        while name in self.taken:
+            name, n = f'{base}{n}', n + 1
+        self.taken.add(name)
+        return name
+
+
+def _indent(text: str, offset: int) -> str:
+    start = text.rfind('\n', 0, offset) + 1
+    line = text[start:offset]
+    return line[:len(line) - len(line.lstrip())]
+
+
+def _whole_lines(text: str, start: int, end: int) -> tuple[int, int]:
+    """Widen ``start..end`` to its full lines when nothing else is on them."""
+    line_start = text.rfind('\n', 0, start) + 1
+    line_end = text.find('\n', end)
+    line_end = len(text) if line_end == -1 else line_end + 1
+    if text[line_start:start].strip() or text[end:line_end].strip():
+        return start, end
+    return line_start, line_end
+
+
+def _remove_edits(f: TokenStream, s: _State) -> list[tuple[int, int, str]]:
+    """Delete the ``useState`` declaration and every setter statement."""
+    toks = f.toks
+    edits = [(*_whole_lines(f.text, toks[s.first].start, toks[s.last].end), '')]
+    for j in s.calls:
+        close = f.close[j + 1]
+        if is_token(f.tok(j - 1), PUNCT, '=>'):
+            edits.append((toks[j].start, toks[close].end, '{}'))
+            continue
+        end = close + 1 if is_token(f.tok(close + 1), PUNCT, ';') else close
+        edits.append((*_whole_lines(f.text, toks[j].start, toks[end].end), ''))
+    return edits
+
+
+def _motion_edits(f: TokenStream, s: _State, plan: dict, names: _Names) -> tuple[list, set[str]]:
+    toks, text = f.toks, f.text
+    keys, reads = plan['keys'], plan['reads']
+    edits = []
+    imports = {'useMotionValue'}
+    indent = _indent(text, toks[s.first].start)
+    values = {k: names.new(s.name + _camel(k)) for k in keys} if keys else {}
+    lo, hi = s.init
+    if keys:
+        inits = {toks[j].value: f.src(j + 2, j + 3 if is_token(toks[j + 2], PUNCT, '-') else j + 2)
+                 for j in range(lo + 1, hi) if f.parent[j] == lo and is_token(toks[j], IDENT)
+                 and is_token(toks[j + 1], PUNCT, ':')}
+        decls = [f'const {values[k]} = useMotionValue({inits[k]});' for k in keys]
+    else:
+        decls = [f'const {s.name} = useMotionValue({f.src(lo, hi)});']
+
+    templates = {}   # value range -> const name
+    owners = set()
+    for j, (read_hi, style) in sorted(reads.items()):
+        owners.add(style.owner)
+        v_lo, v_hi = style.value
+        if (v_lo, v_hi) == (j, read_hi):
+            if keys:
+                edits.append((toks[j].start, toks[read_hi].end, values[toks[j + 2].value]))
+            continue
+        if (v_lo, v_hi) not in templates:
+            templates[(v_lo, v_hi)] = names.new(s.name + _camel(style.prop))
+    for (v_lo, v_hi), name in templates.items():
+        parts = []
+        pos = toks[v_lo].start
+        for j in sorted(reads):
+            if v_lo < j < v_hi:
+                parts.append(text[pos:toks[j].start])
+                parts.append(values[toks[j + 2].value] if keys else s.name)
+                pos = toks[reads[j][0]].end
+        parts.append(text[pos:toks[v_hi].end])
+        decls.append(f'const {name} = useMotionTemplate{"".join(parts)};')
+        edits.append((toks[v_lo].start, toks[v_hi].end, name))
+        imports.add('useMotionTemplate')
+
+    decl = f'\n{indent}'.join(decls)
+    if not is_token(toks[s.last], PUNCT, ';'):
+        decl = decl[:-1]
+    edits.append((toks[s.first].start, toks[s.last].end, decl))
+
+    for j in s.calls:
+        close = f.close[j + 1]
+        arg = (j + 2, close - 1)
+        if keys:
+            fields = _object_fields(f, arg)
+            sets = [f'{values[k]}.set({fields[k]})' for k in keys]
+            if is_token(f.tok(j - 1), PUNCT, '=>'):
+                new = '{ ' + '; '.join(sets) + '; }'
+            else:
+                new = f';\n{_indent(text, toks[j].start)}'.join(sets)
+        else:
+            new = f'{s.name}.set({f.src(*arg)})'
+        edits.append((toks[j].start, toks[close].end, new))
+
+    for owner in owners:
+        tag = toks[owner].value
+        if tag.startswith('motion.'):
+            continue
+        close = _closing_tag(f, owner)
+        if close is False:
+            return [], set()
+        edits.append((toks[owner].start, toks[owner].end, f'motion.{tag}'))
+        if close is not None:
+            edits.append((toks[close].start, toks[close].start + len(tag), f'motion.{tag}'))
+        imports.add('motion')
+    return edits, imports
+
+
+def _closing_tag(f: TokenStream, owner: int):
+    """Token of ``</tag>`` for the element opened at ``owner``; None when it
+    self-closes, False when the structure can't be followed."""
+    depth = 0
+    tag = f.toks[owner].value
+    for j in range(owner, len(f.toks)):
+        kind = f.toks[j].kind
+        if kind == JSX_OPEN:
+            depth += 1
+        elif kind in (JSX_SELF_CLOSE, JSX_CLOSE):
+            depth -= 1
+            if depth == 0:
+                if kind == JSX_SELF_CLOSE:
+                    return None
+                return j if f.toks[j].value == tag else False
+    return False
+
+
+# --------------------------------------------------------------------------
+# Entry points
+# --------------------------------------------------------------------------
+
+def analyze(text: str) -> Analysis:
+    f = TokenStream(text)
+    states = _states(f)
+    by_name: dict[str, list[_State]] = {}
+    by_setter: dict[str, list[_State]] = {}
+    for s in states:
+        by_name.setdefault(s.name, []).append(s)
+        by_setter.setdefault(s.setter, []).append(s)
+    decl_tokens = {s.first + 2 for s in states} | {s.first + 4 for s in states}
+    for i, tok in enumerate(f.toks):
+        if tok.kind != IDENT or i in decl_tokens or not f.is_ref(i):
+            continue
+        s = _resolve(by_name.get(tok.value, ()), i)
+        if s is not None:
+            s.reads.append(i)
+            continue
+        s = _resolve(by_setter.get(tok.value, ()), i)
+        if s is not None:
+            s.calls.append(i)
+
+    defs = _definitions(f)
+    hot: dict[int, list[tuple]] = {}   # id(state) -> [(event, handler, token, throttled)]
+    for event, handler, (lo, hi) in _handlers(f, defs):
+        seen_here = set()
+        for j, s, throttled in _setter_calls(f, lo, hi, by_setter, defs, False, set()):
+            if id(s) in seen_here:
+                continue
+            seen_here.add(id(s))
+            hot.setdefault(id(s), []).append((event, handler, j, throttled))
+
+    findings, edits, rewritten = [], [], []
+    names = _Names(f.idents)
+    imports: dict[str, set[str]] = {}
+    converted_use_state = 0
+    for s in states:
+        if id(s) not in hot:
+            continue
+        fix, plan = _classify(f, s)
+        new_edits: list = []
+        if fix == 'remove':
+            new_edits = _remove_edits(f, s)
+        elif fix == 'motion':
+            new_edits, needed = _motion_edits(f, s, plan, names)
+            if not new_edits:
+                fix, s.reason = None, 'JSX structure not understood'
+            imports.setdefault('framer-motion', set()).update(needed)
+        if fix is not None:
+            edits.extend(new_edits)
+            if fix == 'remove':
+                handlers = ', '.join(sorted({h for _, h, _, _ in hot[id(s)]}))
+                rewritten.append(f'{s.name}: written, never read; removed (review {handlers})')
+            else:
+                rewritten.append(f'{s.name} -> useMotionValue')
+            converted_use_state += not s.react
+        for event, handler, j, throttled in hot[id(s)]:
+            findings.append(Finding(f.line(j), event, handler, s.setter, s.name,
+                                    throttled, len(s.reads), fix, s.reason))
+    if edits:
+        in_imports = {k for i, j, _ in import_statements(f) for k in range(i, j)}
+        remaining = sum(1 for i, t in enumerate(f.toks) if is_token(t, IDENT, 'useState') and f.is_ref(i)
+                        and i not in in_imports)
+        for module, add in imports.items():
+            remove = {'useState'} if module == 'react' and remaining == converted_use_state else set()
+            edits.extend(import_edits(f, module, add, remove))
+        if 'react' not in imports and remaining == converted_use_state:
+            edits.extend(import_edits(f, 'react', set(), {'useState'}))
+        edits.sort(key=lambda e: (e[0], e[1]))
+        if any(a[1] > b[0] for a, b in zip(edits, edits[1:])):
+            edits, rewritten = [], []
+            findings = [x._replace(fix=None, reason='overlapping rewrites') if x.fix else x for x in findings]
+    findings.sort(key=lambda x: (-x.score, x.line))
+    return Analysis(findings, edits, rewritten)
+
+
+def scan(text: str) -> list[Finding]:
+    return analyze(text).findings
+
+
+def scan_tree(root: str = '.', globs: Sequence[str] = DEFAULT_GLOBS,
+              cache: Optional[Cache] = None) -> list[tuple[str, Finding]]:
+    """Every finding in the tree, highest score first."""
+    version = fingerprint(module_version(__name__), module_version(tokenize.__module__))
+    found = []
+    for rel in iter_files(root, globs):
+        if cache is None:
+            with open(os.path.join(root, rel), 'r', encoding='utf-8') as fh:
+                findings = scan(fh.read())
+        else:
+            findings = [Finding(*x) for x in cache.memoize('hot-state', version, rel, scan)]
+        found.extend((rel, x) for x in findings)
+    found.sort(key=lambda p: (-p[1].score, p[0], p[1].line))
+    return found
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Find state set from mousemove/scroll/resize handlers.')
+    parser.add_argument('--root', default='.')
+    parser.add_argument('--no-cache', action='store_true')
+    parser.add_argument('--fix', action='store_true', help='apply the safe rewrites (hot-state rule)')
+    parser.add_argument('--dry-run', action='store_true', help='with --fix: print a diff instead of writing')
+    parser.add_argument('--limit', type=int, default=0, help='show only the top N findings')
+    args = parser.parse_args(argv)
+
+    if args.fix:
+        from .engine import main as engine_main
+        from .rules import load
+        return engine_main(load('hot_state'), ['--root', args.root] + ['--dry-run'] * args.dry_run
+                           + ['--no-cache'] * args.no_cache)
+
+    cache = None if args.no_cache else Cache(args.root)
+    try:
+        found = scan_tree(args.root, cache=cache)
+    finally:
+        if cache is not None:
+            cache.close()
+    shown = found[:args.limit] if args.limit else found
+    for rel, x in shown:
+        where = 'in rAF' if x.throttled else 'per event'
+        verdict = {'remove': 'written, never read: fixable by removing it',
+                   'motion': 'fixable: useMotionValue'}.get(x.fix, x.reason)
+        reads = f'{x.reads} read' + 's' * (x.reads != 1)
+        print(f'{x.score:6.1f}  {rel}:{x.line}: {x.setter}() in {x.event} handler {x.handler} '
+              f'({where}, {reads}) - {verdict}')
+    fixable = sum(1 for _, x in found if x.fix)
+    print(f'{len(found)} hot setState calls, {fixable} fixable with --fix')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
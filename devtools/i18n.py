@@ -0,0 +1,276 @@
+"""Structured parser and consistency report for the i18n.tsx dictionary.
+
+compare-translations.js and scripts/check-duplicate-keys.cjs cut the
+language blocks out with regexes, so a ``}`` inside a string or a changed
+blank line throws them off. This module runs the ``translations`` object
+literal through the TS tokenizer instead and builds a ``KeyTable``: every
+key is interned once, and each language is one row of
+``(key id, line, value)`` entries in source order.
+
+One pass over the table reports, per language, keys missing from or extra
+to English, keys defined twice, and values identical to the English ones
+(usually untranslated). The parsed table is cached by content hash, so
+re-runs on an unchanged i18n.tsx skip tokenizing entirely:
+
+    python -m devtools.i18n                 # i18n.tsx in the current dir
+    python -m devtools.i18n --identical     # also list untranslated values
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional, Sequence
+
+from .cache import Cache, fingerprint, module_version
+from .lineindex import LineIndex
+from .tokenizer import IDENT, NUMBER, PUNCT, STRING, TEMPLATE, tokenize
+
+DEFAULT_PATH = 'i18n.tsx'
+REFERENCE = 'en'
+
+_ESCAPE = re.compile(r'\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\r\n|[\s\S])')
+_SIMPLE_ESCAPES = {'n': '\n', 'r': '\r', 't': '\t', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0',
+                   '\n': '', '\r\n': '', '\u2028': '', '\u2029': ''}
+
+
+class I18nError(Exception):
+    """Raised when the ``translations`` literal cannot be found or parsed."""
+
+
+class Entry(NamedTuple):
+    key: int                 # index into KeyTable.keys
+    line: int
+    value: Optional[str]     # None when the value is not a plain string literal
+
+
+@dataclass
+class KeyTable:
+    keys: list[str] = field(default_factory=list)
+    rows: dict[str, list[Entry]] = field(default_factory=dict)
+    _ids: dict[str, int] = field(default_factory=dict, repr=False, compare=False)
+
+    def intern(self, key: str) -> int:
+        kid = self._ids.get(key)
+        if kid is None:
+            kid = self._ids[key] = len(self.keys)
+            self.keys.append(sys.intern(key))
+        return kid
+
+    def values(self, lang: str) -> dict[str, Optional[str]]:
+        """``key -> value`` for ``lang``; a later duplicate wins, as in JS."""
+        return {self.keys[e.key]: e.value for e in self.rows.get(lang, ())}
+
+    def to_json(self) -> dict:
+        return {'keys': self.keys, 'rows': {lang: [list(e) for e in row] for lang, row in self.rows.items()}}
+
+    @classmethod
+    def from_json(cls, data: dict) -> 'KeyTable':
+        table = cls()
+        for key in data['keys']:
+            table.intern(key)
+        table.rows = {lang: [Entry(*e) for e in row] for lang, row in data['rows'].items()}
+        return table
+
+
+def unquote(literal: str) -> str:
+    """Value of a JS string literal (or a template chunk without ``${}``)."""
+    body = literal[1:-1]
+    if '\\' not in body:
+        return body
+    return _ESCAPE.sub(_unescape, body)
+
+
+def _unescape(m: re.Match) -> str:
+    esc = m.group(1)
+    if esc[0] == 'u':
+        return chr(int(esc[2:-1] if esc[1] == '{' else esc[1:], 16))
+    if esc[0] == 'x':
+        return chr(int(esc[1:], 16))
+    return _SIMPLE_ESCAPES.get(esc, esc)
+
+
+def parse(text: str, name: str = 'translations') -> KeyTable:
+    """Tokenize ``text`` and read the ``name = { lang: { key: value } }`` literal."""
+    toks = list(tokenize(text, jsx=True))
+    start = _find_literal(toks, name)
+    lines = LineIndex(text)
+    table = KeyTable()
+    i = start + 1
+    while not _punct(toks, i, '}'):
+        lang, i = _property_key(toks, i)
+        if not _punct(toks, i, '{'):
+            raise I18nError(f'line {lines.line_col(toks[i].start)[0]}: expected an object for {lang!r}')
+        row = table.rows.setdefault(lang, [])
+        i += 1
+        while not _punct(toks, i, '}'):
+            key_tok = toks[i]
+            key, i = _property_key(toks, i)
+            value, i = _value(toks, i)
+            row.append(Entry(table.intern(key), lines.line_col(key_tok.start)[0], value))
+            i = _skip_comma(toks, i)
+        i = _skip_comma(toks, i + 1)
+    return table
+
+
+def _find_literal(toks: list, name: str) -> int:
+    for i, tok in enumerate(toks):
+        if tok.kind == IDENT and tok.value == name and i and toks[i - 1].value in ('const', 'let', 'var'):
+            # Skip the type annotation up to '=' at bracket depth 0.
+            depth = 0
+            for j in range(i + 1, len(toks)):
+                v = toks[j].value if toks[j].kind == PUNCT else None
+                if v in ('<', '(', '[', '{'):
+                    depth += 1
+                elif v in ('>', '>>', '>>>'):   # Record<Lang, Record<string, string>>
+                    depth -= len(v)
+                elif v in (')', ']', '}'):
+                    depth -= 1
+                elif v == '=' and depth == 0:
+                    if _punct(toks, j + 1, '{'):
+                        return j + 1
+                    break
+            break
+    raise I18nError(f'no object literal assigned to {name!r}')
+
+
+def _punct(toks: list, i: int, value: str) -> bool:
+    if i >= len(toks):
+        raise I18nError('unexpected end of file inside the translations literal')
+    return toks[i].kind == PUNCT and toks[i].value == value
+
+
+def _property_key(toks: list, i: int) -> tuple[str, int]:
+    tok = toks[i]
+    if tok.kind == STRING:
+        key = unquote(tok.value)
+    elif tok.kind in (IDENT, NUMBER):
+        key = tok.value
+    else:
+        raise I18nError(f'offset {tok.start}: unexpected {tok.value!r} where a property key was expected')
+    if not _punct(toks, i + 1, ':'):
+        raise I18nError(f'offset {toks[i + 1].start}: expected ":" after {key!r}')
+    return key, i + 2
+
+
+def _value(toks: list, i: int) -> tuple[Optional[str], int]:
+    """A value up to the next ``,``/``}`` at depth 0. Plain strings and
+    ``'a' + 'b'`` concatenations are decoded; anything else yields None."""
+    depth = 0
+    parts: list[str] = []
+    literal = True
+    expect_string = True
+    while True:
+        tok = toks[i] if i < len(toks) else None
+        if tok is None:
+            raise I18nError('unexpected end of file inside the translations literal')
+        if tok.kind == PUNCT:
+            if depth == 0 and tok.value in (',', '}'):
+                break
+            if tok.value in ('(', '[', '{', '${'):
+                depth += 1
+            elif tok.value in (')', ']', '}'):
+                depth -= 1
+        if expect_string and tok.kind in (STRING, TEMPLATE) and depth == 0:
+            if tok.kind == TEMPLATE and not (tok.value.startswith('`') and tok.value.endswith('`')
+                                             and len(tok.value) > 1):
+                literal = False
+            parts.append(unquote(tok.value))
+            expect_string = False
+        elif not expect_string and tok.kind == PUNCT and tok.value == '+' and depth == 0:
+            expect_string = True
+        else:
+            literal = False
+        i += 1
+    return (''.join(parts) if literal and parts and not expect_string else None), i
+
+
+def _skip_comma(toks: list, i: int) -> int:
+    return i + 1 if i < len(toks) and _punct(toks, i, ',') else i
+
+
+def load_table(path: str = DEFAULT_PATH, cache: Optional[Cache] = None) -> KeyTable:
+    """Parse ``path``; with a cache, an unchanged file is not re-tokenized."""
+    if cache is None:
+        with open(path, 'r', encoding='utf-8') as f:
+            return parse(f.read())
+    version = fingerprint(module_version(__name__), module_version(tokenize.__module__))
+    return KeyTable.from_json(cache.memoize('i18n:table', version, path, lambda text: parse(text).to_json()))
+
+
+@dataclass
+class Report:
+    counts: dict[str, int] = field(default_factory=dict)
+    missing: dict[str, list[str]] = field(default_factory=dict)
+    extra: dict[str, list[str]] = field(default_factory=dict)
+    duplicates: dict[str, dict[str, list[int]]] = field(default_factory=dict)
+    identical: dict[str, list[str]] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not any(self.missing.values()) and not any(self.extra.values()) \
+            and not any(self.duplicates.values())
+
+
+def analyze(table: KeyTable, reference: str = REFERENCE) -> Report:
+    """Missing/extra/duplicate/identical keys for every language against ``reference``."""
+    if reference not in table.rows:
+        raise I18nError(f'reference language {reference!r} not found')
+    ref_values = {e.key: e.value for e in table.rows[reference]}
+    report = Report()
+    for lang, row in table.rows.items():
+        seen: dict[int, list[int]] = {}
+        values: dict[int, Optional[str]] = {}
+        for e in row:
+            seen.setdefault(e.key, []).append(e.line)
+            values[e.key] = e.value
+        report.counts[lang] = len(seen)
+        report.duplicates[lang] = {table.keys[k]: v for k, v in seen.items() if len(v) > 1}
+        if lang == reference:
+            continue
+        report.missing[lang] = [table.keys[k] for k in ref_values if k not in seen]
+        report.extra[lang] = [table.keys[k] for k in seen if k not in ref_values]
+        report.identical[lang] = [table.keys[k] for k, v in values.items()
+                                  if v is not None and ref_values.get(k) == v]
+    return report
+
+
+def print_report(report: Report, path: str, identical: bool = False, out=sys.stdout) -> None:
+    counts = ', '.join(f'{lang} {n}' for lang, n in report.counts.items())
+    print(f'{path}: {counts}', file=out)
+    for lang in report.counts:
+        for key, lines in report.duplicates.get(lang, {}).items():
+            print(f'{path}:{lines[-1]}: {lang}: duplicate key {key!r} (also at line '
+                  f'{", ".join(map(str, lines[:-1]))})', file=out)
+        for label, keys in (('missing', report.missing.get(lang)), ('extra', report.extra.get(lang))):
+            if keys:
+                print(f'{lang}: {len(keys)} {label}: {", ".join(keys)}', file=out)
+        if identical and report.identical.get(lang):
+            keys = report.identical[lang]
+            print(f'{lang}: {len(keys)} identical to {REFERENCE}: {", ".join(keys)}', file=out)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Check i18n.tsx for missing, extra and duplicate keys.')
+    parser.add_argument('path', nargs='?', default=DEFAULT_PATH)
+    parser.add_argument('--no-cache', action='store_true')
+    parser.add_argument('--identical', action='store_true', help=f'also list values identical to {REFERENCE}')
+    args = parser.parse_args(argv)
+
+    cache = None if args.no_cache else Cache('.')
+    try:
+        table = load_table(args.path, cache)
+    except (OSError, I18nError) as e:
+        print(f'{args.path}: {e}', file=sys.stderr)
+        return 2
+    finally:
+        if cache is not None:
+            cache.close()
+    report = analyze(table)
+    print_report(report, args.path, identical=args.identical)
+    return 0 if report.ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
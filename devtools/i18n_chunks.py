@@ -0,0 +1,173 @@
+"""Split the i18n.tsx dictionary into one lazily loadable module per language.
+
+Every visitor needs one language, but ``translations`` ships all three in
+the entry chunk. This build step reads the table parsed by
+``devtools.i18n`` and writes:
+
+- ``lib/i18n/<lang>.ts``: the language as a compact object literal. The
+  first line records the content hash of that language.
+- ``lib/i18n/index.ts``: the loader index.tsx and I18nProvider use. The
+  reference language (en) is imported statically as the fallback for
+  missing keys. For any other language, ``loadTranslations(lang)``
+  dynamic-imports its module (Vite emits each as its own chunk) and
+  memoises it.
+
+A chunk whose recorded hash matches is left alone. Editing a Czech string
+rewrites cs.ts only, so the en and ru chunk hashes and their long-term
+browser caching survive. Writes go through ``devtools.output``. The chunks
+are committed; tests/i18n.test.tsx fails when they no longer match
+i18n.tsx, and ``--check`` reports the same from Python.
+
+    python -m devtools.i18n_chunks            # regenerate what changed
+    python -m devtools.i18n_chunks --check    # exit 1 if any chunk is stale
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from typing import Optional, Sequence
+
+from .cache import Cache, content_hash
+from .i18n import DEFAULT_PATH, REFERENCE, I18nError, KeyTable, load_table
+from .output import Batch, stage
+
+CHUNK_DIR = 'lib/i18n'
+_HEADER = '// Generated by devtools/i18n_chunks.py from {source}; do not edit. content-hash: {digest}\n'
+
+LOADER = """\
+// Generated by devtools/i18n_chunks.py from {source}; do not edit.
+import type {{ Lang }} from '{lang_module}';
+import {reference} from './{reference}';
+
+type Dict = Record<string, string>;
+
+/** {reference} ships in the entry chunk: `t` falls back to it for keys another language lacks. */
+export const fallbackTranslations: Dict = {reference};
+
+const loaders: Partial<Record<Lang, () => Promise<{{ default: Dict }}>>> = {{
+{loaders}
+}};
+
+const loaded: Partial<Record<Lang, Dict>> = {{ {reference} }};
+
+/** Fetch one language's dictionary; each language is a separate chunk. */
+export const loadTranslations = async (lang: Lang): Promise<Dict> => {{
+  const cached = loaded[lang];
+  if (cached) return cached;
+  const load = loaders[lang];
+  if (!load) return fallbackTranslations;
+  const dict = (await load()).default;
+  loaded[lang] = dict;
+  return dict;
+}};
+
+/** The dictionary for `lang` if it has already been loaded. */
+export const peekTranslations = (lang: Lang): Dict | undefined => loaded[lang];
+"""
+
+
+def chunk_body(table: KeyTable, lang: str) -> str:
+    values = table.values(lang)
+    dynamic = [k for k, v in values.items() if v is None]
+    if dynamic:
+        raise I18nError(f'{lang}: values are not plain strings: {", ".join(dynamic)}')
+    return json.dumps(values, ensure_ascii=False, separators=(',', ':'))
+
+
+def render_chunk(body: str, digest: str, source: str) -> str:
+    return (_HEADER.format(source=source, digest=digest)
+            + f'const dict: Record<string, string> = {body};\n\nexport default dict;\n')
+
+
+def render_loader(langs: Sequence[str], source: str, out_dir: str, reference: str = REFERENCE) -> str:
+    lang_module = os.path.splitext(os.path.relpath(source, out_dir).replace(os.sep, '/'))[0]
+    if not lang_module.startswith('.'):
+        lang_module = './' + lang_module
+    loaders = '\n'.join(f"  {lang}: () => import('./{lang}')," for lang in langs if lang != reference)
+    return LOADER.format(source=source, lang_module=lang_module, loaders=loaders, reference=reference)
+
+
+def recorded_hash(path: str) -> Optional[str]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            first = f.readline()
+    except FileNotFoundError:
+        return None
+    _, sep, digest = first.rstrip('\n').rpartition('content-hash: ')
+    return digest if sep else None
+
+
+def generate(root: str = '.', source: str = DEFAULT_PATH, out_dir: str = CHUNK_DIR,
+             cache: Optional[Cache] = None, check: bool = False) -> list[tuple[str, str]]:
+    """Bring the chunks up to date; returns ``(path, 'written' | 'stale' | 'unchanged')``.
+
+    With ``check`` nothing is written and out-of-date files report ``stale``.
+    """
+    table = load_table(source if cache is not None else os.path.join(root, source), cache)
+    # (relpath, new text); None when the recorded hash says it's current.
+    wanted: list[tuple[str, Optional[str]]] = []
+    for lang in table.rows:
+        body = chunk_body(table, lang)
+        digest = content_hash(body.encode('utf-8'))
+        rel = f'{out_dir}/{lang}.ts'
+        current = recorded_hash(os.path.join(root, rel)) == digest
+        wanted.append((rel, None if current else render_chunk(body, digest, source)))
+    wanted.append((f'{out_dir}/index.ts', render_loader(list(table.rows), source, out_dir)))
+
+    results = []
+    batch = Batch()
+    try:
+        for rel, text in wanted:
+            path = os.path.join(root, rel)
+            if text is None:
+                results.append((rel, 'unchanged'))
+            elif check:
+                results.append((rel, 'unchanged' if _read(path) == text else 'stale'))
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                temp = stage(path, text)
+                if temp is not None:
+                    batch.add(path, temp)
+                results.append((rel, 'unchanged' if temp is None else 'written'))
+        batch.commit()
+    finally:
+        batch.discard()
+    return results
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Write one lazily loaded translation module per language.')
+    parser.add_argument('--root', default='.')
+    parser.add_argument('--source', default=DEFAULT_PATH, help='dictionary file (default: %(default)s)')
+    parser.add_argument('--out', default=CHUNK_DIR, help='output directory (default: %(default)s)')
+    parser.add_argument('--check', action='store_true', help='write nothing; exit 1 if a chunk is stale')
+    parser.add_argument('--no-cache', action='store_true')
+    args = parser.parse_args(argv)
+
+    cache = None if args.no_cache else Cache(args.root)
+    try:
+        results = generate(args.root, args.source, args.out, cache, check=args.check)
+    except (OSError, I18nError) as e:
+        print(f'{args.source}: {e}', file=sys.stderr)
+        return 2
+    finally:
+        if cache is not None:
+            cache.close()
+    for rel, status in results:
+        if status != 'unchanged':
+            print(f'{status.capitalize()} {rel}')
+    return 1 if any(status == 'stale' for _, status in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""Index of translation-key usage, joined against the i18n.tsx key table.
+
+Every scanned file is tokenized once and reduced to a ``FileUsage``:
+
+- ``calls``: literal keys passed to ``t('...')``
+- ``dynamic``: any other ``t(...)`` argument, with its source text. A
+  template literal such as ``t(`project.${i}.title`)`` also gets a glob,
+  ``project.*.title``.
+- ``strings``: other key-shaped string literals (``'project.1.title'`` in
+  constants.tsx). These are what ``t(project.title)`` resolves to at run
+  time.
+
+Per-file results are cached by content hash, so after an edit only that
+file is re-tokenized. ``join`` then sorts every key in the table into
+direct / via-string / via-pattern / unused. The unused ones are what can
+be pruned from the bundle:
+
+    python -m devtools.i18n_usage
+    python -m devtools.i18n_usage --dynamic     # also list dynamic call sites
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional, Sequence
+
+from .cache import Cache, fingerprint, module_version
+from .engine import iter_files
+from .i18n import DEFAULT_PATH, REFERENCE, I18nError, KeyTable, load_table, unquote
+from .i18n_chunks import CHUNK_DIR
+from .lineindex import LineIndex
+from .tokenizer import IDENT, PUNCT, STRING, TEMPLATE, matching, tokenize
+
+DEFAULT_GLOBS = (
+    'components/**/*.{ts,tsx}', 'pages/**/*.{ts,tsx}', 'lib/**/*.{ts,tsx}', '*.{ts,tsx}',
+)
+# Root modules such as App.tsx and constants.tsx use keys too. Copies of the
+# dictionary are skipped: every key appears in them as a literal.
+DICTIONARY_COPIES = ('i18n_backup.tsx',)
+_KEY_SHAPED = re.compile(r'[\w-]+(?:\.[\w-]+)+\Z')
+
+
+class Dynamic(NamedTuple):
+    line: int
+    expr: str
+    pattern: Optional[str]   # glob over keys for template literals, else None
+
+
+class FileUsage(NamedTuple):
+    calls: list[tuple[str, int]]     # (key, line)
+    dynamic: list[Dynamic]
+    strings: list[str]
+
+
+def scan(text: str, func: str = 't') -> FileUsage:
+    toks = list(tokenize(text, jsx=True))
+    lines = LineIndex(text)
+    calls: list[tuple[str, int]] = []
+    dynamic: list[Dynamic] = []
+    args: set[int] = set()   # token indices consumed as call arguments
+    for i, tok in enumerate(toks):
+        if tok.kind != IDENT or tok.value != func or i + 1 >= len(toks):
+            continue
+        if not (toks[i + 1].kind == PUNCT and toks[i + 1].value == '('):
+            continue
+        if i and toks[i - 1].kind == IDENT and toks[i - 1].value == 'function':
+            continue
+        close = matching(toks, i + 1)
+        if close is None:
+            continue
+        arg = toks[i + 2:_first_comma(toks, i + 2, close)]
+        line = lines.line_col(tok.start)[0]
+        if (len(arg) == 1 and arg[0].kind == STRING) or _whole_template(arg):
+            calls.append((unquote(arg[0].value), line))
+        else:
+            expr = text[toks[i + 1].end:toks[close].start].strip()
+            dynamic.append(Dynamic(line, expr, _template_glob(arg)))
+        args.update(range(i + 2, close))
+    strings = sorted({unquote(t.value) for j, t in enumerate(toks)
+                      if j not in args and (t.kind == STRING or _whole_template([t]))
+                      and _KEY_SHAPED.match(t.value[1:-1])})
+    return FileUsage(calls, dynamic, strings)
+
+
+def _first_comma(toks: list, start: int, close: int) -> int:
+    depth = 0
+    for j in range(start, close):
+        v = toks[j].value if toks[j].kind == PUNCT else None
+        if v in ('(', '[', '{', '${'):
+            depth += 1
+        elif v in (')', ']', '}'):
+            depth -= 1
+        elif v == ',' and depth == 0:
+            return j
+    return close
+
+
+def _whole_template(arg: list) -> bool:
+    return len(arg) == 1 and arg[0].kind == TEMPLATE and len(arg[0].value) > 1 \
+        and arg[0].value[0] == '`' and arg[0].value[-1] == '`'
+
+
+def _template_glob(arg: list) -> Optional[str]:
+    """``project.*.title`` for ``\\`project.${i}.title\\```; None for non-templates."""
+    if not arg or arg[0].kind != TEMPLATE:
+        return None
+    parts = []
+    depth = 0
+    for tok in arg:
+        if tok.kind == PUNCT and tok.value == '${':
+            if depth == 0:
+                parts.append('*')
+            depth += 1
+        elif tok.kind == PUNCT and tok.value == '}' and depth:
+            depth -= 1
+        elif tok.kind == TEMPLATE and depth == 0:
+            parts.append(tok.value.strip('`'))
+        elif depth == 0:
+            return None   # e.g. `a.${x}` + suffix
+    return ''.join(parts)
+
+
+def build_index(root: str = '.', globs: Sequence[str] = DEFAULT_GLOBS, cache: Optional[Cache] = None,
+                exclude: Sequence[str] = (DEFAULT_PATH, *DICTIONARY_COPIES)) -> dict[str, FileUsage]:
+    """``FileUsage`` for every matched file; with a cache only changed files are re-scanned."""
+    version = fingerprint(module_version(__name__), module_version(tokenize.__module__))
+    index = {}
+    for rel in iter_files(root, globs):
+        # Generated per-language chunks hold every key as a string literal.
+        if rel in exclude or rel.startswith(CHUNK_DIR + '/'):
+            continue
+        if cache is None:
+            with open(os.path.join(root, rel), 'r', encoding='utf-8') as f:
+                usage = scan(f.read())
+        else:
+            calls, dynamic, strings = cache.memoize('i18n:usage', version, rel, scan)
+            usage = FileUsage([tuple(c) for c in calls], [Dynamic(*d) for d in dynamic], strings)
+        index[rel] = usage
+    return index
+
+
+@dataclass
+class UsageReport:
+    direct: set[str] = field(default_factory=set)     # t('key')
+    via_string: set[str] = field(default_factory=set)  # key-shaped literal elsewhere
+    via_pattern: set[str] = field(default_factory=set)  # matches a t(`...${x}...`) glob
+    unused: list[str] = field(default_factory=list)    # in table order
+    unknown: list[tuple[str, int, str]] = field(default_factory=list)   # (path, line, key) not in table
+
+
+def join(table: KeyTable, index: dict[str, FileUsage]) -> UsageReport:
+    known = set(table.keys)
+    report = UsageReport()
+    strings: set[str] = set()
+    globs: set[str] = set()
+    for path, usage in index.items():
+        for key, line in usage.calls:
+            if key in known:
+                report.direct.add(key)
+            else:
+                report.unknown.append((path, line, key))
+        strings.update(usage.strings)
+        globs.update(d.pattern for d in usage.dynamic if d.pattern)
+    report.via_string = (strings & known) - report.direct
+    if globs:
+        rx = re.compile('|'.join('(?:%s)' % re.escape(g).replace(r'\*', '.*') for g in sorted(globs)))
+        report.via_pattern = {k for k in known - report.direct - report.via_string if rx.fullmatch(k)}
+    used = report.direct | report.via_string | report.via_pattern
+    report.unused = [k for k in table.keys if k not in used]
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Find translation keys that no component uses.')
+    parser.add_argument('--root', default='.')
+    parser.add_argument('--i18n', default=DEFAULT_PATH, help='dictionary file (default: %(default)s)')
+    parser.add_argument('--exclude', action='append', default=[], metavar='FILE',
+                        help=f'another file not to count uses in (always: {", ".join(DICTIONARY_COPIES)})')
+    parser.add_argument('--no-cache', action='store_true')
+    parser.add_argument('--dynamic', action='store_true', help='list t(...) calls with non-literal keys')
+    args = parser.parse_args(argv)
+
+    cache = None if args.no_cache else Cache(args.root)
+    try:
+        table = load_table(os.path.join(args.root, args.i18n) if cache is None else args.i18n, cache)
+        index = build_index(args.root, cache=cache, exclude=(args.i18n, *DICTIONARY_COPIES, *args.exclude))
+    except (OSError, I18nError) as e:
+        print(f'{args.i18n}: {e}', file=sys.stderr)
+        return 2
+    finally:
+        if cache is not None:
+            cache.close()
+
+    report = join(table, index)
+    dynamic = sum(len(u.dynamic) for u in index.values())
+    print(f'{len(index)} files, {len(table.keys)} keys: {len(report.direct)} direct, '
+          f'{len(report.via_string)} via string literals, {len(report.via_pattern)} via templates, '
+          f'{len(report.unused)} unused; {dynamic} dynamic call sites')
+    for path, line, key in report.unknown:
+        print(f'{path}:{line}: t({key!r}) is not in {args.i18n}')
+    if args.dynamic:
+        for path, usage in index.items():
+            for d in usage.dynamic:
+                hint = f' (matches {d.pattern})' if d.pattern else ''
+                print(f'{path}:{d.line}: dynamic key t({d.expr}){hint}')
+    lines = {table.keys[e.key]: e.line for e in table.rows.get(REFERENCE, ())}
+    for key in report.unused:
+        print(f'{args.i18n}:{lines.get(key, 0)}: unused key {key!r}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,350 @@
+"""Undo journal for codemod runs.
+
+Codemods used to overwrite files in place with no way back. The only way to
+recover was a hand-made copy such as ``i18n_backup.tsx``. Now a ``Batch``
+given a ``Journal`` writes one record per run before it renames anything.
+For each file the record holds:
+
+- the content hash before and after the run
+- a reverse diff: the line ranges of the new text to replace, and the
+  original lines to put back. Unchanged lines are not stored.
+
+Records are zlib-compressed JSON under ``.devtools-cache/journal/``. A
+codemod usually touches a few lines per file, so a record costs a few
+percent of the bytes it rewrote. ``undo`` checks that each file still
+hashes to its "after" value, rebuilds the original and commits the result
+as a batch, which is itself journaled. A file edited since the run stops
+the undo: nothing is written and the file is reported. Old runs are
+garbage-collected every time a record is written.
+
+Run ids are the UTC time down to the microsecond plus two random bytes, so
+sorting them orders runs by time even within one second (``undo last``
+and ``gc`` rely on that).
+
+    python -m devtools journal                # list runs, newest last
+    python -m devtools journal show last
+    python -m devtools undo 20261017-081500-042913-3fa2
+    python -m devtools undo last --dry-run
+    python -m devtools journal gc --keep 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import zlib
+from difflib import SequenceMatcher
+from typing import NamedTuple, Optional, Sequence
+
+from .cache import DEFAULT_DIR, content_hash
+from .output import Batch, stage, unified_diff
+
+KEEP = 50                       # runs kept by gc, newest first
+MAX_AGE = 30 * 24 * 3600        # and none older than this
+SUFFIX = '.z'
+
+
+class Entry(NamedTuple):
+    path: str                   # relative to the journal's root
+    before: Optional[str]       # content hash; None if the run created the file
+    after: str
+    ops: list                   # [start, end, original lines] over the new text's lines
+
+
+class Run(NamedTuple):
+    id: str
+    created: float
+    command: str
+    written: int                # bytes the run wrote
+    entries: list[Entry]
+
+
+class JournalError(Exception):
+    """Unknown or ambiguous run id, or an unreadable record."""
+
+
+def journal_dir(root: str = '.') -> str:
+    return os.path.join(root, DEFAULT_DIR, 'journal')
+
+
+def _lines(data: bytes) -> list[str]:
+    # surrogateescape round-trips any byte, so the hashes still match on undo.
+    return data.decode('utf-8', 'surrogateescape').splitlines(keepends=True)
+
+
+def reverse_ops(old: bytes, new: bytes) -> list:
+    """Edits that turn ``new`` back into ``old``, as ``[start, end, lines]`` over the lines of ``new``."""
+    a, b = _lines(new), _lines(old)
+    # Codemods change a few lines; trimming the common ends keeps the matcher off the rest.
+    head = 0
+    while head < len(a) and head < len(b) and a[head] == b[head]:
+        head += 1
+    tail = 0
+    while tail < len(a) - head and tail < len(b) - head and a[-1 - tail] == b[-1 - tail]:
+        tail += 1
+    matcher = SequenceMatcher(None, a[head:len(a) - tail], b[head:len(b) - tail])
+    return [[head + i1, head + i2, b[head + j1:head + j2]]
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != 'equal']
+
+
+def apply_reverse(new: bytes, ops: Sequence) -> bytes:
+    lines = _lines(new)
+    out = []
+    pos = 0
+    for start, end, original in ops:
+        out += lines[pos:start]
+        out += original
+        pos = end
+    out += lines[pos:]
+    return ''.join(out).encode('utf-8', 'surrogateescape')
+
+
+def _program() -> str:
+    path = sys.argv[0]
+    if os.path.basename(path) == '__main__.py':   # python -m devtools
+        return 'python -m ' + os.path.basename(os.path.dirname(path))
+    return os.path.basename(path)
+
+
+class Journal:
+    """Records what a ``Batch`` overwrites; pass one as ``Batch(journal=...)``."""
+
+    def __init__(self, root: str = '.', command: Optional[str] = None, directory: Optional[str] = None,
+                 keep: int = KEEP, max_age: float = MAX_AGE):
+        self.root = root
+        self.directory = directory or journal_dir(root)
+        self.command = command or ' '.join([_program(), *sys.argv[1:]])
+        self.keep = keep
+        self.max_age = max_age
+        self.run_id: Optional[str] = None
+        self.size = 0               # bytes of the last record
+        self.written = 0
+
+    def write(self, pending: Sequence[tuple[str, str]], fsync: bool = False) -> str:
+        """Record ``(target, temp)`` pairs about to be renamed; returns the run id."""
+        entries = []
+        written = 0
+        for target, temp in pending:
+            with open(temp, 'rb') as f:
+                new = f.read()
+            try:
+                with open(target, 'rb') as f:
+                    old = f.read()
+            except FileNotFoundError:
+                old = None
+            written += len(new)
+            rel = os.path.relpath(target, self.root).replace(os.sep, '/')
+            if old is None:
+                entries.append(Entry(rel, None, content_hash(new), []))
+            else:
+                entries.append(Entry(rel, content_hash(old), content_hash(new), reverse_ops(old, new)))
+        now = time.time_ns()
+        run_id = new_run_id(now)
+        record = {'id': run_id, 'created': now / 1e9, 'command': self.command, 'written': written,
+                  'entries': [e._asdict() for e in entries]}
+        data = zlib.compress(json.dumps(record, separators=(',', ':')).encode())
+        os.makedirs(self.directory, exist_ok=True)
+        fd, temp = tempfile.mkstemp(prefix='.run.', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(temp, os.path.join(self.directory, run_id + SUFFIX))
+        except BaseException:
+            try:
+                os.unlink(temp)
+            except FileNotFoundError:
+                pass
+            raise
+        self.run_id, self.size, self.written = run_id, len(data), written
+        gc(self.directory, self.keep, self.max_age)
+        return run_id
+
+
+def new_run_id(now_ns: int) -> str:
+    """``YYYYmmdd-HHMMSS-micros-rand`` in UTC: sorts by time, and the random
+    suffix only separates runs started in the same microsecond."""
+    seconds, ns = divmod(now_ns, 1_000_000_000)
+    return f'{time.strftime("%Y%m%d-%H%M%S", time.gmtime(seconds))}-{ns // 1000:06d}-{os.urandom(2).hex()}'
+
+
+def run_ids(directory: str) -> list[str]:
+    """Recorded runs, oldest first (ids start with their timestamp)."""
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return []
+    return sorted(n[:-len(SUFFIX)] for n in names if n.endswith(SUFFIX) and not n.startswith('.'))
+
+
+def find(directory: str, ref: str) -> str:
+    """Run id for ``ref``: a full id, a unique prefix, or ``last``."""
+    ids = run_ids(directory)
+    if ref == 'last':
+        if not ids:
+            raise JournalError('no runs recorded')
+        return ids[-1]
+    matches = [i for i in ids if i.startswith(ref)]
+    if len(matches) != 1:
+        raise JournalError(f'{"no" if not matches else "ambiguous"} run {ref!r}')
+    return matches[0]
+
+
+def load(directory: str, run_id: str) -> Run:
+    try:
+        with open(os.path.join(directory, run_id + SUFFIX), 'rb') as f:
+            data = f.read()
+        record = json.loads(zlib.decompress(data))
+    except (OSError, zlib.error, ValueError) as e:
+        raise JournalError(f'{run_id}: {e}') from None
+    entries = [Entry(**e) for e in record['entries']]
+    return Run(record['id'], record['created'], record['command'], record['written'], entries)
+
+
+def gc(directory: str, keep: int = KEEP, max_age: float = MAX_AGE) -> int:
+    """Delete all but the ``keep`` newest runs, and any older than ``max_age`` seconds."""
+    ids = run_ids(directory)
+    cutoff = time.time() - max_age
+    removed = 0
+    for i, run_id in enumerate(ids):
+        path = os.path.join(directory, run_id + SUFFIX)
+        try:
+            if i < len(ids) - keep or os.stat(path).st_mtime < cutoff:
+                os.unlink(path)
+                removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+class Conflict(NamedTuple):
+    path: str
+    reason: str
+
+
+def undo(root: str, run: Run, dry_run: bool = False, journal: Optional[Journal] = None,
+         out=sys.stdout) -> tuple[list[str], list[Conflict]]:
+    """Put back what ``run`` overwrote; ``(paths restored, conflicts)``.
+
+    All or nothing: with any conflict, no file is touched. Files already at
+    their original content are left alone. Files the run created are deleted.
+    """
+    restore: list[tuple[str, bytes, bytes]] = []
+    delete = []
+    conflicts = []
+    for e in run.entries:
+        path = os.path.join(root, e.path)
+        try:
+            with open(path, 'rb') as f:
+                current = f.read()
+        except FileNotFoundError:
+            if e.before is not None:
+                conflicts.append(Conflict(e.path, 'deleted since the run'))
+            continue
+        digest = content_hash(current)
+        if digest == e.before:
+            continue
+        if digest != e.after:
+            conflicts.append(Conflict(e.path, 'changed since the run'))
+        elif e.before is None:
+            delete.append(e.path)
+        else:
+            original = apply_reverse(current, e.ops)
+            if content_hash(original) != e.before:
+                conflicts.append(Conflict(e.path, 'journal record does not reproduce the original'))
+            else:
+                restore.append((e.path, current, original))
+    if conflicts:
+        return [], conflicts
+
+    done = [rel for rel, _, _ in restore] + delete
+    if dry_run:
+        for rel, current, original in restore:
+            out.write(unified_diff(rel, current.decode('utf-8', 'surrogateescape'),
+                                   original.decode('utf-8', 'surrogateescape')))
+        for rel in delete:
+            out.write(f'delete {rel}\n')
+        return done, []
+    batch = Batch(journal=journal)
+    try:
+        for rel, current, original in restore:
+            path = os.path.join(root, rel)
+            temp = stage(path, original.decode('utf-8', 'surrogateescape'), current.decode('utf-8', 'surrogateescape'))
+            if temp is not None:
+                batch.add(path, temp)
+        batch.commit()
+    finally:
+        batch.discard()
+    for rel in delete:
+        os.unlink(os.path.join(root, rel))
+    return done, []
+
+
+def _describe(run: Run, size: int) -> str:
+    when = time.strftime('%Y-%m-%d %H:%M', time.localtime(run.created))
+    share = f'{100 * size / run.written:.1f}%' if run.written else '-'
+    return f'{run.id}  {when}  {len(run.entries):3d} files  journal {size} B ({share} of {run.written} B)  {run.command}'
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='List, undo and garbage-collect journaled codemod runs.')
+    parser.add_argument('--root', default='.', help='repository root (default: cwd)')
+    # --root is accepted after the action too, as in ``python -m devtools undo last --root ..``.
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--root', default=argparse.SUPPRESS)
+    sub = parser.add_subparsers(dest='action')
+    sub.add_parser('list', parents=[common], help='recorded runs, oldest first (the default)')
+    show = sub.add_parser('show', parents=[common], help='the files a run touched')
+    show.add_argument('run', help='run id, unique prefix, or "last"')
+    back = sub.add_parser('undo', parents=[common], help='restore the files a run overwrote')
+    back.add_argument('run', help='run id, unique prefix, or "last"')
+    back.add_argument('--dry-run', action='store_true', help='print the diff instead of writing')
+    collect = sub.add_parser('gc', parents=[common], help='delete old runs')
+    collect.add_argument('--keep', type=int, default=KEEP, help='runs to keep (default: %(default)s)')
+    collect.add_argument('--max-age', type=float, default=MAX_AGE / 86400, metavar='DAYS',
+                         help='delete runs older than this (default: %(default)s)')
+    args = parser.parse_args(argv)
+    directory = journal_dir(args.root)
+
+    if args.action == 'gc':
+        removed = gc(directory, args.keep, args.max_age * 86400)
+        print(f'removed {removed} run(s), {len(run_ids(directory))} left')
+        return 0
+    try:
+        if args.action in (None, 'list'):
+            for run_id in run_ids(directory):
+                print(_describe(load(directory, run_id), os.path.getsize(os.path.join(directory, run_id + SUFFIX))))
+            return 0
+        run = load(directory, find(directory, args.run))
+    except JournalError as e:
+        print(f'journal: {e}', file=sys.stderr)
+        return 2
+    if args.action == 'show':
+        print(_describe(run, os.path.getsize(os.path.join(directory, run.id + SUFFIX))))
+        for e in run.entries:
+            changed = sum(end - start for start, end, _ in e.ops)
+            print(f'  {e.path}: {"created" if e.before is None else f"{len(e.ops)} hunks, {changed} lines"}')
+        return 0
+
+    journal = None if args.dry_run else Journal(args.root, command=f'undo {run.id}')
+    done, conflicts = undo(args.root, run, args.dry_run, journal)
+    for c in conflicts:
+        print(f'{c.path}: {c.reason}', file=sys.stderr)
+    if conflicts:
+        print(f'nothing restored; {len(conflicts)} file(s) no longer match run {run.id}', file=sys.stderr)
+        return 1
+    if not args.dry_run:
+        for rel in done:
+            print(f'Restored {rel}')
+        if journal is not None and journal.run_id:
+            print(f'undo recorded as run {journal.run_id}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
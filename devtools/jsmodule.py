@@ -0,0 +1,242 @@
+"""Module-level structure of a TS/TSX file: imports and top-level consts.
+
+Helpers shared by the token-stream codemods (hot_state, style_hoist,
+memoize). They work on a ``TokenStream`` and return token indices or
+``(start, end, replacement)`` edits for ``LineIndex.apply_edits``.
+"""
+from __future__ import annotations
+
+import os
+from typing import NamedTuple, Optional
+
+from .tokenizer import IDENT, PUNCT, STRING, TokenStream, is_token
+
+
+# tsconfig "paths" / vite "resolve.alias": '@/x' is './x' from the root.
+ALIASES = {'@/': ''}
+EXTENSIONS = ('.tsx', '.ts', '.jsx', '.js')
+
+
+class ModuleConst(NamedTuple):
+    first: int       # token index of 'const'
+    last: int        # token index of the terminating ';' (or last token)
+    init: tuple[int, int]
+
+
+def module_consts(ts: TokenStream) -> dict[str, ModuleConst]:
+    """Top-level ``const NAME = ...`` declarations by name."""
+    toks = ts.toks
+    found = {}
+    for i, tok in enumerate(toks):
+        if not (is_token(tok, IDENT, 'const') and ts.parent[i] == -1 and is_token(ts.tok(i + 1), IDENT)):
+            continue
+        j = i + 2
+        if is_token(ts.tok(j), PUNCT, ':'):   # type annotation
+            while j < len(toks) and not (ts.parent[j] == -1 and is_token(toks[j], PUNCT, '=')):
+                j += 1
+        if not is_token(ts.tok(j), PUNCT, '='):
+            continue
+        end = j + 1
+        while end < len(toks) and not (ts.parent[end] == -1 and (
+                is_token(toks[end], PUNCT, ';') or (end > j + 1 and starts_statement(ts, end)))):
+            end += 1
+        last = end if end < len(toks) and is_token(toks[end], PUNCT, ';') else end - 1
+        init_hi = last - 1 if is_token(toks[last], PUNCT, ';') else last
+        if is_token(toks[init_hi], IDENT, 'const') and is_token(ts.tok(init_hi - 1), IDENT, 'as'):
+            init_hi -= 2
+        found[toks[i + 1].value] = ModuleConst(i, last, (j + 1, init_hi))
+    return found
+
+
+def starts_statement(ts: TokenStream, i: int) -> bool:
+    prev = ts.tok(i - 1)
+    return is_token(ts.toks[i], IDENT, 'const', 'let', 'var', 'function', 'export', 'import', 'class',
+                    'interface', 'type') and ts.toks[i].start > 0 and \
+        '\n' in ts.text[prev.end:ts.toks[i].start]
+
+
+def import_statements(ts: TokenStream) -> list[tuple[int, int, int]]:
+    """``(import token, module string token, last token)`` per top-level import."""
+    toks = ts.toks
+    found = []
+    for i, tok in enumerate(toks):
+        if not (is_token(tok, IDENT, 'import') and ts.parent[i] == -1) or is_token(ts.tok(i + 1), PUNCT, '('):
+            continue
+        j = i + 1
+        while j < len(toks) and toks[j].kind != STRING:
+            j += 1
+        if j < len(toks):
+            found.append((i, j, j + 1 if is_token(ts.tok(j + 1), PUNCT, ';') else j))
+    return found
+
+
+def import_bindings(ts: TokenStream) -> list[tuple[str, str, str]]:
+    """``(local name, imported name, module)`` per binding; imported is ``default`` or ``*`` for those forms."""
+    toks = ts.toks
+    found = []
+    for i, j, _ in import_statements(ts):
+        module = toks[j].value[1:-1]
+        k = i + 1
+        if is_token(toks[k], IDENT, 'type'):
+            continue
+        while k < j:
+            tok = toks[k]
+            if is_token(tok, PUNCT, '{'):
+                for m in range(k + 1, ts.close.get(k, j)):
+                    if not is_token(toks[m], IDENT) or is_token(toks[m], IDENT, 'as', 'type') \
+                            or is_token(ts.tok(m + 1), IDENT, 'as'):
+                        continue
+                    imported = toks[m - 2].value if is_token(toks[m - 1], IDENT, 'as') else tok.value
+                    found.append((toks[m].value, imported if imported != '{' else toks[m].value, module))
+                k = ts.close.get(k, j) + 1
+                continue
+            if is_token(tok, PUNCT, '*') and is_token(ts.tok(k + 1), IDENT, 'as'):
+                found.append((toks[k + 2].value, '*', module))
+                k += 3
+                continue
+            if is_token(tok, IDENT) and not is_token(tok, IDENT, 'from'):
+                found.append((tok.value, 'default', module))
+            k += 1
+    return found
+
+
+def export_names(ts: TokenStream) -> Optional[set[str]]:
+    """Names the module exports (``default`` included); ``None`` if it has ``export * from``."""
+    toks = ts.toks
+    names = set()
+    for i, tok in enumerate(toks):
+        if not (is_token(tok, IDENT, 'export') and ts.parent[i] == -1):
+            continue
+        nxt = ts.tok(i + 1)
+        if is_token(nxt, IDENT, 'default'):
+            names.add('default')
+        elif is_token(nxt, PUNCT, '*'):
+            if not is_token(ts.tok(i + 2), IDENT, 'as'):
+                return None
+            names.add(ts.tok(i + 3).value)
+        elif is_token(nxt, PUNCT, '{'):
+            for k in range(i + 2, ts.close.get(i + 1, i + 1)):
+                if is_token(toks[k], IDENT) and not is_token(toks[k], IDENT, 'as', 'type') \
+                        and is_token(ts.tok(k + 1), PUNCT, ',', '}'):
+                    names.add(toks[k].value)
+        else:
+            k = i + 1
+            while is_token(ts.tok(k), IDENT, 'declare', 'async', 'abstract'):
+                k += 1
+            if is_token(ts.tok(k), IDENT, 'const') and is_token(ts.tok(k + 1), IDENT, 'enum'):
+                k += 1
+            if is_token(ts.tok(k), IDENT, 'const', 'let', 'var', 'function', 'class', 'interface', 'type',
+                        'enum', 'namespace'):
+                k += 1
+                if is_token(ts.tok(k), PUNCT, '*'):
+                    k += 1
+                if is_token(ts.tok(k), IDENT):
+                    names.add(toks[k].value)
+    return names
+
+
+def resolve(root: str, importer: str, spec: str) -> Optional[str]:
+    """Root-relative path of the file ``spec`` names from ``importer``; ``None`` for packages."""
+    for prefix, target in ALIASES.items():
+        if spec.startswith(prefix):
+            base = target + spec[len(prefix):]
+            break
+    else:
+        if not spec.startswith('.'):
+            return None
+        base = os.path.join(os.path.dirname(importer), spec)
+    base = os.path.normpath(base).replace(os.sep, '/')
+    candidates = [base] if os.path.splitext(base)[1] in EXTENSIONS else []
+    candidates += [base + ext for ext in EXTENSIONS] + [f'{base}/index{ext}' for ext in EXTENSIONS]
+    for rel in candidates:
+        if os.path.isfile(os.path.join(root, rel)):
+            return rel
+    return None
+
+
+def import_edits(ts: TokenStream, module: str, add: set[str], remove: set[str] = frozenset()) -> list:
+    """Add names to (or drop them from) ``import { ... } from 'module'``.
+
+    Dropping every named binding removes the braces, or the whole
+    declaration when it has no default import either.
+    """
+    toks = ts.toks
+    last_import = None
+    for i, j, end in import_statements(ts):
+        last_import = end
+        if toks[j].value[1:-1] != module or is_token(toks[i + 1], IDENT, 'type'):
+            continue
+        brace = next((k for k in range(i, j) if is_token(toks[k], PUNCT, '{')), None)
+        if brace is None:
+            if not add:
+                continue    # the names may be in another import of the module
+            if is_token(toks[i + 1], IDENT) and is_token(toks[i + 2], IDENT, 'from'):
+                return [(toks[i + 1].end, toks[i + 1].end, ', { ' + ', '.join(sorted(add)) + ' }')]
+            continue
+        close = ts.close[brace]
+        specs = _specifiers(ts, brace)
+        kept = [spec for spec in specs if spec[2] not in remove]
+        missing = sorted(add - {spec[2] for spec in specs})
+        if not kept:
+            if missing:
+                return [(toks[brace].end, toks[close].start, ' ' + ', '.join(missing) + ' ')]
+            if not specs:
+                return []
+            if is_token(toks[brace - 1], PUNCT, ','):    # import React, { ... }
+                return [(toks[brace - 1].start, toks[close].end, '')]
+            return [_statement_span(ts, i, end)]
+        edits = []
+        # A run of dropped specifiers goes with the comma after it, or, at the
+        # end of the list, with the comma before it.
+        k = 0
+        while k < len(specs):
+            if specs[k][2] not in remove:
+                k += 1
+                continue
+            run = k
+            while k < len(specs) and specs[k][2] in remove:
+                k += 1
+            if k < len(specs):
+                edits.append((toks[specs[run][0]].start, toks[specs[k][0]].start, ''))
+            else:
+                edits.append((toks[specs[run - 1][1]].end, toks[specs[-1][1]].end, ''))
+        if missing:
+            anchor = kept[-1][1]
+            edits.append((toks[anchor].end, toks[anchor].end, ''.join(f', {n}' for n in missing)))
+        return edits
+    if not add:
+        return []
+    line = f"import {{ {', '.join(sorted(add))} }} from '{module}';"
+    if last_import is None:
+        return [(0, 0, line + '\n')]
+    pos = toks[last_import].end
+    return [(pos, pos, '\n' + line)]
+
+
+def _specifiers(ts: TokenStream, brace: int) -> list[tuple[int, int, str]]:
+    """``(first token, last token, imported name)`` per ``{ a, b as c }`` entry."""
+    toks = ts.toks
+    specs = []
+    start = brace + 1
+    for comma in ts.top_commas(brace, ts.close[brace]) + [ts.close[brace]]:
+        k = start
+        if is_token(toks[k], IDENT, 'type') and is_token(ts.tok(k + 1), IDENT):
+            k += 1
+        if start < comma and toks[k].kind == IDENT:
+            specs.append((start, comma - 1, toks[k].value))
+        start = comma + 1
+    return specs
+
+
+def _statement_span(ts: TokenStream, first: int, last: int) -> tuple[int, int, str]:
+    """Edit deleting the statement ``first..last`` with its line(s), when it has them to itself."""
+    text = ts.text
+    start = text.rfind('\n', 0, ts.toks[first].start) + 1
+    if text[start:ts.toks[first].start].strip():
+        start = ts.toks[first].start
+    end = text.find('\n', ts.toks[last].end)
+    if end < 0 or text[ts.toks[last].end:end].strip():
+        end = ts.toks[last].end
+    else:
+        end += 1
+    return start, end, ''
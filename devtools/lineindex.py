@@ -0,0 +1,102 @@
+"""Line-offset index: O(log n) conversion between offsets and (line, col).
+
+Built once per file content and shared by every rule through
+``FileContext.lines``, instead of each rule calling ``split('\\n')`` and
+indexing into the list (or, worse, ``lines.index(line)`` inside a loop).
+Lines and columns are 1-based like tsc's; offsets are 0-based ``str``
+indices.
+
+Edits go through ``apply_edits`` and update the text and line starts in one
+pass, so a rule making many splices doesn't re-split the file after each
+one.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Iterable
+
+
+class LineIndex:
+    __slots__ = ('text', 'starts')
+
+    def __init__(self, text: str):
+        self.text = text
+        self.starts = _line_starts(text)
+
+    def __len__(self) -> int:
+        """Number of lines (a trailing newline starts an empty last line)."""
+        return len(self.starts)
+
+    def line_col(self, offset: int) -> tuple[int, int]:
+        line = bisect_right(self.starts, offset)
+        return line, offset - self.starts[line - 1] + 1
+
+    def offset(self, line: int, col: int = 1) -> int:
+        if not 1 <= line <= len(self.starts):
+            raise IndexError(f'line {line} out of range 1..{len(self.starts)}')
+        return self.starts[line - 1] + col - 1
+
+    def line_span(self, line: int) -> tuple[int, int]:
+        """``[start, end)`` of ``line`` without its newline."""
+        start = self.offset(line)
+        end = self.starts[line] - 1 if line < len(self.starts) else len(self.text)
+        return start, end
+
+    def line(self, line: int) -> str:
+        start, end = self.line_span(line)
+        return self.text[start:end]
+
+    def context(self, line: int, before: int = 5, after: int = 5) -> list[tuple[int, str]]:
+        """``(line number, text)`` pairs around ``line``, clipped to the file."""
+        first = max(1, line - before)
+        last = min(len(self.starts), line + after)
+        return [(n, self.line(n)) for n in range(first, last + 1)]
+
+    def apply_edits(self, edits: Iterable[tuple[int, int, str]]) -> str:
+        """Apply non-overlapping ``(start, end, replacement)`` splices.
+
+        The text is rebuilt with one join and line starts are patched
+        rather than recomputed: untouched stretches are shifted, and only the
+        replacement strings are scanned for newlines. Insertions at the same
+        offset keep their given order. Returns the new text.
+        """
+        edits = sorted(edits, key=lambda e: (e[0], e[1]))
+        if not edits:
+            return self.text
+        old_text, old_starts = self.text, self.starts
+        pieces: list[str] = []
+        starts: list[int] = [0]
+        last = 0
+        delta = 0
+        i = 1   # next old line start to consider
+        for start, end, replacement in edits:
+            if start < last:
+                raise ValueError(f'overlapping edits at offset {start}')
+            # Line starts in the unchanged stretch (last, start] shift by delta.
+            while i < len(old_starts) and old_starts[i] <= start:
+                starts.append(old_starts[i] + delta)
+                i += 1
+            # Line starts whose newline is replaced, (start, end], vanish...
+            while i < len(old_starts) and old_starts[i] <= end:
+                i += 1
+            pieces.append(old_text[last:start])
+            new_start = start + delta
+            # ...and the replacement contributes its own.
+            starts.extend(s + new_start for s in _line_starts(replacement)[1:])
+            pieces.append(replacement)
+            delta += len(replacement) - (end - start)
+            last = end
+        starts.extend(s + delta for s in old_starts[i:])
+        pieces.append(old_text[last:])
+        self.text = ''.join(pieces)
+        self.starts = starts
+        return self.text
+
+    def apply_edit(self, start: int, end: int, replacement: str) -> str:
+        return self.apply_edits([(start, end, replacement)])
+
+
+def _line_starts(text: str) -> list[int]:
+    # One C-level split; the list of line lengths is dropped right away.
+    return list(accumulate((len(s) + 1 for s in text.split('\n')[:-1]), initial=0))
@@ -0,0 +1,558 @@
+"""Wrap exported function components in ``React.memo``.
+
+A component re-renders whenever its parent does. For the ones whose props
+are stable that work is wasted, and ``React.memo`` skips it. This tool
+finds exported function components that are not memoised yet and checks
+every place they are rendered, across files (imports are resolved,
+including the ``@/`` alias and ``lazy(() => import(...))``). A component
+is only wrapped when every call site passes stable props. These make a
+prop unstable, because the parent builds a new value on every render and
+memo would compare unequal each time:
+
+- an inline object or array (``style={{...}}``, ``items={[...]}``)
+- an inline function (``onClick={() => ...}``, ``.bind(...)``)
+- a JSX element as a prop, or element children
+- spread props (``{...props}``), which cannot be checked
+
+Components that are rendered nowhere in the tree, generic, async,
+``forwardRef`` or carrying static properties are reported but not wrapped.
+
+The edit is made on the token stream, so the call is closed after the
+initializer or function body no matter how it is formatted:
+
+    export const Card: React.FC<P> = (...) => { ... };
+    export const Card: React.FC<P> = React.memo((...) => { ... });
+
+    Card.displayName = 'Card';
+
+``export [default] function Card`` becomes ``const Card =
+React.memo(function Card ...)``. A missing ``displayName`` is added. Files
+without a default ``React`` import get ``memo`` added to their ``react``
+import instead.
+
+Candidates are ranked by how often their parent re-renders. With
+``--renders LOG`` that comes from the console output of
+``usePerformanceMonitor`` / ``usePerformanceMeasure`` ("X rendered in
+Nms"). Without a log it is estimated: one point per call site, more for
+sites inside ``.map()`` and for sites in files that set state per
+mousemove or scroll event (see ``devtools.hot_state``).
+
+    python -m devtools.memoize                     # ranked report
+    python -m devtools.memoize --renders console.log
+    python -m devtools.memoize --fix --dry-run     # print the diff
+    python -m devtools.memoize --fix
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import NamedTuple, Optional, Sequence
+
+from . import tokenizer
+from .cache import Cache, fingerprint, module_version
+from .engine import iter_files
+from .journal import Journal
+from .jsmodule import import_bindings, import_edits, module_consts, resolve
+from .lineindex import LineIndex
+from .output import Batch, stage, unified_diff
+from .tokenizer import (IDENT, JSX_CLOSE, JSX_OPEN, JSX_OPEN_END, JSX_SELF_CLOSE, PUNCT, STRING,
+                        TokenStream, is_token)
+
+GLOBS = ('*.tsx', 'components/**/*.tsx', 'pages/**/*.tsx', 'lib/**/*.tsx')
+LIST_WEIGHT = 3   # a site inside .map() renders once per item
+_COMPONENT_NAME = re.compile(r'[A-Z][A-Za-z0-9]*$')
+_RENDER_LOG = re.compile(r'(?:Performance Warning: )?([A-Z][\w.]*) (?:rendered in|took) ([\d.]+)\s*ms')
+
+
+class Component(NamedTuple):
+    name: str
+    line: int
+    kind: str        # 'arrow' | 'function'
+    memoized: bool
+    skip: str        # why the codemod leaves it alone, '' if it may wrap it
+    display_name: bool
+
+
+class Site(NamedTuple):
+    tag: str
+    line: int
+    unstable: str    # '' when every prop is stable
+    in_list: bool
+
+
+@dataclass
+class FileInfo:
+    components: list[Component]
+    sites: list[Site]
+    imports: list[tuple[str, str, str]]   # (local, imported, module)
+    exports: dict[str, str]               # exported name -> local name ('default' included)
+
+    @classmethod
+    def from_json(cls, data: dict) -> 'FileInfo':
+        return cls([Component(*c) for c in data['components']], [Site(*s) for s in data['sites']],
+                   [tuple(i) for i in data['imports']], data['exports'])
+
+    def to_json(self) -> dict:
+        return {'components': self.components, 'sites': self.sites, 'imports': self.imports,
+                'exports': self.exports}
+
+
+class Candidate(NamedTuple):
+    path: str
+    component: Component
+    sites: list[tuple[str, Site]]
+    score: float
+    renders: Optional[tuple[int, float]]   # (count, total ms) from a render log
+
+    @property
+    def reason(self) -> str:
+        """Why it is not wrapped; '' when ``--fix`` will wrap it."""
+        if self.component.skip:
+            return self.component.skip
+        if not self.sites:
+            return 'not rendered anywhere in the scanned files'
+        for rel, site in self.sites:
+            if site.unstable:
+                return f'{site.unstable} at {rel}:{site.line}'
+        return ''
+
+
+# -- per-file analysis --------------------------------------------------------
+
+@dataclass
+class _Def:
+    name: str
+    kind: str
+    first: int            # 'export' / 'const' / 'function' token that starts the statement
+    keyword: int          # 'const' or 'function'
+    init: tuple[int, int]  # arrow: initializer tokens; function: 'function' .. closing '}'
+    last: int             # last token of the statement (';' when there is one)
+    exported: bool
+    default: bool         # export default function
+
+
+def _memo_call(ts: TokenStream, i: int) -> bool:
+    """``memo(`` / ``React.memo(`` / ``React.memo<P>(`` starts at ``i``."""
+    if is_token(ts.tok(i), IDENT, 'React') and is_token(ts.tok(i + 1), PUNCT, '.'):
+        i += 2
+    return is_token(ts.tok(i), IDENT, 'memo') and is_token(ts.tok(i + 1), PUNCT, '(', '<')
+
+
+def _arrow(ts: TokenStream, lo: int, hi: int) -> bool:
+    return any(ts.parent[k] == ts.parent[lo] and is_token(ts.toks[k], PUNCT, '=>') for k in range(lo, hi + 1))
+
+
+def _definitions(ts: TokenStream) -> dict[str, _Def]:
+    """Top-level PascalCase consts and function declarations that render JSX."""
+    toks = ts.toks
+    defs = {}
+    for name, c in module_consts(ts).items():
+        lo, hi = c.init
+        if not _COMPONENT_NAME.match(name) or lo > hi:
+            continue
+        if not any(toks[k].kind == JSX_OPEN for k in range(lo, hi + 1)):
+            continue
+        exported = is_token(ts.tok(c.first - 1), IDENT, 'export')
+        first = c.first - 1 if exported else c.first
+        if _memo_call(ts, lo) or _arrow(ts, lo, hi) or is_token(toks[lo], IDENT, 'function', 'async') \
+                or is_token(toks[lo], PUNCT, '<') or re.match(r'(React\.)?forwardRef\b', ts.src(lo, min(hi, lo + 2))):
+            defs[name] = _Def(name, 'arrow', first, c.first, (lo, hi), c.last, exported, False)
+    for i, tok in enumerate(toks):
+        if not (is_token(tok, IDENT, 'function') and ts.parent[i] == -1 and is_token(ts.tok(i + 1), IDENT)):
+            continue
+        name = toks[i + 1].value
+        if not _COMPONENT_NAME.match(name) or not is_token(ts.tok(i + 2), PUNCT, '('):
+            continue
+        body = ts.close.get(i + 2, -1) + 1
+        while 0 < body < len(toks) and not (is_token(toks[body], PUNCT, '{') and ts.parent[body] == -1
+                                            and not is_token(toks[body - 1], PUNCT, ':', '|', '&', ',', '<')):
+            body += 1
+        end = ts.close.get(body)
+        if end is None or not any(toks[k].kind == JSX_OPEN for k in range(body, end)):
+            continue
+        first = i
+        default = False
+        if is_token(ts.tok(i - 1), IDENT, 'async'):
+            first -= 1
+        if is_token(ts.tok(first - 1), IDENT, 'default') and is_token(ts.tok(first - 2), IDENT, 'export'):
+            first -= 2
+            default = True
+        elif is_token(ts.tok(first - 1), IDENT, 'export'):
+            first -= 1
+        defs[name] = _Def(name, 'function', first, i, (i, end), end, first < i and toks[first].value == 'export',
+                          default)
+    return defs
+
+
+def _exports(ts: TokenStream, defs: dict[str, _Def]) -> dict[str, str]:
+    toks = ts.toks
+    exports = {d.name: d.name for d in defs.values() if d.exported}
+    exports.update({'default': d.name for d in defs.values() if d.default})
+    for i, tok in enumerate(toks):
+        if not (is_token(tok, IDENT, 'export') and ts.parent[i] == -1):
+            continue
+        nxt = ts.tok(i + 1)
+        if is_token(nxt, IDENT, 'default'):
+            k = i + 2
+            while is_token(ts.tok(k), IDENT, 'React', 'memo') or is_token(ts.tok(k), PUNCT, '.', '('):
+                k += 1
+            if is_token(ts.tok(k), IDENT) and not is_token(ts.tok(k), IDENT, 'function', 'class'):
+                exports['default'] = toks[k].value
+        elif is_token(nxt, PUNCT, '{') and not is_token(ts.tok(ts.close.get(i + 1, i) + 1), IDENT, 'from'):
+            for k in range(i + 2, ts.close.get(i + 1, i + 1)):
+                if is_token(toks[k], IDENT) and not is_token(toks[k], IDENT, 'as') \
+                        and not is_token(ts.tok(k + 1), IDENT, 'as'):
+                    exports[toks[k].value] = toks[k - 2].value if is_token(toks[k - 1], IDENT, 'as') \
+                        else toks[k].value
+    return exports
+
+
+def _memo_wrapped(ts: TokenStream) -> set[str]:
+    """Names passed to ``memo(Name)`` anywhere in the file."""
+    return {ts.toks[i + 2].value for i, tok in enumerate(ts.toks)
+            if is_token(tok, IDENT, 'memo') and is_token(ts.tok(i + 1), PUNCT, '(')
+            and is_token(ts.tok(i + 2), IDENT) and is_token(ts.tok(i + 3), PUNCT, ')')}
+
+
+def _skip(ts: TokenStream, d: _Def) -> str:
+    toks = ts.toks
+    lo, hi = d.init
+    if d.kind == 'function':
+        if is_token(ts.tok(d.keyword - 1), IDENT, 'async'):
+            return 'async function'
+        if any(is_token(toks[k], IDENT, d.name) for k in range(d.first)):
+            return 'used before its declaration'
+    elif is_token(toks[lo], PUNCT, '<'):
+        return 'generic component'
+    elif is_token(toks[lo], IDENT, 'async'):
+        return 'async function'
+    elif re.match(r'(React\.)?forwardRef\b', ts.src(lo, min(hi, lo + 2))):
+        return 'forwardRef component'
+    for k, tok in enumerate(toks):
+        if is_token(tok, IDENT, d.name) and is_token(ts.tok(k + 1), PUNCT, '.') \
+                and is_token(ts.tok(k + 3), PUNCT, '=') and ts.parent[k] == -1 \
+                and not is_token(ts.tok(k + 2), IDENT, 'displayName'):
+            return f'has static property {ts.tok(k + 2).value}'
+    return ''
+
+
+def _has_display_name(ts: TokenStream, name: str) -> bool:
+    return any(is_token(tok, IDENT, name) and is_token(ts.tok(k + 1), PUNCT, '.')
+               and is_token(ts.tok(k + 2), IDENT, 'displayName') for k, tok in enumerate(ts.toks))
+
+
+def _lazy_imports(ts: TokenStream) -> list[tuple[str, str, str]]:
+    """``const X = lazy(() => import('./m'))`` as ``(X, 'default' | named, './m')``."""
+    found = []
+    for name, c in module_consts(ts).items():
+        lo, hi = c.init
+        src = ts.src(lo, hi) if lo <= hi else ''
+        if not re.match(r'(React\.)?lazy\s*\(', src):
+            continue
+        spec = next((ts.toks[k + 2].value[1:-1] for k in range(lo, hi) if is_token(ts.toks[k], IDENT, 'import')
+                     and is_token(ts.tok(k + 1), PUNCT, '(') and ts.tok(k + 2).kind == STRING), None)
+        if spec is None:
+            continue
+        named = re.search(r'default\s*:\s*\w+\.(\w+)', src)
+        found.append((name, named.group(1) if named else 'default', spec))
+    return found
+
+
+def _element_end(ts: TokenStream, o: int) -> tuple[int, int]:
+    """``(end of the opening tag, closing tag)`` for the element at ``o``; equal when self-closing."""
+    toks = ts.toks
+    k = o + 1
+    while k < len(toks) and not (ts.parent[k] == ts.parent[o] and toks[k].kind in (JSX_OPEN_END, JSX_SELF_CLOSE)):
+        k += 1
+    if k >= len(toks) or toks[k].kind == JSX_SELF_CLOSE:
+        return k, k
+    depth = 1
+    j = k + 1
+    while j < len(toks):
+        if toks[j].kind == JSX_OPEN_END:
+            depth += 1
+        elif toks[j].kind == JSX_CLOSE:
+            depth -= 1
+            if depth == 0:
+                break
+        j += 1
+    return k, j
+
+
+def _unstable(ts: TokenStream, o: int) -> str:
+    toks = ts.toks
+    open_end, close = _element_end(ts, o)
+    for k in range(o + 1, open_end):
+        if ts.parent[k] == ts.parent[o] and is_token(toks[k], PUNCT, '{') and is_token(ts.tok(k + 1), PUNCT, '...'):
+            return 'spread props'
+    for name, first, last in ts.attributes(o):
+        if last == first or not is_token(toks[first + 2], PUNCT, '{'):
+            continue
+        lo, hi = first + 3, last - 1
+        if lo > hi:
+            continue
+        head = toks[lo]
+        if is_token(head, PUNCT, '{', '['):
+            return f'inline {"object" if head.value == "{" else "array"} in {name}'
+        if head.kind == JSX_OPEN:
+            return f'JSX element in {name}'
+        if is_token(head, IDENT, 'function', 'new') or _arrow(ts, lo, hi) or any(
+                is_token(toks[k], IDENT, 'bind') and is_token(ts.tok(k - 1), PUNCT, '.') for k in range(lo, hi)):
+            return f'inline function in {name}'
+    for k in range(open_end + 1, close):
+        if toks[k].kind == JSX_OPEN:
+            return 'element children'
+        if is_token(toks[k], PUNCT, '=>'):
+            return 'function children'
+    return ''
+
+
+def _inside_call(ts: TokenStream, o: int, method: str) -> bool:
+    """The element at ``o`` is inside the arguments of ``.method(...)``."""
+    p = ts.parent[o]
+    while p != -1:
+        if is_token(ts.toks[p], PUNCT, '(') and is_token(ts.tok(p - 1), IDENT, method) \
+                and is_token(ts.tok(p - 2), PUNCT, '.', '?.'):
+            return True
+        p = ts.parent[p]
+    return False
+
+
+def analyze(text: str) -> FileInfo:
+    ts = TokenStream(text)
+    defs = _definitions(ts)
+    exports = _exports(ts, defs)
+    wrapped = _memo_wrapped(ts)
+    exported = set(exports.values())
+    components = []
+    for d in sorted(defs.values(), key=lambda d: d.first):
+        if d.name not in exported:
+            continue
+        memoized = d.name in wrapped or (d.kind == 'arrow' and _memo_call(ts, d.init[0]))
+        components.append(Component(d.name, ts.line(d.keyword), d.kind, memoized, _skip(ts, d),
+                                    _has_display_name(ts, d.name)))
+    sites = [Site(tok.value, ts.line(i),
+                  'rendered once as the app root' if _inside_call(ts, i, 'render') else _unstable(ts, i),
+                  _inside_call(ts, i, 'map'))
+             for i, tok in enumerate(ts.toks) if tok.kind == JSX_OPEN and tok.value[:1].isupper()]
+    return FileInfo(components, sites, import_bindings(ts) + _lazy_imports(ts), exports)
+
+
+def scan_tree(root: str = '.', globs: Sequence[str] = GLOBS,
+              cache: Optional[Cache] = None) -> dict[str, FileInfo]:
+    version = fingerprint(module_version(__name__), module_version(tokenizer.__name__),
+                          module_version('devtools.jsmodule'))
+    infos = {}
+    for rel in iter_files(root, globs):
+        if cache is None:
+            with open(os.path.join(root, rel), 'r', encoding='utf-8') as fh:
+                infos[rel] = analyze(fh.read())
+        else:
+            infos[rel] = FileInfo.from_json(cache.memoize('memoize', version, rel,
+                                                          lambda text: analyze(text).to_json()))
+    return infos
+
+
+# -- cross-file ranking -------------------------------------------------------
+
+def call_sites(root: str, infos: dict[str, FileInfo]) -> dict[tuple[str, str], list[tuple[str, Site]]]:
+    """Sites by ``(defining file, component name)``, resolved through imports."""
+    found = defaultdict(list)
+    for rel, info in infos.items():
+        local = {c.name for c in info.components} | set(info.exports.values())
+        imports = {name: (imported, module) for name, imported, module in info.imports}
+        for site in info.sites:
+            head, _, member = site.tag.partition('.')
+            if not member and head in local:
+                found[rel, head].append((rel, site))
+                continue
+            if head not in imports:
+                continue
+            imported, module = imports[head]
+            target = resolve(root, rel, module)
+            if target not in infos:
+                continue
+            if imported == '*':
+                imported = member
+            elif member:
+                continue
+            name = infos[target].exports.get(imported)
+            if name:
+                found[target, name].append((rel, site))
+    return found
+
+
+def read_renders(path: str) -> dict[str, tuple[int, float]]:
+    """``(render count, total ms)`` per component from a console log."""
+    counts: Counter = Counter()
+    total: Counter = Counter()
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            m = _RENDER_LOG.search(line)
+            if m:
+                counts[m.group(1)] += 1
+                total[m.group(1)] += float(m.group(2))
+    return {name: (counts[name], total[name]) for name in counts}
+
+
+def candidates(root: str, infos: dict[str, FileInfo], renders: Optional[dict] = None,
+               hot: Optional[dict[str, float]] = None) -> list[Candidate]:
+    """Exported components that are not memoised, most re-rendered first.
+
+    ``hot`` maps a file to the weight of its per-event setState calls; sites
+    in those files re-render with every event.
+    """
+    sites = call_sites(root, infos)
+    hot = hot or {}
+    found = []
+    for rel, info in infos.items():
+        for c in info.components:
+            if c.memoized:
+                continue
+            where = sites.get((rel, c.name), [])
+            seen = None
+            if renders is not None:
+                seen = renders.get(c.name)
+                score = float(seen[0]) if seen else 0.0
+            else:
+                score = sum(1 + LIST_WEIGHT * s.in_list + hot.get(r, 0) for r, s in where)
+            found.append(Candidate(rel, c, where, score, seen))
+    found.sort(key=lambda x: (-x.score, x.path, x.component.line))
+    return found
+
+
+def hot_files(root: str, cache: Optional[Cache]) -> dict[str, float]:
+    from .hot_state import scan_tree as hot_scan
+    weights: dict[str, float] = defaultdict(float)
+    for rel, finding in hot_scan(root, cache=cache):
+        weights[rel] += finding.score
+    return weights
+
+
+# -- rewriting ----------------------------------------------------------------
+
+def plan(text: str, names: set[str]) -> list[tuple[int, int, str]]:
+    """Edits that wrap the named components of ``text`` in ``memo``."""
+    ts = TokenStream(text)
+    toks = ts.toks
+    defs = _definitions(ts)
+    bindings = {local: (imported, module) for local, imported, module in import_bindings(ts)}
+    if bindings.get('React', ('', ''))[1] == 'react':
+        memo = 'React.memo'
+    else:
+        memo = next((local for local, (imported, module) in bindings.items()
+                     if module == 'react' and imported == 'memo'), 'memo')
+    edits = []
+    for name in sorted(names):
+        d = defs.get(name)
+        if d is None:
+            continue
+        lo, hi = d.init
+        tail = '' if _has_display_name(ts, name) else f"\n\n{name}.displayName = '{name}';"
+        if d.kind == 'arrow':
+            edits.append((toks[lo].start, toks[lo].start, f'{memo}('))
+            if is_token(toks[d.last], PUNCT, ';'):
+                edits.append((toks[hi].end, toks[hi].end, ')'))
+                edits.append((toks[d.last].end, toks[d.last].end, tail))
+            else:
+                edits.append((toks[hi].end, toks[hi].end, ');' + tail))
+        else:
+            start = toks[d.first].start if d.default else toks[d.keyword].start
+            edits.append((start, toks[d.keyword].start, f'const {name} = {memo}('))
+            if d.default:
+                tail += f'\n\nexport default {name};'
+            edits.append((toks[hi].end, toks[hi].end, ');' + tail))
+    if edits and memo == 'memo':
+        edits.extend(import_edits(ts, 'react', {'memo'}))
+    return edits
+
+
+def apply(root: str, wrap: dict[str, set[str]], dry_run: bool = False, out=sys.stdout,
+          journal: Optional[Journal] = None) -> list[str]:
+    """Wrap ``{path: names}``; returns the paths changed (or that would be)."""
+    changed = []
+    batch = Batch(journal=journal)
+    try:
+        for rel in sorted(wrap):
+            path = os.path.join(root, rel)
+            with open(path, 'r', encoding='utf-8', newline='') as f:
+                text = f.read()
+            new = LineIndex(text).apply_edits(plan(text, wrap[rel]))
+            if new == text:
+                continue
+            changed.append(rel)
+            if dry_run:
+                out.write(unified_diff(rel, text, new))
+                continue
+            temp = stage(path, new, text)
+            if temp is not None:
+                batch.add(path, temp)
+        if not dry_run:
+            batch.commit()
+    finally:
+        batch.discard()
+    return changed
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Wrap exported function components in React.memo.')
+    parser.add_argument('--root', default='.')
+    parser.add_argument('--no-cache', action='store_true')
+    parser.add_argument('--renders', metavar='LOG', help='console log with "X rendered in Nms" lines to rank by')
+    parser.add_argument('--fix', action='store_true', help='wrap every candidate whose call sites are stable')
+    parser.add_argument('--dry-run', action='store_true', help='with --fix: print a diff instead of writing')
+    parser.add_argument('--limit', type=int, default=0, help='show only the top N candidates')
+    args = parser.parse_args(argv)
+
+    renders = None
+    if args.renders:
+        try:
+            renders = read_renders(args.renders)
+        except OSError as e:
+            print(f'{args.renders}: {e}', file=sys.stderr)
+            return 2
+    cache = None if args.no_cache else Cache(args.root)
+    try:
+        infos = scan_tree(args.root, cache=cache)
+        hot = hot_files(args.root, cache) if renders is None else None
+    finally:
+        if cache is not None:
+            cache.close()
+    found = candidates(args.root, infos, renders, hot)
+
+    if args.fix:
+        wrap: dict[str, set[str]] = defaultdict(set)
+        for x in found:
+            if not x.reason:
+                wrap[x.path].add(x.component.name)
+        journal = None if args.dry_run else Journal(args.root)
+        changed = apply(args.root, wrap, args.dry_run, journal=journal)
+        verb = 'Would wrap' if args.dry_run else 'Wrapped'
+        print(f'{verb} {sum(len(v) for v in wrap.values())} components in {len(changed)} files',
+              file=sys.stderr if args.dry_run else sys.stdout)
+        if journal is not None and journal.run_id:
+            print(f'Journaled as run {journal.run_id} (python -m devtools undo {journal.run_id})')
+        return 0
+
+    for x in found[:args.limit] if args.limit else found:
+        c = x.component
+        if x.renders is not None:
+            count, total = x.renders
+            usage = f'{count} render' + 's' * (count != 1) + f', {total / count:.1f} ms avg'
+        elif renders is not None:
+            usage = 'no renders logged'
+        else:
+            lists = sum(1 for _, s in x.sites if s.in_list)
+            usage = f'{len(x.sites)} site' + 's' * (len(x.sites) != 1) + (f', {lists} in a list' if lists else '')
+        print(f'{x.score:6.1f}  {x.path}:{c.line}: {c.name} ({usage}) - {x.reason or "wrap"}')
+    safe = sum(1 for x in found if not x.reason)
+    print(f'{len(found)} exported components not memoized, {safe} safe to wrap with --fix')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""Output layer for codemod runs: skip identical writes, stage, commit atomically.
+
+Rewriting a file with the bytes it already has still bumps its mtime, which
+makes Vite HMR reload and tsc's incremental build re-check it. Output goes
+through here instead:
+
+- ``stage`` returns ``None`` when the new text equals what is on disk;
+  otherwise it writes a temp file next to the target (same filesystem, same
+  mode) and returns its path.
+- ``Batch`` collects staged files and ``commit``s them together with
+  ``os.replace``. With ``fsync=True`` there is a single barrier: every temp
+  file is flushed before the first rename, and each touched directory is
+  flushed once after the last one.
+- ``Batch(journal=...)`` first records what the renames will overwrite,
+  so the run can be undone (see ``devtools.journal``).
+- ``unified_diff`` is what dry runs emit instead of writing.
+"""
+from __future__ import annotations
+
+import difflib
+import os
+import stat
+import tempfile
+from typing import Optional
+
+
+def stage(path: str, text: str, original: Optional[str] = None) -> Optional[str]:
+    """Write ``text`` to a temp file beside ``path``; ``None`` if nothing would change."""
+    if original is None:
+        try:
+            with open(path, 'r', encoding='utf-8', newline='') as f:
+                original = f.read()
+        except FileNotFoundError:
+            original = None
+    if original == text:
+        return None
+    directory, name = os.path.split(path)
+    fd, temp = tempfile.mkstemp(prefix=f'.{name}.', suffix='.tmp', dir=directory or '.')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_umask()   # what open() would have given a new file
+        os.chmod(temp, mode)
+    except BaseException:
+        os.unlink(temp)
+        raise
+    return temp
+
+
+def _umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+class Batch:
+    """Staged writes that land together on ``commit`` or not at all on ``discard``."""
+
+    def __init__(self, fsync: bool = False, journal=None):
+        self.fsync = fsync
+        self.journal = journal   # devtools.journal.Journal, written before the first rename
+        self.pending: list[tuple[str, str]] = []   # (target, temp)
+
+    def add(self, target: str, temp: str) -> None:
+        self.pending.append((target, temp))
+
+    def commit(self) -> list[str]:
+        """Rename every staged file into place; returns the targets written."""
+        if self.journal is not None and self.pending:
+            self.journal.write(self.pending, self.fsync)
+        if self.fsync:
+            for _, temp in self.pending:
+                fd = os.open(temp, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+        written = []
+        try:
+            for target, temp in self.pending:
+                os.replace(temp, target)
+                written.append(target)
+        except BaseException:
+            self.pending = self.pending[len(written):]
+            self.discard()
+            raise
+        if self.fsync:
+            for directory in sorted({os.path.dirname(t) or '.' for t in written}):
+                _fsync_dir(directory)
+        self.pending = []
+        return written
+
+    def discard(self) -> None:
+        for _, temp in self.pending:
+            try:
+                os.unlink(temp)
+            except FileNotFoundError:
+                pass
+        self.pending = []
+
+
+def _fsync_dir(directory: str) -> None:
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:  # e.g. Windows cannot open directories
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def unified_diff(relpath: str, old: str, new: str) -> str:
+    return ''.join(difflib.unified_diff(old.splitlines(keepends=True), new.splitlines(keepends=True),
+                                        fromfile=f'a/{relpath}', tofile=f'b/{relpath}'))
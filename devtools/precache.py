@@ -0,0 +1,151 @@
+"""Content-hashed precache manifest for public/sw.js.
+
+sw.js used to list prefixes such as ``'/assets/index-'``, and these never
+match Vite's hashed file names. Its cache names were also bumped by hand, so
+each deploy threw away every cached file. This post-build step writes
+``dist/precache-manifest.js`` with the exact URL and a content revision of
+each file to precache:
+
+- every local ``src`` / ``href`` in ``dist/index.html``: the entry chunk, its
+  ``modulepreload`` chunks, the stylesheets and preloaded images
+- the files in public/ matching ``PUBLIC`` (images and icons), as copied
+  into dist
+
+Files are hashed in parallel through ``engine.parallel_map``. sw.js loads the
+manifest with ``importScripts``. It caches each entry under
+``<url>?__rev=<revision>``, fetches only the entries whose key it does not
+already hold, and deletes keys no longer in the manifest. Cache names stay
+fixed across deploys.
+
+    npm run build                     # runs this as the postbuild step
+    python -m devtools.precache --dist dist
+"""
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import os
+import re
+import sys
+from typing import NamedTuple, Optional, Sequence
+
+from .cache import content_hash
+from .engine import parallel_map
+from .output import Batch, stage
+
+DIST = 'dist'
+PUBLIC = ('*.webp', '*.svg', 'manifest.json', 'favicon.ico', 'logo*.png')
+MANIFEST = 'precache-manifest.js'
+SKIP = ('sw.js', 'service-worker.js', MANIFEST)
+_REF = re.compile(r'''\b(?:src|href)\s*=\s*["'](/[^"'?#]*)''')
+
+_TEMPLATE = """\
+// Generated by devtools/precache.py after vite build; do not edit.
+self.__PRECACHE_MANIFEST = {entries};
+"""
+
+
+class Asset(NamedTuple):
+    url: str
+    revision: str
+    size: int
+
+
+def html_refs(html: str) -> list[str]:
+    """Local root-relative URLs referenced by ``src`` / ``href`` attributes, in order."""
+    seen = []
+    for m in _REF.finditer(html):
+        if not m.group(1).startswith('//') and m.group(1) not in seen:
+            seen.append(m.group(1))
+    return seen
+
+
+def public_files(public: str, patterns: Sequence[str] = PUBLIC) -> list[str]:
+    """Top-level files of ``public`` matching ``patterns``, as URLs."""
+    try:
+        names = sorted(os.listdir(public))
+    except FileNotFoundError:
+        return []
+    return [f'/{n}' for n in names if n not in SKIP and any(fnmatch.fnmatch(n, p) for p in patterns)
+            and os.path.isfile(os.path.join(public, n))]
+
+
+def _hash_batch(dist: str, urls: list[str]) -> list[Asset]:
+    found = []
+    for url in urls:
+        with open(os.path.join(dist, url.lstrip('/')), 'rb') as f:
+            data = f.read()
+        found.append(Asset(url, content_hash(data)[:12], len(data)))
+    return found
+
+
+def collect(dist: str = DIST, public: str = 'public', patterns: Sequence[str] = PUBLIC,
+            jobs: Optional[int] = None) -> tuple[list[Asset], list[str]]:
+    """``(assets, missing URLs)``: what index.html references plus matching public files."""
+    with open(os.path.join(dist, 'index.html'), 'r', encoding='utf-8') as f:
+        urls = html_refs(f.read())
+    urls += [u for u in public_files(public, patterns) if u not in urls]
+    present = [u for u in urls if os.path.isfile(os.path.join(dist, u.lstrip('/'))) and u.lstrip('/') not in SKIP]
+    missing = [u for u in urls if u not in present and u.lstrip('/') not in SKIP]
+    assets = list(parallel_map(lambda batch: (_hash_batch, (dist, batch)), present, jobs, batch_size=16))
+    return assets, missing
+
+
+def render(assets: Sequence[Asset]) -> str:
+    entries = ',\n'.join(f'  {json.dumps({"url": a.url, "revision": a.revision})}' for a in assets)
+    return _TEMPLATE.format(entries=f'[\n{entries}\n]' if assets else '[]')
+
+
+def previous(path: str) -> dict[str, str]:
+    """``url -> revision`` from an earlier manifest, to report what a deploy re-downloads."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+    except FileNotFoundError:
+        return {}
+    body = text[text.index('=') + 1:].strip().rstrip(';')
+    return {e['url']: e['revision'] for e in json.loads(body)}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Write the service worker precache manifest.')
+    parser.add_argument('--dist', default=DIST, help='build output (default: %(default)s)')
+    parser.add_argument('--public', default='public', help='public directory (default: %(default)s)')
+    parser.add_argument('--include', action='append', default=[], metavar='GLOB',
+                        help=f'extra public/ pattern to precache (default: {", ".join(PUBLIC)})')
+    parser.add_argument('--since', metavar='MANIFEST', help='earlier manifest to compare revisions against')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    args = parser.parse_args(argv)
+
+    try:
+        assets, missing = collect(args.dist, args.public, PUBLIC + tuple(args.include), args.jobs)
+    except FileNotFoundError as e:
+        print(f'{e.filename}: not found; run vite build first', file=sys.stderr)
+        return 2
+    for url in missing:
+        print(f'{url}: referenced but not in {args.dist}; not precached', file=sys.stderr)
+
+    path = os.path.join(args.dist, MANIFEST)
+    batch = Batch()
+    try:
+        temp = stage(path, render(assets))
+        if temp is not None:
+            batch.add(path, temp)
+        batch.commit()
+    finally:
+        batch.discard()
+    total = sum(a.size for a in assets)
+    print(f'{path}: {len(assets)} assets, {total / 1024:.0f} KiB')
+    if args.since:
+        before = previous(args.since)
+        changed = [a for a in assets if before.get(a.url) != a.revision]
+        size = sum(a.size for a in changed)
+        print(f'{len(changed)} of {len(assets)} changed since {args.since} ({size / 1024:.0f} KiB to re-download)')
+        for a in changed:
+            print(f'  {a.url}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""Per-rule profiling for codemod runs: summary table and Chrome trace.
+
+Run the engine with ``profile=True`` (or a fix script with ``--profile`` /
+``--trace FILE``) and every rule is timed on every file, together with the
+bytes it scanned, the matches it reported via ``ctx.count`` (``Rewriter``
+rules do this automatically) and whether it changed the text. ``Profile``
+aggregates the results into a per-rule table plus the slowest rule/file
+pairs, and can write them as Chrome trace-event JSON: open it in
+``chrome://tracing`` or https://ui.perfetto.dev to see each worker
+process as a track, with one slice per file and per rule inside it.
+
+    python fix_errors_2.py --no-cache --profile --trace fix.trace.json
+"""
+from __future__ import annotations
+
+import json
+import sys
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional
+
+from .engine import FileResult
+
+
+@dataclass
+class RuleStats:
+    files: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+    max_file: str = ''
+    matches: Optional[int] = None   # None: the rule never reported any
+    bytes: int = 0
+    changed: int = 0
+
+
+@dataclass
+class Profile:
+    results: list[FileResult] = field(default_factory=list)
+
+    def collect(self, results: Iterable[FileResult]) -> Iterator[FileResult]:
+        """Pass results through unchanged, keeping the profiled ones."""
+        for res in results:
+            if res.span is not None:
+                self.results.append(res)
+            yield res
+
+    def rules(self) -> dict[str, RuleStats]:
+        stats: dict[str, RuleStats] = {}
+        for res in self.results:
+            for t in res.timings:
+                s = stats.setdefault(t.rule, RuleStats())
+                s.files += 1
+                s.total_ns += t.duration_ns
+                if t.matches is not None:
+                    s.matches = (s.matches or 0) + t.matches
+                s.bytes += t.bytes
+                s.changed += t.changed
+                if t.duration_ns > s.max_ns:
+                    s.max_ns, s.max_file = t.duration_ns, res.path
+        return stats
+
+    def slowest(self, n: int = 10) -> list[tuple[int, str, str]]:
+        """The ``n`` slowest ``(duration_ns, rule, path)`` pairs."""
+        pairs = [(t.duration_ns, t.rule, res.path) for res in self.results for t in res.timings]
+        return sorted(pairs, reverse=True)[:n]
+
+    def summary(self, out=sys.stderr, top: int = 10) -> None:
+        stats = self.rules()
+        if not stats:
+            print('profile: no files were processed', file=out)
+            return
+        width = max(len(name) for name in stats)
+        print(f'{"rule":<{width}} {"files":>6} {"total ms":>9} {"max ms":>8} {"MB/s":>7} '
+              f'{"matches":>7} {"changed":>7}  slowest file', file=out)
+        for name, s in sorted(stats.items(), key=lambda kv: kv[1].total_ns, reverse=True):
+            rate = s.bytes / 1e6 / (s.total_ns / 1e9) if s.total_ns else 0.0
+            matches = '-' if s.matches is None else s.matches
+            print(f'{name:<{width}} {s.files:>6} {s.total_ns / 1e6:>9.2f} {s.max_ns / 1e6:>8.2f} '
+                  f'{rate:>7.1f} {matches:>7} {s.changed:>7}  {s.max_file}', file=out)
+        written = sum(1 for res in self.results if res.staged)
+        print(f'{len(self.results)} files, {written} written', file=out)
+        slow = self.slowest(top)
+        if slow:
+            print('slowest rule/file pairs:', file=out)
+            for ns, rule, path in slow:
+                print(f'  {ns / 1e6:>9.2f} ms  {rule}  {path}', file=out)
+
+    def trace_events(self) -> list[dict]:
+        if not self.results:
+            return []
+        origin = min(res.span[1] for res in self.results)
+        events = []
+        for pid in sorted({res.span[0] for res in self.results}):
+            events.append({'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': pid,
+                           'args': {'name': f'worker {pid}'}})
+        for res in self.results:
+            pid, start, duration = res.span
+            args = {'applied': res.applied, 'written': bool(res.staged)}
+            if res.error:
+                args['error'] = res.error
+            events.append({'name': res.path, 'cat': 'file', 'ph': 'X', 'pid': pid, 'tid': pid,
+                           'ts': (start - origin) / 1e3, 'dur': duration / 1e3, 'args': args})
+            for t in res.timings:
+                events.append({'name': t.rule, 'cat': 'rule', 'ph': 'X', 'pid': pid, 'tid': pid,
+                               'ts': (t.start_ns - origin) / 1e3, 'dur': t.duration_ns / 1e3,
+                               'args': {'file': res.path, 'matches': t.matches, 'bytes': t.bytes,
+                                        'changed': t.changed}})
+        return events
+
+    def write_trace(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': self.trace_events(), 'displayTimeUnit': 'ms'}, f)
+
+    def finish(self, trace: Optional[str] = None, out=sys.stderr) -> None:
+        self.summary(out)
+        if trace:
+            self.write_trace(trace)
+            print(f'trace written to {trace}', file=out)
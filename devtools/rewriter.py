@@ -0,0 +1,146 @@
+"""Compiled multi-rule rewriter: many regex fixes, one scan per file.
+
+The old scripts ran one ``re.sub`` per fix, so every extra fix meant
+another full pass over the file. A ``Rewriter`` folds all of its rules into
+one alternation, ``(?P<r0>...)|(?P<r1>...)|...``, walks the text once and
+hands each match to the rule that owns it (``lastgroup``). The result is
+built with a single join.
+
+Overlaps are reported, not resolved silently. Where two rules want the same
+or overlapping text, the earlier rule wins (as it would have with
+sequential ``re.sub`` calls) and a ``Conflict`` is recorded. Rivals are
+found with one "every rule but the owner" regex per rule that actually
+matched. That search only moves forward, so finding conflicts does not add
+a pass per rule either.
+
+Rule patterns may use any syntax except backreferences: group numbers shift
+inside the combined pattern. Replacement templates may use ``\\1`` and
+``\\g<name>`` as usual.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Callable, NamedTuple, Optional, Sequence, Union
+
+Replacement = Union[str, Callable[[re.Match], str]]
+
+_NAMED_GROUP = re.compile(r'\(\?P<\w+>')
+_BACKREF = re.compile(r'\\[1-9]|\(\?P=\w+\)')
+_INLINE_FLAGS = {re.IGNORECASE: 'i', re.MULTILINE: 'm', re.DOTALL: 's', re.VERBOSE: 'x'}
+
+
+class RewriteError(Exception):
+    """Raised when a rule pattern cannot be folded into the combined regex."""
+
+
+@dataclass(frozen=True)
+class RewriteRule:
+    name: str
+    pattern: str
+    replacement: Replacement
+    flags: int = 0
+
+
+class Edit(NamedTuple):
+    rule: str
+    start: int
+    end: int
+    replacement: str
+
+
+class Conflict(NamedTuple):
+    winner: str
+    loser: str
+    start: int       # where the winning edit starts
+    other: int       # where the losing rule's match starts
+
+
+@dataclass
+class RewriteResult:
+    text: str
+    edits: list[Edit] = field(default_factory=list)
+    conflicts: list[Conflict] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.edits)
+
+
+def _scoped(rule: RewriteRule) -> str:
+    if _BACKREF.search(rule.pattern):
+        raise RewriteError(f'rule {rule.name!r}: backreferences are not supported in combined patterns')
+    if re.match(r'\(\?[aiLmsux]+\)', rule.pattern):
+        raise RewriteError(f'rule {rule.name!r}: pass flags via RewriteRule.flags, not a leading (?flags)')
+    body = _NAMED_GROUP.sub('(', rule.pattern)
+    flags = ''.join(c for f, c in _INLINE_FLAGS.items() if rule.flags & f)
+    return f'(?{flags}:{body})' if flags else f'(?:{body})'
+
+
+class Rewriter:
+    def __init__(self, rules: Sequence[RewriteRule]):
+        if len({r.name for r in rules}) != len(rules):
+            raise RewriteError('rule names must be unique within a Rewriter')
+        self.rules = list(rules)
+        self._groups = {f'r{i}': r for i, r in enumerate(self.rules)}
+        self._combined = re.compile('|'.join(f'(?P<r{i}>{_scoped(r)})' for i, r in enumerate(self.rules)))
+        self._own = {f'r{i}': re.compile(r.pattern, r.flags) for i, r in enumerate(self.rules)}
+        self._others: dict[str, Optional[re.Pattern]] = {}
+
+    def _rivals(self, group: str) -> Optional[re.Pattern]:
+        """Combined regex of every rule except ``group``, compiled on first use."""
+        if group not in self._others:
+            parts = [f'(?P<{g}>{_scoped(r)})' for g, r in self._groups.items() if g != group]
+            self._others[group] = re.compile('|'.join(parts)) if parts else None
+        return self._others[group]
+
+    def _expand(self, group: str, m: re.Match, text: str) -> str:
+        rule = self._groups[group]
+        repl = rule.replacement
+        if isinstance(repl, str) and '\\' not in repl:
+            return repl
+        # Re-match with the rule's own pattern so its group numbers are right.
+        own = self._own[group].match(text, m.start())
+        return repl(own) if callable(repl) else own.expand(repl)
+
+    def apply(self, text: str) -> RewriteResult:
+        result = RewriteResult(text)
+        pieces = []
+        last = 0
+        # Per owner: the next rival match at or after some position, reused
+        # while still ahead of us so rival searches only move forward.
+        rival_next: dict[str, Optional[re.Match]] = {}
+        for m in self._combined.finditer(text):
+            group = m.lastgroup
+            start, end = m.span()
+            rivals = self._rivals(group)
+            if rivals is not None:
+                nxt = rival_next.get(group, False)
+                if nxt is False or (nxt is not None and nxt.start() < start):
+                    nxt = rival_next[group] = rivals.search(text, start)
+                if nxt is not None and nxt.start() < max(end, start + 1):
+                    result.conflicts.append(Conflict(self._groups[group].name, self._groups[nxt.lastgroup].name,
+                                                     start, nxt.start()))
+                    rival_next[group] = rivals.search(text, nxt.start() + 1)
+            replacement = self._expand(group, m, text)
+            if replacement != m.group():
+                pieces.append(text[last:start])
+                pieces.append(replacement)
+                last = end
+                result.edits.append(Edit(self._groups[group].name, start, end, replacement))
+        if result.edits:
+            pieces.append(text[last:])
+            result.text = ''.join(pieces)
+        return result
+
+    def apply_ctx(self, ctx) -> str:
+        """Engine adapter: rewrite ``ctx.text``, report the edit count and log conflicts."""
+        result = self.apply(ctx.text)
+        ctx.count(len(result.edits))
+        if result.conflicts:
+            lines = ctx.lines
+            for c in result.conflicts:
+                line, col = lines.line_col(c.start)
+                other = '%d,%d' % lines.line_col(c.other)
+                ctx.log(f'conflict at {line},{col}: {c.winner!r} overlaps {c.loser!r} (at {other})')
+        return result.text
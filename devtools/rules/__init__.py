@@ -0,0 +1,19 @@
+"""Rule modules for the codemod engine, one per legacy fix script.
+
+Importing a module registers its rules; ``load`` does that by name so the
+engine (and its worker processes) only import what a run needs.
+"""
+from __future__ import annotations
+
+import importlib
+
+from ..engine import Rule, rules_from
+
+MODULES = ('codebase', 'errors', 'errors_2', 'final', 'final_final', 'gallery', 'glow_card', 'hot_state', 'last_errors',
+           'style_hoist', 'tsc_fixes')
+
+
+def load(*names: str) -> list[Rule]:
+    """Import the named rule modules (default: all) and return their rules."""
+    modules = [importlib.import_module(f'{__name__}.{n}') for n in (names or MODULES)]
+    return rules_from(*modules)
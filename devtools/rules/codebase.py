@@ -0,0 +1,59 @@
+"""Rules formerly inlined in fix_codebase.py."""
+from __future__ import annotations
+
+from ..anchors import Anchor, AnchorPatch, PatchSet
+from ..balance import check
+from ..engine import rule
+
+HERO_CLEAN_MIDDLE = """
+      </div>
+
+      {/* Scroll Progress Bar */}
+      <div
+        className="scroll-progress"
+        style={{ width: `${Math.min(scrollY / Math.max(document.body.scrollHeight - window.innerHeight, 1) * 100, 100)}%` }}
+        role="progressbar"
+        aria-valuenow={Math.min(scrollY / Math.max(document.body.scrollHeight - window.innerHeight, 1) * 100, 100)}
+        aria-valuemin={0}
+        aria-valuemax={100}
+        aria-label="Scroll progress indicator"
+      />
+
+      """
+
+
+HERO_ORBS_REPAIR = PatchSet([AnchorPatch(
+    'hero-orbs-repair',
+    start=(Anchor('{/* Floating Orbs */}', 0), Anchor('))}', 0)),
+    end=(Anchor('{/* Animated Background Elements */}', -1),),
+    replacement=HERO_CLEAN_MIDDLE, keep_start=True)])
+
+
+@rule('hero-orbs-repair', 'components/Hero.tsx')
+def hero_orbs_repair(ctx):
+    """Drop the duplicated block between the Floating Orbs map and the last
+    "Animated Background Elements" comment left behind by a bad merge."""
+    return HERO_ORBS_REPAIR.apply_ctx(ctx)
+
+
+@rule('memo-trailing-close', 'components/Footer2026.tsx', 'components/InteractiveGallery.tsx',
+      'components/CardStack.tsx')
+def memo_trailing_close(ctx):
+    """Turn ``};`` into ``});`` where the balance checker says a ``)`` is missing,
+    i.e. the closing of a hand-written ``React.memo(() => {`` wrapper."""
+    c = ctx.text
+    inserted = 0
+    for _ in range(c.count('React.memo(')):
+        diag = check(c)
+        if diag is None or diag.message != "')' expected." or not c.startswith('};', diag.offset - 1):
+            break
+        c = c[:diag.offset] + ')' + c[diag.offset:]
+        inserted += 1
+    ctx.count(inserted)
+    return c
+
+
+@rule('mobile-menu-aria', 'components/MobileMenu.tsx')
+def mobile_menu_aria(ctx):
+    c = ctx.text.replace('aria-label="Open navigation menu"', "aria-label={t('nav.aria.open')}")
+    return c.replace('aria-label="Close navigation menu"', "aria-label={t('nav.aria.close')}")
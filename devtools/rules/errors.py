@@ -0,0 +1,57 @@
+"""Rules formerly inlined in fix_errors.py."""
+from __future__ import annotations
+
+import re
+
+from ..engine import rule
+
+
+@rule('i18n-drop-stale-cta', 'i18n.tsx')
+def i18n_drop_stale_cta(ctx):
+    """Remove the old cta/projects block (lines 274-285) ahead of contact.help."""
+    lines = ctx.lines
+    if len(lines) > 280 and "'cta.title'" in lines.line(274):
+        return lines.apply_edit(lines.offset(274), lines.offset(286), '')
+    ctx.log('Skipping: content mismatch at line 274')
+    return None
+
+
+@rule('duplicate-clip-path-style', 'components/EnhancedElements.tsx')
+def duplicate_clip_path_style(ctx):
+    """Drop an inline clipPath style that is immediately overridden by a second style prop."""
+    return re.sub(r'style=\{\{\s*clipPath:\s*\'inset\([^)]+\)\'\s*\}\}\s*(?=\s*style=\{)', '', ctx.text)
+
+
+@rule('intrinsic-elements-type', 'components/AccessibilityUtils.tsx')
+def intrinsic_elements_type(ctx):
+    return ctx.text.replace('keyof JSX.IntrinsicElements', 'React.ElementType')
+
+
+@rule('batched-update-cast', 'components/PerformanceOptimizer.tsx')
+def batched_update_cast(ctx):
+    c = ctx.text.replace('update(prevState)', '(update as Function)(prevState)')
+    return c.replace('(prev: T) =>', '(prev: any) =>')
+
+
+@rule('telegram-chat-name-shadowing', 'components/SimpleTelegramChat.tsx')
+def telegram_chat_name_shadowing(ctx):
+    """Split the two ``name`` locals in handleSend into nameToUse/finalName."""
+    c = ctx.text.replace('let name = userName.trim();', 'let nameToUse = userName.trim();')
+    c = c.replace('const name = userName.trim();', 'const finalName = userName.trim();')
+    c = c.replace('name: name,', 'name: finalName,')
+    c = c.replace('setUserName(name);', 'setUserName(nameToUse);')
+    c = c.replace("localStorage.setItem('chat_user_name', name);", "localStorage.setItem('chat_user_name', nameToUse);")
+    return c.replace('text: name,', 'text: nameToUse,')
+
+
+@rule('test-component-import-paths', 'tests/Navigation.optimization.test.tsx',
+      'tests/ScrollToTop.optimization.test.tsx', 'tests/SimpleTelegramChat.optimization.test.tsx')
+def test_component_import_paths(ctx):
+    return ctx.text.replace("from './", "from '../components/")
+
+
+@rule('perf-test-imports', 'tests/PerformanceOptimizations.test.tsx')
+def perf_test_imports(ctx):
+    """Drop the removed SpinningCube import and use SkipLink's default export."""
+    lines = [l for l in ctx.text.split('\n') if 'SpinningCube' not in l]
+    return '\n'.join(lines).replace('{ SkipLink }', 'SkipLink')
@@ -0,0 +1,104 @@
+"""Rules formerly inlined in fix_errors_2.py."""
+from __future__ import annotations
+
+import re
+
+from ..anchors import Anchor, AnchorPatch, PatchSet
+from ..engine import rule
+from ..rewriter import RewriteRule, Rewriter
+
+TELEGRAM_NAME_BLOCK = """// Conversational name entry logic
+    let currentName = userName.trim();
+    if (!currentName) {
+      const promptName = inputValue.trim();
+      if (!promptName) {
+        setError(t('chat.error.name_required'));
+        return;
+      }
+      currentName = promptName;
+      setUserName(currentName);
+      try {
+        localStorage.setItem('chat_user_name', currentName);
+      } catch {}
+
+      // Clear input and add user's name message
+      setInputValue('');
+      setMessages(prev => [
+        ...prev,
+        { id: createId(), role: 'user', text: currentName, timestamp: new Date() },
+        { id: createId(), role: 'bot', text: t('chat.bot.welcome'), timestamp: new Date() }
+      ]);
+      return;
+    }
+
+    const finalName = currentName;
+    """
+
+
+# Inline style literals left next to the constants they were hoisted into.
+DUPLICATE_STYLE_PROPS = Rewriter([
+    RewriteRule('wave-svg-style', r"style=\{\{ height: '50%' \}\}\s*style=\{WAVE_SVG_STYLE\}",
+                'style={WAVE_SVG_STYLE}'),
+    RewriteRule('perspective-container-style',
+                r"style=\{\{ width: size, height: size, perspective: 1000 \}\}\s*"
+                r"style=\{\{ width: size, height: size, \.\.\.PERSPECTIVE_CONTAINER_STYLE \}\}",
+                'style={{ width: size, height: size, ...PERSPECTIVE_CONTAINER_STYLE }}'),
+    RewriteRule('clip-path-top', r"style=\{\{ clipPath: 'inset\([^)]+\)' \}\}\s*style=\{CLIP_PATH_TOP\}",
+                'style={CLIP_PATH_TOP}'),
+    RewriteRule('clip-path-bottom', r"style=\{\{ clipPath: 'inset\([^)]+\)' \}\}\s*style=\{CLIP_PATH_BOTTOM\}",
+                'style={CLIP_PATH_BOTTOM}'),
+])
+
+
+@rule('duplicate-style-props', 'components/EnhancedElements.tsx')
+def duplicate_style_props(ctx):
+    """Collapse inline style literals that were left next to their hoisted constants."""
+    return DUPLICATE_STYLE_PROPS.apply_ctx(ctx)
+
+
+@rule('element-type-any', 'components/AccessibilityUtils.tsx')
+def element_type_any(ctx):
+    c = ctx.text.replace('keyof JSX.IntrinsicElements', 'any')
+    return c.replace('React.ElementType', 'any')
+
+
+@rule('batched-update-any', 'components/PerformanceOptimizer.tsx')
+def batched_update_any(ctx):
+    c = ctx.text.replace('update(prevState)', '(update as any)(prevState)')
+    c = c.replace('(prev: T) =>', '(prev: any) =>')
+    return c.replace('(update as Function)(prevState)', '(update as any)(prevState)')
+
+
+TELEGRAM_NAME_PATCH = PatchSet([AnchorPatch(
+    'telegram-chat-name-block',
+    start=(Anchor('// Conversational name entry logic', 0),),
+    end=(Anchor('const userMessage = inputValue.trim();', 0),),
+    replacement=TELEGRAM_NAME_BLOCK)])
+
+
+@rule('telegram-chat-name-block', 'components/SimpleTelegramChat.tsx')
+def telegram_chat_name_block(ctx):
+    """Replace the conversational name entry block up to ``const userMessage``."""
+    return TELEGRAM_NAME_PATCH.apply_ctx(ctx)
+
+
+@rule('canvas-rect-to-json', 'tests/FloatingParticleCanvas.test.tsx')
+def canvas_rect_to_json(ctx):
+    """Add ``toJSON`` to the getBoundingClientRect mock so it satisfies DOMRect."""
+    if 'toJSON' in ctx.text:
+        return None
+    return re.sub(r'(vi\.fn\(\(\) => \(\{.*?)( \}\)\))', r'\1, toJSON: () => {} \2', ctx.text, flags=re.DOTALL)
+
+
+@rule('raf-mock-number', 'tests/RenderOptimizer.test.tsx')
+def raf_mock_number(ctx):
+    return ctx.text.replace('setTimeout(cb, 1)', '123')
+
+
+@rule('perf-test-double-close', 'tests/PerformanceOptimizations.test.tsx')
+def perf_test_double_close(ctx):
+    """Drop one of two trailing ``});`` lines (TS1128 at end of file)."""
+    lines = ctx.text.strip().split('\n')
+    if len(lines) > 1 and lines[-1].strip() == '});' and lines[-2].strip() == '});':
+        return '\n'.join(lines[:-1]) + '\n'
+    return None
@@ -0,0 +1,13 @@
+"""Rules formerly inlined in fix_final_final.py."""
+from __future__ import annotations
+
+from ..engine import rule
+
+
+@rule('batched-update-result-cast', 'components/PerformanceOptimizer.tsx')
+def batched_update_result_cast(ctx):
+    """Cast the reduce inside ``setState(prev => ...)`` back to ``T``."""
+    if '}, prev);' not in ctx.text:
+        ctx.log("could not find '}, prev);'")
+        return None
+    return ctx.text.replace('}, prev);', '}, prev) as T;')
@@ -0,0 +1,21 @@
+"""Rules formerly inlined in fix_gallery.py."""
+from __future__ import annotations
+
+import re
+
+from ..engine import rule
+
+_DISPLAY_NAME = re.compile(r'\};\s*InteractiveGallery\.displayName')
+
+
+@rule('gallery-memo-close', 'components/InteractiveGallery.tsx')
+def gallery_memo_close(ctx):
+    """Add the ``)`` missing before ``;`` ahead of ``InteractiveGallery.displayName``."""
+    if 'InteractiveGallery.displayName' not in ctx.text:
+        return None
+    c, n = _DISPLAY_NAME.subn('});\n\nInteractiveGallery.displayName', ctx.text)
+    ctx.count(n)
+    if n == 0:
+        idx = ctx.text.find('InteractiveGallery.displayName')
+        ctx.log(f'pattern not found; context: {ctx.text[idx - 20:idx + 20]!r}')
+    return c
@@ -0,0 +1,38 @@
+"""Rules formerly inlined in optimize_glow_card.py.
+
+GlowCard tracked the cursor with ``useState``, re-rendering on every
+mousemove; this moves it to ``useMotionValue``/``useTransform``.
+"""
+from __future__ import annotations
+
+from ..engine import rule
+from ..rewriter import RewriteRule, Rewriter
+
+GLOW_CARD_MOTION_VALUES = Rewriter([
+    RewriteRule('mouse-position-state',
+                r'const \[mousePosition, setMousePosition\] = useState\(\{ x: 0, y: 0 \}\);',
+                'const mouseX = useMotionValue(0);\n  const mouseY = useMotionValue(0);\n'
+                '  const glowLeft = useTransform(mouseX, x => x - 100);\n'
+                '  const glowTop = useTransform(mouseY, y => y - 100);'),
+    RewriteRule('mouse-move-handler',
+                r'const handleMouseMove = useCallback\(\(e: React.MouseEvent\) => \{\s*if \(!cardRef.current\) return;'
+                r'\s*const rect = cardRef.current.getBoundingClientRect\(\);\s*setMousePosition\(\{\s*x: e.clientX - rect.left,'
+                r'\s*y: e.clientY - rect.top,\s*\}\);\s*\}, \[\]\);',
+                'const handleMouseMove = useCallback((e: React.MouseEvent) => {\n'
+                '    if (!cardRef.current) return;\n'
+                '    const rect = cardRef.current.getBoundingClientRect();\n'
+                '    mouseX.set(e.clientX - rect.left);\n'
+                '    mouseY.set(e.clientY - rect.top);\n'
+                '  }, [mouseX, mouseY]);'),
+    RewriteRule('glow-position-style',
+                r'left: mousePosition.x - 100,\s*top: mousePosition.y - 100,',
+                'left: glowLeft,\n              top: glowTop,'),
+])
+
+
+@rule('glow-card-motion-values', 'components/EnhancedElements.tsx')
+def glow_card_motion_values(ctx):
+    new_text = GLOW_CARD_MOTION_VALUES.apply_ctx(ctx)
+    if new_text == ctx.text:
+        ctx.log('No changes made. Patterns might be incorrect.')
+    return new_text
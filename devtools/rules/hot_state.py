@@ -0,0 +1,19 @@
+"""Codemods for state written from mousemove/scroll/resize handlers.
+
+See devtools/hot_state.py for what is rewritten and why it is safe.
+"""
+from __future__ import annotations
+
+from ..engine import rule
+from ..hot_state import analyze
+
+
+@rule('hot-state', 'components/**/*.tsx', 'pages/**/*.tsx', '*.tsx')
+def hot_state(ctx):
+    """Take state set on every pointer/scroll event out of React: delete it
+    when nothing reads it, move it to motion values when only styles do."""
+    result = analyze(ctx.text)
+    ctx.count(len(result.rewritten))
+    for change in result.rewritten:
+        ctx.log(change)
+    return ctx.lines.apply_edits(result.edits)
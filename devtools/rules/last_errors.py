@@ -0,0 +1,17 @@
+"""Rules formerly inlined in fix_last_errors.py."""
+from __future__ import annotations
+
+from ..engine import rule
+
+
+@rule('batched-update-call-cast', 'components/PerformanceOptimizer.tsx')
+def batched_update_call_cast(ctx):
+    """Cast the queued updater before calling it inside the reduce."""
+    old = "typeof update === 'function' ? update(currentState) : update"
+    if old not in ctx.text:
+        idx = ctx.text.find('typeof update ===')
+        if idx != -1:
+            ctx.log(f'search string not found; nearby: {ctx.text[idx:idx + 50]!r}')
+        return None
+    return ctx.text.replace(old, "typeof update === 'function' ? (update as any)(currentState) : update")
+
@@ -0,0 +1,16 @@
+"""Hoisting of constant inline style objects; see devtools/style_hoist.py."""
+from __future__ import annotations
+
+from ..engine import rule
+from ..style_hoist import GLOBS, plan
+
+
+@rule('style-hoist', *GLOBS)
+def style_hoist(ctx):
+    """Merge duplicate JSX props and hoist constant ``style``/``className``
+    values to module constants."""
+    result = plan(ctx.text)
+    ctx.count(len(result.messages))
+    for message in result.messages:
+        ctx.log(message)
+    return ctx.lines.apply_edits(result.edits)
@@ -0,0 +1,25 @@
+"""Fixers dispatched from tsc output rather than from fixed path lists.
+
+Each rule declares the codes it handles and works from ``ctx.diagnostics``,
+so ``python -m devtools.tsc --fix`` only opens the files tsc complained
+about.
+"""
+from __future__ import annotations
+
+from ..engine import rule
+
+
+@rule('missing-close-paren', '**/*.{ts,tsx}', codes=('TS1005',))
+def missing_close_paren(ctx):
+    """``')' expected.`` on the ``;`` of a ``};``: the closing of a
+    ``React.memo(() => { ... })`` or ``forwardRef`` wrapper lost its ``)``."""
+    lines = ctx.lines
+    edits = []
+    for d in ctx.diagnostics:
+        if d.code != 'TS1005' or d.message != "')' expected.":
+            continue
+        pos = lines.offset(d.line, d.col)
+        if lines.text.startswith('};', pos - 1):
+            edits.append((pos, pos, ')'))
+    ctx.count(len(edits))
+    return lines.apply_edits(edits)
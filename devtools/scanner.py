@@ -0,0 +1,184 @@
+"""Single-pass multi-pattern scanner for conflict markers and code smells.
+
+Every pattern is folded into one compiled alternation over bytes, so each
+file is walked once no matter how many patterns there are; ``lastgroup``
+tells which pattern fired. Files are memory-mapped and only the bytes of a
+hit's own line are decoded, which keeps Cyrillic-heavy files such as
+i18n.tsx cheap. Line numbers come from counting newlines between hits, so
+no line list is ever built.
+"""
+from __future__ import annotations
+
+import argparse
+import mmap
+import os
+import re
+import sys
+from dataclasses import dataclass
+from typing import Iterator, NamedTuple, Optional, Sequence
+
+from .cache import Cache, fingerprint
+from .engine import iter_files, parallel_map
+
+DEFAULT_GLOBS = (
+    'components/**/*.{ts,tsx}', 'pages/**/*.{ts,tsx}', 'lib/**/*.{ts,tsx}',
+    'tests/**/*.{ts,tsx}', 'api/**/*.ts', '*.{ts,tsx}',
+)
+
+
+@dataclass(frozen=True)
+class Pattern:
+    name: str
+    regex: bytes
+    severity: str = 'warning'
+
+
+PATTERNS = (
+    Pattern('conflict-start', rb'^<<<<<<<(?=[ \r\n]|$)', 'error'),
+    Pattern('conflict-separator', rb'^=======\r?$', 'error'),
+    Pattern('conflict-end', rb'^>>>>>>>(?=[ \r\n]|$)', 'error'),
+    Pattern('react-memo', rb'\bReact\.memo\(', 'info'),
+    Pattern('console-log', rb'\bconsole\.log\('),
+    Pattern('debugger', rb'\bdebugger\b'),
+    Pattern('ts-suppress', rb'@ts-(?:ignore|nocheck)\b'),
+    Pattern('as-any', rb'\bas any\b'),
+)
+
+SEVERITIES = ('info', 'warning', 'error')
+CONFLICT_PATTERNS = frozenset({'conflict-start', 'conflict-separator', 'conflict-end'})
+
+
+class Hit(NamedTuple):
+    pattern: str
+    line: int      # 1-based
+    col: int       # 1-based, in characters
+    text: str      # the hit's line, stripped of its newline
+
+
+_COMPILED: dict[tuple[Pattern, ...], re.Pattern] = {}
+
+
+def compile_patterns(patterns: Sequence[Pattern] = PATTERNS) -> re.Pattern:
+    key = tuple(patterns)
+    rx = _COMPILED.get(key)
+    if rx is None:
+        alternation = b'|'.join(b'(?P<%s>%s)' % (_group(p.name).encode(), p.regex) for p in patterns)
+        rx = _COMPILED[key] = re.compile(alternation, re.MULTILINE)
+    return rx
+
+
+def _group(name: str) -> str:
+    return name.replace('-', '_')
+
+
+def patterns_version(patterns: Sequence[Pattern] = PATTERNS) -> str:
+    return fingerprint([(p.name, p.regex.decode('latin-1'), p.severity) for p in patterns])
+
+
+def scan_bytes(data, patterns: Sequence[Pattern] = PATTERNS, max_line: int = 200) -> list[Hit]:
+    """Scan a bytes-like object (``bytes`` or ``mmap``) in one pass."""
+    rx = compile_patterns(patterns)
+    names = {_group(p.name): p.name for p in patterns}
+    hits = []
+    line = 1
+    last = 0
+    for m in rx.finditer(data):
+        pos = m.start()
+        line += data.count(b'\n', last, pos) if isinstance(data, bytes) else data[last:pos].count(b'\n')
+        last = pos
+        line_start = data.rfind(b'\n', 0, pos) + 1
+        line_end = data.find(b'\n', pos)
+        if line_end == -1:
+            line_end = len(data)
+        col = len(data[line_start:pos].decode('utf-8', 'replace')) + 1
+        text = data[line_start:min(line_end, line_start + max_line * 4)].decode('utf-8', 'replace').rstrip('\r')
+        hits.append(Hit(names[m.lastgroup], line, col, text[:max_line]))
+    return hits
+
+
+def scan_file(path: str, patterns: Sequence[Pattern] = PATTERNS) -> list[Hit]:
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return scan_bytes(mm, patterns)
+
+
+def _scan_batch(root: str, paths: list[str], patterns: Sequence[Pattern]) -> list[tuple[str, list[Hit], Optional[str]]]:
+    out = []
+    for rel in paths:
+        try:
+            out.append((rel, scan_file(os.path.join(root, rel), patterns), None))
+        except OSError as exc:
+            out.append((rel, [], f'{type(exc).__name__}: {exc}'))
+    return out
+
+
+def scan_tree(root: str = '.', globs: Sequence[str] = DEFAULT_GLOBS, patterns: Sequence[Pattern] = PATTERNS,
+              cache: Optional[Cache] = None, jobs: Optional[int] = None,
+              paths: Optional[Sequence[str]] = None) -> Iterator[tuple[str, list[Hit], Optional[str]]]:
+    """Yield ``(path, hits, error)`` for every matched file, in path order.
+
+    Cached results are served in the parent; only cache misses are scanned,
+    in parallel.
+    """
+    files = list(paths) if paths is not None else list(iter_files(root, globs))
+    if cache is None:
+        yield from parallel_map(lambda batch: (_scan_batch, (root, batch, patterns)), files, jobs, 64)
+        return
+
+    version = patterns_version(patterns)
+    cached: dict[str, list[Hit]] = {}
+    digests: dict[str, str] = {}
+    misses = []
+    for rel in files:
+        digest = cache.file_hash(rel)
+        value = cache.get('scan:markers', digest, version) if digest else None
+        if value is None:
+            misses.append(rel)
+            digests[rel] = digest
+        else:
+            cached[rel] = [Hit(*h) for h in value]
+    fresh = parallel_map(lambda batch: (_scan_batch, (root, batch, patterns)), misses, jobs, 64)
+    for rel in files:
+        if rel in cached:
+            yield rel, cached[rel], None
+            continue
+        rel, hits, error = next(fresh)
+        if error is None and digests[rel]:
+            cache.put('scan:markers', digests[rel], version, [list(h) for h in hits])
+        yield rel, hits, error
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Scan the tree for conflict markers and code smells.')
+    parser.add_argument('paths', nargs='*', help='files to scan (default: the source tree)')
+    parser.add_argument('--root', default='.')
+    parser.add_argument('-j', '--jobs', type=int, default=None)
+    parser.add_argument('--no-cache', action='store_true')
+    parser.add_argument('--min-severity', choices=SEVERITIES, default='warning',
+                        help='lowest severity to report (default: warning)')
+    args = parser.parse_args(argv)
+
+    severity = {p.name: p.severity for p in PATTERNS}
+    threshold = SEVERITIES.index(args.min_severity)
+    cache = None if args.no_cache else Cache(args.root)
+    errors = 0
+    try:
+        for path, hits, error in scan_tree(args.root, cache=cache, jobs=args.jobs, paths=args.paths or None):
+            if error:
+                print(f'{path}: {error}')
+                errors += 1
+            for hit in hits:
+                if SEVERITIES.index(severity[hit.pattern]) < threshold:
+                    continue
+                errors += severity[hit.pattern] == 'error'
+                print(f'{path}:{hit.line}:{hit.col}: {severity[hit.pattern]} {hit.pattern}: {hit.text.strip()}')
+    finally:
+        if cache is not None:
+            cache.close()
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,477 @@
+"""Perceptual-hash index for the e2e screenshots.
+
+tests/e2e/screenshots holds dozens of captures, many of them the same page
+at a few scroll offsets (``overlap_check_<scrollY>.png``). Comparing them
+pixel by pixel means decoding tens of megapixels per pair. This keeps two
+64-bit perceptual hashes per image instead:
+
+- dHash: the signs of horizontal gradients on a 9x8 grayscale thumbnail
+- pHash: the low 8x8 frequencies of a 32x32 DCT, thresholded at their median
+
+Both are stored in a compact binary index (``.devtools-cache/screenshots.idx``,
+52 bytes plus the name per image). An entry is only rehashed when the
+file's size or mtime changes. Hamming distances are XOR + popcount on
+ints. A multi-index (four 16-bit blocks per hash, pigeonhole) answers "which
+image is closest" in microseconds, and only a pair whose distance exceeds
+``--threshold`` goes on to a full-resolution diff.
+
+PNGs are decoded with Pillow when it is installed. Otherwise a pure-Python
+decoder is used: zlib inflates the image data, and only the rows the
+thumbnail needs are unfiltered. Rows using the None or Sub filter can be
+decoded on their own. For the rest, the rows from the last such row are
+replayed, and Up rows are added 8 bytes at a time as big-int words.
+
+    python -m devtools.screenshots                       # update index, list duplicate groups
+    python -m devtools.screenshots --closest new.png --among 'homepage_*'
+    python -m devtools.screenshots --diff a.png b.png    # hash gate, then pixel diff
+"""
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import math
+import os
+import struct
+import sys
+import time
+import zlib
+from itertools import accumulate
+from typing import Iterator, NamedTuple, Optional, Sequence
+
+from .cache import DEFAULT_DIR, content_hash
+
+try:
+    from PIL import Image
+except ImportError:   # the pure-Python decoder below is used instead
+    Image = None
+
+DEFAULT_DIR_SHOTS = 'tests/e2e/screenshots'
+INDEX_NAME = 'screenshots.idx'
+GRID = 32           # pHash works on a GRID x GRID thumbnail
+SAMPLES = 4         # sampled rows / columns per thumbnail cell
+MAX_CHAIN = 64      # rows replayed to reach a row that depends on the one above
+THRESHOLD = 4       # hash distance at or below which two captures are the same
+_MAGIC = b'SSIX'
+_VERSION = 1
+_HEADER = struct.Struct('<4sBBI')
+_ENTRY = struct.Struct('<H8sQQIIQQ')   # name length, digest, mtime_ns, size, width, height, dhash, phash
+_CHANNELS = {0: 1, 2: 3, 4: 2, 6: 4}   # PNG color type -> samples per pixel (8-bit)
+
+
+class ScreenshotError(Exception):
+    """A file is not a PNG this decoder handles."""
+
+
+class Entry(NamedTuple):
+    name: str
+    digest: bytes
+    mtime_ns: int
+    size: int
+    width: int
+    height: int
+    dhash: int
+    phash: int
+
+
+def distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+# -- decoding -----------------------------------------------------------------
+
+def _png_chunks(f) -> Iterator[tuple[bytes, bytes]]:
+    if f.read(8) != b'\x89PNG\r\n\x1a\n':
+        raise ScreenshotError('not a PNG file')
+    while True:
+        head = f.read(8)
+        if len(head) < 8:
+            return
+        length, kind = struct.unpack('>I4s', head)
+        body = f.read(length)
+        f.read(4)   # CRC
+        yield kind, body
+        if kind == b'IEND':
+            return
+
+
+def _rows(path: str) -> tuple[int, int, int, Iterator[tuple[int, bytes]]]:
+    """``(width, height, channels, (filter, filtered row) per row)``, inflated as it is read."""
+    f = open(path, 'rb')
+    chunks = _png_chunks(f)
+    kind, body = next(chunks, (b'', b''))
+    if kind != b'IHDR':
+        f.close()
+        raise ScreenshotError('missing IHDR')
+    width, height, depth, color, _, _, interlace = struct.unpack('>IIBBBBB', body)
+    if depth != 8 or color not in _CHANNELS or interlace:
+        f.close()
+        raise ScreenshotError(f'unsupported PNG (bit depth {depth}, color type {color}, interlace {interlace})')
+    channels = _CHANNELS[color]
+    stride = width * channels + 1
+
+    def rows() -> Iterator[tuple[int, bytes]]:
+        inflate = zlib.decompressobj()
+        buf = b''
+        try:
+            for kind, body in chunks:
+                if kind != b'IDAT':
+                    continue
+                buf += inflate.decompress(body)
+                full = len(buf) // stride * stride
+                for pos in range(0, full, stride):
+                    yield buf[pos], buf[pos + 1:pos + stride]
+                buf = buf[full:]
+        finally:
+            f.close()
+
+    return width, height, channels, rows()
+
+
+def _masks(n: int) -> tuple[int, int]:
+    return int.from_bytes(b'\x7f' * n, 'little'), int.from_bytes(b'\x80' * n, 'little')
+
+
+def unfilter(ftype: int, row: bytes, prev: Optional[bytes], bpp: int, masks=None) -> bytes:
+    """Undo one PNG row filter; ``prev`` is the previous unfiltered row (``None`` for the first)."""
+    if ftype == 0:
+        return row
+    if ftype == 1:   # Sub: running sum per channel
+        out = bytearray(row)
+        for c in range(bpp):
+            out[c::bpp] = bytes(accumulate(row[c::bpp], lambda x, y: (x + y) & 255))
+        return bytes(out)
+    if prev is None:
+        prev = bytes(len(row))
+    if ftype == 2:   # Up: bytewise add without carries, as one big-int operation
+        low, high = masks or _masks(len(row))
+        a, b = int.from_bytes(row, 'little'), int.from_bytes(prev, 'little')
+        return (((a & low) + (b & low)) ^ ((a ^ b) & high)).to_bytes(len(row), 'little')
+    out = bytearray(row)
+    if ftype == 3:   # Average
+        for i in range(len(out)):
+            left = out[i - bpp] if i >= bpp else 0
+            out[i] = (out[i] + ((left + prev[i]) >> 1)) & 255
+    elif ftype == 4:   # Paeth
+        for i in range(len(out)):
+            if i >= bpp:
+                a, c = out[i - bpp], prev[i - bpp]
+            else:
+                a = c = 0
+            b = prev[i]
+            p = a + b - c
+            pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+            out[i] = (out[i] + (a if pa <= pb and pa <= pc else b if pb <= pc else c)) & 255
+    else:
+        raise ScreenshotError(f'bad filter type {ftype}')
+    return bytes(out)
+
+
+def _gray(row: bytes, channels: int, xs: Sequence[int]) -> list[int]:
+    if channels < 3:
+        return [row[x * channels] for x in xs]
+    return [(299 * row[x * channels] + 587 * row[x * channels + 1] + 114 * row[x * channels + 2]) // 1000
+            for x in xs]
+
+
+def thumbnail(path: str) -> tuple[int, int, list[list[float]]]:
+    """``(width, height, GRID x GRID grayscale means)`` of a PNG."""
+    if Image is not None:
+        with Image.open(path) as im:
+            width, height = im.size
+            small = im.convert('L').resize((GRID, GRID), Image.BOX)
+            px = list(small.getdata())
+        return width, height, [[float(v) for v in px[r * GRID:(r + 1) * GRID]] for r in range(GRID)]
+    width, height, channels, rows = _rows(path)
+    xs = [min(width - 1, int((c + (s + 0.5) / SAMPLES) * width / GRID)) for c in range(GRID) for s in range(SAMPLES)]
+    sums = [[0.0] * GRID for _ in range(GRID)]
+    counts = [0] * GRID
+    masks = _masks(width * channels)
+    spacing = max(1.0, height / (GRID * SAMPLES))
+    next_y = 0.0
+    chain: Optional[list[tuple[int, bytes]]] = []   # rows since the last independent one; None: too long
+
+    def sample(cell: int, row: bytes) -> None:
+        gray = _gray(row, channels, xs)
+        acc = sums[cell]
+        for i, g in enumerate(gray):
+            acc[i // SAMPLES] += g
+        counts[cell] += 1
+
+    for y, (ftype, raw) in enumerate(rows):
+        cell = y * GRID // height
+        if ftype in (0, 1):
+            chain = [(ftype, raw)]
+            if y >= next_y:
+                sample(cell, unfilter(ftype, raw, None, channels))
+                next_y += spacing
+        elif chain is not None:
+            chain.append((ftype, raw))
+            if len(chain) > MAX_CHAIN:
+                chain = None
+        last_in_cell = (y + 1) * GRID // height != cell or y == height - 1
+        if last_in_cell and counts[cell] == 0 and chain:
+            prev = None
+            for ft, r in chain:   # replay from the last independent row
+                prev = unfilter(ft, r, prev, channels, masks)
+            sample(cell, prev)
+    if not any(counts):
+        raise ScreenshotError('no row could be decoded cheaply')
+    for r in range(GRID):   # cells nothing could be sampled for borrow the nearest row that was
+        if not counts[r]:
+            src = min((k for k in range(GRID) if counts[k]), key=lambda k: abs(k - r))
+            sums[r], counts[r] = list(sums[src]), counts[src]
+    return width, height, [[v / (counts[r] * SAMPLES) for v in sums[r]] for r in range(GRID)]
+
+
+# -- hashing ------------------------------------------------------------------
+
+def dhash(grid: list[list[float]]) -> int:
+    """Horizontal-gradient hash of the grid shrunk to 9 x 8."""
+    small = [[_mean(grid, r * GRID // 8, (r + 1) * GRID // 8, c * GRID // 9, (c + 1) * GRID // 9)
+              for c in range(9)] for r in range(8)]
+    bits = 0
+    for row in small:
+        for left, right in zip(row, row[1:]):
+            bits = bits << 1 | (left > right)
+    return bits
+
+
+def _mean(grid, r0, r1, c0, c1) -> float:
+    cells = [grid[r][c] for r in range(r0, r1) for c in range(c0, c1)]
+    return sum(cells) / len(cells)
+
+
+_DCT = [[math.cos((2 * x + 1) * u * math.pi / (2 * GRID)) for x in range(GRID)] for u in range(8)]
+
+
+def phash(grid: list[list[float]]) -> int:
+    """Low-frequency DCT hash: 8x8 coefficients against their median (DC excluded)."""
+    rows = [[sum(v * k for v, k in zip(row, basis)) for basis in _DCT] for row in grid]   # GRID x 8
+    coeffs = [sum(rows[x][u] * _DCT[v][x] for x in range(GRID)) for v in range(8) for u in range(8)]
+    median = sorted(coeffs[1:])[31]
+    bits = 0
+    for c in coeffs:
+        bits = bits << 1 | (c > median)
+    return bits
+
+
+def hash_file(path: str) -> tuple[int, int, int, int]:
+    """``(width, height, dhash, phash)``."""
+    width, height, grid = thumbnail(path)
+    return width, height, dhash(grid), phash(grid)
+
+
+# -- index --------------------------------------------------------------------
+
+class Index:
+    """Hashes of every screenshot in a directory, persisted between runs."""
+
+    def __init__(self, entries: Sequence[Entry] = ()):
+        self.entries = list(entries)
+        self._build()
+
+    def _build(self) -> None:
+        self.by_name = {e.name: i for i, e in enumerate(self.entries)}
+        # Multi-index hashing: two hashes within distance 3 agree on at least one 16-bit block.
+        self.blocks: dict[tuple[int, int], list[int]] = {}
+        for i, e in enumerate(self.entries):
+            for b in range(4):
+                self.blocks.setdefault((b, e.phash >> (16 * b) & 0xffff), []).append(i)
+
+    @staticmethod
+    def decoder() -> int:
+        return 1 if Image is not None else 0
+
+    @classmethod
+    def load(cls, path: str) -> 'Index':
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return cls()
+        if len(data) < _HEADER.size:
+            return cls()
+        magic, version, decoder, count = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION or decoder != cls.decoder():
+            return cls()   # hashes from another decoder differ slightly; rebuild
+        entries = []
+        pos = _HEADER.size
+        for _ in range(count):
+            n, *rest = _ENTRY.unpack_from(data, pos)
+            pos += _ENTRY.size
+            entries.append(Entry(data[pos:pos + n].decode('utf-8'), *rest))
+            pos += n
+        return cls(entries)
+
+    def save(self, path: str) -> None:
+        parts = [_HEADER.pack(_MAGIC, _VERSION, self.decoder(), len(self.entries))]
+        for e in self.entries:
+            name = e.name.encode('utf-8')
+            parts.append(_ENTRY.pack(len(name), *e[1:]) + name)
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        temp = path + '.tmp'
+        with open(temp, 'wb') as f:
+            f.write(b''.join(parts))
+        os.replace(temp, path)
+
+    def update(self, directory: str, out=sys.stderr) -> tuple[int, list[str]]:
+        """Rehash new or changed PNGs and drop deleted ones; returns ``(rehashed, errors)``."""
+        names = sorted(n for n in os.listdir(directory) if n.lower().endswith('.png'))
+        entries = []
+        rehashed = 0
+        errors = []
+        for name in names:
+            path = os.path.join(directory, name)
+            st = os.stat(path)
+            old = self.by_name.get(name)
+            if old is not None and (self.entries[old].size, self.entries[old].mtime_ns) == (st.st_size,
+                                                                                           st.st_mtime_ns):
+                entries.append(self.entries[old])
+                continue
+            with open(path, 'rb') as f:
+                digest = bytes.fromhex(content_hash(f.read())[:16])
+            same = next((e for e in self.entries if e.digest == digest), None)
+            if same is None:
+                try:
+                    width, height, dh, ph = hash_file(path)
+                except (ScreenshotError, OSError, zlib.error) as e:
+                    errors.append(f'{name}: {e}')
+                    continue
+                rehashed += 1
+                print(f'hashed {name}', file=out)
+            else:   # identical bytes under another name
+                width, height, dh, ph = same.width, same.height, same.dhash, same.phash
+            entries.append(Entry(name, digest, st.st_mtime_ns, st.st_size, width, height, dh, ph))
+        self.entries = entries
+        self._build()
+        return rehashed, errors
+
+    def closest(self, dh: int, ph: int, among: Optional[str] = None, exclude: str = '') -> Optional[tuple[Entry, int]]:
+        """The entry nearest to the hashes (pHash + dHash distance), optionally within a name glob."""
+        pool = None
+        if among is None:
+            pool = {i for b in range(4) for i in self.blocks.get((b, ph >> (16 * b) & 0xffff), ())}
+            pool.discard(self.by_name.get(exclude, -1))
+        if not pool:   # nothing within distance 3 by pHash: scan
+            pool = range(len(self.entries))
+        best = None
+        for i in pool:
+            e = self.entries[i]
+            if e.name == exclude or (among is not None and not fnmatch.fnmatch(e.name, among)):
+                continue
+            d = distance(e.phash, ph) + distance(e.dhash, dh)
+            if best is None or d < best[1]:
+                best = (e, d)
+        return best
+
+    def groups(self, threshold: int = THRESHOLD) -> list[list[Entry]]:
+        """Captures whose pHash and dHash are both within ``threshold`` and whose sizes match."""
+        parent = list(range(len(self.entries)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for i, a in enumerate(self.entries):
+            for j in range(i + 1, len(self.entries)):
+                b = self.entries[j]
+                if (a.width, a.height) == (b.width, b.height) and distance(a.phash, b.phash) <= threshold \
+                        and distance(a.dhash, b.dhash) <= threshold:
+                    parent[find(j)] = find(i)
+        found: dict[int, list[Entry]] = {}
+        for i, e in enumerate(self.entries):
+            found.setdefault(find(i), []).append(e)
+        return [g for g in found.values() if len(g) > 1]
+
+
+def pixel_diff(a: str, b: str) -> tuple[int, int]:
+    """``(differing pixels, total pixels)`` at full resolution."""
+    if Image is not None:
+        with Image.open(a) as ia, Image.open(b) as ib:
+            if ia.size != ib.size:
+                raise ScreenshotError(f'sizes differ: {ia.size} vs {ib.size}')
+            pa, pb = ia.convert('RGB').tobytes(), ib.convert('RGB').tobytes()
+        diff = sum(1 for i in range(0, len(pa), 3) if pa[i:i + 3] != pb[i:i + 3])
+        return diff, ia.size[0] * ia.size[1]
+    wa, ha, ca, rows_a = _rows(a)
+    wb, hb, cb, rows_b = _rows(b)
+    if (wa, ha) != (wb, hb):
+        raise ScreenshotError(f'sizes differ: {wa}x{ha} vs {wb}x{hb}')
+    masks_a, masks_b = _masks(wa * ca), _masks(wb * cb)
+    prev_a = prev_b = None
+    diff = 0
+    for (fa, ra), (fb, rb) in zip(rows_a, rows_b):
+        prev_a = unfilter(fa, ra, prev_a, ca, masks_a)
+        prev_b = unfilter(fb, rb, prev_b, cb, masks_b)
+        if prev_a != prev_b:
+            diff += sum(1 for x in range(wa) if prev_a[x * ca:x * ca + 3] != prev_b[x * cb:x * cb + 3])
+    return diff, wa * ha
+
+
+def _hashes(index: Index, directory: str, path: str) -> tuple[int, int]:
+    """``(dhash, phash)`` from the index when ``path`` is an indexed capture, else hashed now."""
+    i = index.by_name.get(os.path.basename(path))
+    if i is not None and os.path.abspath(os.path.dirname(path)) == os.path.abspath(directory):
+        return index.entries[i].dhash, index.entries[i].phash
+    return hash_file(path)[2:]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Perceptual-hash index for e2e screenshots.')
+    parser.add_argument('--root', default='.')
+    parser.add_argument('--dir', default=DEFAULT_DIR_SHOTS, help='screenshot directory (default: %(default)s)')
+    parser.add_argument('--threshold', type=int, default=THRESHOLD, help='hash distance that counts as the same')
+    parser.add_argument('--closest', metavar='PNG', help='print the indexed capture nearest to PNG')
+    parser.add_argument('--among', metavar='GLOB', help='with --closest: only consider names matching GLOB')
+    parser.add_argument('--diff', nargs=2, metavar='PNG', help='hash gate, then a full diff if they differ')
+    args = parser.parse_args(argv)
+
+    directory = os.path.join(args.root, args.dir)
+    index_path = os.path.join(args.root, DEFAULT_DIR, INDEX_NAME)
+    index = Index.load(index_path)
+    before = index.entries
+    start = time.perf_counter()
+    rehashed, errors = index.update(directory)
+    if index.entries != before:
+        index.save(index_path)
+    for error in errors:
+        print(error, file=sys.stderr)
+    print(f'{len(index.entries)} screenshots indexed, {rehashed} hashed in '
+          f'{time.perf_counter() - start:.2f}s', file=sys.stderr)
+
+    if args.closest:
+        dh, ph = _hashes(index, directory, args.closest)
+        t = time.perf_counter()
+        best = index.closest(dh, ph, args.among, exclude=os.path.basename(args.closest))
+        elapsed = (time.perf_counter() - t) * 1e6
+        if best is None:
+            print('no candidates')
+            return 1
+        print(f'{best[0].name} (distance {best[1]}, {best[0].width}x{best[0].height}; lookup {elapsed:.0f} us)')
+        return 0
+
+    if args.diff:
+        hashes = [_hashes(index, directory, path) for path in args.diff]
+        d = max(distance(hashes[0][0], hashes[1][0]), distance(hashes[0][1], hashes[1][1]))
+        if d <= args.threshold:
+            print(f'same (hash distance {d} <= {args.threshold}); full diff skipped')
+            return 0
+        try:
+            diff, total = pixel_diff(*args.diff)
+        except ScreenshotError as e:
+            print(f'different (hash distance {d}): {e}')
+            return 1
+        print(f'different (hash distance {d}): {diff} of {total} pixels ({100 * diff / total:.2f}%)')
+        return 1 if diff else 0
+
+    for group in sorted(index.groups(args.threshold), key=lambda g: (-len(g), g[0].name)):
+        keep, *dupes = sorted(group, key=lambda e: e.name)
+        print(f'{keep.name} ({keep.width}x{keep.height}): {len(dupes)} duplicate'
+              + 's' * (len(dupes) != 1) + ': ' + ', '.join(e.name for e in dupes))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
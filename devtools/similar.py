@@ -0,0 +1,276 @@
+"""Near-duplicate files and functions, found with MinHash and LSH.
+
+Copies of one component drift apart: Hero / HeroClean / Hero2026, the
+GradientShaderCard family, ErrorBoundary / ErrorBoundaryEnhanced. A fix made
+in one copy has to be repeated in the others (see fix_codebase.py's Hero
+repair). This groups such copies.
+
+Each file and each top-level function, class or component is reduced to
+a normalized token stream. Identifiers, strings and numbers become
+placeholders, while keywords, punctuation, intrinsic JSX tags and attribute
+names are kept, so renamed copies still match. The stream is cut into
+5-token shingles. A MinHash signature is built with one-permutation hashing:
+one hash per shingle, 128 bins, and empty bins filled from their neighbour.
+Signatures are split into 42 bands of 3 rows. Only units that share a band
+bucket are compared, so the search is not quadratic. Pairs whose estimated
+Jaccard similarity reaches ``--threshold`` are merged into clusters. Merging
+is transitive, so two members of a cluster can be further apart than the
+threshold. Each cluster is printed with its mean pairwise similarity, and
+each member with its closest match (``best``), which does reach it.
+
+Every member is labelled by how the app loads it: ``eager`` (static imports
+from index.tsx), ``lazy`` (only behind ``import()``) or ``unused``.
+Signatures are cached per file by content hash.
+
+    python -m devtools.similar
+    python -m devtools.similar --threshold 0.7 --level files
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import zlib
+from collections import defaultdict
+from itertools import combinations
+from typing import NamedTuple, Optional, Sequence
+
+from . import tokenizer
+from .cache import Cache, fingerprint, module_version
+from .engine import iter_files
+from .jsmodule import module_consts
+from .tokenizer import (IDENT, JSX_ATTR, JSX_CLOSE, JSX_OPEN, JSX_OPEN_END, JSX_SELF_CLOSE, NUMBER, PUNCT,
+                        TokenStream, is_jsx_path, is_token)
+
+GLOBS = ('*.tsx', 'components/**/*.tsx', 'pages/**/*.tsx', 'lib/**/*.ts', 'lib/**/*.tsx')
+SHINGLE = 5
+BINS = 128
+ROWS = 3
+BANDS = BINS // ROWS   # 42 bands; a pair at 0.35 shares a bucket with p ~ 0.84, at 0.1 with p ~ 0.04
+MIN_TOKENS = 80    # smaller functions are too generic to compare
+THRESHOLD = 0.35   # unrelated components here score about 0.1
+
+KEYWORDS = frozenset({
+    'async', 'await', 'break', 'case', 'catch', 'class', 'const', 'continue', 'default', 'delete', 'do',
+    'else', 'export', 'extends', 'false', 'finally', 'for', 'function', 'if', 'import', 'in', 'instanceof',
+    'interface', 'let', 'new', 'null', 'of', 'return', 'static', 'super', 'switch', 'this', 'throw', 'true',
+    'try', 'type', 'typeof', 'undefined', 'var', 'void', 'while', 'yield',
+})
+_MASK = (1 << 64) - 1
+
+
+class Unit(NamedTuple):
+    name: str            # '' for the whole file
+    line: int
+    signature: list[int]
+
+
+def _normalize(tok) -> str:
+    kind = tok.kind
+    if kind == IDENT:
+        return tok.value if tok.value in KEYWORDS else 'id'
+    if kind == PUNCT:
+        return tok.value
+    if kind == JSX_OPEN:
+        return '<' + (tok.value if tok.value[:1].islower() else 'C')
+    if kind == JSX_ATTR:
+        return '@' + tok.value
+    if kind in (JSX_OPEN_END, JSX_SELF_CLOSE, JSX_CLOSE):
+        return kind
+    return 'num' if kind == NUMBER else kind   # strings, templates, regexes, JSX text
+
+
+def _mix(h: int) -> int:
+    """splitmix64 finalizer."""
+    h = (h ^ (h >> 30)) * 0xbf58476d1ce4e5b9 & _MASK
+    h = (h ^ (h >> 27)) * 0x94d049bb133111eb & _MASK
+    return h ^ (h >> 31)
+
+
+def signature(ids: Sequence[int]) -> list[int]:
+    """One-permutation MinHash of the shingles of ``ids``, densified by rotation."""
+    bins = [-1] * BINS
+    for i in range(len(ids) - SHINGLE + 1):
+        h = 0
+        for t in ids[i:i + SHINGLE]:
+            h = (h * 1000003 ^ t) & _MASK
+        h = _mix(h)
+        b, v = h % BINS, h // BINS
+        if bins[b] < 0 or v < bins[b]:
+            bins[b] = v
+    if all(v < 0 for v in bins):
+        return bins
+    for b in range(BINS):
+        if bins[b] < 0:
+            k = 1
+            while bins[(b + k) % BINS] < 0:
+                k += 1
+            bins[b] = bins[(b + k) % BINS] + k * (1 << 58)
+    return bins
+
+
+def similarity(a: Sequence[int], b: Sequence[int]) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(x == y for x, y in zip(a, b)) / BINS
+
+
+def _spans(ts: TokenStream) -> list[tuple[str, int, int]]:
+    """``(name, first token, last token)`` for top-level functions, classes and function consts."""
+    toks = ts.toks
+    spans = [(name, c.first, c.last) for name, c in module_consts(ts).items()
+             if c.init[0] <= c.init[1] and any(is_token(toks[k], PUNCT, '=>') or is_token(toks[k], IDENT, 'function')
+                                               for k in range(*c.init))]
+    for i, tok in enumerate(toks):
+        if is_token(tok, IDENT, 'function', 'class') and ts.parent[i] == -1 and is_token(ts.tok(i + 1), IDENT):
+            body = i + 2
+            while body < len(toks) and not (is_token(toks[body], PUNCT, '{') and ts.parent[body] == -1
+                                            and not is_token(toks[body - 1], PUNCT, ':', '|', '&', ',', '<')):
+                body += 1
+            if body in ts.close:
+                spans.append((toks[i + 1].value, i, ts.close[body]))
+    return spans
+
+
+def units(text: str, jsx: bool = True) -> list[Unit]:
+    """The whole file first, then each top-level unit of at least ``MIN_TOKENS`` tokens."""
+    ts = TokenStream(text, jsx=jsx)
+    codes: dict[str, int] = {}
+    ids = [codes.setdefault(s, zlib.crc32(s.encode())) for s in map(_normalize, ts.toks)]
+    found = [Unit('', 1, signature(ids))] if len(ids) >= SHINGLE else []
+    for name, lo, hi in sorted(_spans(ts), key=lambda s: s[1]):
+        if hi - lo + 1 >= MIN_TOKENS:
+            found.append(Unit(name, ts.line(lo), signature(ids[lo:hi + 1])))
+    return found
+
+
+def _generated(path: str) -> bool:
+    with open(path, 'r', encoding='utf-8') as fh:
+        return 'do not edit' in fh.readline()
+
+
+def scan_tree(root: str = '.', globs: Sequence[str] = GLOBS,
+              cache: Optional[Cache] = None) -> dict[str, list[Unit]]:
+    version = fingerprint(module_version(__name__), module_version(tokenizer.__name__),
+                          module_version('devtools.jsmodule'))
+    found = {}
+    for rel in iter_files(root, globs):
+        if _generated(os.path.join(root, rel)):
+            continue   # copies by construction (lib/i18n chunks)
+        jsx = is_jsx_path(rel)
+        if cache is None:
+            with open(os.path.join(root, rel), 'r', encoding='utf-8') as fh:
+                found[rel] = units(fh.read(), jsx)
+        else:
+            namespace = 'similar-jsx' if jsx else 'similar'
+            found[rel] = [Unit(*u) for u in cache.memoize(namespace, version, rel, lambda t: units(t, jsx))]
+    return found
+
+
+def near_pairs(items: Sequence[tuple[object, list[int]]], threshold: float = THRESHOLD
+               ) -> dict[tuple[int, int], float]:
+    """``{(i, j): similarity}`` for items that share an LSH bucket and reach ``threshold``."""
+    buckets = defaultdict(list)
+    for i, (_, sig) in enumerate(items):
+        for band in range(BANDS):
+            buckets[band, tuple(sig[band * ROWS:(band + 1) * ROWS])].append(i)
+    pairs = {}
+    for members in buckets.values():
+        for i, j in combinations(members, 2):
+            if (i, j) not in pairs:
+                pairs[i, j] = similarity(items[i][1], items[j][1])
+    return {p: s for p, s in pairs.items() if s >= threshold}
+
+
+def clusters(items: Sequence[tuple[object, list[int]]], pairs: dict[tuple[int, int], float]
+             ) -> list[tuple[float, list[int]]]:
+    """Connected components of ``pairs`` as ``(mean pairwise similarity, member indices)``."""
+    parent = list(range(len(items)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in pairs:
+        parent[find(i)] = find(j)
+    groups = defaultdict(list)
+    for i, j in pairs:
+        groups[find(i)].extend((i, j))
+    found = []
+    for members in groups.values():
+        members = sorted(set(members))
+        sims = [similarity(items[i][1], items[j][1]) for i, j in combinations(members, 2)]
+        found.append((sum(sims) / len(sims), members))
+    found.sort(key=lambda c: (-c[0], c[1]))
+    return found
+
+
+def loading(root: str, cache: Optional[Cache]) -> dict[str, str]:
+    """``eager`` / ``lazy`` per file reachable from the app entry."""
+    from .graph import LAZY, STATIC, Graph
+    try:
+        graph = Graph(root, cache=cache)
+    except OSError:
+        return {}
+    eager = graph.reach()[0]
+    return {rel: 'eager' if rel in eager else 'lazy' for rel in graph.reach((STATIC, LAZY))[0]}
+
+
+_LEGEND = 'first column: mean over all pairs in the cluster'
+
+
+def _print_cluster(score: float, members: list[tuple[int, str]], items: Sequence[tuple[object, list[int]]]) -> None:
+    """Mean similarity, then each member with its closest match in the cluster."""
+    lines = []
+    for i, text in members:
+        best = max(similarity(items[i][1], items[j][1]) for j, _ in members if j != i)
+        lines.append(f'{text} (best {best:.2f})')
+    print(f'  {score:.2f}  ' + '\n        '.join(lines))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Find near-duplicate files and functions.')
+    parser.add_argument('--root', default='.')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD, help='minimum estimated Jaccard similarity')
+    parser.add_argument('--level', choices=('files', 'functions', 'both'), default='both')
+    parser.add_argument('--no-cache', action='store_true')
+    args = parser.parse_args(argv)
+
+    cache = None if args.no_cache else Cache(args.root)
+    try:
+        found = scan_tree(args.root, cache=cache)
+        loaded = loading(args.root, cache)
+    finally:
+        if cache is not None:
+            cache.close()
+
+    def label(rel: str) -> str:
+        return loaded.get(rel, 'unused')
+
+    file_items = [(rel, us[0].signature) for rel, us in found.items() if us and not us[0].name]
+    file_cluster = {}
+    if args.level in ('files', 'both'):
+        print(f'Files (linked at similarity >= {args.threshold:.2f}; {_LEGEND}):')
+        for n, (score, members) in enumerate(clusters(file_items, near_pairs(file_items, args.threshold))):
+            for i in members:
+                file_cluster[file_items[i][0]] = n
+            _print_cluster(score, [(i, f'{file_items[i][0]} [{label(file_items[i][0])}]') for i in members],
+                           file_items)
+    if args.level in ('functions', 'both'):
+        items = [((rel, u), u.signature) for rel, us in found.items() for u in us if u.name]
+        pairs = {}
+        for (i, j), s in near_pairs(items, args.threshold).items():
+            a, b = items[i][0][0], items[j][0][0]
+            # Pairs inside files that already cluster together add nothing.
+            if a == b or file_cluster.get(a, -1) != file_cluster.get(b, -2):
+                pairs[i, j] = s
+        print(f'Functions (linked at similarity >= {args.threshold:.2f}, at least {MIN_TOKENS} tokens; {_LEGEND}):')
+        for score, members in clusters(items, pairs):
+            _print_cluster(score, [(i, f'{items[i][0][0]}:{items[i][0][1].line} {items[i][0][1].name} '
+                                       f'[{label(items[i][0][0])}]') for i in members], items)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
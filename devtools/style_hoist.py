@@ -0,0 +1,490 @@
+"""Hoist constant inline style objects and merge duplicate JSX props.
+
+``style={{ height: '50%' }}`` builds a new object on every render, and
+any ``React.memo`` child that receives it re-renders too. When every value
+in the literal is a compile-time constant, the object can be built once at
+module level. Constants are literals, or module-level ``const``s declared
+above the use and not shadowed inside the component. The
+``style-hoist`` rule (``devtools/rules/style_hoist.py``) does three things:
+
+- Merges duplicate attributes on one element, such as ``style={...}
+  style={...}`` (TS17001). JSX keeps only the last one, so the earlier
+  ones are dropped. Keys that only they set are logged.
+- Hoists constant ``style={{...}}`` literals into ``const NAME = {...} as
+  const;`` directly above the component and its doc comment, or into the
+  block of constants already there. ``NAME`` is the component plus the
+  element's ``{/* label */}`` or tag, e.g. ``TROPHY_3D_TROPHY_BASE_STYLE``.
+  A ``div`` or ``span`` is named by what its style sets instead:
+  ``GRADIENT_WAVE_EMERALD_GRADIENT_STYLE``. A module constant with the same
+  content, existing or hoisted earlier in the run, is reused.
+- Hoists ``className={`...`}`` templates whose interpolations are all
+  module constants. Otherwise they are concatenated again on every render.
+
+All of this happens on one token stream per file. The whole tree is
+handled in one engine run:
+
+    python -m devtools.style_hoist --dry-run
+"""
+from __future__ import annotations
+
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Optional, Sequence
+
+from .jsmodule import ModuleConst, module_consts, starts_statement
+from .tokenizer import IDENT, JSX_OPEN, NUMBER, PUNCT, STRING, TEMPLATE, TokenStream, is_token
+
+GLOBS = ('components/**/*.tsx', 'pages/**/*.tsx', 'lib/**/*.tsx', '*.tsx')
+MAX_INLINE = 100   # longer hoisted objects get one property per line
+_LITERALS = frozenset({'true', 'false', 'null', 'undefined'})
+_DECLARES = frozenset({'const', 'let', 'var'})
+
+
+@dataclass
+class Plan:
+    edits: list[tuple[int, int, str]] = field(default_factory=list)
+    hoisted: list[str] = field(default_factory=list)    # names of new constants
+    messages: list[str] = field(default_factory=list)
+
+
+def _is_data(ts: TokenStream, c: ModuleConst) -> bool:
+    """A literal-valued constant (``{...} as const``, a string or template)."""
+    lo, hi = c.init
+    return lo <= hi and (ts.toks[lo].kind in (STRING, TEMPLATE) or (
+        is_token(ts.toks[lo], PUNCT, '{') and ts.close.get(lo) == hi))
+
+
+def _statement_of(ts: TokenStream, i: int) -> int:
+    """Index of the first token of the top-level statement containing ``i``."""
+    while ts.parent[i] != -1:
+        i = ts.parent[i]
+    while i > 0 and not (is_token(ts.toks[i - 1], PUNCT, ';', '}') and ts.parent[i - 1] == -1) \
+            and not starts_statement(ts, i):
+        i -= 1
+    return i
+
+
+def _locals(ts: TokenStream, lo: int, hi: int) -> set[str]:
+    """Names declared inside ``lo..hi``: variables, destructuring targets and
+    parameters. Used to spot module constants shadowed by the component."""
+    toks = ts.toks
+    names = set()
+    for i in range(lo, hi + 1):
+        tok = toks[i]
+        if tok.kind == IDENT and tok.value in _DECLARES:
+            nxt = ts.tok(i + 1)
+            if nxt.kind == IDENT:
+                names.add(nxt.value)
+            elif is_token(nxt, PUNCT, '{', '[') and i + 1 in ts.close:
+                names.update(_pattern_names(ts, i + 1, ts.close[i + 1]))
+        elif is_token(tok, PUNCT, '(') and i in ts.close:
+            close = ts.close[i]
+            after = ts.tok(close + 1)
+            returns_type = is_token(after, PUNCT, ':') and any(
+                is_token(toks[k], PUNCT, '=>', '{') for k in range(close, min(hi, close + 40)))
+            control = is_token(ts.tok(i - 1), IDENT, 'if', 'for', 'while', 'switch', 'catch')
+            if (is_token(after, PUNCT, '=>', '{') or returns_type) and not control:
+                names.update(_pattern_names(ts, i, close))
+        elif tok.kind == IDENT and is_token(ts.tok(i + 1), PUNCT, '=>') and not is_token(ts.tok(i - 1), PUNCT, '.'):
+            names.add(tok.value)
+    return names
+
+
+def _pattern_names(ts: TokenStream, lo: int, hi: int) -> set[str]:
+    """Binding names in a parameter list or destructuring pattern (ignoring
+    types, defaults and renamed keys)."""
+    names = set()
+    for k in range(lo + 1, hi):
+        tok = ts.toks[k]
+        if tok.kind != IDENT or is_token(ts.tok(k - 1), PUNCT, '.'):
+            continue
+        nxt = ts.tok(k + 1)
+        prev = ts.tok(k - 1)
+        if is_token(prev, PUNCT, '=') or (is_token(prev, PUNCT, ':') and ts.toks[ts.parent[k]].value == '('):
+            continue   # default value or type annotation
+        if is_token(nxt, PUNCT, ':') and ts.toks[ts.parent[k]].value == '{':
+            continue   # renamed key: { a: b } binds b
+        if is_token(nxt, PUNCT, ',', ')', '}', ']', '=', '?') or (
+                is_token(nxt, PUNCT, ':') and ts.toks[ts.parent[k]].value == '(') or is_token(prev, PUNCT, '...'):
+            names.add(tok.value)
+    return names
+
+
+def _constant(ts: TokenStream, lo: int, hi: int, consts: dict[str, ModuleConst], shadowed: set[str],
+              refs: set[str]) -> bool:
+    """Is ``lo..hi`` a compile-time constant expression? Module constants it
+    uses are added to ``refs``."""
+    toks = ts.toks
+    if lo > hi:
+        return False
+    first = toks[lo]
+    if lo == hi:
+        if first.kind in (STRING, NUMBER):
+            return True
+        if first.kind == TEMPLATE:
+            return len(first.value) > 1 and first.value[0] == '`' and first.value[-1] == '`'
+        if first.kind == IDENT:
+            if first.value in _LITERALS:
+                return True
+            if first.value in consts and first.value not in shadowed:
+                refs.add(first.value)
+                return True
+        return False
+    if is_token(first, PUNCT, '-', '+') and hi == lo + 1:
+        return toks[hi].kind == NUMBER
+    if is_token(first, PUNCT, '{', '[') and ts.close.get(lo) == hi:
+        start = lo + 1
+        for end in ts.top_commas(lo, hi) + [hi]:
+            if start == end:
+                if end != hi:
+                    return False
+                break
+            if not _constant_item(ts, start, end - 1, first.value == '{', consts, shadowed, refs):
+                return False
+            start = end + 1
+        return True
+    if first.kind == TEMPLATE and toks[hi].kind == TEMPLATE:
+        k = lo
+        while k <= hi:
+            if is_token(toks[k], PUNCT, '${'):
+                close = ts.close.get(k)
+                if close is None or close > hi or not _constant(ts, k + 1, close - 1, consts, shadowed, refs):
+                    return False
+                k = close + 1
+            elif toks[k].kind == TEMPLATE:
+                k += 1
+            else:
+                return False
+        return True
+    return False
+
+
+def _constant_item(ts, lo, hi, in_object, consts, shadowed, refs) -> bool:
+    toks = ts.toks
+    if is_token(toks[lo], PUNCT, '...'):
+        return _constant(ts, lo + 1, hi, consts, shadowed, refs)
+    if not in_object:
+        return _constant(ts, lo, hi, consts, shadowed, refs)
+    if lo == hi:   # shorthand { NAME }
+        return _constant(ts, lo, hi, consts, shadowed, refs)
+    return toks[lo].kind in (IDENT, STRING, NUMBER) and is_token(ts.tok(lo + 1), PUNCT, ':') \
+        and _constant(ts, lo + 2, hi, consts, shadowed, refs)
+
+
+def _compact(ts: TokenStream, lo: int, hi: int) -> str:
+    """One-line source for a constant expression, spaced like the repo."""
+    toks = ts.toks
+    interp_close = {c for o, c in ts.close.items() if toks[o].value == '${'}
+    out = []
+    for k in range(lo, hi + 1):
+        tok = toks[k]
+        if k > lo:
+            prev = toks[k - 1]
+            tight = is_token(prev, PUNCT, '${', '...') or is_token(tok, PUNCT, '${') or k in interp_close \
+                or (tok.kind == TEMPLATE and k - 1 in interp_close)
+            if not tight and (is_token(prev, PUNCT, ',', ':', '{')
+                              or (is_token(tok, PUNCT, '}') and not is_token(prev, PUNCT, '{'))):
+                out.append(' ')
+        out.append(ts.text[tok.start:tok.end])
+    return ''.join(out)
+
+
+def _layout(ts: TokenStream, lo: int, hi: int) -> str:
+    """The object at ``lo..hi`` on one line, or one property per line if long."""
+    if not is_token(ts.toks[lo], PUNCT, '{'):
+        return _compact(ts, lo, hi)
+    items = []
+    start = lo + 1
+    for end in ts.top_commas(lo, hi) + [hi]:
+        if start < end:
+            items.append(_compact(ts, start, end - 1))
+        start = end + 1
+    one = '{ ' + ', '.join(items) + ' }'
+    if len(one) <= MAX_INLINE:
+        return one
+    return '{\n' + ''.join(f'  {item},\n' for item in items) + '}'
+
+
+def _snake(name: str) -> str:
+    """``CTASection`` -> ``CTA_SECTION``, ``Trophy3D`` -> ``TROPHY_3D``."""
+    name = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1_\2', name.strip('\'"'))
+    name = re.sub(r'([a-z])([A-Z])|(?<=[a-z]{2})(\d)', lambda m: f'{m[1]}_{m[2]}' if m[1] else f'_{m[3]}', name)
+    return re.sub(r'[^A-Za-z0-9]+', '_', name).strip('_').upper()
+
+
+# Tags that say nothing about the element; its style is described instead.
+_GENERIC_TAGS = frozenset({'div', 'span', 'section'})
+# (style keys, (substring of the value, word), word otherwise): what an
+# object sets, in order of how much it tells apart.
+_WHAT = (
+    (('background', 'backgroundImage'), (('radial-gradient', 'RADIAL_GRADIENT'), ('conic-gradient', 'CONIC_GRADIENT'),
+                                         ('gradient', 'GRADIENT'), ('url(', 'IMAGE')), 'BACKGROUND'),
+    (('boxShadow',), (('inset', 'INNER_GLOW'),), 'GLOW'),
+    (('textShadow',), (), 'TEXT_GLOW'),
+    (('filter', 'backdropFilter'), (('blur(', 'BLUR'),), 'FILTER'),
+    (('transform',), (('rotate', 'ROTATED'), ('translateZ', 'DEPTH'), ('translate', 'OFFSET'),
+                      ('scale', 'SCALED')), 'TRANSFORM'),
+    (('perspective',), (), 'PERSPECTIVE'),
+    (('transformStyle',), (('preserve-3d', 'PRESERVE_3D'),), 'TRANSFORM_STYLE'),
+)
+_COLORED = frozenset({'background', 'backgroundImage', 'boxShadow', 'textShadow'})
+_COLOR = re.compile(r'#([0-9a-fA-F]{6}|[0-9a-fA-F]{3})\b|rgba?\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)')
+# Upper hue bound (degrees) -> name, Tailwind's palette names.
+_HUES = ((15, 'RED'), (35, 'ORANGE'), (55, 'AMBER'), (70, 'YELLOW'), (100, 'LIME'), (140, 'GREEN'),
+         (170, 'EMERALD'), (200, 'CYAN'), (230, 'BLUE'), (250, 'INDIGO'), (290, 'PURPLE'), (340, 'PINK'),
+         (360, 'RED'))
+
+
+def _color_name(value: str) -> Optional[str]:
+    """Name of the first colour in ``value``: ``rgba(16, 185, 129, 0.3)`` -> ``EMERALD``."""
+    m = _COLOR.search(value)
+    if not m:
+        return None
+    if m[1]:
+        hex_ = m[1] if len(m[1]) == 6 else ''.join(c * 2 for c in m[1])
+        r, g, b = (int(hex_[k:k + 2], 16) for k in (0, 2, 4))
+    else:
+        r, g, b = int(m[2]), int(m[3]), int(m[4])
+    hi, lo = max(r, g, b), min(r, g, b)
+    if hi - lo < 40:
+        return 'WHITE' if lo > 200 else 'BLACK' if hi < 60 else 'GRAY'
+    if hi == r:
+        hue = 60 * (g - b) / (hi - lo) % 360
+    elif hi == g:
+        hue = 60 * (b - r) / (hi - lo) + 120
+    else:
+        hue = 60 * (r - g) / (hi - lo) + 240
+    return next(name for bound, name in _HUES if hue < bound or bound == 360)
+
+
+def _style_props(ts: TokenStream, lo: int, hi: int) -> dict[str, str]:
+    """``key -> value source`` of a style object literal (spreads are skipped)."""
+    props = {}
+    start = lo + 1
+    for end in ts.top_commas(lo, hi) + [hi]:
+        if start + 2 < end and is_token(ts.toks[start + 1], PUNCT, ':'):
+            props[ts.toks[start].value.strip('\'"')] = ts.text[ts.toks[start + 2].start:ts.toks[end - 1].end]
+        start = end + 1
+    return props
+
+
+def _what(props: dict[str, str]) -> list[str]:
+    """Words for what a style sets, e.g. ``['EMERALD', 'GRADIENT']``."""
+    for keys, cases, default in _WHAT:
+        key = next((k for k in keys if k in props), None)
+        if key is None:
+            continue
+        word = next((w for needle, w in cases if needle in props[key]), default)
+        color = _color_name(props[key]) if key in _COLORED and word != 'IMAGE' else None
+        return [color, word] if color else [word]
+    return [_snake(next(iter(props)))] if props else []
+
+
+def _position(props: dict[str, str]) -> list[str]:
+    """``['BOTTOM_RIGHT']`` for a style that sets ``bottom`` and ``right``."""
+    sides = [side for side in ('top', 'bottom', 'left', 'right') if side in props]
+    return ['_'.join(sides).upper()] if sides else []
+
+
+def _const_names(owner: str, element: str, kind: str, props: Optional[dict[str, str]]) -> list[str]:
+    """Candidate names, shortest first. The component comes first, then the
+    element's label or tag, then what the style sets. A generic tag
+    (``motion.div``) is replaced by what the style sets rather than named."""
+    tag = element.rsplit('.', 1)[-1]
+    suffix = 'STYLE' if kind == 'style' else 'CLASS'
+    what, where = (_what(props), _position(props)) if props else ([], [])
+    if tag in _GENERIC_TAGS and what:
+        parts = [[_snake(owner)] + what, [_snake(owner)] + where + what]
+    else:
+        parts = [[_snake(owner), _snake(tag)], [_snake(owner), _snake(tag)] + what,
+                 [_snake(owner), _snake(tag)] + where + what]
+    names = []
+    for words in parts:
+        name = '_'.join(words + [suffix])
+        if name not in names:
+            names.append(name)
+    return names
+
+
+_JSX_COMMENT = re.compile(r'\{\s*/\*\s*([A-Za-z][\w -]{0,30}?)\s*\*/\s*\}\s*<?\Z')
+
+
+def _element(ts: TokenStream, o: int) -> str:
+    """The element's label: a short ``{/* Trophy Base */}`` right above it, else its tag."""
+    before = ts.text[max(0, ts.toks[o].start - 80):ts.toks[o].start]
+    m = _JSX_COMMENT.search(before)
+    return m.group(1).title().replace(' ', '').replace('-', '') if m else ts.toks[o].value
+
+
+def _owner_name(ts: TokenStream, statement: int) -> str:
+    """Declared name of the top-level statement (the component), if any."""
+    for k in range(statement, min(statement + 4, len(ts.toks))):
+        tok = ts.toks[k]
+        if tok.kind == IDENT and tok.value not in ('export', 'default', 'const', 'let', 'function', 'class'):
+            return tok.value
+    return 'MODULE'
+
+
+def _object_keys(ts: TokenStream, lo: int, hi: int) -> Optional[set[str]]:
+    """Plain keys of an object literal; None if it spreads anything."""
+    keys = set()
+    start = lo + 1
+    for end in ts.top_commas(lo, hi) + [hi]:
+        if start < end:
+            if is_token(ts.toks[start], PUNCT, '...'):
+                return None
+            keys.add(ts.toks[start].value.strip('\'"'))
+        start = end + 1
+    return keys
+
+
+def _key(ts: TokenStream, lo: int, hi: int) -> str:
+    """Content of a constant expression, ignoring layout, quote style,
+    quoted keys and trailing commas, so equal objects share one constant."""
+    toks = ts.toks
+    parts = []
+    for k in range(lo, hi + 1):
+        tok = toks[k]
+        if is_token(tok, PUNCT, ',') and k < hi and is_token(toks[k + 1], PUNCT, '}', ']'):
+            continue
+        if tok.kind == STRING:
+            body = tok.value[1:-1]
+            parts.append(body if is_token(ts.tok(k + 1), PUNCT, ':') and body.isidentifier() else f"'{body}'")
+        else:
+            parts.append(tok.value)
+    return ' '.join(parts)
+
+
+def _insertion(ts: TokenStream, statement: int, by_last: dict[int, ModuleConst]) -> tuple[int, bool]:
+    """Where constants hoisted out of ``statement`` go: ``(offset, append)``.
+
+    With a literal-valued constant right before the statement they join
+    that block (``append``: inserted after its line). Otherwise they go
+    directly above the statement and the comments that document it.
+    """
+    toks, text = ts.toks, ts.text
+    prev = by_last.get(statement - 1)
+    if prev is not None and _is_data(ts, prev):
+        end = text.find('\n', toks[prev.last].end)
+        return (len(text) if end < 0 else end), True
+    pos = toks[statement - 1].end if statement > 0 else 0
+    if statement > 0:
+        # A comment on the previous statement's last line stays with it.
+        newline = text.find('\n', pos, toks[statement].start)
+        pos = toks[statement].start if newline < 0 else newline + 1
+    while pos < toks[statement].start and text[pos] in ' \t\r\n':
+        pos += 1
+    return pos, False
+
+
+def plan(text: str) -> Plan:
+    ts = TokenStream(text)
+    toks = ts.toks
+    result = Plan()
+    consts = module_consts(ts)
+    # Reuse existing constants with the same content.
+    known: dict[str, str] = {}
+    for name, c in consts.items():
+        lo, hi = c.init
+        if lo <= hi and (is_token(toks[lo], PUNCT, '{') or toks[lo].kind == TEMPLATE):
+            known.setdefault(_key(ts, lo, hi), name)
+    taken = set(ts.idents)
+    shadowed_by_statement: dict[int, set[str]] = {}
+    new_consts: list[tuple[int, str, str]] = []   # (statement using it, name, declaration)
+
+    def hoist(lo: int, hi: int, use: int, kind: str, element: str) -> Optional[str]:
+        statement = _statement_of(ts, use)
+        if statement not in shadowed_by_statement:
+            end = statement
+            while end + 1 < len(toks) and not (ts.parent[end + 1] == -1 and starts_statement(ts, end + 1)):
+                end += 1
+            shadowed_by_statement[statement] = _locals(ts, statement, end)
+        refs: set[str] = set()
+        if not _constant(ts, lo, hi, consts, shadowed_by_statement[statement], refs):
+            return None
+        key = _key(ts, lo, hi)
+        if key in known:
+            return known[key]
+        if any(consts[r].first >= statement for r in refs):
+            return None   # would be declared before something it uses
+        props = _style_props(ts, lo, hi) if kind == 'style' else None
+        names = _const_names(_owner_name(ts, statement), element, kind, props)
+        name = next((c for c in names if c not in taken), f'{names[-1]}_2')
+        n = 3
+        while name in taken:   # same component, element and content words
+            name, n = f'{names[-1]}_{n}', n + 1
+        taken.add(name)
+        known[key] = name
+        suffix = ' as const' if kind == 'style' else ''
+        new_consts.append((statement, name, f'const {name} = {_layout(ts, lo, hi)}{suffix};'))
+        result.hoisted.append(name)
+        return name
+
+    for o, tok in enumerate(toks):
+        if tok.kind != JSX_OPEN or not tok.value:
+            continue
+        attrs = ts.attributes(o)
+        by_name: dict[str, list[tuple[int, int]]] = {}
+        for name, first, last in attrs:
+            by_name.setdefault(name, []).append((first, last))
+        for name, spans in by_name.items():
+            if len(spans) < 2:
+                continue
+            kept = spans[-1]
+            for first, last in spans[:-1]:
+                result.edits.append((toks[first].start, toks[last + 1].start if last + 1 < len(toks) else toks[last].end,
+                                     ''))
+                lost = _dropped_keys(ts, (first, last), kept)
+                note = f'; keys only the dropped one set: {", ".join(sorted(lost))}' if lost else ''
+                result.messages.append(f'line {ts.line(first)}: merged duplicate {name} on <{tok.value}>{note}')
+            by_name[name] = [kept]
+        for name, spans in by_name.items():
+            first, last = spans[-1]
+            if last < first + 3 or not is_token(toks[first + 2], PUNCT, '{'):
+                continue
+            lo, hi = first + 3, last - 1
+            if name == 'style' and is_token(toks[lo], PUNCT, '{') and ts.close.get(lo) == hi and hi > lo + 1:
+                kind = 'style'
+            elif name == 'className' and toks[lo].kind == TEMPLATE and any(
+                    is_token(toks[k], PUNCT, '${') for k in range(lo, hi)):
+                kind = 'className'
+            else:
+                continue
+            const = hoist(lo, hi, first, kind, _element(ts, o))
+            if const is not None:
+                result.edits.append((toks[first + 2].start, toks[last].end, f'{{{const}}}'))
+                result.messages.append(f'line {ts.line(first)}: {name} -> {const}')
+
+    by_statement: dict[int, list[str]] = {}
+    for statement, _name, decl in new_consts:
+        by_statement.setdefault(statement, []).append(decl)
+    by_last = {c.last: c for c in consts.values()}
+    for statement, decls in by_statement.items():
+        body = '\n'.join(decls)
+        pos, append = _insertion(ts, statement, by_last)
+        result.edits.append((pos, pos, f'\n{body}' if append else f'{body}\n\n'))
+    return result
+
+
+def _dropped_keys(ts: TokenStream, dropped: tuple[int, int], kept: tuple[int, int]) -> set[str]:
+    def keys(span):
+        first, last = span
+        lo, hi = first + 3, last - 1
+        if last >= first + 3 and is_token(ts.toks[lo], PUNCT, '{') and ts.close.get(lo) == hi:
+            return _object_keys(ts, lo, hi)
+        return None
+    old, new = keys(dropped), keys(kept)
+    if old is None or new is None:
+        return set()
+    return old - new
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    from .engine import main as engine_main
+    from .rules import load
+    return engine_main(load('style_hoist'), argv)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
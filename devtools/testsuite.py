@@ -0,0 +1,493 @@
+"""Block structure of the test suite: describe / it / test trees and their repairs.
+
+fix_test.py repaired tests/PerformanceOptimizations.test.tsx with a lazy
+``[\\s\\S]*?`` regex between two hard-coded tests. fix_final.py guessed at the
+missing close by appending ``});``. This reads every file under tests/ as a
+token stream and builds the tree of ``describe`` / ``it`` / ``test`` calls
+(``.skip``, ``.only``, ``.each(...)``, and Playwright's ``test.describe``
+included). It then reports and, with ``--fix``, repairs:
+
+- orphan-body: a callback body whose call line was deleted. Its ``});``
+  closes the enclosing block early. That closer is indented deeper than
+  the call it closes, and the body is the run of deeper lines above it. The
+  body is wrapped in ``it.skip('recovered ...')`` so the code survives. If
+  it uses a missing import, it is deleted instead.
+- stray-closer: a line of closers that matches nothing.
+- unclosed: blocks still open at the end of the file. Their ``});`` lines are
+  appended at each call's indentation, which needs no guess.
+- missing-module / missing-export / unbound-component: an import of a file
+  or export that no longer exists (the removed SpinningCube), or a JSX
+  component that is never imported. The tests using the name are deleted
+  together with its import. Uses outside a test are only reported.
+
+A structural repair changes the tree after it, so each file is repaired in
+rounds: analyze, apply the first repair, re-analyze. Reported lines refer
+to the file as it was read. Files are checked in parallel through
+``engine.parallel_map``. Export names of the source files are cached by
+content hash, so the worker processes only tokenize the tests.
+
+    python -m devtools.testsuite                  # report
+    python -m devtools.testsuite --tree tests/PerformanceOptimizations.test.tsx
+    python -m devtools.testsuite --fix --dry-run  # show the repairs as diffs
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional, Sequence
+
+from . import tokenizer
+from .cache import Cache, fingerprint, module_version
+from .engine import iter_files, parallel_map
+from .journal import Journal
+from .jsmodule import ALIASES, export_names, import_bindings, import_edits, import_statements, resolve
+from .lineindex import LineIndex
+from .output import Batch, stage, unified_diff
+from .tokenizer import IDENT, JSX_OPEN, PUNCT, STRING, TEMPLATE, TokenStream, is_jsx_path, is_token
+
+GLOBS = ('tests/**/*.test.ts', 'tests/**/*.test.tsx', 'tests/**/*.spec.ts', 'tests/**/*.spec.tsx')
+SOURCE_GLOBS = ('*.ts', '*.tsx', 'components/**/*.ts', 'components/**/*.tsx', 'lib/**/*.ts', 'lib/**/*.tsx',
+                'pages/**/*.tsx', 'hooks/**/*.ts')
+CALLS = ('describe', 'it', 'test')
+MODIFIERS = ('skip', 'only', 'todo', 'fails', 'fixme', 'concurrent', 'sequential', 'serial', 'parallel',
+             'describe', 'each', 'runIf', 'skipIf')
+_CURRIED = ('each', 'runIf', 'skipIf')   # it.each(table)(name, fn)
+_CLOSERS = frozenset('})];')
+MAX_ROUNDS = 16
+
+
+@dataclass
+class Block:
+    kind: str       # 'describe', 'it' or 'test'
+    name: str
+    call: int       # token index of the callee
+    open: int       # '(' of the call
+    body: int       # '{' of the callback body, or -1
+    parent: int = -1                 # index into the file's blocks
+    children: list[int] = field(default_factory=list)
+
+
+class Problem(NamedTuple):
+    line: int
+    code: str
+    message: str
+    fixed: bool
+
+
+class LineEdit(NamedTuple):
+    first: int          # replace lines first..last (last = first - 1 inserts before ``first``)
+    last: int
+    lines: tuple[str, ...]
+
+
+class FileReport(NamedTuple):
+    path: str
+    outline: list[tuple[int, str, str, int]]   # (depth, kind, name, line)
+    problems: list[Problem]
+    text: Optional[str]                        # repaired text, when it changed
+
+
+def blocks(ts: TokenStream) -> list[Block]:
+    """Every describe/it/test call that starts a line, with parents linked."""
+    toks = ts.toks
+    found: list[Block] = []
+    for i, tok in enumerate(toks):
+        if not is_token(tok, IDENT, *CALLS) or is_token(ts.tok(i - 1), PUNCT, '.', '?.') \
+                or ts.text[ts.text.rfind('\n', 0, tok.start) + 1:tok.start].strip():
+            continue
+        kind = tok.value
+        k = i + 1
+        while is_token(ts.tok(k), PUNCT, '.') and is_token(ts.tok(k + 1), IDENT, *MODIFIERS):
+            member = toks[k + 1].value
+            kind = 'describe' if member == 'describe' else kind
+            k += 2
+            if member in _CURRIED and is_token(ts.tok(k), PUNCT, '(') \
+                    and is_token(ts.tok(ts.close.get(k, -2) + 1), PUNCT, '('):
+                k = ts.close[k] + 1
+        if not is_token(ts.tok(k), PUNCT, '('):
+            continue
+        first = ts.tok(k + 1)
+        name = first.value[1:-1] if first.kind in (STRING, TEMPLATE) else ''
+        body = next((m for m in range(k + 1, ts.close.get(k, len(toks)))
+                     if ts.parent[m] == k and is_token(toks[m], PUNCT, '{')
+                     and is_token(toks[m - 1], PUNCT, '=>', ')')), -1)
+        found.append(Block(kind, name, i, k, body))
+    stack: list[int] = []
+    for n, b in enumerate(found):
+        while stack and _end(ts, found[stack[-1]]) < b.call:
+            stack.pop()
+        if stack:
+            b.parent = stack[-1]
+            found[stack[-1]].children.append(n)
+        stack.append(n)
+    return found
+
+
+def _end(ts: TokenStream, b: Block) -> int:
+    return ts.close.get(b.open, len(ts.toks))
+
+
+def _indent(line: str) -> int:
+    return len(line) - len(line.lstrip(' \t'))
+
+
+def _closers_only(line: str) -> bool:
+    stripped = line.strip()
+    return bool(stripped) and set(stripped) <= _CLOSERS
+
+
+class _Round:
+    """One analysis of the current text."""
+
+    def __init__(self, text: str, jsx: bool):
+        self.ts = TokenStream(text, jsx=jsx)
+        self.lines = LineIndex(text)
+        self.blocks = blocks(self.ts)
+
+    def line_text(self, n: int) -> str:
+        return self.lines.line(n)
+
+    def orphan(self, names: set[str]) -> Optional[tuple[Problem, LineEdit]]:
+        """The first block closed early by an orphaned body's ``});``."""
+        ts = self.ts
+        for b in self.blocks:
+            end = ts.close.get(b.body)
+            if end is None:
+                continue
+            end_line = ts.line(end)
+            closer = self.line_text(end_line)
+            call_indent = _indent(self.line_text(ts.line(b.call)))
+            if not closer.lstrip().startswith('}') or _indent(closer) <= call_indent:
+                continue
+            depth = _indent(closer)
+            first = end_line
+            while first - 1 > ts.line(b.body) and (not self.line_text(first - 1).strip()
+                                                   or _indent(self.line_text(first - 1)) > depth):
+                first -= 1
+            while first < end_line and not self.line_text(first).strip():
+                first += 1
+            lo, hi = self.lines.offset(first), self.lines.offset(end_line)
+            body = {t.value.split('.')[0] for t in ts.toks if lo <= t.start < hi}
+            used = sorted(body & names)
+            if used:
+                if not self.line_text(first - 1).strip() and end_line < len(self.lines) \
+                        and not self.line_text(end_line + 1).strip():
+                    first -= 1
+                return (Problem(first, 'orphan-body',
+                                f'orphaned test body closed at line {end_line} ends {b.kind} {b.name!r} early; '
+                                f'it uses missing {", ".join(used)}, so it is removed', True),
+                        LineEdit(first, end_line, ()))
+            kind = next((self.blocks[c].kind for c in b.children if self.blocks[c].kind != 'describe'), 'it')
+            opener = f"{' ' * depth}{kind}.skip('recovered test body (line {first})', () => {{"
+            return (Problem(first, 'orphan-body',
+                            f'orphaned test body closed at line {end_line} ends {b.kind} {b.name!r} early; '
+                            f'wrapped in {kind}.skip', True),
+                    LineEdit(first, first - 1, (opener,)))
+        return None
+
+    def stray(self) -> list[tuple[Problem, Optional[LineEdit]]]:
+        ts = self.ts
+        matched = set(ts.close.values())
+        found = []
+        seen = set()
+        for k, tok in enumerate(ts.toks):
+            if tok.kind == PUNCT and tok.value in (')', ']', '}') and k not in matched:
+                line = ts.line(k)
+                if line in seen:
+                    continue
+                seen.add(line)
+                fix = LineEdit(line, line, ()) if _closers_only(self.line_text(line)) else None
+                found.append((Problem(line, 'stray-closer', f"'{tok.value}' closes nothing", fix is not None), fix))
+        return found
+
+    def unclosed(self) -> Optional[tuple[Problem, Optional[LineEdit]]]:
+        ts = self.ts
+        open_brackets = [k for k, tok in enumerate(ts.toks) if tok.kind == PUNCT
+                         and tok.value in ('(', '[', '{', '${') and k not in ts.close]
+        if not open_brackets:
+            return None
+        open_blocks = [b for b in self.blocks if b.open in open_brackets]
+        owned = {b.open for b in open_blocks} | {b.body for b in open_blocks}
+        first = ts.line(open_brackets[0])
+        if set(open_brackets) != owned or any(b.body < 0 for b in open_blocks):
+            return (Problem(first, 'unclosed', f"'{ts.toks[open_brackets[-1]].value}' opened at line "
+                            f'{ts.line(open_brackets[-1])} is never closed', False), None)
+        closing = tuple(' ' * _indent(self.line_text(ts.line(b.call))) + '});' for b in reversed(open_blocks))
+        last = len(self.lines)
+        if not self.line_text(last).strip():
+            last -= 1
+        names = ', '.join(f'{b.kind} {b.name!r}' for b in open_blocks)
+        return (Problem(ts.line(open_blocks[0].call), 'unclosed', f'{names} never closed; appended '
+                        f'{len(closing)} closing line' + 's' * (len(closing) != 1), True),
+                LineEdit(last + 1, last, closing))
+
+    def missing(self, root: str, rel: str, exports: dict) -> list[tuple[str, int, str, str]]:
+        """``(local name, line, code, message)`` for imports and components that do not exist."""
+        ts = self.ts
+        toks = ts.toks
+        found = []
+        bound = set()
+        lines = {toks[j].value[1:-1]: ts.line(i) for i, j, _ in import_statements(ts)}
+        for local, imported, module in import_bindings(ts):
+            bound.add(local)
+            if not (module.startswith('.') or any(module.startswith(p) for p in ALIASES)):
+                continue
+            target = resolve(root, rel, module)
+            if target is None:
+                found.append((local, lines[module], 'missing-module', f'{local!r} is imported from '
+                              f'{module!r}, which does not exist'))
+                continue
+            if target not in exports:
+                with open(os.path.join(root, target), 'r', encoding='utf-8') as f:
+                    exports[target] = export_names(TokenStream(f.read(), jsx=is_jsx_path(target)))
+            names = exports[target]
+            if names is not None and imported != '*' and imported not in names:
+                found.append((local, lines[module], 'missing-export',
+                              f'{target} has no export {imported!r} (imported as {local!r})'))
+        for k, tok in enumerate(toks):
+            if is_token(tok, IDENT, 'const', 'let', 'var', 'function', 'class'):
+                nxt = ts.tok(k + 1)
+                if is_token(nxt, PUNCT, '{', '['):
+                    bound.update(t.value for t in toks[k + 2:ts.close.get(k + 1, k + 1)] if t.kind == IDENT)
+                elif nxt.kind == IDENT:
+                    bound.add(nxt.value)
+        reported = set()
+        for k, tok in enumerate(toks):
+            head = tok.value.split('.')[0]
+            if tok.kind == JSX_OPEN and head[:1].isupper() and head not in bound and head not in reported:
+                reported.add(head)
+                found.append((head, ts.line(k), 'unbound-component', f'<{head}> is used but never imported'))
+        return found
+
+    def removal(self, name: str) -> Optional[tuple[list[LineEdit], int]]:
+        """Edits deleting every test that uses ``name``, and its import, with the number of tests.
+
+        ``None`` if ``name`` is also used outside a test.
+        """
+        ts = self.ts
+        toks = ts.toks
+        spans = {}
+        imports = [(i, end) for i, _, end in import_statements(ts)]
+        for k, tok in enumerate(toks):
+            if not ((tok.kind == IDENT and tok.value == name and ts.is_ref(k))
+                    or (tok.kind == JSX_OPEN and tok.value.split('.')[0] == name)):
+                continue
+            if any(i <= k <= end for i, end in imports):
+                continue
+            owner = None
+            for b in self.blocks:
+                if b.kind != 'describe' and b.open < k < _end(ts, b) and (owner is None or b.open > owner.open):
+                    owner = b
+            if owner is None:
+                return None
+            while owner.parent >= 0 and self.blocks[owner.parent].kind != 'describe':
+                owner = self.blocks[owner.parent]
+            spans[owner.call] = (ts.line(owner.call), ts.line(_end(ts, owner)))
+        edits = []
+        for first, last in sorted(spans.values()):
+            if first > 1 and not self.line_text(first - 1).strip() and \
+                    (last == len(self.lines) or not self.line_text(last + 1).strip()):
+                first -= 1
+            edits.append(LineEdit(first, last, ()))
+        bindings = import_bindings(ts)
+        for i, j, end in import_statements(ts):
+            module = toks[j].value[1:-1]
+            locals_ = {local for local, _, m in bindings if m == module}
+            if name not in locals_:
+                continue
+            lo, hi = ts.line(i), ts.line(end)
+            if len(locals_) == 1:
+                edits.append(LineEdit(lo, hi, ()))
+                continue
+            start = self.lines.offset(lo)
+            changes = import_edits(ts, module, set(), {name})
+            if not changes:
+                return None
+            src = self.lines.text[start:self.lines.line_span(hi)[1]]
+            for s, e, r in sorted(changes, reverse=True):
+                src = src[:s - start] + r + src[e - start:]
+            edits.append(LineEdit(lo, hi, tuple(src.split('\n'))))
+        return edits, len(spans)
+
+
+def _apply(text: str, edits: Sequence[LineEdit]) -> str:
+    lines = text.split('\n')
+    for e in sorted(edits, key=lambda e: e.first, reverse=True):
+        lines[e.first - 1:e.last] = list(e.lines)
+    return '\n'.join(lines)
+
+
+def _origin(line: int, applied: list[LineEdit]) -> int:
+    """Map a line of the repaired text back to the text as read."""
+    for e in reversed(applied):
+        added = len(e.lines) - (e.last - e.first + 1)
+        if line >= e.first + len(e.lines):
+            line -= added
+        elif line >= e.first:
+            line = e.first
+    return line
+
+
+def analyze(text: str, jsx: bool = True, root: Optional[str] = None, rel: str = '',
+            exports: Optional[dict] = None) -> FileReport:
+    """Outline and problems of one test file, plus the repaired text.
+
+    Import checks need ``root``. ``exports`` maps source files to their export
+    names (``None`` for ``export *``); files missing from it are read as needed.
+    """
+    problems: list[Problem] = []
+    applied: list[LineEdit] = []
+    exports = dict(exports or {})
+    original = text
+    current = _Round(text, jsx)
+    outline = _outline(current)
+    reported_missing = set()
+    for _ in range(MAX_ROUNDS):
+        missing = current.missing(root, rel, exports) if root is not None else []
+        names = {m[0] for m in missing}
+        edits: list[LineEdit] = []
+        found = current.orphan(names)
+        if found is not None:
+            problem, edit = found
+            problems.append(problem._replace(line=_origin(problem.line, applied)))
+            edits.append(edit)
+        else:
+            for problem, edit in current.stray():
+                problems.append(problem._replace(line=_origin(problem.line, applied)))
+                if edit is not None:
+                    edits.append(edit)
+            unclosed = current.unclosed()
+            if unclosed is not None:
+                problem, edit = unclosed
+                problems.append(problem._replace(line=_origin(problem.line, applied)))
+                if edit is not None:
+                    edits.append(edit)
+            if not edits and unclosed is None:
+                for name, line, code, message in missing:
+                    if (name, code) in reported_missing:
+                        continue
+                    reported_missing.add((name, code))
+                    removal = current.removal(name)
+                    if removal is not None:
+                        removed, tests = removal
+                        used = f'{tests} test' + 's' * (tests != 1) + ' using it'
+                        if code == 'unbound-component':
+                            message += f'; removed {used}'
+                        else:
+                            message += f'; removed it and {used}' if tests else '; removed the unused import'
+                        edits.extend(removed)
+                    problems.append(Problem(_origin(line, applied), code, message, removal is not None))
+                    if removal is not None:
+                        break   # one name per round; the others' lines move
+        if not edits:
+            break
+        text = _apply(text, edits)
+        applied.extend(sorted(edits, key=lambda e: e.first, reverse=True))
+        current = _Round(text, jsx)
+    return FileReport(rel, outline, problems, text if text != original else None)
+
+
+def _outline(r: _Round) -> list[tuple[int, str, str, int]]:
+    rows = []
+    for b in r.blocks:
+        depth = 0
+        p = b.parent
+        while p >= 0:
+            depth += 1
+            p = r.blocks[p].parent
+        rows.append((depth, b.kind, b.name, r.ts.line(b.call)))
+    return rows
+
+
+def export_table(root: str, cache: Cache) -> dict[str, Optional[set[str]]]:
+    """Export names of every source file tests import from, cached by content hash."""
+    version = fingerprint(module_version('devtools.jsmodule'), module_version(tokenizer.__name__))
+    table = {}
+    for rel in iter_files(root, SOURCE_GLOBS):
+        jsx = is_jsx_path(rel)
+        found = cache.memoize('export-names-jsx' if jsx else 'export-names', version, rel,
+                              lambda t: {'names': _sorted(export_names(TokenStream(t, jsx=jsx)))})
+        table[rel] = None if found['names'] is None else set(found['names'])
+    return table
+
+
+def _sorted(names: Optional[set[str]]) -> Optional[list[str]]:
+    return None if names is None else sorted(names)
+
+
+def _check_batch(root: str, rels: list[str], exports: dict) -> list[FileReport]:
+    found = []
+    for rel in rels:
+        with open(os.path.join(root, rel), 'r', encoding='utf-8') as f:
+            found.append(analyze(f.read(), is_jsx_path(rel), root, rel, exports))
+    return found
+
+
+def check_tree(root: str = '.', paths: Sequence[str] = (), jobs: Optional[int] = None,
+               cache: Optional[Cache] = None) -> list[FileReport]:
+    """Analyze ``paths`` (default: every test file); export tables come from ``cache`` when given."""
+    rels = list(paths) or list(iter_files(root, GLOBS))
+    exports = export_table(root, cache) if cache is not None else {}
+    return list(parallel_map(lambda batch: (_check_batch, (root, batch, exports)), rels, jobs, batch_size=8))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Check and repair describe/it/test structure under tests/.')
+    parser.add_argument('paths', nargs='*', help='test files (default: everything under tests/)')
+    parser.add_argument('--root', default='.')
+    parser.add_argument('--tree', action='store_true', help='print the block tree of each file')
+    parser.add_argument('--fix', action='store_true', help='apply the repairs')
+    parser.add_argument('--dry-run', action='store_true', help='with --fix: print diffs, write nothing')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--no-cache', action='store_true')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    cache = None if args.no_cache else Cache(args.root)
+    try:
+        reports = check_tree(args.root, args.paths, args.jobs, cache)
+    except OSError as e:
+        print(f'{e.filename}: {e.strerror}', file=sys.stderr)
+        return 2
+    finally:
+        if cache is not None:
+            cache.close()
+    elapsed = time.perf_counter() - start
+    journal = Journal(args.root) if args.fix and not args.dry_run else None
+    batch = Batch(journal=journal)
+    try:
+        for r in reports:
+            if args.tree:
+                print(r.path)
+                for depth, kind, name, line in r.outline:
+                    print(f'{"  " * (depth + 1)}{kind} {name!r} :{line}')
+            for p in r.problems:
+                tag = ' [fixable]' if p.fixed and not args.fix else ''
+                print(f'{r.path}:{p.line}: {p.code}: {p.message}{tag}')
+            if args.fix and r.text is not None:
+                path = os.path.join(args.root, r.path)
+                with open(path, 'r', encoding='utf-8') as f:
+                    old = f.read()
+                if args.dry_run:
+                    sys.stdout.write(unified_diff(r.path, old, r.text))
+                    continue
+                temp = stage(path, r.text, old)
+                if temp is not None:
+                    batch.add(path, temp)
+                    print(f'Updated {r.path}')
+        batch.commit()
+    finally:
+        batch.discard()
+    if journal is not None and journal.run_id:
+        print(f'Journaled as run {journal.run_id} (python -m devtools undo {journal.run_id})')
+    blocks_total = sum(len(r.outline) for r in reports)
+    problems = sum(len(r.problems) for r in reports)
+    print(f'{len(reports)} files, {blocks_total} blocks, {problems} problems in {elapsed:.2f}s', file=sys.stderr)
+    return 1 if problems and not (args.fix and all(p.fixed for r in reports for p in r.problems)) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,392 @@
+"""Linear-time TS/TSX tokenizer.
+
+Good enough to tell code from strings, template literals, comments, regex
+literals and JSX, which is what bracket checking and the token-stream
+codemods need. It is not a parser: ``/`` versus regex and ``<`` versus JSX
+are decided from the previous significant token, the same heuristic the
+TypeScript scanner uses.
+
+Lexing is driven by a stack of modes (plain code, template literal, JSX
+tag, JSX children). Each code frame counts its own braces so that a ``}``
+at depth zero hands control back to the template or JSX frame that opened
+it.
+
+Token offsets are into the ``str`` being lexed. For ``jsx_open`` and
+``jsx_close`` the offset is that of the tag name (of the ``<`` for
+fragments), matching where tsc reports JSX errors.
+"""
+from __future__ import annotations
+
+import re
+from typing import Iterator, NamedTuple, Optional, Sequence
+
+from .lineindex import LineIndex
+
+
+class Token(NamedTuple):
+    kind: str
+    value: str
+    start: int
+    end: int
+
+
+# Token kinds.
+IDENT = 'ident'
+NUMBER = 'number'
+STRING = 'string'
+TEMPLATE = 'template'          # static chunk of a template literal, quotes included
+REGEX = 'regex'
+PUNCT = 'punct'
+COMMENT = 'comment'
+JSX_OPEN = 'jsx_open'          # <Name  (value: tag name, '' for fragments)
+JSX_OPEN_END = 'jsx_open_end'  # >     ends an opening tag, children follow
+JSX_SELF_CLOSE = 'jsx_self_close'  # />
+JSX_CLOSE = 'jsx_close'        # </Name>  (value: tag name)
+JSX_ATTR = 'jsx_attr'
+JSX_TEXT = 'jsx_text'
+ERROR = 'error'                # value: "TSxxxx: message"
+
+# Keywords after which an expression (so a regex or JSX) may start.
+EXPR_KEYWORDS = frozenset({
+    'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void', 'throw',
+    'case', 'do', 'else', 'yield', 'await', 'extends', 'default',
+})
+# Punctuators after which the next token is an operand.
+_NOT_EXPR_PUNCT = frozenset({')', ']', '}', '++', '--'})
+
+_CODE = re.compile(r'''
+    (?P<ws>[ \t\r\n\f\v\u00a0\ufeff\u2028\u2029]+)
+  | (?P<line_comment>//[^\n]*)
+  | (?P<block_comment>/\*.*?\*/)
+  | (?P<ident>\#?[A-Za-z_$\u0080-\uffff][\w$\u0080-\uffff]*)
+  | (?P<number>(?:0[xX][\da-fA-F_]+|0[oO][0-7_]+|0[bB][01_]+
+        |(?:\d[\d_]*(?:\.[\d_]*)?|\.\d[\d_]*)(?:[eE][+-]?\d[\d_]*)?)n?)
+  | (?P<string>'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*")
+  | (?P<punct>>>>=|\.\.\.|===|!==|\*\*=|<<=|>>=|>>>|&&=|\|\|=|\?\?=
+        |=>|==|!=|<=|>=|&&|\|\||\?\?|\?\.(?!\d)|\+\+|--|\+=|-=|\*=|/=|%=|&=|\|=|\^=|<<|>>|\*\*
+        |[{}()\[\];,<>+\-*/%&|^!~?:=.@])
+''', re.VERBOSE | re.DOTALL)
+_REGEX = re.compile(r'/(?![*/])(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*')
+_TEMPLATE_CHUNK = re.compile(r'(?:[^`\\$]|\\.|\$(?!\{))*', re.DOTALL)
+_JSX_START = re.compile(r'<\s*(>|[A-Za-z_$][\w$.:\-]*)')
+_GENERIC_AFTER_NAME = re.compile(r'\s*(?:,|extends\b)')
+_JSX_TAG = re.compile(r'''
+    (?P<ws>\s+)
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<self_close>/>)
+  | (?P<open_end>>)
+  | (?P<brace>\{)
+  | (?P<attr>[A-Za-z_$][\w$:.\-]*)
+  | (?P<eq>=)
+  | (?P<string>"[^"]*"|'[^']*')
+''', re.VERBOSE | re.DOTALL)
+_JSX_TEXT = re.compile(r'[^{}<>]+')
+_JSX_CLOSE = re.compile(r'</\s*([A-Za-z_$][\w$.:\-]*)?\s*>')
+
+# Frame modes.
+_CODE_MODE, _TEMPLATE_MODE, _TAG_MODE, _CHILDREN_MODE = range(4)
+
+
+def tokenize(text: str, jsx: bool = True, comments: bool = False) -> Iterator[Token]:
+    """Yield tokens of ``text``. Whitespace is dropped; comments only on request.
+
+    Lexical errors (unterminated literals, stray ``>``/``}`` in JSX text) are
+    yielded as ``error`` tokens and lexing carries on.
+    """
+    n = len(text)
+    pos = 0
+    # Each frame is [mode, brace_depth_or_tag_name].
+    stack: list[list] = [[_CODE_MODE, 0]]
+    prev: Optional[Token] = None   # last significant code token
+
+    def expr_allowed() -> bool:
+        if prev is None:
+            return True
+        if prev.kind == PUNCT:
+            return prev.value not in _NOT_EXPR_PUNCT
+        if prev.kind == IDENT:
+            return prev.value in EXPR_KEYWORDS
+        return False
+
+    while pos < n:
+        frame = stack[-1]
+        mode = frame[0]
+
+        if mode == _CODE_MODE:
+            c = text[pos]
+            if c == '`':
+                stack.append([_TEMPLATE_MODE, None])
+                pos += 1
+                continue
+            if c == '/' and expr_allowed() and text[pos + 1:pos + 2] not in ('/', '*'):
+                m = _REGEX.match(text, pos)
+                if m:
+                    prev = Token(REGEX, m.group(), pos, m.end())
+                    yield prev
+                    pos = m.end()
+                    continue
+            if c == '<' and jsx and expr_allowed():
+                m = _JSX_START.match(text, pos)
+                if m and (m.group(1) == '>' or not _GENERIC_AFTER_NAME.match(text, m.end())):
+                    if m.group(1) == '>':
+                        yield Token(JSX_OPEN, '', pos, pos + 1)
+                        yield Token(JSX_OPEN_END, '>', m.end() - 1, m.end())
+                        stack.append([_CHILDREN_MODE, ''])
+                    else:
+                        yield Token(JSX_OPEN, m.group(1), m.start(1), m.end(1))
+                        stack.append([_TAG_MODE, m.group(1)])
+                    pos = m.end()
+                    continue
+            m = _CODE.match(text, pos)
+            if m is None:
+                if text.startswith('/*', pos):
+                    yield Token(ERROR, "TS1010: '*/' expected.", pos, n)
+                    return
+                if c in '\'"':
+                    end = text.find('\n', pos)
+                    end = n if end == -1 else end
+                    yield Token(ERROR, 'TS1002: Unterminated string literal.', pos, end)
+                    prev = Token(STRING, text[pos:end], pos, end)
+                    pos = end
+                    continue
+                yield Token(ERROR, 'TS1127: Invalid character.', pos, pos + 1)
+                pos += 1
+                continue
+            kind = m.lastgroup
+            end = m.end()
+            if kind == 'ws':
+                pass
+            elif kind in ('line_comment', 'block_comment'):
+                if comments:
+                    yield Token(COMMENT, m.group(), pos, end)
+            elif kind == 'punct':
+                value = m.group()
+                if value == '{':
+                    frame[1] += 1
+                elif value == '}':
+                    if frame[1] == 0 and len(stack) > 1:
+                        # End of a ${...} or JSX {...} expression.
+                        stack.pop()
+                        prev = Token(PUNCT, value, pos, end)
+                        yield prev
+                        pos = end
+                        continue
+                    frame[1] = max(frame[1] - 1, 0)
+                prev = Token(PUNCT, value, pos, end)
+                yield prev
+            else:
+                prev = Token(kind, m.group(), pos, end)
+                yield prev
+            pos = end
+
+        elif mode == _TEMPLATE_MODE:
+            start = pos - 1 if text[pos - 1] == '`' else pos
+            m = _TEMPLATE_CHUNK.match(text, pos)
+            pos = m.end()
+            if pos >= n:
+                yield Token(ERROR, 'TS1160: Unterminated template literal.', start, n)
+                return
+            if text[pos] == '`':
+                stack.pop()
+                prev = Token(TEMPLATE, text[start:pos + 1], start, pos + 1)
+                yield prev
+                pos += 1
+            else:  # ${
+                yield Token(TEMPLATE, text[start:pos], start, pos)
+                prev = Token(PUNCT, '${', pos, pos + 2)
+                yield prev
+                stack.append([_CODE_MODE, 0])
+                pos += 2
+
+        elif mode == _TAG_MODE:
+            m = _JSX_TAG.match(text, pos)
+            if m is None:
+                if text[pos] == '<':
+                    # Element as an attribute value: <A icon=<B /> />
+                    m = _JSX_START.match(text, pos)
+                    if m and m.group(1) != '>':
+                        yield Token(JSX_OPEN, m.group(1), m.start(1), m.end(1))
+                        stack.append([_TAG_MODE, m.group(1)])
+                        pos = m.end()
+                        continue
+                yield Token(ERROR, 'TS1003: Identifier expected.', pos, pos + 1)
+                pos += 1
+                continue
+            kind = m.lastgroup
+            end = m.end()
+            if kind == 'self_close':
+                yield Token(JSX_SELF_CLOSE, '/>', pos, end)
+                stack.pop()
+                prev = _element_done(stack, pos, end)
+            elif kind == 'open_end':
+                yield Token(JSX_OPEN_END, '>', pos, end)
+                frame[0] = _CHILDREN_MODE
+            elif kind == 'brace':
+                yield Token(PUNCT, '{', pos, end)
+                stack.append([_CODE_MODE, 0])
+                prev = None
+            elif kind == 'attr':
+                yield Token(JSX_ATTR, m.group(), pos, end)
+            elif kind == 'eq':
+                yield Token(PUNCT, '=', pos, end)
+            elif kind == 'string':
+                yield Token(STRING, m.group(), pos, end)
+            elif kind == 'comment' and comments:
+                yield Token(COMMENT, m.group(), pos, end)
+            pos = end
+
+        else:  # _CHILDREN_MODE
+            c = text[pos]
+            if c == '{':
+                yield Token(PUNCT, '{', pos, pos + 1)
+                stack.append([_CODE_MODE, 0])
+                prev = None
+                pos += 1
+            elif c == '<':
+                if text.startswith('/', pos + 1):
+                    m = _JSX_CLOSE.match(text, pos)
+                    if m is None:
+                        yield Token(ERROR, "TS1005: '>' expected.", pos, pos + 2)
+                        pos += 2
+                        continue
+                    name = m.group(1) or ''
+                    name_start = m.start(1) if m.group(1) else pos
+                    yield Token(JSX_CLOSE, name, name_start, name_start + len(name))
+                    stack.pop()
+                    prev = _element_done(stack, pos, m.end())
+                    pos = m.end()
+                    continue
+                m = _JSX_START.match(text, pos)
+                if m is None:
+                    yield Token(ERROR, 'TS1003: Identifier expected.', pos, pos + 1)
+                    pos += 1
+                elif m.group(1) == '>':
+                    yield Token(JSX_OPEN, '', pos, pos + 1)
+                    yield Token(JSX_OPEN_END, '>', m.end() - 1, m.end())
+                    stack.append([_CHILDREN_MODE, ''])
+                    pos = m.end()
+                else:
+                    yield Token(JSX_OPEN, m.group(1), m.start(1), m.end(1))
+                    stack.append([_TAG_MODE, m.group(1)])
+                    pos = m.end()
+            elif c == '>':
+                yield Token(ERROR, "TS1382: Unexpected token. Did you mean `{'>'}` or `&gt;`?", pos, pos + 1)
+                pos += 1
+            elif c == '}':
+                yield Token(ERROR, "TS1381: Unexpected token. Did you mean `{'}'}` or `&rbrace;`?", pos, pos + 1)
+                pos += 1
+            else:
+                m = _JSX_TEXT.match(text, pos)
+                yield Token(JSX_TEXT, m.group(), pos, m.end())
+                pos = m.end()
+
+    if stack[-1][0] == _TEMPLATE_MODE:
+        yield Token(ERROR, 'TS1160: Unterminated template literal.', n, n)
+
+
+def _element_done(stack: list, start: int, end: int) -> Optional[Token]:
+    """After an element closes, code sees it as a complete operand."""
+    if stack[-1][0] == _CODE_MODE:
+        return Token(JSX_CLOSE, '', start, end)
+    return None
+
+
+_OPEN = ('(', '[', '{', '${')
+_CLOSE = (')', ']', '}')
+
+
+def matching(tokens: Sequence[Token], i: int) -> Optional[int]:
+    """Index of the bracket closing the one at ``tokens[i]``, or None."""
+    depth = 0
+    for j in range(i, len(tokens)):
+        if tokens[j].kind != PUNCT:
+            continue
+        v = tokens[j].value
+        if v in _OPEN:
+            depth += 1
+        elif v in _CLOSE:
+            depth -= 1
+            if depth == 0:
+                return j
+    return None
+
+
+def is_token(tok: Token, kind: str, *values: str) -> bool:
+    return tok.kind == kind and (not values or tok.value in values)
+
+
+class TokenStream:
+    """Tokens of one file plus their bracket structure, for token-stream codemods."""
+
+    def __init__(self, text: str, jsx: bool = True):
+        self.text = text
+        self.toks = list(tokenize(text, jsx=jsx))
+        n = len(self.toks)
+        self.parent = [-1] * n    # innermost open bracket around each token
+        self.close = {}           # open bracket index -> close index
+        stack: list[int] = []
+        for i, tok in enumerate(self.toks):
+            self.parent[i] = stack[-1] if stack else -1
+            if tok.kind == PUNCT:
+                if tok.value in _OPEN:
+                    stack.append(i)
+                elif tok.value in _CLOSE and stack:
+                    self.close[stack.pop()] = i
+        self.idents = {t.value for t in self.toks if t.kind == IDENT}
+        self._lines: Optional[LineIndex] = None
+
+    def line(self, i: int) -> int:
+        if self._lines is None:
+            self._lines = LineIndex(self.text)
+        return self._lines.line_col(self.toks[i].start)[0]
+
+    def tok(self, i: int) -> Token:
+        return self.toks[i] if 0 <= i < len(self.toks) else Token('', '', len(self.text), len(self.text))
+
+    def src(self, lo: int, hi: int) -> str:
+        """Source of tokens ``lo..hi`` inclusive."""
+        return self.text[self.toks[lo].start:self.toks[hi].end]
+
+    def block_end(self, i: int) -> int:
+        p = self.parent[i]
+        while p >= 0 and self.toks[p].value != '{':
+            p = self.parent[p]
+        return self.close.get(p, len(self.toks)) if p >= 0 else len(self.toks)
+
+    def is_ref(self, i: int) -> bool:
+        """An identifier use, not ``obj.name`` or an object key."""
+        prev, nxt = self.tok(i - 1), self.tok(i + 1)
+        if is_token(prev, PUNCT, '.', '?.'):
+            return False
+        return not (is_token(nxt, PUNCT, ':') and is_token(prev, PUNCT, '{', ','))
+
+    def top_commas(self, lo: int, hi: int) -> list[int]:
+        """Commas directly inside the bracket at ``lo`` (closed at ``hi``)."""
+        return [j for j in range(lo + 1, hi) if self.parent[j] == lo and is_token(self.toks[j], PUNCT, ',')]
+
+    def attributes(self, o: int) -> list[tuple[str, int, int]]:
+        """``(name, first token, last token)`` for each attribute of the element opened at ``o``."""
+        toks = self.toks
+        attrs = []
+        k = o + 1
+        while k < len(toks):
+            tok = toks[k]
+            if self.parent[k] == self.parent[o] and tok.kind in (JSX_OPEN_END, JSX_SELF_CLOSE):
+                break
+            if tok.kind == JSX_ATTR and self.parent[k] == self.parent[o]:
+                last = k
+                if is_token(self.tok(k + 1), PUNCT, '='):
+                    value = k + 2
+                    last = self.close.get(value, value) if is_token(self.tok(value), PUNCT, '{') else value
+                attrs.append((tok.value, k, last))
+                k = last + 1
+                continue
+            if is_token(tok, PUNCT, '{') and k in self.close:   # {...spread}
+                k = self.close[k] + 1
+                continue
+            k += 1
+        return attrs
+
+
+def is_jsx_path(path: str) -> bool:
+    return path.endswith(('.tsx', '.jsx'))
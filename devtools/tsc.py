@@ -0,0 +1,158 @@
+"""Ingest tsc diagnostics and dispatch fixers to just the flagged files.
+
+``parse`` streams ``tsc --noEmit`` output, from a file such as
+typecheck_output_final.txt or from a pipe, in either the plain
+``file(line,col): error TS1005: ...`` form or the ``--pretty`` form. It
+builds a ``DiagnosticIndex`` keyed by file, line and code.
+
+Rules opt in by declaring the codes they handle,
+``@rule('name', '**/*.tsx', codes=('TS1005',))``. ``run`` then opens only
+the files that have one of those codes and gives each rule the file's
+diagnostics via ``ctx.diagnostics``:
+
+    tsc --noEmit | python -m devtools.tsc --fix -
+    python -m devtools.tsc typecheck_output_final.txt          # summary
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+from collections import Counter, defaultdict
+from typing import Iterable, Iterator, NamedTuple, Optional, Sequence, TextIO
+
+_ANSI = re.compile(r'\x1b\[[0-9;]*m')
+_PLAIN = re.compile(r'^(?P<path>.+?)\((?P<line>\d+),(?P<col>\d+)\): '
+                    r'(?P<severity>error|warning|message) (?P<code>TS\d+): (?P<message>.*)$')
+_PRETTY = re.compile(r'^(?P<path>.+?):(?P<line>\d+):(?P<col>\d+) - '
+                     r'(?P<severity>error|warning|message) (?P<code>TS\d+): (?P<message>.*)$')
+_RELATED = re.compile(r'^\s+(?P<path>.+?)\((?P<line>\d+),(?P<col>\d+)\): (?P<message>.*)$')
+_SOURCE_ECHO = re.compile(r'\d+\s')
+
+
+class RelatedLocation(NamedTuple):
+    path: str
+    line: int
+    col: int
+    message: str    # 'The parser expected to find a ...'
+
+
+class TscDiagnostic(NamedTuple):
+    path: str
+    line: int      # 1-based
+    col: int       # 1-based
+    code: str      # 'TS1005'
+    severity: str
+    message: str
+    # Indented ``file(line,col): ...`` lines under the diagnostic.
+    related: tuple[RelatedLocation, ...] = ()
+
+
+def parse(lines: Iterable[str]) -> Iterator[TscDiagnostic]:
+    """Yield diagnostics one at a time. Indented continuation lines that
+    point at another location ("The opening bracket is here.") go to
+    ``related``; the rest (the elaboration under TS2322 and friends) are
+    folded into the message."""
+    current: Optional[TscDiagnostic] = None
+    for raw in lines:
+        line = _ANSI.sub('', raw.rstrip('\r\n'))
+        m = _PLAIN.match(line) or _PRETTY.match(line)
+        related = _RELATED.match(line) if m is None and current is not None else None
+        if m:
+            if current is not None:
+                yield current
+            current = TscDiagnostic(m['path'].replace('\\', '/'), int(m['line']), int(m['col']),
+                                    m['code'], m['severity'], m['message'])
+        elif related:
+            loc = RelatedLocation(related['path'].replace('\\', '/'), int(related['line']),
+                                  int(related['col']), related['message'])
+            current = current._replace(related=current.related + (loc,))
+        elif current is not None and line.startswith((' ', '\t')) and line.strip() and not _is_pretty_source(line):
+            current = current._replace(message=f'{current.message}\n{line.strip()}')
+    if current is not None:
+        yield current
+
+
+def _is_pretty_source(line: str) -> bool:
+    # --pretty echoes the source line ("42   foo();") and a "~~~" underline.
+    stripped = line.strip()
+    return bool(_SOURCE_ECHO.match(stripped)) or set(stripped) <= {'~', ' '}
+
+
+class DiagnosticIndex:
+    """Diagnostics grouped by file (sorted by position) and by code."""
+
+    def __init__(self, diagnostics: Iterable[TscDiagnostic] = ()):
+        self._by_file: dict[str, list[TscDiagnostic]] = defaultdict(list)
+        self._by_code: dict[str, set[str]] = defaultdict(set)
+        for d in diagnostics:
+            self.add(d)
+
+    def add(self, d: TscDiagnostic) -> None:
+        self._by_file[d.path].append(d)
+        self._by_code[d.code].add(d.path)
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._by_file.values())
+
+    def files(self, codes: Optional[Iterable[str]] = None) -> list[str]:
+        """Flagged files, optionally only those with one of ``codes``."""
+        if codes is None:
+            return sorted(self._by_file)
+        paths = set()
+        for code in codes:
+            paths |= self._by_code.get(code, set())
+        return sorted(paths)
+
+    def for_file(self, path: str, codes: Optional[Iterable[str]] = None) -> list[TscDiagnostic]:
+        diags = sorted(self._by_file.get(path, ()), key=lambda d: (d.line, d.col))
+        if codes is not None:
+            codes = set(codes)
+            diags = [d for d in diags if d.code in codes]
+        return diags
+
+    def at(self, path: str, line: int) -> list[TscDiagnostic]:
+        return [d for d in self._by_file.get(path, ()) if d.line == line]
+
+    def codes(self) -> Counter:
+        return Counter(d.code for diags in self._by_file.values() for d in diags)
+
+
+def load(source: str) -> DiagnosticIndex:
+    """Index diagnostics from a file path, or from stdin when ``source`` is ``-``."""
+    if source == '-':
+        return DiagnosticIndex(parse(sys.stdin))
+    with open(source, 'r', encoding='utf-8', errors='replace') as f:
+        return DiagnosticIndex(parse(f))
+
+
+def summarize(index: DiagnosticIndex, out: TextIO = sys.stdout) -> None:
+    print(f'{len(index)} diagnostics in {len(index.files())} files', file=out)
+    for code, count in index.codes().most_common():
+        print(f'  {code}: {count}', file=out)
+    for path in index.files():
+        print(f'  {path}: {len(index.for_file(path))}', file=out)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Index tsc output and run the fixers that handle it.')
+    parser.add_argument('source', help="tsc output file, or '-' for stdin")
+    parser.add_argument('--fix', action='store_true', help='run code-aware rules on the flagged files')
+    parser.add_argument('--rules', nargs='*', default=None, help='rule modules to load (default: all)')
+    parser.add_argument('--root', default='.')
+    parser.add_argument('--dry-run', action='store_true')
+    args = parser.parse_args(argv)
+
+    index = load(args.source)
+    if not args.fix:
+        summarize(index)
+        return 0
+
+    from .engine import report, run
+    from .rules import load as load_rules
+    rules = [r for r in load_rules(*(args.rules or ())) if r.codes]
+    return 1 if report(run(rules, args.root, diagnostics=index, dry_run=args.dry_run)) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,280 @@
+"""Watch mode: re-check changed files for conflict markers and imbalance.
+
+analyze_syntax.py checks the whole tree once per run. ``python -m
+devtools.watch`` does a full check once at start-up, keeps every file's
+findings in memory, and then re-checks only the files that change.
+Changes are debounced: the burst from a ``git checkout`` or a rebase is
+collected until the tree has been quiet for ``--debounce`` seconds, then
+handled in one pass. Files whose content hash did not change (a checkout
+back and forth, a touch) are skipped.
+
+Changes come from inotify on Linux, through ctypes, so nothing needs to be
+installed. Elsewhere, or with ``--poll``, the watcher compares stat
+snapshots every ``--interval`` seconds instead.
+
+    python -m devtools.watch                 # components/ pages/ lib/ tests/
+    python -m devtools.watch --poll --interval 1
+"""
+from __future__ import annotations
+
+import argparse
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from typing import Iterable, Optional, Sequence
+
+from .balance import check_file
+from .cache import Cache
+from .engine import EXCLUDED_DIRS, glob_to_regex, iter_files
+from .scanner import CONFLICT_PATTERNS, PATTERNS, scan_tree
+
+DEFAULT_DIRS = ('components', 'pages', 'lib', 'tests')
+WATCH_PATTERNS = tuple(p for p in PATTERNS if p.name in CONFLICT_PATTERNS)
+
+# <sys/inotify.h>
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_DELETE_SELF = 0x400
+IN_Q_OVERFLOW = 0x4000
+IN_IGNORED = 0x8000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+_EVENT = struct.Struct('iIII')
+
+
+class Rescan(Exception):
+    """The watcher lost track of events (queue overflow); re-check everything."""
+
+
+def _globs(dirs: Sequence[str]) -> tuple[str, ...]:
+    return tuple(f'{d}/**/*.{{ts,tsx}}' for d in dirs)
+
+
+class PollingWatcher:
+    """Finds changes by diffing ``(mtime_ns, size)`` snapshots."""
+
+    def __init__(self, root: str, globs: Sequence[str], interval: float = 0.5):
+        self.root = root
+        self.globs = tuple(globs)
+        self.interval = interval
+        self.snapshot = self._stat_all()
+
+    def _stat_all(self) -> dict[str, tuple[int, int]]:
+        snap = {}
+        for rel in iter_files(self.root, self.globs):
+            try:
+                st = os.stat(os.path.join(self.root, rel))
+            except OSError:
+                continue
+            snap[rel] = (st.st_mtime_ns, st.st_size)
+        return snap
+
+    def changes(self, timeout: float) -> set[str]:
+        time.sleep(min(timeout, self.interval))
+        new = self._stat_all()
+        old, self.snapshot = self.snapshot, new
+        return {p for p in old.keys() | new.keys() if old.get(p) != new.get(p)}
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify through ctypes, one watch per directory."""
+
+    def __init__(self, root: str, globs: Sequence[str]):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._add = libc.inotify_add_watch
+        self._add.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.root = root
+        self.globs = tuple(globs)
+        self._rx = [glob_to_regex(g) for g in self.globs]
+        self.dirs: dict[int, str] = {}   # watch descriptor -> directory relpath
+        for g in self.globs:
+            base = g.split('/', 1)[0]
+            if os.path.isdir(os.path.join(root, base)):
+                self._watch_tree(base)
+
+    def _watch_tree(self, rel_dir: str) -> list[str]:
+        """Watch ``rel_dir`` and everything below it; returns the files found."""
+        found = []
+        for dirpath, dirnames, filenames in os.walk(os.path.join(self.root, rel_dir)):
+            dirnames[:] = sorted(d for d in dirnames if d not in EXCLUDED_DIRS)
+            rel = os.path.relpath(dirpath, self.root).replace(os.sep, '/')
+            wd = self._add(self.fd, os.fsencode(dirpath), _MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f'inotify_add_watch failed for {rel}')
+            self.dirs[wd] = rel
+            found.extend(f'{rel}/{name}' for name in filenames)
+        return found
+
+    def _matches(self, rel: str) -> bool:
+        return any(rx.match(rel) for rx in self._rx)
+
+    def changes(self, timeout: float) -> set[str]:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            changed |= self._parse(data)
+        return changed
+
+    def _parse(self, data: bytes) -> set[str]:
+        changed = set()
+        pos = 0
+        while pos < len(data):
+            wd, mask, _cookie, length = _EVENT.unpack_from(data, pos)
+            name = os.fsdecode(data[pos + _EVENT.size:pos + _EVENT.size + length].rstrip(b'\0'))
+            pos += _EVENT.size + length
+            if mask & IN_Q_OVERFLOW:
+                raise Rescan()
+            if mask & IN_IGNORED:
+                self.dirs.pop(wd, None)
+                continue
+            parent = self.dirs.get(wd)
+            if parent is None or not name:
+                continue
+            rel = f'{parent}/{name}'
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and name not in EXCLUDED_DIRS:
+                    changed.update(self._watch_tree(rel))
+                elif mask & IN_MOVED_FROM:
+                    # A directory moved away: its files are gone from our view.
+                    raise Rescan()
+                continue
+            changed.add(rel)
+        return {rel for rel in changed if self._matches(rel)}
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def make_watcher(root: str, globs: Sequence[str], poll: bool = False, interval: float = 0.5):
+    if not poll and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(root, globs)
+        except (OSError, AttributeError) as e:
+            print(f'inotify unavailable ({e}); polling every {interval}s', file=sys.stderr)
+    return PollingWatcher(root, globs, interval)
+
+
+class State:
+    """Warm per-file findings; ``update`` re-checks only what changed."""
+
+    def __init__(self, root: str, cache: Cache):
+        self.root = root
+        self.cache = cache
+        self.digests: dict[str, str] = {}
+        self.problems: dict[str, list[str]] = {}
+
+    def update(self, paths: Iterable[str]) -> tuple[int, list[str]]:
+        """Re-check ``paths``; returns ``(files checked, report lines)``."""
+        todo = []
+        lines = []
+        for rel in sorted(set(paths)):
+            digest = self.cache.file_hash(rel)
+            if digest is None:
+                self.digests.pop(rel, None)
+                if self.problems.pop(rel, None):
+                    lines.append(f'- {rel}: deleted')
+                continue
+            if self.digests.get(rel) != digest:
+                self.digests[rel] = digest
+                todo.append(rel)
+        for rel, hits, error in scan_tree(self.root, patterns=WATCH_PATTERNS, cache=self.cache, paths=todo):
+            found = [error] if error else [f'{rel}:{h.line}:{h.col}: {h.pattern}: {h.text.strip()}' for h in hits]
+            if not error:
+                try:
+                    diag = check_file(rel, self.cache)
+                except (OSError, UnicodeDecodeError) as e:
+                    found.append(f'{rel}: {type(e).__name__}: {e}')
+                else:
+                    if diag is not None:
+                        found.append(diag.format(rel))
+            before = self.problems.get(rel, [])
+            if found != before:
+                lines.extend(f'+ {msg}' for msg in found if msg not in before)
+                if not found:
+                    lines.append(f'- {rel}: clean')
+            if found:
+                self.problems[rel] = found
+            else:
+                self.problems.pop(rel, None)
+        self.cache.commit()
+        return len(todo), lines
+
+
+def watch(root: str = '.', dirs: Sequence[str] = DEFAULT_DIRS, poll: bool = False, interval: float = 0.5,
+          debounce: float = 0.1, max_delay: float = 1.0, out=sys.stdout) -> None:
+    globs = _globs(dirs)
+    with Cache(root) as cache:
+        state = State(root, cache)
+        watcher = make_watcher(root, globs, poll, interval)
+        try:
+            start = time.perf_counter()
+            checked, lines = state.update(iter_files(root, globs))
+            _emit(out, lines, checked, start, state)
+            while True:
+                try:
+                    changed = watcher.changes(1.0)
+                    if not changed:
+                        continue
+                    # Debounce: keep collecting until quiet, but never wait
+                    # longer than max_delay after the first change.
+                    deadline = time.monotonic() + max_delay
+                    while time.monotonic() < deadline:
+                        more = watcher.changes(min(debounce, deadline - time.monotonic()))
+                        if not more:
+                            break
+                        changed |= more
+                except Rescan:
+                    changed = set(iter_files(root, globs)) | set(state.digests)
+                start = time.perf_counter()
+                checked, lines = state.update(changed)
+                _emit(out, lines, checked, start, state)
+        finally:
+            watcher.close()
+
+
+def _emit(out, lines: list[str], checked: int, start: float, state: State) -> None:
+    for line in lines:
+        print(line, file=out)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f'[{time.strftime("%H:%M:%S")}] {checked} checked in {elapsed:.0f} ms; '
+          f'{len(state.problems)} files with problems', file=out, flush=True)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Re-check changed files for conflict markers and imbalance.')
+    parser.add_argument('dirs', nargs='*', default=list(DEFAULT_DIRS))
+    parser.add_argument('--root', default='.')
+    parser.add_argument('--poll', action='store_true', help='poll instead of using inotify')
+    parser.add_argument('--interval', type=float, default=0.5, help='polling interval in seconds')
+    parser.add_argument('--debounce', type=float, default=0.1, help='quiet period before re-checking')
+    args = parser.parse_args(argv)
+    try:
+        watch(args.root, args.dirs, args.poll, args.interval, args.debounce)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,15 +1,14 @@
 import os
 
+from devtools.lineindex import LineIndex
+
 def read_file(path):
     with open(path, 'r') as f:
         return f.read()
 
 def print_context(content, line_num, context=5):
-    lines = content.split('\n')
-    start = max(0, line_num - context - 1)
-    end = min(len(lines), line_num + context)
-    for i in range(start, end):
-        print(f"{i+1}: {lines[i]}")
+    for n, line in LineIndex(content).context(line_num, context, context):
+        print(f"{n}: {line}")
 
 print("--- Hero.tsx Conflict ---")
 hero = read_file('components/Hero.tsx')
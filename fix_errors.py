@@ -1,157 +1,8 @@
-import os
-import re
+import sys
 
-def read_file(path):
-    with open(path, 'r') as f:
-        return f.read()
+from devtools.engine import main
+from devtools.rules import load
 
-def write_file(path, content):
-    with open(path, 'w') as f:
-        f.write(content)
-    print(f"Updated {path}")
-
-# 1. Fix i18n.tsx
-i18n_path = 'i18n.tsx'
-if os.path.exists(i18n_path):
-    c = read_file(i18n_path)
-    lines = c.split('\n')
-    # Remove lines 274-285 (0-indexed: 273-284)
-    # Check content to be safe
-    # Line 274 (index 273) starts with 'cta.title'
-    if len(lines) > 280 and "'cta.title'" in lines[273]:
-         # We want to remove the OLD cta and projects, but KEEP contact.help
-         # The block to remove is roughly 273 to 284.
-         # Line 285 is 'contact.help.optional' (index 285? No line 286 in file is index 285)
-         # Let's verify indexes.
-         # sed '270,310p' showed line 274 is 'cta.title'.
-         # So index 273.
-         # Line 286 is 'contact.help.optional'. Index 285.
-         # So we remove 273 up to 284 (inclusive).
-         # lines[273:285] = []
-         del lines[273:285]
-         write_file(i18n_path, '\n'.join(lines))
-    else:
-         print("Skipping i18n.tsx: content mismatch at line 274")
-
-# 2. Fix EnhancedElements.tsx
-ee_path = 'components/EnhancedElements.tsx'
-if os.path.exists(ee_path):
-    c = read_file(ee_path)
-    # Remove duplicate style props. prefer the non-inline one if overlapping?
-    # Pattern: style={{...}}\s+style={...}
-    # We will remove the FIRST style prop if two exist, assuming the second (variable) is the intended one + overrides.
-    # But wait, clipPath inset might be specific.
-    # Turn 17 snippet: style={{ clipPath: 'inset(0 0 50% 0)' }} \n style={CLIP_PATH_TOP}
-    # CLIP_PATH_TOP probably has the same thing.
-    # I'll replace  with nothing if it's followed by .
-
-    new_c = re.sub(r'style=\{\{\s*clipPath:\s*\'inset\([^)]+\)\'\s*\}\}\s*(?=\s*style=\{)', '', c)
-    # Also check generic duplicates
-    # This regex is tricky.
-    # Let's just fix the specific cases found by tsc if the above covers it.
-    # tsc said lines 23, 585, 600, 675.
-    # I'll rely on the specific regex above for the clipPath ones (which seem to be the issue in the snippet).
-    # Line 23 might be different.
-    if new_c != c:
-        write_file(ee_path, new_c)
-    else:
-         print("No changes to EnhancedElements.tsx (regex failed)")
-
-# 3. Fix AccessibilityUtils.tsx
-au_path = 'components/AccessibilityUtils.tsx'
-if os.path.exists(au_path):
-    c = read_file(au_path)
-    c = c.replace('keyof JSX.IntrinsicElements', 'React.ElementType')
-    write_file(au_path, c)
-
-# 4. Fix PerformanceOptimizer.tsx
-po_path = 'components/PerformanceOptimizer.tsx'
-if os.path.exists(po_path):
-    c = read_file(po_path)
-    # Fix update(prevState)
-    c = c.replace('update(prevState)', '(update as Function)(prevState)')
-    # Fix the other error: Argument of type ... not assignable
-    # line 60: setState(prev => { ... return update(prev) ... })
-    # It seems complex. I'll just suppress TS for this file if needed, or cast  as .
-    c = c.replace('(prev: T) =>', '(prev: any) =>') # Hammer approach
-    write_file(po_path, c)
-
-# 5. Fix SimpleTelegramChat.tsx
-stc_path = 'components/SimpleTelegramChat.tsx'
-if os.path.exists(stc_path):
-    c = read_file(stc_path)
-    # Rename second 'name' variable
-    # Pattern: const name = ...
-    # We'll just replace  with  in the second occurrence?
-    # Risky.
-    # Let's verify line numbers. 95 and 118.
-    lines = c.split('\n')
-    if len(lines) > 117 and 'const name =' in lines[117]:
-        lines[117] = lines[117].replace('const name =', 'const contactName =')
-        # We also need to update usage of  in that scope.
-        # But wait,  is used in  call.
-        #  ->
-        # I need to be careful.
-        # I'll read the block in the script and replace in scope? Too hard.
-        # I'll just change line 95 variable name instead?
-        # Line 95:
-        # Line 118:
-        # They seem to be in different blocks (if/else?).
-        #
-        # This implies they are in the SAME block (e.g. function body).
-        # Ah, line 95 is inside ?
-        # No,  implies re-declaration if  exists in outer scope.
-        # If I change line 118 to  and update usage.
-        pass # Manual fix better for this one.
-
-    # I'll overwrite the file with a manual fix logic for the 'name' conflict.
-    # Assuming the structure from cat output:
-    # It has
-    # Inside:
-    #  (Line 95?)
-    # ... return;
-    #  (Line 118?)
-    # This structure implies  is hoisted or they are in same scope.
-    # I'll rename the first one to  and the second one to .
-    # And update references.
-
-    new_content = c.replace('let name = userName.trim();', 'let nameToUse = userName.trim();')
-    new_content = new_content.replace('const name = userName.trim();', 'const finalName = userName.trim();')
-    new_content = new_content.replace('name: name,', 'name: finalName,') # In fetch body
-    # Wait, the first block uses  too.
-    #  ->
-    #  ->
-    new_content = new_content.replace('setUserName(name);', 'setUserName(nameToUse);')
-    new_content = new_content.replace("localStorage.setItem('chat_user_name', name);", "localStorage.setItem('chat_user_name', nameToUse);")
-    # Also  ->
-    new_content = new_content.replace('text: name,', 'text: nameToUse,')
-
-    # Check if I broke the fetch call which uses .
-    #  became  (from previous replace).
-    # But wait,  might match  if I replaced  variable?
-    # No, I replaced the definition line.
-
-    if new_content != c:
-        write_file(stc_path, new_content)
-
-# 6. Fix Tests
-# tests/Navigation.optimization.test.tsx
-for p in ['tests/Navigation.optimization.test.tsx', 'tests/ScrollToTop.optimization.test.tsx', 'tests/SimpleTelegramChat.optimization.test.tsx']:
-    if os.path.exists(p):
-        c = read_file(p)
-        c = c.replace("from './", "from '../components/")
-        write_file(p, c)
-
-# PerformanceOptimizations.test.tsx
-po_test_path = 'tests/PerformanceOptimizations.test.tsx'
-if os.path.exists(po_test_path):
-    c = read_file(po_test_path)
-    lines = c.split('\n')
-    # Remove SpinningCube import
-    lines = [l for l in lines if 'SpinningCube' not in l]
-    # Remove SkipLink import error (maybe just comment it out if unused or fix path)
-    # It says .
-    #  ->
-    c = '\n'.join(lines)
-    c = c.replace('{ SkipLink }', 'SkipLink')
-    write_file(po_test_path, c)
+# Rules live in devtools/rules/errors.py; this script just runs them.
+if __name__ == '__main__':
+    sys.exit(main(load('errors')))
@@ -1,69 +1,7 @@
-import re
+import sys
 
-path = 'tests/PerformanceOptimizations.test.tsx'
-with open(path, 'r') as f:
-    lines = f.readlines()
+from devtools.testsuite import main
 
-new_lines = []
-skip = False
-for line in lines:
-    if 'Cube 00112' in line:
-        continue
-    if '// Проверяем начальный рендер' in line and lines[lines.index(line)+1] and 'Cube 00112' in lines[lines.index(line)+1]:
-         # This detects the start of the garbage block
-         # But wait, I iterate line by line. I can't look ahead easily like this in a loop unless I use index.
-         continue
-
-    new_lines.append(line)
-
-# This removed the content but maybe not the wrapper  or comments?
-# Let's do a more content-aware pass.
-
-content = ''.join(lines)
-# Regex to remove the garbage block
-# The garbage block looks like:
-#    // Проверяем начальный рендер
-#    expect(screen.getByText(/Cube 00112/i)).toBeInTheDocument();
-#
-#    // Перерендерим - должен использовать memoization
-#    expect(screen.getByText(/Cube 00112/i)).toBeInTheDocument();
-#  });
-
-# Note: The  line was already removed.
-# So we are looking for a block of code that is NOT inside an  (conceptually) but physically exists.
-# And it ends with  which is the closing of the  that was removed.
-# BUT  usually ends with .
-# The  removed the  line.
-# So we have orphan code + .
-
-# I will simply remove ANY line that matches
-# AND I will remove the  that follows it?
-# Actually, if I count  and  in the file, I can find the unbalance.
-# Or I can just parse the file structure.
-
-# Let's just remove the specific garbage lines by context.
-# We know  test ends.
-# Then we have the garbage.
-# Then  starts.
-
-# Find index of SkipLink test end.
-# Find index of All components start.
-# Remove everything in between EXCEPT newlines?
-# No, we want to remove the garbage code.
-
-skip_link_end_pattern = r'expect\(screen\.getByText\(/skip\.content/i\)\)\.toBeInTheDocument\(\);\s*\}\);'
-next_test_start_pattern = r'it\(\'All components handle events'
-
-pattern = f'({skip_link_end_pattern})[\s\S]*?({next_test_start_pattern})'
-
-def replace_func(match):
-    return match.group(1) + "\n\n  " + match.group(2)
-
-new_content = re.sub(pattern, replace_func, content)
-
-# Also remove the  check in the later test
-new_content = new_content.replace("expect(screen.getByText(/Cube 00112/i)).toBeInTheDocument();", "")
-
-with open(path, 'w') as f:
-    f.write(new_content)
-print("Fixed PerformanceOptimizations.test.tsx")
+# The structural repair lives in devtools/testsuite.py; this script just runs it.
+if __name__ == '__main__':
+    sys.exit(main(['--fix', 'tests/PerformanceOptimizations.test.tsx']))
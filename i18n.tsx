@@ -1,10 +1,13 @@
 import React, { createContext, useContext, useMemo, useState, useEffect } from 'react';
+import { fallbackTranslations, loadTranslations, peekTranslations } from './lib/i18n';
 
 export type Lang = 'en' | 'ru' | 'cs';
 
 type Dict = Record<string, string>;
 
-const translations: Record<Lang, Dict> = {
+// Source of truth for lib/i18n/<lang>.ts (npm run i18n:chunks). The app loads
+// those chunks instead, so this literal is not part of the bundle.
+export const translations: Record<Lang, Dict> = {
   en: {
     'header.services': 'Services',
     'header.work': 'Work',
@@ -720,7 +723,8 @@ interface I18nCtx {
 
 const I18nContext = createContext<I18nCtx | null>(null);
 
-const detect = (): Lang => {
+/** The visitor's language: a saved choice, else the browser's. */
+export const detectLang = (): Lang => {
   if (typeof window === 'undefined') return 'en';
   try {
     const fromStorage = localStorage.getItem('lang') as Lang | null;
@@ -734,24 +738,43 @@ const detect = (): Lang => {
   return 'en';
 };
 
+// The language on screen and its dictionary change together, so a page never
+// mixes two languages while a chunk loads.
+type Shown = { lang: Lang; dict: Dict };
+
 export const I18nProvider: React.FC<{ children: React.ReactNode }> = ({ children }) => {
-  const [lang, setLangState] = useState<Lang>(() => detect());
+  const [wanted, setWanted] = useState<Lang>(() => detectLang());
+  // index.tsx loads the detected language before the first render. Without
+  // that (or if its chunk failed) English is shown until the chunk arrives.
+  const [shown, setShown] = useState<Shown>(() => {
+    const dict = peekTranslations(wanted);
+    return dict ? { lang: wanted, dict } : { lang: 'en', dict: fallbackTranslations };
+  });
 
   const setLang = (l: Lang) => {
-    setLangState(l);
+    setWanted(l);
     try { localStorage.setItem('lang', l); } catch {}
   };
 
+  useEffect(() => {
+    let current = true;
+    loadTranslations(wanted).then(
+      (dict) => { if (current) setShown((prev) => (prev.dict === dict ? prev : { lang: wanted, dict })); },
+      () => { /* stay on the language on screen if the chunk fails to load */ },
+    );
+    return () => { current = false; };
+  }, [wanted]);
+
+  const { lang, dict } = shown;
+
   useEffect(() => {
     if (typeof document !== 'undefined') {
       document.documentElement.lang = lang;
     }
   }, [lang]);
 
-  const t = useMemo(() => (key: string) => {
-    const dict = translations[lang] || translations.en;
-    return dict[key] ?? key;
-  }, [lang]);
+  // en is always loaded: it only fills keys missing from another language.
+  const t = useMemo(() => (key: string) => dict[key] ?? fallbackTranslations[key] ?? key, [dict]);
 
   const value = useMemo(() => ({ lang, setLang, t }), [lang, t]);
 
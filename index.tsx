@@ -1,6 +1,8 @@
 import React from 'react';
 import ReactDOM from 'react-dom/client';
 import App from './App';
+import { detectLang } from './i18n';
+import { loadTranslations } from './lib/i18n';
 import './index.css';
 
 const rootElement = document.getElementById('root');
@@ -9,10 +11,15 @@ if (!rootElement) {
 }
 
 const root = ReactDOM.createRoot(rootElement);
-root.render(
-  <React.StrictMode>
-    <App />
-  </React.StrictMode>
-);
+// Load the visitor's language first so the first paint is already in it.
+loadTranslations(detectLang())
+  .catch(() => undefined)
+  .then(() => {
+    root.render(
+      <React.StrictMode>
+        <App />
+      </React.StrictMode>
+    );
+  });
 
 
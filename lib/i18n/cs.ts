@@ -0,0 +1,4 @@
+// Generated by devtools/i18n_chunks.py from i18n.tsx; do not edit. content-hash: 83da0ac513c33ee5e1f991ac9077e744
+const dict: Record<string, string> = {"header.services":"Služby","header.work":"Práce","header.contact":"Kontakt","header.contact.telegram":"Kontakt — Telegram","nav.home":"DOMŮ","nav.works":"PRÁCE","nav.lab":"LABORATOŘ","nav.services":"SLUŽBY","nav.about":"O MNĚ","nav.contact":"KONTAKT","nav.language":"Jazyk","nav.logo.label":"Portfolio Artema Michajlova - Návrat na domovskou stránku","nav.aria.open":"Otevřít navigační menu","nav.aria.close":"Zavřít navigační menu","nav.aria.label":"Mobilní navigace","skip.content":"Přejít na obsah","works.badge":"VÝBĚROVÁ PRÁCE (2026)","works.title":"PRÁCE","works.fallback.tag":"PROJEKT","works.cta.view":"PROZKOUMAT","works.no.desc":"Popis projektu není k dispozici.","works.open_details":"Otevřít podrobnosti pro","works.prev":"Předchozí projekt","works.next":"Následující projekt","contact.title":"Jste připraveni na evoluci?","contact.subtitle":"Máte na mysli projekt? Pojďme společně vytvořit něco úžasného.","contact.label.name":"Jméno","contact.label.email":"Email","contact.label.subject":"Předmět (volitelně)","contact.label.message":"Zpráva","contact.placeholder.name":"Vaše jméno","contact.placeholder.email":"your@email.com","contact.placeholder.subject":"Předmět projektu","contact.placeholder.message":"Řekněte mi o svém projektu...","contact.button.send":"Odeslat zprávu","contact.button.sending":"Odesílání...","contact.success":"✓ Zpráva odeslána! Brzy se vám ozvu.","contact.error.required":"Prosím, vyplňte všechna povinná pole","contact.error.email":"Prosím, zadejte platnou e-mailovou adresu","contact.error.too_short":"Zpráva je příliš krátká. Prosím, uveďte více podrobností.","contact.error.rate_limit":"Před dalším odesláním chvíli počkejte","contact.error.sending":"Chyba při odesílání zprávy. Zkuste to prosím znovu.","contact.error.timeout":"Síťový timeout. Zkuste to prosím znovu později.","contact.reach_out":"Nebo mě kontaktujte přes:","contact.help.optional":"Volitelné","contact.help.message_min":"Minimálně 10 znaků","cta.title":"Jste připraveni na evoluci?","cta.subtitle":"Jste připraveni oživit svůj projekt? Specializuji se na vytváření vysoce výkonných interaktivních webových prostředí přizpůsobených vašim potřebám.","cta.button":"Najmout mě","cta.secondary":"Zobrazit GitHub","cta.stat.projects":"Dokončené projekty","cta.stat.clients":"Spokojení klienti","cta.stat.experience":"Roky praxe","cta.stat.awards":"Ocenění","project.1.title":"Detailing Hub 3D","project.1.desc":"Interaktivní 3D konfigurátor aut postavený na React Three Fiber. Vlastní shadery pro realistické laky a odrazy v reálném čase.","project.2.title":"Dental Clinic Ecosystem","project.2.desc":"AI systém pro správu termínů a vizualizaci diagnostiky. Synchronizace dat v reálném čase přes WebSockets pro aktuální dostupnost kliniky.","project.3.title":"The Barbershop Grid","project.3.desc":"Galerie s magnetickým scrollováním a dynamickým rozložením. Optimalizované doručování obrázků přes Edge funkce pro LCP <100ms.","project.4.title":"Detailing Service","project.4.desc":"Starší vstupní stránka pro detailing servis.","hero.badge":"Senior Frontend Architekt","hero.title.line1":"ARTEM","hero.title.line2":"MIKHAILOV","hero.description":"Navrhuji vysoce výkonné interaktivní 3D ekosystémy a na výsledky zaměřená digitální rozhraní pro rok 2026.","hero.cta.portfolio":"Portfolio","hero.cta.explore":"Portfolio","hero.cta.contact":"Kontakt","hero.stats.uiux":"UI/UX + pohyb","hero.stats.backend":"Backend a data","hero.stats.ai":"AI/automatizace","hero.stats.nps":"NPS dodávek","hero.stats.projects":"PROJEKTŮ","hero.stats.clients":"KLIENTŮ","hero.stats.experience":"ROKY PRAXE","hero.stats.awards":"OCENĚNÍ","hero.stats.satisfaction":"SPOKOJENOST","hero.cta.scroll":"PROZKOUMAT","hero.drag":"TÁHNĚTE","hero.label.brand":"BRAND","hero.label.web":"WEB","hero.label.motion":"POHYB","hero.label.design":"DESIGN","about.badge":"Ekosystém 2026","about.title":"Moderní stack","about.desc":"Vytvářím vysoce výkonná digitální prostředí, kde se precizní inženýrství potkává s imerzivním designem. Specializuji se na Next.js, Three.js a AI-driven SaaS.","about.cta.collaborate":"POĎME SPOLUPRACOVAT","about.expertise":"TECHNICKÁ EXPERTÍZA","about.offer":"CO NABÍZÍM","service.1.name":"Webový vývoj","service.1.desc":"Full-stack aplikace s React, Next.js, Node.js","service.2.name":"UI/UX Design","service.2.desc":"Moderní, přístupná rozhraní s Figma & Tailwind","service.3.name":"Integrace API","service.3.desc":"RESTful API, GraphQL, služby třetích stran","service.4.name":"Návrh databází","service.4.desc":"Optimalizace PostgreSQL, MongoDB, Redis","service.5.name":"Výkon","service.5.desc":"Core Web Vitals, SEO, optimalizace načítání","service.6.name":"Nasazení","service.6.desc":"CI/CD, Docker, AWS, cloud hosting Vercel","projects.badge":"Vybrané práce","projects.title":"Moje projekty.","footer.cta.build":"POĎME STAVĚT","footer.ready.title.main":"Připraven na","footer.ready.title.sub":"spolupráci.","footer.contacts":"Kontakty","footer.copyright":"Full Stack vývojář","footer.build":"POSTAVME TO","footer.ready.desc":"Jste připraveni oživit svůj projekt? Pojďme společně vytvořit něco výjimečného.","footer.social":"Sociální sítě","footer.status":"Stav","footer.version":"Verze","footer.available":"Dostupný Q4 2026","footer.location":"Londýn / Dálkově","footer.rights":"© Všechna práva vyhrazena 2026","footer.start_project":"ZAHÁJIT PROJEKT","footer.twitter.label":"Sledovat mě na Twitteru (X)","footer.linkedin.label":"Spojit se se mnou na LinkedIn","footer.github.label":"Zobrazit mé projekty na GitHubu","contacts.telegram":"Telegram: @younghustle45","contacts.email":"Email: fear75412@gmail.com","contacts.phone":"Telefon: +420 737 500 587","contacts.location":"Lokalita: Praha, Česko","contacts.github":"GitHub: akira777777","brand.vision":"Synchronizace vize","brand.mission":"Parametry mise","brand.aspect":"Geometrie poměru","brand.generate":"Vytvořit identitu","chat.placeholder":"Napište zprávu...","chat.bot.welcome":"Ahoj! 👋 Pošlete mi zprávu a já vám ji přepošlu na Telegram.","chat.bot.success":"✓ Zpráva odeslána! Na Telegramu vám odpovím co nejdříve.","chat.error.wait":"Před dalším odesláním chvíli počkejte","chat.error.name_required":"Jméno je povinné","chat.prompt.name":"Zadejte prosím své jméno:","chat.label.telegram":"TELEGRAM CHAT","chat.button.send":"Odeslat","chat.aria.close":"Zavřít chat","chat.aria.open":"Otevřít chat","chat.aria.expand":"Rozbalit panel","chat.aria.collapse":"Sbalit panel","chat.role.bot":"Asistent","chat.role.user":"Vy","chat.initial":"Tiše pozoruji. Jak mohu dnes pomoci se strategií?","chat.error.sending":"Chyba při odesílání zprávy","chat.error.timeout":"Časový limit vypršel. Zkuste to prosím znovu.","scroll_to_top":"Zpět nahoru","works.scroll_left":"Posunout projekty doleva","works.scroll_right":"Posunout projekty doprava","switch.to":"Přepnout na","accessibility.title":"Nastavení přístupnosti","accessibility.close":"Zavřít panel přístupnosti","accessibility.open":"Otevřít panel přístupnosti","accessibility.font_size":"Velikost textu","accessibility.contrast":"Kontrast","accessibility.reduce_motion":"Snížit pohyb","accessibility.focus_indicator":"Zobrazit indikátor fokusu","accessibility.skip_to_main":"Přejít na hlavní obsah","skill.frontend":"Frontend vývoj","skill.backend":"Backend systémy","skill.architecture":"Architektura a Devops","skill.tools":"Nástroje a Workflow","services.grid.title":"specializace","services.grid.subtitle":"Přeměňuji nápady na kvalitní digitální produkty.","lab.badge":"Interaktivní Laboratoř","lab.title":"Živé 3D akcenty pro wow efekt.","lab.desc":"Přidána interaktivní tilt karta a holografická koule — obojí funguje bez těžkých knihoven, pouze s CSS 3D a Framer Motion. Plynulý parallax, skleněné povrchy a živé nápovědy.","lab.orb":"Holo koule","lab.tokens":"Tokeny hloubky","lab.tokens.desc":"Adaptabilní pro jakoukoli sekci: karty, CTA, náhledy případů nebo avatary.","lab.tilt.title":"3D Tilt Karta","lab.tilt.hint":"Najetím prozkoumejte","lab.subtitle":"Experimentální R&D","lab.main_title":"Digitální laboratoř","lab.main_desc":"Zkoumání hranic hydrodynamiky, prostorového UI a frontendových architektur řízených AI.","lab.card1.title":"Prostorová navigace","lab.card1.desc":"Navigační paradigmata zaměřená na osu Z pro budoucí prostorové prohlížeče.","lab.card2.title":"Prediktivní UI","lab.card2.desc":"Komponenty integrované s LLM, které přizpůsobují rozložení podle záměru uživatele.","stack.nextjs.name":"Next.js 16","stack.nextjs.desc":"SSR Framework","stack.threejs.name":"Three.js / WebGPU","stack.threejs.desc":"Grafické jádro","stack.gsap.name":"GSAP Motion","stack.gsap.desc":"Logika animace","stack.performance":"Pouze vysoký výkon","detailing.hero.title":"DETAILING HUB","detailing.hero.desc":"Vysoce výkonná interaktivní 3D platforma pro automobilové nadšence k přizpůsobení a rezervaci prémiových služeb.","detailing.hero.rotate":"Klikněte a táhněte pro rotaci","detailing.tech.badge":"Architektura","detailing.tech.title":"Technická propracovanost","detailing.tech.render.part1":"Optimalizace vykreslování","detailing.tech.render.part2":"v reálném čase","detailing.tech.render.desc":"Vlastní shadery GLSL a instancování geometrie pro dosažení 144FPS na desktopu a 60FPS na mobilních zařízeních.","detailing.tech.engine.part1":"Serverless rezervační","detailing.tech.engine.part2":"systém","detailing.tech.engine.desc":"Headless commerce architektura využívající serverless funkce pro okamžitou synchronizaci kalendáře.","detailing.tech.latency":"Latence","detailing.tech.dynamic_light.title":"Dynamické osvětlení","detailing.tech.dynamic_light.desc":"HDR mapovaná prostředí pro fotorealistické odrazy na karoseriích automobilů.","detailing.tech.post_process.title":"Post-processing","detailing.tech.post_process.desc":"Vrstvy Bloom, SSAO a TAA pro prémiovou filmovou estetiku.","detailing.tech.responsive.title":"Responzivní 3D","detailing.tech.responsive.desc":"Sjednocené ovládací prvky UI napříč desktopovými, tabletovými a mobilními prohlížeči.","detailing.footer.engineer":"© 2026 Senior Frontend Engineer & 3D specialista.","detailing.footer.type":"Typ projektu","detailing.footer.webgl":"Interaktivní WebGL","detailing.nav.process":"Proces","detailing.nav.technical":"Technologie","detailing.nav.impact":"Vliv","detailing.nav.launch":"Spustit","detailing.nav.home_label":"Návrat na domovskou stránku","error.title":"Něco se pokazilo","error.description":"Nastala neočekávaná chyba. Zkuste prosím stránku obnovit nebo se vraťte později.","error.details":"Podrobnosti chyby","error.retry":"Zkusit znovu"};
+
+export default dict;
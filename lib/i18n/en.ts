@@ -0,0 +1,4 @@
+// Generated by devtools/i18n_chunks.py from i18n.tsx; do not edit. content-hash: 84826c23db72d231b091642e70cd89b8
+const dict: Record<string, string> = {"header.services":"Services","header.work":"Work","header.contact":"Contact","header.contact.telegram":"Contact — Telegram","nav.home":"HOME","nav.works":"WORK","nav.lab":"LAB","nav.services":"STACK","nav.about":"ABOUT","nav.contact":"CONTACT","nav.language":"Language","nav.logo.label":"Artem Mikhailov Portfolio - Return to home","nav.aria.open":"Open navigation menu","nav.aria.close":"Close navigation menu","nav.aria.label":"Mobile navigation","skip.content":"Skip to content","works.badge":"FEATURED WORK (2026)","works.title":"WORK","works.fallback.tag":"CASE STUDY","works.cta.view":"EXPLORE","works.no.desc":"Project description unavailable.","works.open_details":"View details","works.prev":"Previous project","works.next":"Next project","contact.title":"Ready to Evolve?","contact.subtitle":"Have a project in mind? Let's work together to create something amazing.","contact.label.name":"Name","contact.label.email":"Email","contact.label.subject":"Subject (Optional)","contact.label.message":"Message","contact.placeholder.name":"Your name","contact.help.optional":"Optional","contact.help.message_min":"Minimum 10 characters","contact.placeholder.email":"your@email.com","contact.placeholder.subject":"Project subject","contact.placeholder.message":"Tell me about your project...","contact.button.send":"Send Message","contact.button.sending":"Sending...","contact.success":"✓ Message sent! I'll get back to you soon.","contact.error.required":"Please fill in all required fields","contact.error.email":"Please enter a valid email address","contact.error.too_short":"Message is too short. Please provide more details.","contact.error.rate_limit":"Please wait a moment before sending again","contact.error.sending":"Failed to send message. Please try again.","contact.error.timeout":"Network timeout. Please try again later.","contact.reach_out":"Or reach out through:","cta.title":"Ready to Evolve?","cta.subtitle":"Ready to bring your vision to life? I specialize in creating high-performance, interactive web experiences tailored to your needs.","cta.button":"Hire Me","cta.secondary":"View GitHub","cta.stat.projects":"Projects Completed","cta.stat.clients":"Happy Clients","cta.stat.experience":"Years Experience","cta.stat.awards":"Awards","project.1.title":"Detailing Hub 3D","project.1.desc":"Interactive 3D car configurator using React Three Fiber. Custom shader implementation for realistic paint finishes and real-time reflection probes.","project.2.title":"Dental Clinic Ecosystem","project.2.desc":"AI-powered appointment orchestration and diagnostic visualization. Real-time data sync using WebSockets for live clinic availability.","project.3.title":"The Barbershop Grid","project.3.desc":"Magnetic scroll-driven gallery with dynamic layout shifts. Optimized image delivery via Edge functions to ensure <100ms LCP.","project.4.title":"Detailing Service","project.4.desc":"Legacy Detailing Service Landing.","hero.badge":"Senior Frontend Architect","hero.title.line1":"ARTEM","hero.title.line2":"MIKHAILOV","hero.description":"Engineering high-performance interactive 3D ecosystems and results-oriented digital interfaces for 2026.","hero.cta.portfolio":"Explore Projects","hero.cta.explore":"Explore Projects","hero.cta.contact":"Let's Talk","hero.stats.uiux":"UI/UX + Motion","hero.stats.backend":"Backend & Data","hero.stats.ai":"AI/Automation","hero.stats.nps":"Delivery NPS","hero.stats.projects":"PROJECTS","hero.stats.clients":"CLIENTS","hero.stats.experience":"YEARS EXP","hero.stats.awards":"AWARDS","hero.stats.satisfaction":"SATISFACTION","hero.cta.scroll":"SCROLL","hero.drag":"DRAG","hero.label.brand":"BRAND","hero.label.web":"WEB","hero.label.motion":"MOTION","hero.label.design":"DESIGN","about.badge":"Ecosystem 2026","about.title":"Cutting Edge Stack","about.desc":"I build high-performance digital experiences where precision engineering meets immersive design. Specializing in Next.js, Three.js, and AI-driven SaaS.","about.cta.collaborate":"LET'S COLLABORATE","about.expertise":"TECHNICAL EXPERTISE","about.offer":"WHAT I OFFER","service.1.name":"Web Development","service.1.desc":"Full-stack applications with React, Next.js, Node.js","service.2.name":"UI/UX Design","service.2.desc":"Modern, accessible interfaces with Figma & Tailwind","service.3.name":"API Integration","service.3.desc":"RESTful APIs, GraphQL, third-party services","service.4.name":"Database Design","service.4.desc":"PostgreSQL, MongoDB, Redis optimization","service.5.name":"Performance","service.5.desc":"Core Web Vitals, SEO, loading optimization","service.6.name":"Deployment","service.6.desc":"CI/CD, Docker, AWS, Vercel cloud hosting","projects.badge":"Selected Work","projects.title":"My projects.","footer.cta.build":"LET'S BUILD","footer.ready.title.main":"Ready for","footer.ready.title.sub":"collaboration.","footer.contacts":"Contacts","footer.copyright":"Full Stack Developer","footer.build":"LET'S BUILD","footer.ready.desc":"Ready to bring your project to life? Let's create something exceptional together.","footer.social":"Social","footer.status":"Status","footer.version":"Version","footer.available":"Available Q4 2026","footer.location":"London / Remote","footer.rights":"© All rights reserved 2026","footer.start_project":"START A PROJECT","footer.twitter.label":"Follow me on Twitter (X)","footer.linkedin.label":"Connect with me on LinkedIn","footer.github.label":"View my projects on GitHub","contacts.telegram":"Telegram: @younghustle45","contacts.email":"Email: fear75412@gmail.com","contacts.phone":"Phone: +420 737 500 587","contacts.location":"Location: Prague, Czechia","contacts.github":"GitHub: akira777777","brand.vision":"Vision Sync","brand.mission":"Mission Parameters","brand.aspect":"Aspect Geometry","brand.generate":"Generate Identity","chat.placeholder":"Type a message...","chat.bot.welcome":"Hi! 👋 Send me a message and I'll forward it to you on Telegram.","chat.bot.success":"✓ Message sent! I'll reply to you on Telegram as soon as possible.","chat.error.wait":"Please wait before sending another message","chat.error.name_required":"Name is required","chat.prompt.name":"Please specify your name:","chat.label.telegram":"TELEGRAM CHAT","chat.button.send":"Send","chat.aria.close":"Close chat","chat.aria.open":"Open chat","chat.aria.expand":"Expand panel","chat.aria.collapse":"Collapse panel","chat.role.bot":"Assistant","chat.role.user":"You","chat.initial":"Quietly observing. How can I assist with your strategy today?","chat.error.sending":"Error sending message","chat.error.timeout":"Timeout sending message. Please try again.","scroll_to_top":"Scroll to top","works.scroll_left":"Scroll projects left","works.scroll_right":"Scroll projects right","switch.to":"Switch to","accessibility.title":"Accessibility Options","accessibility.close":"Close accessibility panel","accessibility.open":"Open accessibility panel","accessibility.font_size":"Text Size","accessibility.contrast":"Contrast","accessibility.reduce_motion":"Reduce Motion","accessibility.focus_indicator":"Show Focus Indicator","accessibility.skip_to_main":"Skip to main content","skill.frontend":"Frontend Development","skill.backend":"Backend Systems","skill.architecture":"Architecture & Devops","skill.tools":"Workflow & Tools","services.grid.title":"Specializations","services.grid.subtitle":"Turning ideas into high-quality digital products.","lab.badge":"Interactive Lab","lab.title":"Live 3D accents for the wow effect.","lab.desc":"Added an interactive tilt card and a holographic orb — both work without heavy libraries, using only CSS 3D and Framer Motion. Smooth parallax, glass surfaces, and live hints.","lab.orb":"Holo Orb","lab.tokens":"Depth Tokens","lab.tokens.desc":"Adaptable for any section: cards, CTA, case previews, or avatars.","lab.tilt.title":"3D Tilt Card","lab.tilt.hint":"Hover to explore","lab.subtitle":"Experimental R&D","lab.main_title":"The Digital Lab","lab.main_desc":"Exploring the boundaries of fluid dynamics, spatial UI, and AI-driven frontend architectures.","lab.card1.title":"Spatial Navigation","lab.card1.desc":"Z-axis focused navigation paradigms for future spatial browsers.","lab.card2.title":"Predictive UI","lab.card2.desc":"LLM-integrated components that adapt layout based on user intent.","stack.nextjs.name":"Next.js 16","stack.nextjs.desc":"SSR Framework","stack.threejs.name":"Three.js / WebGPU","stack.threejs.desc":"Graphic Core","stack.gsap.name":"GSAP Motion","stack.gsap.desc":"Animation Logic","stack.performance":"High Performance Only","detailing.hero.title":"DETAILING HUB","detailing.hero.desc":"A high-performance interactive 3D platform for automotive enthusiasts to customize and book premium services.","detailing.hero.rotate":"Click & Drag to Rotate","detailing.tech.badge":"Architecture","detailing.tech.title":"Technical Sophistication","detailing.tech.render.part1":"Real-time Rendering","detailing.tech.render.part2":"Optimization","detailing.tech.render.desc":"Custom GLSL shaders and geometry instancing to achieve 144FPS on desktop and 60FPS on mobile devices, ensuring fluid transitions during paint customization.","detailing.tech.engine.part1":"Serverless","detailing.tech.engine.part2":"Booking Engine","detailing.tech.engine.desc":"A headless commerce architecture utilizing serverless functions for instant calendar sync and automated service dispatch.","detailing.tech.latency":"Latency","detailing.tech.dynamic_light.title":"Dynamic Lighting","detailing.tech.dynamic_light.desc":"HDR-mapped environments for photorealistic reflections on car bodies.","detailing.tech.post_process.title":"Post-Processing","detailing.tech.post_process.desc":"Bloom, SSAO, and TAA layers for a premium cinematic aesthetic.","detailing.tech.responsive.title":"Responsive 3D","detailing.tech.responsive.desc":"Unified UI controls across desktop, tablet, and mobile browsers.","detailing.footer.engineer":"© 2026 Senior Frontend Engineer & 3D Specialist.","detailing.footer.type":"Project Type","detailing.footer.webgl":"Interactive WebGL","detailing.nav.process":"Process","detailing.nav.technical":"Technical","detailing.nav.impact":"Impact","detailing.nav.launch":"Launch Experience","detailing.nav.home_label":"Return to home","error.title":"Something went wrong","error.description":"We encountered an unexpected error. Please try refreshing the page or come back later.","error.details":"Error Details","error.retry":"Try Again"};
+
+export default dict;
@@ -0,0 +1,29 @@
+// Generated by devtools/i18n_chunks.py from i18n.tsx; do not edit.
+import type { Lang } from '../../i18n';
+import en from './en';
+
+type Dict = Record<string, string>;
+
+/** en ships in the entry chunk: `t` falls back to it for keys another language lacks. */
+export const fallbackTranslations: Dict = en;
+
+const loaders: Partial<Record<Lang, () => Promise<{ default: Dict }>>> = {
+  ru: () => import('./ru'),
+  cs: () => import('./cs'),
+};
+
+const loaded: Partial<Record<Lang, Dict>> = { en };
+
+/** Fetch one language's dictionary; each language is a separate chunk. */
+export const loadTranslations = async (lang: Lang): Promise<Dict> => {
+  const cached = loaded[lang];
+  if (cached) return cached;
+  const load = loaders[lang];
+  if (!load) return fallbackTranslations;
+  const dict = (await load()).default;
+  loaded[lang] = dict;
+  return dict;
+};
+
+/** The dictionary for `lang` if it has already been loaded. */
+export const peekTranslations = (lang: Lang): Dict | undefined => loaded[lang];
@@ -0,0 +1,4 @@
+// Generated by devtools/i18n_chunks.py from i18n.tsx; do not edit. content-hash: e5c644a1dfe009df578144bec114c6d7
+const dict: Record<string, string> = {"header.services":"Услуги","header.work":"Работы","header.contact":"Контакт","header.contact.telegram":"Связаться — Telegram","nav.home":"ГЛАВНАЯ","nav.works":"РАБОТЫ","nav.lab":"ЛАБОРАТОРИЯ","nav.services":"УСЛУГИ","nav.about":"ОБО МНЕ","nav.contact":"КОНТАКТ","nav.language":"Язык","nav.logo.label":"Портфолио Артема Михайлова - Вернуться на главную","nav.aria.open":"Открыть меню навигации","nav.aria.close":"Закрыть меню навигации","nav.aria.label":"Мобильная навигация","skip.content":"Перейти к контенту","works.badge":"ВЫБОРОЧНЫЕ РАБОТЫ (2026)","works.title":"РАБОТЫ","works.fallback.tag":"КЕЙС","works.cta.view":"ИЗУЧИТЬ","works.no.desc":"Описание проекта недоступно.","works.open_details":"Открыть детали для","works.prev":"Предыдущий проект","works.next":"Следующий проект","contact.title":"Готовы к эволюции?","contact.subtitle":"Есть проект на примете? Давайте создадим что-то потрясающее вместе.","contact.label.name":"Имя","contact.label.email":"Email","contact.label.subject":"Тема (опционально)","contact.label.message":"Сообщение","contact.placeholder.name":"Ваше имя","contact.placeholder.email":"your@email.com","contact.placeholder.subject":"Тема проекта","contact.placeholder.message":"Расскажите о вашем проекте...","contact.button.send":"Отправить сообщение","contact.button.sending":"Отправка...","contact.success":"✓ Сообщение отправлено! Я свяжусь с вами в ближайшее время.","contact.error.required":"Пожалуйста, заполните все обязательные поля","contact.error.email":"Пожалуйста, введите корректный адрес электронной почты","contact.error.too_short":"Сообщение слишком короткое. Пожалуйста, введите больше деталей.","contact.error.rate_limit":"Пожалуйста, подождите немного перед повторной отправкой","contact.error.sending":"Ошибка при отправке сообщения. Пожалуйста, попробуйте еще раз.","contact.error.timeout":"Таймаут сети. Пожалуйста, попробуйте позже.","contact.reach_out":"Или свяжитесь через:","cta.title":"Готовы к эволюции?","cta.subtitle":"Готовы воплотить ваше видение в жизнь? Я специализируюсь на создании высокопроизводительных интерактивных веб-приложений, адаптированных под ваши потребности.","cta.button":"Начать сотрудничество","cta.secondary":"Смотреть GitHub","cta.stat.projects":"Завершено проектов","cta.stat.clients":"Довольных клиентов","cta.stat.experience":"Лет опыта","cta.stat.awards":"Награды","project.1.title":"Barber Shop","project.1.desc":"AI-диспетчер барбершопа: онлайн-запись, анти-овербукинг, CRM клиентов и платежная аналитика. Оптимизирован под многокресельные салоны.","project.2.title":"Dental Clinic Vakalova","project.2.desc":"Лендинг и запись к врачу: каталог услуг, интерактивные планы лечения, отзывы пациентов. Уделено внимание доступности и скорости загрузки.","project.3.title":"Game Marketplace","project.3.desc":"Современный маркетплейс игр с каталогом, корзиной покупок, системой фильтрации и адаптивным интерфейсом. Реализованы анимации и плавные переходы.","project.4.title":"Detailing Service","project.4.desc":"Лендинг для сервиса детейлинга.","contact.help.optional":"Необязательно","contact.help.message_min":"Минимум 10 символов","hero.badge":"Старший фронтенд-архитектор","hero.title.line1":"АРТЕМ","hero.title.line2":"МИХАЙЛОВ","hero.description":"Проектирую высокопроизводительные интерактивные 3D-экосистемы и ориентированные на результат цифровые интерфейсы для 2026 года.","hero.cta.portfolio":"Портфолио","hero.cta.explore":"Портфолио","hero.cta.contact":"Связаться","hero.stats.uiux":"UI/UX + анимация","hero.stats.backend":"Бэкенд и данные","hero.stats.ai":"AI/автоматизация","hero.stats.nps":"NPS по доставке","hero.stats.projects":"ПРОЕКТОВ","hero.stats.clients":"КЛИЕНТОВ","hero.stats.experience":"ЛЕТ ОПЫТА","hero.stats.awards":"НАГРАДЫ","hero.stats.satisfaction":"ДОВОЛЬСТВО","hero.cta.scroll":"ЛИСТАЙТЕ","hero.drag":"ТЯНИТЕ","hero.label.brand":"БРЕНД","hero.label.web":"ВЕБ","hero.label.motion":"МОУШН","hero.label.design":"ДИЗАЙН","about.badge":"Экосистема 2026","about.title":"Современный стек","about.desc":"Я создаю высокопроизводительные цифровые решения, где точное проектирование встречается с иммерсивным дизайном. Специализируюсь на Next.js, Three.js и AI-SaaS.","about.cta.collaborate":"ДАВАЙТЕ СОТРУДНИЧАТЬ","about.expertise":"ТЕХНИЧЕСКАЯ ЭКСПЕРТИЗА","about.offer":"ЧТО Я ПРЕДЛАГАЮ","service.1.name":"Web-разработка","service.1.desc":"Full-stack приложения на React, Next.js, Node.js","service.2.name":"UI/UX Дизайн","service.2.desc":"Современные, доступные интерфейсы в Figma и Tailwind","service.3.name":"Интеграция API","service.3.desc":"RESTful API, GraphQL, сторонние сервисы","service.4.name":"Проектирование БД","service.4.desc":"Оптимизация PostgreSQL, MongoDB, Redis","service.5.name":"Производительность","service.5.desc":"Core Web Vitals, SEO, оптимизация загрузки","service.6.name":"Деплой","service.6.desc":"CI/CD, Docker, AWS, в облаке Vercel","projects.badge":"Выборочные работы","projects.title":"Мои проекты.","footer.cta.build":"ДАВАЙТЕ СТРОИТЬ","footer.ready.title.main":"Готов к","footer.ready.title.sub":"сотрудничеству.","footer.contacts":"Контакты","footer.copyright":"Full Stack разработчик","footer.build":"ПОСТРОИМ ВМЕСТЕ","footer.ready.desc":"Готовы воплотить проект в жизнь? Давайте создадим что-то исключительное вместе.","footer.social":"Социальные сети","footer.status":"Статус","footer.version":"Версия","footer.available":"Доступен Q4 2026","footer.location":"Лондон / Удалённо","footer.rights":"© Все права защищены 2026","footer.start_project":"НАЧАТЬ ПРОЕКТ","footer.twitter.label":"Подписаться на мой Twitter (X)","footer.linkedin.label":"Связаться со мной в LinkedIn","footer.github.label":"Посмотреть мои проекты на GitHub","contacts.telegram":"Telegram: @younghustle45","contacts.email":"Email: fear75412@gmail.com","contacts.phone":"Телефон: +420 737 500 587","contacts.location":"Локация: Прага, Чехия","contacts.github":"GitHub: akira777777","brand.vision":"Синхронизация видения","brand.mission":"Параметры миссии","brand.aspect":"Геометрия аспектов","brand.generate":"Сгенерировать идентичность","chat.placeholder":"Введите сообщение...","chat.bot.welcome":"Привет! 👋 Отправьте мне сообщение, и я пересошлю его вам в Telegram.","chat.bot.success":"✓ Сообщение отправлено! Я отвечу вам в Telegram как можно скорее.","chat.error.wait":"Пожалуйста, подождите перед следующим сообщением","chat.error.name_required":"Имя обязательно","chat.prompt.name":"Укажите ваше имя:","chat.label.telegram":"TELEGRAM CHAT","chat.button.send":"Отправить","chat.aria.close":"Закрыть чат","chat.aria.open":"Открыть чат","chat.aria.expand":"Развернуть панель","chat.aria.collapse":"Свернуть панель","chat.role.bot":"Ассистент","chat.role.user":"Вы","chat.initial":"Тихо наблюдаю. Чем помочь со стратегией сегодня?","chat.error.sending":"Ошибка при отправке сообщения","chat.error.timeout":"Timeout при отправке. Попробуйте позже.","scroll_to_top":"Вернуться наверх","works.scroll_left":"Листать проекты влево","works.scroll_right":"Листать проекты вправо","switch.to":"Переключить на","accessibility.title":"Настройки доступности","accessibility.close":"Закрыть панель доступности","accessibility.open":"Открыть панель доступности","accessibility.font_size":"Размер текста","accessibility.contrast":"Контраст","accessibility.reduce_motion":"Уменьшить движение","accessibility.focus_indicator":"Показывать индикатор фокуса","accessibility.skip_to_main":"Перейти к основному содержимому","skill.frontend":"Frontend разработка","skill.backend":"Backend системы","skill.architecture":"Архитектура и Devops","skill.tools":"Инструменты и Workflow","services.grid.title":"специализации","services.grid.subtitle":"Превращаю идеи в работающие цифровые продукты высокого качества.","lab.badge":"Интерактивная Лаборатория","lab.title":"Живые 3D-акценты для вау-эффекта.","lab.desc":"Добавил интерактивную tilt-карту и голографический шар — оба работают без тяжёлых библиотек, только CSS 3D and Framer Motion. Мягкие параллаксы, стеклянные поверхности, живые подсказки.","lab.orb":"Голо-шар","lab.tokens":"Токены глубины","lab.tokens.desc":"Адаптируй под любые секции: карточки, CTA, превью кейсов или аватары.","lab.tilt.title":"3D Tilt карта","lab.tilt.hint":"Наведите для изучения","lab.subtitle":"Экспериментальные R&D","lab.main_title":"Цифровая лаборатория","lab.main_desc":"Исследование границ гидродинамики, пространственных интерфейсов и фронтенд-архитектур на базе AI.","lab.card1.title":"Пространственная навигация","lab.card1.desc":"Парадигмы навигации по оси Z для браузеров будущего.","lab.card2.title":"Прогностический UI","lab.card2.desc":"Компоненты с интеграцией LLM, адаптирующие макет под намерения пользователя.","stack.nextjs.name":"Next.js 16","stack.nextjs.desc":"SSR Фреймворк","stack.threejs.name":"Three.js / WebGPU","stack.threejs.desc":"Графическое ядро","stack.gsap.name":"GSAP Motion","stack.gsap.desc":"Логика анимации","stack.performance":"Только высокая производительность","detailing.hero.title":"DETAILING HUB","detailing.hero.desc":"Высокопроизводительная интерактивная 3D-платформа для любителей авто: кастомизация и бронирование премиальных услуг.","detailing.hero.rotate":"Нажмите и тяните для вращения","detailing.tech.badge":"Архитектура","detailing.tech.title":"Техническая сложность","detailing.tech.render.part1":"Оптимизация рендеринга","detailing.tech.render.part2":"в реальном времени","detailing.tech.render.desc":"Кастомные шейдеры GLSL и инстансинг геометрии для достижения 144FPS на десктопах и 60FPS на мобильных устройствах.","detailing.tech.engine.part1":"Serverless движок","detailing.tech.engine.part2":"бронирования","detailing.tech.engine.desc":"Архитектура headless commerce с использованием serverless-функций для мгновенной синхронизации календаря.","detailing.tech.latency":"Задержка","detailing.tech.dynamic_light.title":"Динамическое освещение","detailing.tech.dynamic_light.desc":"HDR-карты окружения для фотореалистичных отражений на кузовах автомобилей.","detailing.tech.post_process.title":"Пост-обработка","detailing.tech.post_process.desc":"Слои Bloom, SSAO и TAA для создания премиальной кинематографической эстетики.","detailing.tech.responsive.title":"Адаптивный 3D","detailing.tech.responsive.desc":"Единое управление интерфейсом для десктопных, планшетных и мобильных браузеров.","detailing.footer.engineer":"© 2026 Старший Frontend-инженер и 3D-специалист.","detailing.footer.type":"Тип проекта","detailing.footer.webgl":"Интерактивный WebGL","detailing.nav.process":"Процесс","detailing.nav.technical":"Технологии","detailing.nav.impact":"Влияние","detailing.nav.launch":"Запустить","detailing.nav.home_label":"Вернуться на главную","error.title":"Что-то пошло не так","error.description":"Произошла неожиданная ошибка. Попробуйте обновить страницу или вернитесь позже.","error.details":"Детали ошибки","error.retry":"Попробовать снова"};
+
+export default dict;
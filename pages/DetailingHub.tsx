@@ -6,7 +6,7 @@ import BaseLayout from '../components/BaseLayout';
 
 interface DetailingHubProps {}
 
-const DetailingHub: React.FC<DetailingHubProps> = () => {
+const DetailingHub: React.FC<DetailingHubProps> = React.memo(() => {
   const { t } = useI18n();
 
   return (
@@ -118,6 +118,8 @@ const DetailingHub: React.FC<DetailingHubProps> = () => {
       </main>
     </BaseLayout>
   );
-};
+});
+
+DetailingHub.displayName = 'DetailingHub';
 
 export default DetailingHub;
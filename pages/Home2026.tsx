@@ -12,7 +12,7 @@ const SectionLoader = () => (
   </div>
 );
 
-const Home2026: React.FC = () => {
+const Home2026: React.FC = React.memo(() => {
   return (
     <DefaultLayout>
       <Hero2026 />
@@ -24,6 +24,8 @@ const Home2026: React.FC = () => {
       </Suspense>
     </DefaultLayout>
   );
-};
+});
+
+Home2026.displayName = 'Home2026';
 
 export default Home2026;
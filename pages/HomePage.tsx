@@ -43,7 +43,7 @@ const SectionLoader: React.FC<{ label?: string }> = ({ label }) => (
  * - Reduced initial bundle size
  * - Progressive loading strategy
  */
-const HomePage: React.FC = () => {
+const HomePage: React.FC = React.memo(() => {
   // Preload LabSection on idle
   useEffect(() => {
     if ('requestIdleCallback' in window) {
@@ -105,6 +105,8 @@ const HomePage: React.FC = () => {
       </Suspense>
     </DefaultLayout>
   );
-};
+});
+
+HomePage.displayName = 'HomePage';
 
 export default HomePage;
@@ -1,73 +1,54 @@
 // Enhanced service-worker.js with improved caching strategies
 const CACHE_NAME = 'artemcv-v2';
-const STATIC_CACHE = [
-  '/',
-  '/index.html',
-  '/manifest.json',
-  '/favicon.ico',
-  '/logo192.png',
-  '/logo512.png',
-];
 
 // Cache versioning for better cache management
 const DYNAMIC_CACHE = 'artemcv-dynamic-v1';
 const IMAGE_CACHE = 'artemcv-images-v1';
 
-// Critical assets that should be precached
-const PRECACHE_ASSETS = [
-  '/index.css',
-  '/assets/index-', // Main JS bundle
-  '/assets/react-', // React chunk
-  '/assets/motion-', // Framer Motion chunk
-  '/assets/icons-', // Icons chunk
-  // Image assets
-  '/marketplace.webp',
-  '/detailing.webp',
-  '/barber.webp',
-  '/dental.webp',
-  '/game.webp',
-];
+// Critical assets that should be precached: exact URLs with content
+// revisions, written to dist/ by `python -m devtools.precache` after the build.
+// The manifest is absent in development, so nothing is precached there.
+self.__PRECACHE_MANIFEST = [];
+try {
+  importScripts('/precache-manifest.js');
+} catch (error) {
+  console.warn('[Service Worker] No precache manifest, skipping precache');
+}
+const PRECACHE = 'artemcv-precache';
+const PRECACHE_KEYS = new Map(
+  self.__PRECACHE_MANIFEST.map(({ url, revision }) => [url, `${url}?__rev=${revision}`])
+);
 
-// Precache critical assets
+// Cache keys as path + query, to compare with PRECACHE_KEYS
+const cacheKeyPath = (request) => {
+  const url = new URL(request.url);
+  return url.pathname + url.search;
+};
+
+// Precache critical assets, fetching only revisions not already cached
 self.addEventListener('install', (event) => {
   console.log('[Service Worker] Installing...');
   
   event.waitUntil(
-    Promise.all([
-      // Precache static assets
-      caches.open(CACHE_NAME)
-        .then((cache) => {
-          console.log('[Service Worker] Pre-caching static assets');
-          return cache.addAll(STATIC_CACHE);
-        }),
-      // Precache critical dynamic assets
-      caches.open(DYNAMIC_CACHE)
-        .then((cache) => {
-          console.log('[Service Worker] Pre-caching dynamic assets');
-          // Add wildcard matching for dynamic assets
-          return Promise.all(
-            PRECACHE_ASSETS.map(asset => {
-              if (asset.endsWith('-')) {
-                // Handle versioned assets with wildcards
-                return fetch('/').then(response => response.text()).then(html => {
-                  // Parse HTML to find actual asset URLs
-                  const matches = html.match(new RegExp(asset + '[a-zA-Z0-9_-]+\.js', 'g'));
-                  if (matches) {
-                    return cache.addAll(matches);
-                  }
-                }).catch(() => {});
-              } else {
-                return cache.add(asset).catch(() => {});
-              }
-            })
-          );
-        })
-    ]).then(() => {
-      console.log('[Service Worker] Installation complete');
-      self.skipWaiting(); // Activate immediately
-    }).catch((error) => {
-      console.error('[Service Worker] Installation failed:', error);
-    })
+    caches.open(PRECACHE)
+      .then(async (cache) => {
+        const cached = new Set((await cache.keys()).map(cacheKeyPath));
+        const missing = [...PRECACHE_KEYS].filter(([, key]) => !cached.has(key));
+        console.log(`[Service Worker] Pre-caching ${missing.length} of ${PRECACHE_KEYS.size} assets`);
+        return Promise.all(missing.map(async ([url, key]) => {
+          const response = await fetch(url, { cache: 'reload' });
+          if (!response.ok) {
+            throw new Error(`${url}: HTTP ${response.status}`);
+          }
+          return cache.put(key, response);
+        }));
+      })
+      .then(() => {
+        console.log('[Service Worker] Installation complete');
+        self.skipWaiting(); // Activate immediately
+      }).catch((error) => {
+        console.error('[Service Worker] Installation failed:', error);
+      })
   );
 });
 
@@ -75,7 +56,8 @@ self.addEventListener('install', (event) => {
 self.addEventListener('activate', (event) => {
   console.log('[Service Worker] Activating...');
   
-  const currentCaches = [CACHE_NAME, DYNAMIC_CACHE, IMAGE_CACHE];
+  const currentCaches = [PRECACHE, CACHE_NAME, DYNAMIC_CACHE, IMAGE_CACHE];
+  const currentKeys = new Set(PRECACHE_KEYS.values());
   
   event.waitUntil(
     caches.keys().then((cacheNames) => {
@@ -87,6 +69,14 @@ self.addEventListener('activate', (event) => {
           }
         })
       );
+    }).then(async () => {
+      // Drop precached revisions that are no longer in the manifest
+      if (currentKeys.size === 0) {
+        return;
+      }
+      const cache = await caches.open(PRECACHE);
+      const stale = (await cache.keys()).filter((request) => !currentKeys.has(cacheKeyPath(request)));
+      await Promise.all(stale.map((request) => cache.delete(request)));
     }).then(() => {
       console.log('[Service Worker] Activation complete');
       return self.clients.claim(); // Take control of all clients immediately
@@ -101,6 +91,19 @@ self.addEventListener('fetch', (event) => {
     return;
   }
   
+  // Precached assets are served from their current revision
+  const requestUrl = new URL(event.request.url);
+  const precacheKey = requestUrl.origin === self.location.origin && PRECACHE_KEYS.get(requestUrl.pathname);
+  if (precacheKey) {
+    event.respondWith(
+      caches.open(PRECACHE)
+        .then((cache) => cache.match(precacheKey))
+        .then((cachedResponse) => cachedResponse || fetch(event.request))
+        .catch(() => fetch(event.request))
+    );
+    return;
+  }
+
   // Cache-first strategy for hashed assets (they never change)
   const isHashedAsset = event.request.url.includes('/assets/') &&
                         /\.[a-f0-9]{8,10}\./.test(event.request.url);
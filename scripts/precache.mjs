@@ -0,0 +1,19 @@
+// postbuild: write dist/precache-manifest.js with devtools/precache.py.
+// The build must not depend on Python, so the step is skipped when no
+// interpreter is found; sw.js then runs without a precache list.
+import { spawnSync } from 'child_process';
+
+const CANDIDATES = ['python3', 'python'];
+
+for (const python of CANDIDATES) {
+  const result = spawnSync(python, ['-m', 'devtools.precache', ...process.argv.slice(2)], { stdio: 'inherit' });
+  if (result.error && result.error.code === 'ENOENT') {
+    continue;
+  }
+  if (result.error) {
+    throw result.error;
+  }
+  process.exit(result.status ?? 1);
+}
+
+console.warn(`⚠️ No Python interpreter (${CANDIDATES.join(', ')}) found; skipping the precache manifest.`);
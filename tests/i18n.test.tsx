@@ -1,7 +1,11 @@
 
 import React from 'react';
-import { renderHook, act } from '@testing-library/react';
-import { I18nProvider, useI18n } from '../i18n';
+import { renderHook, act, waitFor } from '@testing-library/react';
+import { I18nProvider, translations, useI18n } from '../i18n';
+import { loadTranslations } from '../lib/i18n';
+import en from '../lib/i18n/en';
+import ru from '../lib/i18n/ru';
+import cs from '../lib/i18n/cs';
 import { describe, it, expect, beforeEach, vi } from 'vitest';
 
 describe('I18n', () => {
@@ -10,12 +14,15 @@ describe('I18n', () => {
     vi.mocked(localStorage.getItem).mockClear();
   });
 
-  it('should detect language from localStorage', () => {
+  it('should detect language from localStorage', async () => {
     localStorage.setItem('lang', 'ru');
+    // As index.tsx does before the first render.
+    await loadTranslations('ru');
     const { result } = renderHook(() => useI18n(), {
       wrapper: ({ children }) => <I18nProvider>{children}</I18nProvider>
     });
     expect(result.current.lang).toBe('ru');
+    expect(result.current.t('nav.home')).toBe(ru['nav.home']);
   });
 
   it('should fallback to English if nothing is set', () => {
@@ -25,7 +32,7 @@ describe('I18n', () => {
     expect(result.current.lang).toBe('en');
   });
 
-  it('should change language and update localStorage', () => {
+  it('should change language and update localStorage', async () => {
     const { result } = renderHook(() => useI18n(), {
       wrapper: ({ children }) => <I18nProvider>{children}</I18nProvider>
     });
@@ -34,8 +41,13 @@ describe('I18n', () => {
       result.current.setLang('cs');
     });
 
-    expect(result.current.lang).toBe('cs');
+    // The old language stays on screen, whole, until the new chunk is loaded.
+    expect(result.current.lang).toBe('en');
+    expect(result.current.t('nav.home')).toBe(en['nav.home']);
     expect(localStorage.setItem).toHaveBeenCalledWith('lang', 'cs');
+
+    await waitFor(() => expect(result.current.lang).toBe('cs'));
+    expect(result.current.t('nav.home')).toBe(cs['nav.home']);
   });
 
   it('should return translation key if not found', () => {
@@ -44,4 +56,10 @@ describe('I18n', () => {
     });
     expect(result.current.t('non.existent.key')).toBe('non.existent.key');
   });
+
+  it('should ship per-language chunks that match i18n.tsx (npm run i18n:chunks)', () => {
+    expect(en).toEqual(translations.en);
+    expect(ru).toEqual(translations.ru);
+    expect(cs).toEqual(translations.cs);
+  });
 });
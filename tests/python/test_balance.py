@@ -0,0 +1,41 @@
+import pytest
+
+from devtools.balance import check
+
+
+@pytest.mark.parametrize('text, code, message, line, col, related', [
+    ('foo(1;\n', 'TS1005', "')' expected.", 1, 6, (1, 4)),
+    ('const X = React.memo(() => {\n  return 1;\n};\n', 'TS1005', "')' expected.", 3, 2, (1, 21)),
+    ('f(]', 'TS1005', "')' expected.", 1, 3, (1, 2)),
+    ('}', 'TS1128', 'Declaration or statement expected.', 1, 1, None),
+    ('x = <div><span></div>;', 'TS17008', "JSX element 'span' has no corresponding closing tag.", 1, 11, None),
+    ('x = <div></span>;', 'TS17002', "Expected corresponding JSX closing tag for 'div'.", 1, 12, (1, 6)),
+])
+def test_codes_and_positions(text, code, message, line, col, related):
+    d = check(text)
+    assert (d.code, d.message, d.line, d.col, d.related) == (code, message, line, col, related)
+
+
+def test_unclosed_at_end_of_file():
+    d = check('function f() {\n  return 1;\n')
+    assert d.code == 'TS1005' and d.message == "'}' expected."
+    assert d.offset == len('function f() {\n  return 1;\n')
+    assert d.related == (1, 14)
+
+
+def test_for_header_semicolons_are_allowed():
+    assert check('for (let i = 0; i < n; i++) { x[i] = i; }') is None
+
+
+def test_brackets_in_strings_regexes_and_templates_are_ignored():
+    assert check("const a = '(' + \"[\" + `${'{'}` + /[(]/.source;") is None
+
+
+def test_balanced_jsx():
+    assert check('const el = <ul>{items.map(i => <li key={i}>{i}</li>)}</ul>;') is None
+
+
+def test_format_puts_the_related_location_on_its_own_line():
+    out = check('foo(1;\n').format('a.ts')
+    assert out.splitlines() == ["a.ts(1,6): error TS1005: ')' expected.",
+                                '  a.ts(1,4): The opening bracket is here.']
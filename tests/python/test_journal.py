@@ -0,0 +1,105 @@
+import io
+import os
+
+import pytest
+
+from devtools import journal as journal_module
+from devtools.journal import Journal, JournalError, find, gc, journal_dir, load, run_ids, undo
+from devtools.output import Batch, stage
+
+
+def write(path, text):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(text)
+
+
+def read(path):
+    with open(path, encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def journaled(root, changes, command='test'):
+    """Commit ``{relpath: text}`` through a journaled batch; returns the run id."""
+    journal = Journal(str(root), command=command)
+    batch = Batch(journal=journal)
+    for rel, text in changes.items():
+        path = os.path.join(root, rel)
+        batch.add(path, stage(path, text))
+    batch.commit()
+    return journal.run_id
+
+
+ORIGINAL = ''.join(f'line {i}\n' for i in range(200))
+
+
+def test_write_then_undo_round_trip(tmp_path):
+    write(tmp_path / 'a.ts', ORIGINAL)
+    changed = ORIGINAL.replace('line 7\n', 'line seven\n').replace('line 150\n', '')
+    run_id = journaled(tmp_path, {'a.ts': changed, 'new.ts': 'created\n'})
+    directory = journal_dir(str(tmp_path))
+    run = load(directory, find(directory, 'last'))
+    assert run.id == run_id and run.command == 'test'
+    assert {e.path for e in run.entries} == {'a.ts', 'new.ts'}
+    # Only the changed lines are stored.
+    (entry,) = [e for e in run.entries if e.path == 'a.ts']
+    assert sum(len(lines) for _, _, lines in entry.ops) == 2
+
+    done, conflicts = undo(str(tmp_path), run, journal=Journal(str(tmp_path), command='undo'))
+    assert conflicts == [] and sorted(done) == ['a.ts', 'new.ts']
+    assert read(tmp_path / 'a.ts') == ORIGINAL
+    assert not os.path.exists(tmp_path / 'new.ts')
+
+
+def test_undo_refuses_files_edited_since(tmp_path):
+    write(tmp_path / 'a.ts', ORIGINAL)
+    write(tmp_path / 'b.ts', ORIGINAL)
+    journaled(tmp_path, {'a.ts': ORIGINAL + 'x\n', 'b.ts': ORIGINAL + 'y\n'})
+    write(tmp_path / 'b.ts', 'hand edit\n')
+    directory = journal_dir(str(tmp_path))
+    done, conflicts = undo(str(tmp_path), load(directory, find(directory, 'last')))
+    assert done == [] and [c.path for c in conflicts] == ['b.ts']
+    assert read(tmp_path / 'a.ts') == ORIGINAL + 'x\n'
+
+
+def test_dry_run_writes_nothing(tmp_path):
+    write(tmp_path / 'a.ts', ORIGINAL)
+    journaled(tmp_path, {'a.ts': 'replaced\n'})
+    directory = journal_dir(str(tmp_path))
+    out = io.StringIO()
+    done, _ = undo(str(tmp_path), load(directory, find(directory, 'last')), dry_run=True, out=out)
+    assert done == ['a.ts'] and '+line 0' in out.getvalue()
+    assert read(tmp_path / 'a.ts') == 'replaced\n'
+
+
+def test_find_by_prefix(tmp_path):
+    write(tmp_path / 'a.ts', 'a\n')
+    run_id = journaled(tmp_path, {'a.ts': 'b\n'})
+    directory = journal_dir(str(tmp_path))
+    assert find(directory, run_id[:-1]) == run_id
+    with pytest.raises(JournalError):
+        find(directory, 'nope')
+    assert run_ids(directory) == [run_id]
+
+
+def test_runs_in_one_second_sort_by_time(tmp_path, monkeypatch):
+    # Same second, random suffixes in descending order: the old ids sorted
+    # the second run first.
+    clock = iter([1_760_688_000_000_100_000, 1_760_688_000_000_200_000, 1_760_688_000_000_300_000])
+    suffixes = iter([b'\xff\xff', b'\x80\x00', b'\x00\x00'])
+    monkeypatch.setattr(journal_module.time, 'time_ns', lambda: next(clock))
+    monkeypatch.setattr(journal_module.os, 'urandom', lambda n: next(suffixes))
+    write(tmp_path / 'a.ts', 'one\n')
+    first = journaled(tmp_path, {'a.ts': 'two\n'})
+    second = journaled(tmp_path, {'a.ts': 'three\n'})
+    directory = journal_dir(str(tmp_path))
+    assert run_ids(directory) == [first, second]
+
+    # undo last undoes the newest run, and its own record sorts after it.
+    undo_journal = Journal(str(tmp_path), command='undo')
+    undo(str(tmp_path), load(directory, find(directory, 'last')), journal=undo_journal)
+    assert read(tmp_path / 'a.ts') == 'two\n'
+    assert run_ids(directory) == [first, second, undo_journal.run_id]
+
+    # gc keeps the newest.
+    assert gc(directory, keep=1) == 2
+    assert run_ids(directory) == [undo_journal.run_id]
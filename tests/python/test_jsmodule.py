@@ -0,0 +1,44 @@
+import pytest
+
+from devtools.jsmodule import import_edits
+from devtools.lineindex import LineIndex
+from devtools.tokenizer import TokenStream
+
+
+def edit(text, module, add=(), remove=()):
+    return LineIndex(text).apply_edits(import_edits(TokenStream(text), module, set(add), set(remove)))
+
+
+BODY = 'export const x = 1;\n'
+
+
+@pytest.mark.parametrize('before, remove, after', [
+    ("import { a, b, c } from 'm';\n", {'b'}, "import { a, c } from 'm';\n"),
+    ("import { a, b, c } from 'm';\n", {'b', 'c'}, "import { a } from 'm';\n"),
+    ("import { a, b, c } from 'm';\n", {'a', 'b'}, "import { c } from 'm';\n"),
+    ("import { a, b as bb, c } from 'm';\n", {'b'}, "import { a, c } from 'm';\n"),
+    ("import {\n  a,\n  b,\n} from 'm';\n", {'b'}, "import {\n  a,\n} from 'm';\n"),
+])
+def test_drop_some_names(before, remove, after):
+    assert edit(before + BODY, 'm', remove=remove) == after + BODY
+
+
+def test_dropping_every_name_removes_the_declaration():
+    text = "import React from 'react';\nimport { useState } from 'react';\nimport { a } from 'm';\n" + BODY
+    assert edit(text, 'react', remove={'useState'}) == "import React from 'react';\nimport { a } from 'm';\n" + BODY
+
+
+def test_dropping_every_name_keeps_the_default_import():
+    text = "import React, { useState, useRef } from 'react';\n" + BODY
+    assert edit(text, 'react', remove={'useState', 'useRef'}) == "import React from 'react';\n" + BODY
+
+
+def test_replace_every_name():
+    text = "import { useState } from 'react';\n" + BODY
+    assert edit(text, 'react', add={'useRef'}, remove={'useState'}) == "import { useRef } from 'react';\n" + BODY
+
+
+def test_add_names():
+    assert edit("import { a } from 'm';\n", 'm', add={'c', 'b'}) == "import { a, b, c } from 'm';\n"
+    assert edit("import React from 'react';\n", 'react', add={'memo'}) == "import React, { memo } from 'react';\n"
+    assert edit("import { a } from 'm';\n", 'n', add={'b'}) == "import { a } from 'm';\nimport { b } from 'n';\n"
@@ -0,0 +1,26 @@
+import pytest
+
+from devtools.lineindex import LineIndex
+
+
+def test_line_col_round_trip():
+    idx = LineIndex('ab\ncd\n\nef')
+    for offset in range(len(idx.text)):
+        assert idx.offset(*idx.line_col(offset)) == offset
+
+
+def test_apply_edits_patches_line_starts():
+    idx = LineIndex('one\ntwo\nthree\nfour\n')
+    idx.apply_edits([(0, 3, '1\n1'), (8, 14, ''), (19, 19, 'five\n')])
+    assert idx.text == '1\n1\ntwo\nfour\nfive\n'
+    assert idx.starts == LineIndex(idx.text).starts
+
+
+def test_insertions_at_one_offset_keep_their_order():
+    idx = LineIndex('x')
+    assert idx.apply_edits([(0, 0, 'a'), (0, 0, 'b')]) == 'abx'
+
+
+def test_overlapping_edits_are_rejected():
+    with pytest.raises(ValueError):
+        LineIndex('abcdef').apply_edits([(0, 3, 'x'), (2, 4, 'y')])
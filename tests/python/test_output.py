@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+from devtools.output import Batch, stage
+
+
+def read(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+def temps(directory):
+    return [n for n in os.listdir(directory) if n.endswith('.tmp')]
+
+
+def test_stage_skips_identical_text(tmp_path):
+    target = tmp_path / 'a.ts'
+    target.write_text('same\n')
+    assert stage(str(target), 'same\n') is None
+    assert temps(tmp_path) == []
+
+
+def test_stage_keeps_the_target_mode(tmp_path):
+    target = tmp_path / 'run.sh'
+    target.write_text('old\n')
+    os.chmod(target, 0o750)
+    temp = stage(str(target), 'new\n')
+    assert os.stat(temp).st_mode & 0o777 == 0o750
+    assert read(temp) == 'new\n' and read(target) == 'old\n'
+
+
+def test_commit_writes_everything(tmp_path):
+    batch = Batch(fsync=True)
+    for name in ('a.ts', 'b.ts'):
+        path = tmp_path / name
+        path.write_text('old\n')
+        batch.add(str(path), stage(str(path), f'new {name}\n'))
+    assert sorted(os.path.basename(p) for p in batch.commit()) == ['a.ts', 'b.ts']
+    assert read(tmp_path / 'a.ts') == 'new a.ts\n'
+    assert read(tmp_path / 'b.ts') == 'new b.ts\n'
+    assert temps(tmp_path) == [] and batch.pending == []
+
+
+def test_failed_rename_discards_the_rest(tmp_path):
+    good = tmp_path / 'a.ts'
+    good.write_text('old\n')
+    blocked = tmp_path / 'b.ts'
+    blocked.mkdir()         # os.replace onto a directory fails
+    last = tmp_path / 'c.ts'
+    last.write_text('old\n')
+    batch = Batch()
+    batch.add(str(good), stage(str(good), 'new\n'))
+    batch.add(str(blocked), stage(str(tmp_path / 'staged-b.ts'), 'new\n'))
+    batch.add(str(last), stage(str(last), 'new\n'))
+    with pytest.raises(OSError):
+        batch.commit()
+    assert read(good) == 'new\n'
+    assert read(last) == 'old\n'
+    assert temps(tmp_path) == [] and batch.pending == []
+
+
+def test_discard_removes_temps(tmp_path):
+    target = tmp_path / 'a.ts'
+    target.write_text('old\n')
+    batch = Batch()
+    batch.add(str(target), stage(str(target), 'new\n'))
+    batch.discard()
+    assert read(target) == 'old\n' and temps(tmp_path) == []
@@ -0,0 +1,48 @@
+import pytest
+
+from devtools.rewriter import Conflict, RewriteError, RewriteRule, Rewriter
+
+
+def test_one_pass_many_rules():
+    rw = Rewriter([RewriteRule('var', r'\bvar\b', 'let'),
+                   RewriteRule('eq', r'==(?!=)', '===')])
+    result = rw.apply('var a = b == c; var d;')
+    assert result.text == 'let a = b === c; let d;'
+    assert [e.rule for e in result.edits] == ['var', 'eq', 'var']
+    assert result.conflicts == []
+
+
+def test_overlap_keeps_the_earlier_rule_and_reports_it():
+    rw = Rewriter([RewriteRule('memo', r'React\.memo\(', 'memo('),
+                   RewriteRule('react', r'React\.', '')])
+    result = rw.apply('x = React.memo(f);')
+    assert result.text == 'x = memo(f);'
+    assert result.conflicts == [Conflict('memo', 'react', 4, 4)]
+
+
+def test_partial_overlap_is_reported():
+    rw = Rewriter([RewriteRule('ab', 'ab', 'X'), RewriteRule('bc', 'bc', 'Y')])
+    result = rw.apply('abc')
+    assert result.text == 'Xc'
+    assert result.conflicts == [Conflict('ab', 'bc', 0, 1)]
+
+
+def test_group_references_use_the_rule_numbering():
+    rw = Rewriter([RewriteRule('other', r'(x)(y)', r'\2\1'),
+                   RewriteRule('swap', r'(\w+) as (\w+)', r'\2 as \1')])
+    assert rw.apply('a as b').text == 'b as a'
+
+
+def test_unchanged_text_has_no_edits():
+    result = Rewriter([RewriteRule('same', 'a', 'a')]).apply('banana')
+    assert not result.changed and result.text == 'banana'
+
+
+def test_backreferences_are_rejected():
+    with pytest.raises(RewriteError):
+        Rewriter([RewriteRule('dup', r'(\w)\1', '')])
+
+
+def test_duplicate_names_are_rejected():
+    with pytest.raises(RewriteError):
+        Rewriter([RewriteRule('a', 'x', 'y'), RewriteRule('a', 'z', 'y')])
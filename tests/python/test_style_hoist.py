@@ -0,0 +1,55 @@
+from devtools.lineindex import LineIndex
+from devtools.style_hoist import plan
+
+
+def hoist(text):
+    return LineIndex(text).apply_edits(plan(text).edits)
+
+
+HEADER = "import React from 'react';\n\n"
+
+
+def test_hoisted_above_the_component_doc_comment():
+    text = HEADER + ("interface Props {}\n\n"
+                     "/** The card. */\n"
+                     "export const Card = () => <div style={{ filter: 'blur(40px)' }} />;\n")
+    assert hoist(text) == HEADER + ("interface Props {}\n\n"
+                                    "const CARD_BLUR_STYLE = { filter: 'blur(40px)' } as const;\n\n"
+                                    "/** The card. */\n"
+                                    "export const Card = () => <div style={CARD_BLUR_STYLE} />;\n")
+
+
+def test_joins_the_constant_block_and_reuses_identical_objects():
+    text = HEADER + ("const CENTER_STYLE = { transform: 'rotate(45deg)', } as const;\n\n"
+                     "export const Divider = () => (\n"
+                     "  <div>\n"
+                     '    <span style={{ "transform": "rotate(45deg)" }} />\n'
+                     "    <span style={{ boxShadow: '0 0 10px rgba(236, 72, 153, 0.6)' }} />\n"
+                     "  </div>\n"
+                     ");\n")
+    out = hoist(text)
+    assert '<span style={CENTER_STYLE} />' in out
+    assert out.count('rotate(45deg)') == 1
+    assert ("const CENTER_STYLE = { transform: 'rotate(45deg)', } as const;\n"
+            "const DIVIDER_PINK_GLOW_STYLE = { boxShadow: '0 0 10px rgba(236, 72, 153, 0.6)' } as const;\n\n"
+            "export const Divider") in out
+
+
+def test_names_say_what_the_style_sets():
+    gradient = "    <motion.div style={{ background: 'linear-gradient(90deg, %s)'%s }} />\n"
+    text = HEADER + ("export const Wave = () => (\n"
+                     "  <div>\n"
+                     + gradient % ('rgba(16, 185, 129, 0.3), transparent', '')
+                     + gradient % ('#F59E0B, transparent', '')
+                     + gradient % ('#10B981, #fff', ', top: 0, left: 0')
+                     + "    {/* Title */}\n"
+                     "    <h1 style={{ fontSize: '2rem' }} />\n"
+                     "  </div>\n"
+                     ");\n")
+    assert plan(text).hoisted == ['WAVE_EMERALD_GRADIENT_STYLE', 'WAVE_AMBER_GRADIENT_STYLE',
+                                  'WAVE_TOP_LEFT_EMERALD_GRADIENT_STYLE', 'WAVE_TITLE_STYLE']
+
+
+def test_dynamic_values_stay_inline():
+    text = HEADER + 'export const Bar = ({ w }) => <div style={{ width: w }} />;\n'
+    assert plan(text).edits == []
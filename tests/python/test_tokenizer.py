@@ -0,0 +1,72 @@
+from devtools.tokenizer import (JSX_CLOSE, JSX_OPEN, JSX_TEXT, PUNCT, REGEX, TEMPLATE,
+                                TokenStream, matching, tokenize)
+
+
+def kinds(text, jsx=True):
+    return [(t.kind, t.value) for t in tokenize(text, jsx=jsx)]
+
+
+def test_slash_after_operand_is_division():
+    toks = kinds('const d = a / b / c;')
+    assert ('punct', '/') in toks
+    assert not any(k == REGEX for k, _ in toks)
+
+
+def test_slash_after_operator_is_regex():
+    toks = kinds('const r = /a\\/b[/]/g;')
+    assert (REGEX, '/a\\/b[/]/g') in toks
+
+
+def test_regex_after_keyword():
+    assert (REGEX, '/x/') in kinds('return /x/.test(s);')
+
+
+def test_nested_template_literals():
+    toks = kinds('x = `a${ {b: `c${d}`}.b }e`;')
+    assert [v for k, v in toks if k == TEMPLATE] == ['`a', '`c', '`', 'e`']
+    # The object literal's braces don't end the outer substitution early.
+    assert toks[-2:] == [(TEMPLATE, 'e`'), (PUNCT, ';')]
+
+
+def test_jsx_text_and_expressions():
+    toks = kinds('const el = <div className="x">Hello {name} world</div>;')
+    assert (JSX_OPEN, 'div') in toks
+    assert [v for k, v in toks if k == JSX_TEXT] == ['Hello ', ' world']
+    assert (JSX_CLOSE, 'div') in toks
+
+
+def test_jsx_text_is_not_code():
+    # An apostrophe in JSX text must not open a string.
+    toks = kinds("<p>Don't stop</p>")
+    assert (JSX_TEXT, "Don't stop") in toks
+    assert toks[-1] == (JSX_CLOSE, 'p')
+
+
+def test_fragments():
+    toks = kinds('return (<>text</>);')
+    assert (JSX_OPEN, '') in toks and (JSX_CLOSE, '') in toks
+
+
+def test_generic_arrow_is_not_jsx():
+    assert not any(k == JSX_OPEN for k, _ in kinds('const f = <T,>(x: T) => x;'))
+
+
+def test_comparison_without_jsx():
+    assert kinds('a < b && c > d', jsx=False)[1] == (PUNCT, '<')
+
+
+def test_jsx_open_offset_is_the_tag_name():
+    text = 'x = <span />;'
+    tok = next(t for t in tokenize(text) if t.kind == JSX_OPEN)
+    assert text[tok.start:tok.end].startswith('span')
+
+
+def test_matching_brackets():
+    toks = list(tokenize('f(a, [b, {c}]);'))
+    i = next(i for i, t in enumerate(toks) if t.value == '(')
+    assert toks[matching(toks, i)].value == ')'
+
+
+def test_token_stream_lines():
+    ts = TokenStream('a\nb\n\nc')
+    assert [ts.line(i) for i in range(len(ts.toks))] == [1, 2, 4]
@@ -0,0 +1,66 @@
+import os
+import subprocess
+import sys
+
+from devtools.tsc import DiagnosticIndex, RelatedLocation, parse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PLAIN = """\
+components/A.tsx(12,5): error TS2322: Type 'string' is not assignable to type 'number'.
+  The expected type comes from property 'n'.
+components\\B.tsx(3,1): error TS1128: Declaration or statement expected.
+Found 2 errors.
+"""
+
+PRETTY = """\
+\x1b[96mcomponents/A.tsx\x1b[0m:\x1b[93m4\x1b[0m:\x1b[93m7\x1b[0m - \x1b[91merror\x1b[0m TS2304: Cannot find name 'x'.
+
+4   y = x;
+        ~
+"""
+
+
+def test_plain_with_continuation_lines():
+    a, b = parse(PLAIN.splitlines(keepends=True))
+    assert (a.path, a.line, a.col, a.code, a.severity) == ('components/A.tsx', 12, 5, 'TS2322', 'error')
+    assert a.message == ("Type 'string' is not assignable to type 'number'.\n"
+                         "The expected type comes from property 'n'.")
+    assert b.path == 'components/B.tsx'
+    assert b.message == 'Declaration or statement expected.'
+
+
+def test_pretty_drops_the_source_echo():
+    (d,) = parse(PRETTY.splitlines())
+    assert (d.path, d.line, d.col, d.code) == ('components/A.tsx', 4, 7, 'TS2304')
+    assert d.message == "Cannot find name 'x'."
+
+
+def test_index_by_file_and_code():
+    index = DiagnosticIndex(parse(PLAIN.splitlines()))
+    assert len(index) == 2
+    assert index.files(['TS1128']) == ['components/B.tsx']
+    assert [d.line for d in index.at('components/A.tsx', 12)] == [12]
+    assert index.codes() == {'TS2322': 1, 'TS1128': 1}
+
+
+def test_related_locations_stay_out_of_the_message():
+    (d,) = parse(["a.ts(9,2): error TS1005: ')' expected.\n",
+                  '  a.ts(3,21): The opening bracket is here.\n'])
+    assert d.message == "')' expected."
+    assert d.related == (RelatedLocation('a.ts', 3, 21, 'The opening bracket is here.'),)
+
+
+def test_balance_output_pipes_into_the_fixers(tmp_path):
+    """``python -m devtools.balance X | python -m devtools.tsc - --fix``."""
+    component = tmp_path / 'components' / 'X.tsx'
+    component.parent.mkdir()
+    component.write_text('const X = React.memo(() => {\n  return <div />;\n};\n\nexport default X;\n')
+    env = {**os.environ, 'PYTHONPATH': ROOT}
+    found = subprocess.run([sys.executable, '-m', 'devtools.balance', 'components/X.tsx'],
+                           cwd=tmp_path, env=env, capture_output=True, text=True)
+    assert found.returncode == 1
+    fixed = subprocess.run([sys.executable, '-m', 'devtools.tsc', '-', '--fix'], input=found.stdout,
+                           cwd=tmp_path, env=env, capture_output=True, text=True)
+    assert fixed.returncode == 0, fixed.stdout + fixed.stderr
+    assert component.read_text() == 'const X = React.memo(() => {\n  return <div />;\n});\n\nexport default X;\n'